@@ -35,6 +35,7 @@ if lib_dir.exists() and str(lib_dir) not in sys.path:
 # Only include modules that have register() functions
 MODULE_REGISTRATION_ORDER = [
     # Core utilities first
+    "utils.view_model",
     "utils.file_manager",
     "utils.api_client",
     "utils.backup_manager",
@@ -54,8 +55,16 @@ MODULE_REGISTRATION_ORDER = [
     "vision.multi_modal_vision",
 
     # Workflow system
+    "workflow.render_cost",
+    "workflow.geometry_dedup",
+    "workflow.material_dedup",
+    "workflow.texture_analyzer",
+    "workflow.lod_pipeline",
+    "workflow.modifier_profiler",
+    "workflow.render_optimizer",
     "workflow.scene_monitor",
     "workflow.proactive_suggestions",
+    "workflow.frame_monitor",
     "workflow.action_library",
     "workflow.auto_fix_system",
 
@@ -208,6 +217,10 @@ def unregister():
             file_manager.save_chat_history(bpy.context.scene.blendpro_chat_history)
             print("BlendPro: ✓ Chat history saved")
 
+        # Save learned vision routing weights
+        from .vision.vision_router import get_vision_router
+        get_vision_router().save_model()
+
         # Clear properties
         clear_props()
         print("BlendPro: ✓ Blender properties cleared")
@@ -0,0 +1,317 @@
+"""
+Headless batch health audit for BlendPro
+Controller:  python batch_audit.py ASSET_DIR --blender /path/to/blender --workers 4 --output audit.jsonl [--fix]
+Worker:      blender -b FILE.blend --python batch_audit.py -- --worker [--fix]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+RESULT_MARKER = "BLENDPRO_AUDIT_RESULT "
+ADDON_PACKAGE = "blendpro"
+_HASH_CHUNK = 1024 * 1024
+
+def file_hash(path: Path) -> str:
+    """Content hash of a file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def find_blend_files(root: Path) -> List[Path]:
+    """All .blend files under a directory (Blender's .blend1 backups excluded)"""
+    return sorted(path for path in root.rglob("*.blend") if path.is_file())
+
+def load_previous_records(output: Path) -> Dict[str, Dict[str, Any]]:
+    """Latest record per file from an existing JSONL report"""
+    records: Dict[str, Dict[str, Any]] = {}
+    if not output.exists():
+        return records
+    with open(output, "r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Truncated line from an interrupted run
+            if "path" in record:
+                records[record["path"]] = record
+    return records
+
+def is_unchanged(path: Path, record: Optional[Dict[str, Any]], fix: bool = False) -> Optional[str]:
+    """Current hash if the file was already audited successfully in this state and mode, else None"""
+    if record is None or record.get("status") != "ok":
+        return None
+    # An audit-only record does not cover a --fix run
+    if fix and not record.get("fix", False):
+        return None
+
+    stat = path.stat()
+    # Same size and mtime as recorded: trust the recorded hash without reading the file
+    if record.get("size") == stat.st_size and record.get("mtime_ns") == stat.st_mtime_ns:
+        return record.get("hash_after") or record.get("hash")
+
+    current = file_hash(path)
+    if current in (record.get("hash"), record.get("hash_after")):
+        return current
+    return None
+
+class BatchAuditor:
+    """Runs one background Blender per file across a pool of workers"""
+
+    def __init__(self, blender: str, output: Path, workers: int, fix: bool, timeout: float, no_backup: bool):
+        self.blender = blender
+        self.output = output
+        self.workers = max(1, workers)
+        self.fix = fix
+        self.timeout = timeout
+        self.no_backup = no_backup
+        self._stats = {
+            "files_found": 0,
+            "files_skipped": 0,
+            "files_audited": 0,
+            "files_failed": 0,
+            "files_fixed": 0,
+            "issues_found": 0
+        }
+
+    def run(self, root: Path, resume: bool = True) -> Dict[str, Any]:
+        """Audit every changed .blend file under root"""
+
+        start_time = time.perf_counter()
+        files = find_blend_files(root.resolve())
+        previous = load_previous_records(self.output) if resume else {}
+        self._stats["files_found"] = len(files)
+
+        pending = []
+        for path in files:
+            if resume and is_unchanged(path, previous.get(str(path)), self.fix):
+                self._stats["files_skipped"] += 1
+            else:
+                pending.append(path)
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._audit_file, path): path for path in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                record = future.result()
+                self._tally(record)
+                self._write_record(record)
+                print(f"[{done}/{len(pending)}] {record['status']:7s} {record['path']}", flush=True)
+
+        elapsed = time.perf_counter() - start_time
+        processed = self._stats["files_audited"] + self._stats["files_failed"]
+        return {
+            **self._stats,
+            "elapsed": elapsed,
+            "files_per_minute": processed / elapsed * 60.0 if elapsed > 0 else 0.0,
+            "workers": self.workers
+        }
+
+    def _audit_file(self, path: Path) -> Dict[str, Any]:
+        """Run one background Blender on a file and parse its result line"""
+
+        stat = path.stat()
+        record: Dict[str, Any] = {
+            "path": str(path),
+            "hash": file_hash(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "fix": self.fix,
+            "timestamp": time.time()
+        }
+
+        command = [
+            self.blender, "-b", "--factory-startup", str(path),
+            "--python", str(Path(__file__).resolve()), "--", "--worker"
+        ]
+        if self.fix:
+            command.append("--fix")
+        if self.no_backup:
+            command.append("--no-backup")
+
+        start_time = time.perf_counter()
+        try:
+            completed = subprocess.run(command, capture_output=True, text=True, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            return self._failed(record, "timeout", f"No result after {self.timeout:.0f}s", start_time)
+        except OSError as e:
+            return self._failed(record, "error", f"Could not start Blender: {e}", start_time)
+
+        result = None
+        for line in completed.stdout.splitlines():
+            if line.startswith(RESULT_MARKER):
+                try:
+                    result = json.loads(line[len(RESULT_MARKER):])
+                except ValueError as e:
+                    return self._failed(record, "error", f"Malformed result line: {e}", start_time)
+                if not isinstance(result, dict):
+                    return self._failed(record, "error", "Malformed result line: not an object", start_time)
+        if result is None:
+            stderr_tail = completed.stderr.strip().splitlines()[-5:]
+            return self._failed(record, "error", f"Exit code {completed.returncode}: {' | '.join(stderr_tail)}", start_time)
+
+        record.update(result)
+        record["elapsed"] = time.perf_counter() - start_time
+
+        if record.get("saved"):
+            # The fixed file is what the next run will see
+            stat = path.stat()
+            record["hash_after"] = file_hash(path)
+            record["size"] = stat.st_size
+            record["mtime_ns"] = stat.st_mtime_ns
+        return record
+
+    def _failed(self, record: Dict[str, Any], status: str, error: str, start_time: float) -> Dict[str, Any]:
+        """Record a worker that produced no result"""
+        record.update(status=status, error=error, elapsed=time.perf_counter() - start_time)
+        return record
+
+    def _tally(self, record: Dict[str, Any]) -> None:
+        """Count one finished file (called from the controller thread only)"""
+        if record.get("status") == "ok":
+            self._stats["files_audited"] += 1
+            self._stats["issues_found"] += len(record.get("issues", []))
+            if record.get("saved"):
+                self._stats["files_fixed"] += 1
+        else:
+            self._stats["files_failed"] += 1
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        """Append one JSONL line and flush so an interrupted run can resume"""
+        with open(self.output, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+def _json_default(value):
+    """Serialize enums and other non-JSON values in fix results"""
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+def _import_addon():
+    """Import this directory as the BlendPro package so relative imports resolve"""
+    import importlib.util
+
+    addon_dir = Path(__file__).resolve().parent
+    spec = importlib.util.spec_from_file_location(
+        ADDON_PACKAGE, addon_dir / "__init__.py", submodule_search_locations=[str(addon_dir)]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_PACKAGE] = package
+    spec.loader.exec_module(package)
+    return package
+
+def run_worker(fix: bool, no_backup: bool) -> Dict[str, Any]:
+    """Audit (and optionally fix) the file Blender has open; runs inside blender -b"""
+
+    import bpy
+    import importlib
+
+    _import_addon()
+    settings = importlib.import_module(f"{ADDON_PACKAGE}.config.settings").get_settings()
+    scene_analyzer = importlib.import_module(f"{ADDON_PACKAGE}.vision.scene_analyzer").get_scene_analyzer()
+    monitor = importlib.import_module(f"{ADDON_PACKAGE}.workflow.scene_monitor").get_scene_health_monitor()
+
+    if no_backup:
+        settings.update(enable_auto_backup=False)
+
+    context = bpy.context
+    scene_data = scene_analyzer.analyze_scene(context, use_cache=False)
+    if scene_data.get("error"):
+        return {"status": "error", "error": scene_data["error"]}
+
+    health_report = monitor.analyze_scene_health(context, include_ai_insights=False)
+    if health_report.get("error"):
+        return {"status": "error", "error": health_report["error"]}
+
+    result = {
+        "status": "ok",
+        "blender_version": bpy.app.version_string,
+        "scene": scene_data.get("metadata", {}),
+        "object_count": len(scene_data.get("objects", [])),
+        "material_count": len(scene_data.get("materials", [])),
+        "health_score": health_report["overall_score"],
+        "critical_count": health_report["critical_count"],
+        "warning_count": health_report["warning_count"],
+        "issues": [
+            {key: issue[key] for key in ("severity", "category", "description", "affected_objects")}
+            for issue in health_report["issues"]
+        ],
+        "saved": False
+    }
+
+    if fix:
+        auto_fix = importlib.import_module(f"{ADDON_PACKAGE}.workflow.auto_fix_system").get_auto_fix_system()
+        fix_result = auto_fix.auto_fix_scene(context, include_ai_insights=False, unattended=True)
+        result["fixes"] = json.loads(json.dumps(fix_result, default=_json_default))
+        if fix_result.get("fixes_applied"):
+            bpy.ops.wm.save_mainfile()
+            result["saved"] = True
+
+    return result
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for both the controller and Blender workers"""
+
+    if argv is None:
+        # Inside Blender, script arguments follow "--"
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Audit a directory of .blend files with BlendPro health checks")
+    parser.add_argument("directory", nargs="?", help="Directory searched recursively for .blend files")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="Parallel Blender processes")
+    parser.add_argument("--output", default="blendpro_audit.jsonl", help="JSONL report (appended, used for resume)")
+    parser.add_argument("--fix", action="store_true", help="Apply auto-fixes and save changed files")
+    parser.add_argument("--no-backup", action="store_true", help="Skip BlendPro backups before fixes")
+    parser.add_argument("--no-resume", action="store_true", help="Audit every file even if unchanged since the last report")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds allowed per file")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        try:
+            result = run_worker(args.fix, args.no_backup)
+        except Exception as e:
+            result = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        print(RESULT_MARKER + json.dumps(result, default=_json_default), flush=True)
+        return 0 if result.get("status") == "ok" else 1
+
+    if not args.directory:
+        parser.error("a directory is required")
+
+    auditor = BatchAuditor(
+        blender=args.blender,
+        output=Path(args.output),
+        workers=args.workers,
+        fix=args.fix,
+        timeout=args.timeout,
+        no_backup=args.no_backup
+    )
+    summary = auditor.run(Path(args.directory), resume=not args.no_resume)
+
+    print("=" * 40)
+    print(f"Files found:    {summary['files_found']}")
+    print(f"Skipped:        {summary['files_skipped']} (unchanged)")
+    print(f"Audited:        {summary['files_audited']}")
+    print(f"Failed:         {summary['files_failed']}")
+    if args.fix:
+        print(f"Fixed & saved:  {summary['files_fixed']}")
+    print(f"Issues found:   {summary['issues_found']}")
+    print(f"Throughput:     {summary['files_per_minute']:.1f} files/min "
+          f"({summary['workers']} workers, {summary['elapsed']:.1f}s)")
+    return 0 if summary["files_failed"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
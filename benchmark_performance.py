@@ -0,0 +1,686 @@
+"""
+Performance benchmarks for BlendPro
+Run inside Blender (e.g. blender -b --python benchmark_performance.py)
+"""
+
+import bpy
+import io
+import time
+import tracemalloc
+from utils.code_executor import get_code_executor
+from utils.logger import get_logger, setup_logging
+from workflow.action_library import get_action_library, UserAction, ActionParameter, ParameterType
+from vision.screenshot_manager import get_screenshot_manager
+from vision.spatial_index import SpatialIndex
+from vision.scene_snapshot import ObjectSnapshot
+from workflow.material_dedup import MaterialDeduplicator
+from workflow.orphan_data import OrphanDataAnalyzer
+from workflow.auto_fix_system import get_auto_fix_system
+from vision.image_encoder import get_image_encoder, EncodingOptions, PIL_AVAILABLE, NUMPY_AVAILABLE
+
+if PIL_AVAILABLE:
+    from PIL import Image
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+def _create_benchmark_objects(count: int, prefix: str = "BP_Bench"):
+    """Create lightweight objects sharing a single mesh"""
+    mesh = bpy.data.meshes.new(f"{prefix}_Mesh")
+    collection = bpy.data.collections.new(f"{prefix}_Collection")
+    bpy.context.scene.collection.children.link(collection)
+
+    objects = []
+    for i in range(count):
+        obj = bpy.data.objects.new(f"{prefix}_{i:05d}", mesh)
+        collection.objects.link(obj)
+        objects.append(obj)
+
+    return objects, collection, mesh
+
+def _remove_benchmark_objects(objects, collection, mesh):
+    """Remove objects created by _create_benchmark_objects"""
+    for obj in objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    bpy.data.collections.remove(collection)
+    bpy.data.meshes.remove(mesh)
+
+def benchmark_action_throughput(object_count: int = 2000):
+    """Compare text-substituted vs compiled action execution over many objects"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info(f"=== Action throughput ({object_count} objects) ===")
+
+    library = get_action_library()
+    executor = get_code_executor()
+
+    action = UserAction(
+        id="benchmark_offset_action",
+        name="Benchmark Offset",
+        description="Move an object up by an offset",
+        code_template=(
+            'obj = bpy.data.objects["{object_name}"]\n'
+            'obj.location.z += {offset}\n'
+        ),
+        parameters=[
+            ActionParameter("object_name", ParameterType.OBJECT_NAME, "Object", ""),
+            ActionParameter("offset", ParameterType.FLOAT, "Offset", 0.0)
+        ]
+    )
+    library._actions[action.id] = action
+
+    objects, collection, mesh = _create_benchmark_objects(object_count)
+    auto_backup = executor.settings.enable_auto_backup
+    executor.settings.enable_auto_backup = False
+
+    try:
+        # Baseline: substitute values into the text, validate and compile every call
+        start = time.perf_counter()
+        for i, obj in enumerate(objects):
+            params = {"object_name": obj.name, "offset": i * 0.001}
+            library._validate_parameters(action, params)
+            executor.execute_code(library._generate_code_from_template(action, params))
+        text_time = time.perf_counter() - start
+
+        # Compiled: one validation per template version, values injected as variables
+        start = time.perf_counter()
+        for i, obj in enumerate(objects):
+            library.execute_action(action.id, {"object_name": obj.name, "offset": i * 0.001})
+        compiled_time = time.perf_counter() - start
+
+        logger.info(f"Text substitution: {text_time:.3f}s ({object_count / text_time:.0f} actions/s)")
+        logger.info(f"Compiled action:   {compiled_time:.3f}s ({object_count / compiled_time:.0f} actions/s)")
+        logger.info(f"Speedup: {text_time / compiled_time:.1f}x")
+        return True
+
+    except Exception as e:
+        logger.exception(f"Action throughput benchmark failed: {str(e)}")
+        return False
+
+    finally:
+        executor.settings.enable_auto_backup = auto_backup
+        library._actions.pop(action.id, None)
+        _remove_benchmark_objects(objects, collection, mesh)
+
+def _synthetic_viewport(width: int, height: int):
+    """Viewport-like RGBA frame: gradient background with flat-shaded blocks and noise"""
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    pixels[..., 0] = 40 + (x * 60 // width)
+    pixels[..., 1] = 40 + (y * 60 // height)
+    pixels[..., 2] = 60
+    pixels[..., 3] = 255
+
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        x0, y0 = rng.integers(0, width - 200), rng.integers(0, height - 200)
+        w, h = rng.integers(40, 200, size=2)
+        pixels[y0:y0 + h, x0:x0 + w, :3] = rng.integers(0, 255, size=3)
+
+    pixels[..., :3] = np.clip(pixels[..., :3] + rng.integers(-3, 4, size=(height, width, 3)), 0, 255)
+    return Image.fromarray(pixels, 'RGBA')
+
+def benchmark_screenshot_encoding(repeats: int = 3):
+    """Compare the legacy full-size PNG path with the budgeted encoder at 1080p and 4K"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info("=== Screenshot encoding ===")
+
+    if not (PIL_AVAILABLE and NUMPY_AVAILABLE):
+        logger.warning("Pillow and NumPy are required for the encoding benchmark")
+        return False
+
+    encoder = get_image_encoder()
+
+    for label, size in (("1080p", (1920, 1080)), ("4K", (3840, 2160))):
+        image = _synthetic_viewport(*size)
+
+        # Legacy: full-resolution RGBA PNG
+        start = time.perf_counter()
+        for _ in range(repeats):
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG', optimize=True, quality=95)
+        legacy_time = (time.perf_counter() - start) / repeats
+        logger.info(f"{label} legacy PNG: {legacy_time * 1000:.0f} ms, {len(buffer.getvalue()) / 1024:.0f} KB")
+
+        for image_format in ("JPEG", "WEBP", "PNG"):
+            options = EncodingOptions(image_format=image_format, byte_budget=300 * 1024)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                encoded = encoder.encode(image, options)
+            encode_time = (time.perf_counter() - start) / repeats
+            logger.info(
+                f"{label} {encoded.image_format} {encoded.width}x{encoded.height}: "
+                f"{encode_time * 1000:.0f} ms, {encoded.byte_size / 1024:.0f} KB (q={encoded.quality})"
+            )
+
+    return True
+
+def benchmark_buffer_conversion(width: int = 1920, height: int = 1080, repeats: int = 5):
+    """Compare GPU buffer to image conversion paths for one viewport frame"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info(f"=== Buffer conversion ({width}x{height}) ===")
+
+    if not (PIL_AVAILABLE and NUMPY_AVAILABLE):
+        logger.warning("Pillow and NumPy are required for the conversion benchmark")
+        return False
+
+    import gpu
+    pixels = np.random.default_rng(0).integers(0, 255, width * height * 4, dtype=np.uint8)
+    buffer = gpu.types.Buffer('UBYTE', width * height * 4, pixels.tolist())
+    manager = get_screenshot_manager()
+
+    def legacy_numpy():
+        array = np.flipud(np.frombuffer(buffer, dtype=np.uint8).reshape((height, width, 4)))
+        return Image.fromarray(array, 'RGBA')
+
+    def legacy_per_pixel():
+        values = list(buffer)
+        image = Image.new('RGBA', (width, height))
+        image.putdata([tuple(values[i:i + 4]) for i in range(0, len(values), 4)])
+        return image.transpose(Image.FLIP_TOP_BOTTOM)
+
+    paths = [
+        ("Per-pixel putdata", legacy_per_pixel, 1),
+        ("NumPy reshape/flipud/fromarray", legacy_numpy, repeats),
+        ("Image.frombuffer (memoryview)", lambda: manager._buffer_to_image(buffer, width, height), repeats)
+    ]
+
+    reference = None
+    for name, convert, runs in paths:
+        start = time.perf_counter()
+        for _ in range(runs):
+            image = convert()
+            image.load()
+        elapsed = (time.perf_counter() - start) / runs
+        logger.info(f"{name}: {elapsed * 1000:.1f} ms")
+
+        pixels_out = image.tobytes()
+        if reference is None:
+            reference = pixels_out
+        elif pixels_out != reference:
+            logger.error(f"{name} produced different pixels")
+            return False
+
+    return True
+
+def _find_view3d():
+    """First 3D viewport of the current screen, or None in background mode"""
+    screen = bpy.context.screen
+    if screen is None:
+        return None
+    for area in screen.areas:
+        if area.type == 'VIEW_3D':
+            for region in area.regions:
+                if region.type == 'WINDOW':
+                    return area, region
+    return None
+
+def benchmark_multi_view_capture(resolution: int = 512):
+    """Compare the per-view viewport loop with batched offscreen contact-sheet capture"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info(f"=== Multi-view capture ({resolution}px views) ===")
+
+    view3d = _find_view3d()
+    if view3d is None:
+        logger.warning("Multi-view benchmark needs a 3D viewport (run Blender with a UI)")
+        return False
+
+    import gpu
+    area, region = view3d
+    space = area.spaces.active
+    region_3d = space.region_3d
+    manager = get_screenshot_manager()
+    encoder = get_image_encoder()
+    view_angles = manager.get_standard_view_angles()
+
+    with bpy.context.temp_override(area=area, region=region):
+        context = bpy.context
+
+        # Legacy: move the user's view, redraw, allocate an offscreen per view, encode each image
+        saved = (region_3d.view_location.copy(), region_3d.view_rotation.copy(), region_3d.view_distance)
+        start = time.perf_counter()
+        legacy_bytes = 0
+        try:
+            for view_angle in view_angles:
+                region_3d.view_rotation = view_angle["rotation"]
+                region_3d.view_distance = view_angle["distance"]
+                bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+
+                offscreen = gpu.types.GPUOffScreen(resolution, resolution)
+                offscreen.draw_view3d(context.scene, context.view_layer, space, region,
+                                      region_3d.view_matrix, region_3d.window_matrix)
+                buffer = gpu.types.Buffer('UBYTE', resolution * resolution * 4)
+                with offscreen.bind():
+                    gpu.state.active_framebuffer_get().read_color(
+                        0, 0, resolution, resolution, 4, 0, 'UBYTE', data=buffer)
+                offscreen.free()
+
+                image = manager._buffer_to_image(buffer, resolution, resolution)
+                legacy_bytes += encoder.encode(image).byte_size
+        finally:
+            region_3d.view_location, region_3d.view_rotation, region_3d.view_distance = saved
+        legacy_time = time.perf_counter() - start
+
+        # Batched: pooled offscreen, explicit matrices, one contact sheet
+        manager.capture_contact_sheet(context, view_angles, (resolution, resolution))  # warm the pool
+        start = time.perf_counter()
+        sheet = manager.capture_contact_sheet(context, view_angles, (resolution, resolution))
+        batched_time = time.perf_counter() - start
+
+    if sheet.get("error"):
+        logger.error(f"Contact sheet capture failed: {sheet['error']}")
+        return False
+
+    logger.info(f"Per-view loop:  {legacy_time * 1000:.0f} ms, {len(view_angles)} images, {legacy_bytes / 1024:.0f} KB")
+    logger.info(f"Contact sheet:  {batched_time * 1000:.0f} ms, 1 image, {sheet['byte_size'] / 1024:.0f} KB")
+    logger.info(f"Speedup: {legacy_time / batched_time:.1f}x")
+    return True
+
+def benchmark_spatial_index(sizes=(1000, 10000, 50000), queries: int = 1000):
+    """Spatial index build and query cost against the pairwise relationship loop"""
+
+    from mathutils import Vector
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info("=== Spatial index ===")
+
+    if not NUMPY_AVAILABLE:
+        logger.warning("NumPy is required for the spatial index")
+        return False
+
+    rng = np.random.default_rng(0)
+    pairwise_rate = None
+
+    for count in sizes:
+        centers = rng.uniform(-100.0, 100.0, (count, 3))
+        extents = rng.uniform(0.2, 2.0, (count, 3))
+        boxes = [(f"obj_{i}", centers[i] - extents[i] / 2, centers[i] + extents[i] / 2) for i in range(count)]
+        points = rng.uniform(-100.0, 100.0, (queries, 3))
+
+        index = SpatialIndex()
+        start = time.perf_counter()
+        index.build(boxes)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for point in points:
+            index.nearest(point, 5)
+        knn_time = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        for point in points:
+            index.within_radius(point, 10.0)
+        radius_time = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        for i in range(queries):
+            index.overlapping(f"obj_{i % count}")
+        overlap_time = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        pairs = index.neighbor_pairs(4)
+        pairs_time = time.perf_counter() - start
+
+        # Old approach: every pair through mathutils; time a slice and extrapolate
+        if pairwise_rate is None:
+            locations = [Vector(c) for c in centers[:1000]]
+            start = time.perf_counter()
+            compared = 0
+            for i, a in enumerate(locations):
+                for b in locations[i + 1:]:
+                    distance = (a - b).length
+                    direction = (b - a).normalized()
+                    compared += 1
+            pairwise_rate = compared / (time.perf_counter() - start)
+        pairwise_estimate = count * (count - 1) / 2 / pairwise_rate
+
+        logger.info(
+            f"{count} objects: build {build_time * 1000:.0f} ms, kNN {knn_time * 1e6:.0f} us, "
+            f"radius {radius_time * 1e6:.0f} us, overlap {overlap_time * 1e6:.0f} us"
+        )
+        logger.info(
+            f"{count} objects: {len(pairs)} neighbour pairs in {pairs_time * 1000:.0f} ms "
+            f"vs ~{pairwise_estimate:.1f} s for all pairs"
+        )
+
+    return True
+
+def _synthetic_object_dicts(count: int):
+    """SceneAnalyzer-style object dicts for a scene of mostly meshes"""
+    objects = []
+    for i in range(count):
+        obj = {
+            "name": f"Object_{i:06d}",
+            "type": "MESH" if i % 10 else "EMPTY",
+            "location": [float(i % 100), float(i // 100 % 100), float(i // 10000)],
+            "rotation_euler": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0],
+            "dimensions": [2.0, 2.0, 2.0],
+            "world_bounds": [[i % 100 - 1.0, i // 100 % 100 - 1.0, -1.0], [i % 100 + 1.0, i // 100 % 100 + 1.0, 1.0]],
+            "visible": True,
+            "selected": i % 50 == 0,
+            "active": i == 0,
+            "parent": f"Object_{i - i % 10:06d}" if i % 10 else None,
+            "children": [f"Object_{i + j:06d}" for j in range(1, 10) if i + j < count] if i % 10 == 0 else [],
+            "material_slots": 0 if i % 7 == 0 else 1,
+            "modifiers": ["Subdivision", "Bevel"][:i % 3],
+            "constraints": []
+        }
+        if obj["type"] == "MESH":
+            obj.update({
+                "vertices": (i * 7919) % 200000,
+                "edges": 12,
+                "faces": 6,
+                "materials": [] if i % 7 == 0 else ["Material"],
+                "uv_layers": 1,
+                "vertex_colors": 0,
+                "issues": []
+            })
+        objects.append(obj)
+    return objects
+
+def benchmark_scene_snapshot(sizes=(10000, 50000)):
+    """Memory and filter cost of the columnar snapshot against per-object dicts"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info("=== Scene snapshot ===")
+
+    if not NUMPY_AVAILABLE:
+        logger.warning("NumPy is required for the columnar snapshot")
+        return False
+
+    for count in sizes:
+        tracemalloc.start()
+        objects = _synthetic_object_dicts(count)
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        snapshot = ObjectSnapshot.from_dicts(objects)
+        snapshot_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        snapshot = ObjectSnapshot.from_dicts(objects)
+        build_time = time.perf_counter() - start
+
+        filters = [
+            (
+                "meshes with > 100k verts",
+                lambda: [o["name"] for o in objects if o["type"] == "MESH" and o.get("vertices", 0) > 100000],
+                lambda: snapshot.names(snapshot.meshes_with_vertices_over(100000))
+            ),
+            (
+                "meshes without materials",
+                lambda: [o["name"] for o in objects if o["type"] == "MESH" and o.get("material_slots", 0) == 0],
+                lambda: snapshot.names(snapshot.without_materials())
+            ),
+            (
+                "more than 1 modifier",
+                lambda: [o["name"] for o in objects if len(o.get("modifiers", [])) > 1],
+                lambda: snapshot.names(snapshot.with_modifiers_over(1))
+            )
+        ]
+
+        logger.info(
+            f"{count} objects: dicts {dict_bytes / 1e6:.1f} MB, snapshot {snapshot_bytes / 1e6:.1f} MB "
+            f"(built in {build_time * 1000:.0f} ms)"
+        )
+
+        for name, dict_filter, snapshot_filter in filters:
+            start = time.perf_counter()
+            expected = dict_filter()
+            dict_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = snapshot_filter()
+            snapshot_time = time.perf_counter() - start
+
+            if result != expected:
+                logger.error(f"{name}: snapshot filter disagrees with the dict loop")
+                return False
+            logger.info(
+                f"{count} objects, {name}: dict loop {dict_time * 1000:.1f} ms, "
+                f"vectorized {snapshot_time * 1000:.1f} ms"
+            )
+
+        # Existing consumers read rows through the lazy dict view
+        start = time.perf_counter()
+        selected = [o["name"] for o in snapshot.objects if o["selected"]]
+        view_time = time.perf_counter() - start
+        logger.info(f"{count} objects: dict-view scan of 'selected' {view_time * 1000:.1f} ms ({len(selected)} found)")
+
+    # Extraction from the open scene
+    from vision.scene_analyzer import get_scene_analyzer
+    start = time.perf_counter()
+    scene_snapshot = get_scene_analyzer().extract_object_snapshot(bpy.context)
+    logger.info(
+        f"Open scene: {len(scene_snapshot)} objects extracted in {(time.perf_counter() - start) * 1000:.0f} ms, "
+        f"{scene_snapshot.nbytes / 1024:.0f} KB of columns"
+    )
+
+    return True
+
+def benchmark_material_dedup(count: int = 2000, variants: int = 40):
+    """Duplicate-material scan on imported-style copies of a few base materials"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info("=== Material dedup ===")
+
+    materials = []
+    try:
+        for i in range(count):
+            material = bpy.data.materials.new(f"BP_Bench_Mat_{i % variants}")
+            material.use_nodes = True
+            principled = material.node_tree.nodes.get("Principled BSDF")
+            if principled is not None:
+                principled.inputs["Roughness"].default_value = (i % variants) / variants
+            materials.append(material)
+
+        deduplicator = MaterialDeduplicator()
+
+        start = time.perf_counter()
+        groups = deduplicator.find_duplicates()
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deduplicator.find_duplicates()
+        warm_time = time.perf_counter() - start
+
+        savings = deduplicator.estimate_savings(groups)
+        logger.info(
+            f"{len(bpy.data.materials)} materials: {len(groups)} groups, "
+            f"{savings['materials_removed']} duplicates, {savings['nodes_removed']} nodes"
+        )
+        logger.info(f"Scan {cold_time * 1000:.0f} ms cold, {warm_time * 1000:.0f} ms cached")
+
+        return cold_time < 1.0
+    finally:
+        bpy.data.batch_remove(ids=materials)
+
+def _create_orphan_chains(count: int, prefix: str):
+    """Orphan mesh -> material -> node group chains plus actions, about `count` datablocks"""
+    created = []
+    for i in range(count // 4):
+        group = bpy.data.node_groups.new(f"{prefix}_Group_{i}", 'ShaderNodeTree')
+        material = bpy.data.materials.new(f"{prefix}_Mat_{i}")
+        material.use_nodes = True
+        group_node = material.node_tree.nodes.new('ShaderNodeGroup')
+        group_node.node_tree = group
+        mesh = bpy.data.meshes.new(f"{prefix}_Mesh_{i}")
+        mesh.materials.append(material)
+        action = bpy.data.actions.new(f"{prefix}_Action_{i}")
+        created.extend((mesh, material, group, action))
+    return created
+
+def benchmark_orphan_purge(count: int = 10000):
+    """Orphan graph analysis and batched purge against per-datablock removal"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info("=== Orphan purge ===")
+
+    analyzer = OrphanDataAnalyzer()
+
+    _create_orphan_chains(count, "BP_Bench_Orphan")
+    start = time.perf_counter()
+    report = analyzer.analyze()
+    analysis_time = time.perf_counter() - start
+    logger.info(
+        f"{report.total_ids} datablocks: {len(report.orphans)} orphans found in {analysis_time * 1000:.0f} ms, "
+        f"~{report.file_bytes / 1024:.0f} KB reclaimable"
+    )
+
+    # Only purge what the benchmark created
+    report.orphans = [datablock for datablock in report.orphans if datablock.name.startswith("BP_Bench_Orphan")]
+    result = analyzer.purge(report)
+    logger.info(f"Batched purge: {result['ids_removed']} datablocks in {result['purge_time'] * 1000:.0f} ms")
+
+    # Old approach: one remove() call per zero-user datablock, repeated until chains are gone
+    created = _create_orphan_chains(count, "BP_Bench_Orphan")
+    collections = {
+        "Mesh": bpy.data.meshes,
+        "Material": bpy.data.materials,
+        "ShaderNodeTree": bpy.data.node_groups,
+        "Action": bpy.data.actions
+    }
+    start = time.perf_counter()
+    remaining = list(created)
+    while remaining:
+        removable = [datablock for datablock in remaining if datablock.users == 0]
+        if not removable:
+            break
+        for datablock in removable:
+            collections[datablock.bl_rna.identifier].remove(datablock)
+        removed = set(map(id, removable))
+        remaining = [datablock for datablock in remaining if id(datablock) not in removed]
+    sequential_time = time.perf_counter() - start
+    logger.info(f"Per-datablock removal: {len(created)} datablocks in {sequential_time * 1000:.0f} ms")
+
+    return True
+
+def _create_messy_meshes(count: int, prefix: str):
+    """Objects with their own sphere meshes carrying doubled and loose vertices"""
+    import bmesh
+
+    collection = bpy.data.collections.new(f"{prefix}_Collection")
+    bpy.context.scene.collection.children.link(collection)
+
+    objects = []
+    for i in range(count):
+        bm = bmesh.new()
+        bmesh.ops.create_uvsphere(bm, u_segments=16, v_segments=8, radius=1.0)
+        bmesh.ops.split_edges(bm, edges=bm.edges[:len(bm.edges) // 8])
+        for j in range(5):
+            bm.verts.new((3.0 + j, 0.0, 0.0))
+        mesh = bpy.data.meshes.new(f"{prefix}_Mesh_{i:04d}")
+        bm.to_mesh(mesh)
+        bm.free()
+
+        obj = bpy.data.objects.new(f"{prefix}_{i:04d}", mesh)
+        collection.objects.link(obj)
+        objects.append(obj)
+
+    return objects, collection
+
+def _remove_messy_meshes(objects, collection):
+    """Remove objects created by _create_messy_meshes"""
+    meshes = [obj.data for obj in objects]
+    bpy.data.batch_remove(ids=objects + meshes + [collection])
+
+def _legacy_mesh_fix(obj):
+    """Per-object edit-mode fix as the auto-fixes used to run"""
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.mesh.remove_doubles(threshold=0.0001)
+    bpy.ops.mesh.select_all(action='DESELECT')
+    bpy.ops.mesh.select_loose()
+    bpy.ops.mesh.delete(type='VERT')
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+def benchmark_mesh_fixes(mesh_count: int = 500, legacy_sample: int = 50):
+    """Mesh auto-fix throughput: bmesh batch against per-object edit-mode operators"""
+
+    logger = get_logger("BlendPro.Benchmark")
+    logger.info(f"=== Mesh fixes ({mesh_count} meshes) ===")
+
+    auto_fix = get_auto_fix_system()
+
+    objects, collection = _create_messy_meshes(mesh_count, "BP_Bench_Fix")
+    try:
+        names = [obj.name for obj in objects]
+        start = time.perf_counter()
+        auto_fix._fix_remove_doubles(bpy.context, names)
+        auto_fix._fix_loose_vertices(bpy.context, names)
+        auto_fix._fix_non_manifold(bpy.context, names)
+        batch_time = time.perf_counter() - start
+        logger.info(
+            f"bmesh batch: 3 fixes on {mesh_count} meshes in {batch_time:.2f}s "
+            f"({3 * mesh_count / batch_time:.0f} fixes/s)"
+        )
+
+        # Re-run on already clean meshes: array prechecks skip most conversions
+        start = time.perf_counter()
+        auto_fix._fix_loose_vertices(bpy.context, names)
+        auto_fix._fix_non_manifold(bpy.context, names)
+        clean_time = time.perf_counter() - start
+        logger.info(f"Clean re-run: 2 fixes in {clean_time * 1000:.0f} ms ({2 * mesh_count / clean_time:.0f} fixes/s)")
+    finally:
+        _remove_messy_meshes(objects, collection)
+
+    objects, collection = _create_messy_meshes(legacy_sample, "BP_Bench_Legacy")
+    try:
+        start = time.perf_counter()
+        for obj in objects:
+            _legacy_mesh_fix(obj)
+        legacy_time = time.perf_counter() - start
+        logger.info(
+            f"Edit-mode operators: 2 fixes on {legacy_sample} meshes in {legacy_time:.2f}s "
+            f"({2 * legacy_sample / legacy_time:.0f} fixes/s)"
+        )
+    except Exception as e:
+        logger.warning(f"Edit-mode comparison needs a 3D viewport context: {e}")
+    finally:
+        _remove_messy_meshes(objects, collection)
+
+    return True
+
+def run_all_benchmarks():
+    """Run all performance benchmarks"""
+
+    setup_logging("INFO")
+
+    print("BlendPro Performance Benchmarks")
+    print("=" * 40)
+
+    benchmarks = [
+        ("Action Throughput", benchmark_action_throughput),
+        ("Screenshot Encoding", benchmark_screenshot_encoding),
+        ("Buffer Conversion", benchmark_buffer_conversion),
+        ("Multi-View Capture", benchmark_multi_view_capture),
+        ("Spatial Index", benchmark_spatial_index),
+        ("Scene Snapshot", benchmark_scene_snapshot),
+        ("Material Dedup", benchmark_material_dedup),
+        ("Orphan Purge", benchmark_orphan_purge),
+        ("Mesh Fixes", benchmark_mesh_fixes)
+    ]
+
+    results = []
+    for name, func in benchmarks:
+        print(f"\nRunning {name}...")
+        try:
+            success = func()
+            results.append((name, success))
+            print(f"✓ {name}: {'DONE' if success else 'FAILED'}")
+        except Exception as e:
+            results.append((name, False))
+            print(f"✗ {name}: ERROR - {str(e)}")
+
+    print(f"\n{'='*40}")
+    completed = sum(1 for _, success in results if success)
+    print(f"Overall: {completed}/{len(results)} benchmarks completed")
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -28,13 +28,23 @@ class BlendProSettings:
     use_custom_vision_model: bool = False
     custom_vision_model: str = ""
     enable_vision_context: bool = True
+    enable_vision_routing: bool = True  # Answer from scene data unless the query needs pixels
     auto_vision_keywords: str = "scene,current,visible,see,look,analyze,what,this,these,objects"
+    screenshot_format: str = "JPEG"  # PNG, JPEG or WEBP
+    screenshot_max_dimension: int = 2048
+    screenshot_byte_budget_kb: int = 300  # 0 disables the budget
+    vision_dedup_threshold: int = 4  # Hamming distance in bits of a 64-bit dHash
+    vision_send_changed_tiles: bool = True
+    image_cache_mb: int = 64
+    vision_roi_crops: bool = True  # Crop to mentioned objects instead of sending the whole viewport
+    vision_roi_overview: bool = True  # Add a low-resolution full frame to region crops
     
     # Scene Monitoring
     enable_scene_monitoring: bool = True
     monitoring_interval: float = 2.0
     analysis_cooldown: float = 10.0
     max_suggestions: int = 10
+    enable_frame_monitor: bool = True  # Time viewport draws and flag regressions
     
     # Interaction Engine
     enable_task_classification: bool = True
@@ -74,6 +84,7 @@ class BlendProSettings:
     # Timeout Settings
     api_timeout: float = 30.0
     code_execution_timeout: float = 60.0
+    code_execution_memory_limit: int = 0  # MB of growth, 0 disables the cap
     planning_timeout: float = 45.0
 
     # Validation Settings
@@ -186,15 +197,27 @@ def sync_from_preferences(preferences) -> None:
         temperature=getattr(preferences, 'temperature', 0.7),
         max_tokens=getattr(preferences, 'max_tokens', 1500),
         enable_vision_context=getattr(preferences, 'enable_vision_context', True),
+        enable_vision_routing=getattr(preferences, 'enable_vision_routing', True),
         enable_multi_step_planning=getattr(preferences, 'enable_multi_step_planning', True),
         enable_proactive_suggestions=getattr(preferences, 'enable_proactive_suggestions', True),
         enable_scene_monitoring=getattr(preferences, 'enable_scene_monitoring', True),
         enable_auto_backup=getattr(preferences, 'enable_auto_backup', True),
         enable_caching=getattr(preferences, 'enable_caching', True),
         monitoring_interval=getattr(preferences, 'monitoring_interval', 2.0),
+        enable_frame_monitor=getattr(preferences, 'enable_frame_monitor', True),
         max_concurrent_requests=getattr(preferences, 'max_concurrent_requests', 3),
         max_suggestions=getattr(preferences, 'max_suggestions', 5),
         backup_interval=getattr(preferences, 'backup_interval', 300),
         max_backups=getattr(preferences, 'max_backups', 10),
-        analysis_cooldown=getattr(preferences, 'analysis_cooldown', 1.0)
+        analysis_cooldown=getattr(preferences, 'analysis_cooldown', 1.0),
+        code_execution_timeout=getattr(preferences, 'code_execution_timeout', 60.0),
+        code_execution_memory_limit=getattr(preferences, 'code_execution_memory_limit', 0),
+        screenshot_format=getattr(preferences, 'screenshot_format', 'JPEG'),
+        screenshot_max_dimension=getattr(preferences, 'screenshot_max_dimension', 2048),
+        screenshot_byte_budget_kb=getattr(preferences, 'screenshot_byte_budget_kb', 300),
+        vision_dedup_threshold=getattr(preferences, 'vision_dedup_threshold', 4),
+        vision_send_changed_tiles=getattr(preferences, 'vision_send_changed_tiles', True),
+        image_cache_mb=getattr(preferences, 'image_cache_mb', 64),
+        vision_roi_crops=getattr(preferences, 'vision_roi_crops', True),
+        vision_roi_overview=getattr(preferences, 'vision_roi_overview', True)
     )
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 from ..config.prompts import get_system_prompt, PromptType
 from ..utils.api_client import get_api_client, APIRequest
+from ..vision.scene_snapshot import snapshot_json_default
 
 @dataclass
 class ClarificationRequest:
@@ -49,7 +50,7 @@ class ClarificationSystem:
             # Get clarification prompt
             system_prompt = get_system_prompt(
                 PromptType.CLARIFICATION,
-                scene_context=json.dumps(context, indent=2),
+                scene_context=json.dumps(context, indent=2, default=snapshot_json_default),
                 user_request=user_input,
                 ambiguity_reason=ambiguity_reason
             )
@@ -83,7 +84,7 @@ class ClarificationSystem:
             
             return ClarificationResponse(
                 question=response.content,
-                context_provided=json.dumps(context, indent=2),
+                context_provided=json.dumps(context, indent=2, default=snapshot_json_default),
                 suggested_defaults={},
                 confidence=0.8
             )
@@ -131,7 +132,7 @@ class ClarificationSystem:
         
         return ClarificationResponse(
             question=question,
-            context_provided=json.dumps(context, indent=2),
+            context_provided=json.dumps(context, indent=2, default=snapshot_json_default),
             suggested_defaults={},
             confidence=0.6
         )
@@ -16,6 +16,8 @@ from ..utils.code_executor import get_code_executor
 from ..utils.backup_manager import get_backup_manager
 from ..utils.file_manager import get_file_manager
 from ..utils.input_validator import get_input_validator, ValidationSeverity
+from ..utils.view_model import get_view_model
+from ..vision.scene_snapshot import snapshot_json_default
 
 from .task_classifier import get_task_classifier, TaskType
 from .clarification_system import get_clarification_system
@@ -71,6 +73,7 @@ class InteractionEngine:
                               issues=validation_result.issues)
 
         self._processing = True
+        get_view_model().publish_system_status(processing=True)
 
         try:
             # Get scene context if not provided
@@ -105,6 +108,7 @@ class InteractionEngine:
             return {"error": f"Processing error: {str(e)}"}
         finally:
             self._processing = False
+            get_view_model().publish_system_status(processing=False)
     
     def _handle_question(
         self, 
@@ -208,7 +212,7 @@ Please provide a helpful answer based on the current scene and conversation cont
         system_prompt = get_system_prompt(
             PromptType.CODE_GENERATOR,
             task_description=user_input,
-            scene_context=json.dumps(context, indent=2),
+            scene_context=json.dumps(context, indent=2, default=snapshot_json_default),
             requirements="Generate safe, efficient Python code for Blender"
         )
         
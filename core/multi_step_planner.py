@@ -12,6 +12,7 @@ from ..config.prompts import get_system_prompt, PromptType
 from ..config.settings import get_settings
 from ..utils.api_client import get_api_client, APIRequest
 from ..utils.logger import get_logger
+from ..vision.scene_snapshot import snapshot_json_default
 
 class ActionType(Enum):
     """Types of actions in a plan step"""
@@ -68,7 +69,7 @@ class MultiStepPlanner:
             system_prompt = get_system_prompt(
                 PromptType.MULTI_STEP_PLANNER,
                 user_task=user_task,
-                scene_context=json.dumps(context, indent=2)
+                scene_context=json.dumps(context, indent=2, default=snapshot_json_default)
             )
             
             messages = [
@@ -256,7 +257,7 @@ class MultiStepPlanner:
         code_prompt = get_system_prompt(
             PromptType.CODE_GENERATOR,
             task_description=step.description,
-            scene_context=json.dumps(context or {}, indent=2),
+            scene_context=json.dumps(context or {}, indent=2, default=snapshot_json_default),
             requirements=f"Expected outcome: {step.expected_outcome}"
         )
         
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from ..config.prompts import get_system_prompt, PromptType
 from ..config.settings import get_settings
 from ..utils.api_client import get_api_client, APIRequest
+from ..vision.scene_snapshot import snapshot_json_default
 
 class TaskType(Enum):
     """Types of user tasks"""
@@ -51,7 +52,7 @@ class TaskClassifier:
             # Add context information if available
             context_info = ""
             if context:
-                context_info = f"\nScene context: {json.dumps(context, indent=2)}"
+                context_info = f"\nScene context: {json.dumps(context, indent=2, default=snapshot_json_default)}"
             
             messages = [
                 {"role": "system", "content": system_prompt},
@@ -161,7 +162,7 @@ class TaskClassifier:
             "context": context or {}
         }
         
-        cache_string = json.dumps(cache_data, sort_keys=True)
+        cache_string = json.dumps(cache_data, sort_keys=True, default=snapshot_json_default)
         return hashlib.md5(cache_string.encode()).hexdigest()
     
     def is_question(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> bool:
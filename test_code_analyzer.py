@@ -0,0 +1,53 @@
+"""
+Test script for the shared code analyzer
+Checks that code the compiler rejects is reported as unsafe instead of raising
+"""
+
+from utils.code_analyzer import analyze_code
+
+def test_compile_only_errors():
+    """Module-level return, break and await parse but do not compile"""
+
+    print("=== Testing Compile-Only Syntax Errors ===")
+
+    for code in ("return 1", "break", "await x"):
+        analysis = analyze_code(code)
+        print(f"{code!r}: is_safe={analysis.is_safe} errors={analysis.errors}")
+        if analysis.is_safe or analysis.code_object is not None or not analysis.syntax_error:
+            return False
+    return True
+
+def test_valid_code():
+    """Plain code still compiles once"""
+
+    print("=== Testing Valid Code ===")
+
+    analysis = analyze_code("value = 1 + 1\n")
+    return analysis.is_safe and analysis.code_object is not None
+
+def run_all_tests():
+    """Run all code analyzer tests"""
+
+    tests = [
+        ("Compile-only syntax errors", test_compile_only_errors),
+        ("Valid code", test_valid_code)
+    ]
+
+    passed = 0
+    for name, test in tests:
+        try:
+            if test():
+                print(f"✓ {name}")
+                passed += 1
+            else:
+                print(f"✗ {name}")
+        except Exception as e:
+            print(f"✗ {name}: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+if __name__ == "__main__":
+    print("=== BlendPro Code Analyzer Test ===")
+    run_all_tests()
+    print("\n=== Test Complete ===")
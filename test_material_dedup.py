@@ -0,0 +1,105 @@
+"""
+Test script for material deduplication digests
+Checks that node trees wired differently never share a digest
+"""
+
+from types import SimpleNamespace
+
+from workflow.material_dedup import node_tree_digest
+
+def make_node(name, node_type, inputs=(), outputs=(), **settings):
+    """Stand-in node with unlinked input values and no extra RNA settings"""
+    node = SimpleNamespace(
+        name=name, type=node_type, bl_idname=f"ShaderNode{node_type.title()}", mute=False,
+        bl_rna=SimpleNamespace(properties=[]), outputs=[SimpleNamespace(identifier=o) for o in outputs],
+        inputs=[SimpleNamespace(identifier=identifier, enabled=True, is_linked=False, default_value=value)
+                for identifier, value in inputs],
+        **settings
+    )
+    return node
+
+def make_tree(swap_mix_inputs):
+    """V(0.5) -> Math A, V(0.7) -> Math B, A and B into Mix (optionally swapped) -> Output"""
+
+    nodes = {
+        "V1": make_node("V1", "VALUE", outputs=["Value"]),
+        "V2": make_node("V2", "VALUE", outputs=["Value"]),
+        "MathA": make_node("MathA", "MATH", inputs=[("Value", 0.0)], outputs=["Value"]),
+        "MathB": make_node("MathB", "MATH", inputs=[("Value", 0.0)], outputs=["Value"]),
+        "Mix": make_node("Mix", "MIX", inputs=[("A", 0.0), ("B", 0.0)], outputs=["Result"]),
+        "Output": make_node("Output", "OUTPUT_MATERIAL", inputs=[("Surface", None)], is_active_output=True)
+    }
+    # Value nodes differ only in their output value, stored as a node setting
+    nodes["V1"].bl_rna = SimpleNamespace(properties=[SimpleNamespace(identifier="value", type='FLOAT')])
+    nodes["V2"].bl_rna = nodes["V1"].bl_rna
+    nodes["V1"].value = 0.5
+    nodes["V2"].value = 0.7
+
+    mix_a, mix_b = ("B", "A") if swap_mix_inputs else ("A", "B")
+    wiring = [
+        ("V1", "Value", "MathA", "Value"),
+        ("V2", "Value", "MathB", "Value"),
+        ("MathA", "Value", "Mix", mix_a),
+        ("MathB", "Value", "Mix", mix_b),
+        ("Mix", "Result", "Output", "Surface")
+    ]
+
+    links = []
+    for from_name, from_socket, to_name, to_socket in wiring:
+        to_node = nodes[to_name]
+        socket = next(s for s in to_node.inputs if s.identifier == to_socket)
+        socket.is_linked = True
+        links.append(SimpleNamespace(
+            is_valid=True, is_muted=False,
+            from_node=nodes[from_name], from_socket=SimpleNamespace(identifier=from_socket),
+            to_node=to_node, to_socket=socket
+        ))
+    return SimpleNamespace(nodes=list(nodes.values()), links=links)
+
+def test_swapped_inputs():
+    """Identical nodes wired into swapped sockets render differently"""
+
+    print("=== Testing Swapped Inputs ===")
+
+    straight = node_tree_digest(make_tree(False))
+    swapped = node_tree_digest(make_tree(True))
+    print(f"straight={straight} swapped={swapped}")
+    return straight != swapped
+
+def test_identical_trees():
+    """The same wiring with different node names still matches"""
+
+    print("=== Testing Identical Trees ===")
+
+    first = make_tree(False)
+    second = make_tree(False)
+    for node in second.nodes:
+        node.name = f"{node.name}.001"
+    return node_tree_digest(first) == node_tree_digest(second)
+
+def run_all_tests():
+    """Run all material digest tests"""
+
+    tests = [
+        ("Swapped inputs", test_swapped_inputs),
+        ("Identical trees", test_identical_trees)
+    ]
+
+    passed = 0
+    for name, test in tests:
+        try:
+            if test():
+                print(f"✓ {name}")
+                passed += 1
+            else:
+                print(f"✗ {name}")
+        except Exception as e:
+            print(f"✗ {name}: {e}")
+
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+if __name__ == "__main__":
+    print("=== BlendPro Material Dedup Test ===")
+    run_all_tests()
+    print("\n=== Test Complete ===")
@@ -312,6 +312,10 @@ class BLENDPRO_OT_ExecuteCode(bpy.types.Operator):
                 print(result["output"])
         else:
             error_msg = result.get("error", "Unknown error")
+            if result.get("aborted"):
+                print(result.get("profile_summary", error_msg))
+            if result.get("reload_scheduled"):
+                self.report({'WARNING'}, f"Undo failed; reopening backup {result['backup_path']} (your saved file is unchanged)")
             self.report({'ERROR'}, f"Code execution failed: {error_msg}")
             return {'CANCELLED'}
         
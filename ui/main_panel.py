@@ -7,10 +7,9 @@ import bpy
 from typing import Dict, Any, Optional
 
 from ..config.settings import get_settings
-from ..core.interaction_engine import get_interaction_engine
 from ..workflow.scene_monitor import get_scene_health_monitor
 from ..workflow.proactive_suggestions import get_proactive_suggestions
-from ..utils.api_client import get_api_client
+from ..utils.view_model import get_view_model
 
 class BLENDPRO_PT_MainPanel(bpy.types.Panel):
     """Main BlendPro panel in 3D viewport"""
@@ -195,71 +194,72 @@ class BLENDPRO_PT_MainPanel(bpy.types.Panel):
         box = layout.box()
         box.label(text="Scene Health", icon='HEART')
         
-        # Monitoring status
-        monitor = get_scene_health_monitor()
-        status = monitor.get_monitoring_status()
+        # Monitoring status (published by the scene monitor)
+        snapshot = get_view_model().snapshot
         
         row = box.row()
-        if status["active"]:
+        if snapshot.monitoring_active:
             row.label(text="Monitoring: Active", icon='REC')
         else:
             row.label(text="Monitoring: Inactive", icon='PAUSE')
         
         # Recent suggestions
-        suggestions = monitor.get_recent_suggestions(limit=2)
-        if suggestions:
-            for suggestion in suggestions:
-                suggestion_row = box.row()
-                suggestion_row.alert = suggestion.get("type") == "health_alert"
-                suggestion_row.label(text=suggestion.get("message", "")[:40] + "...", icon='INFO')
+        for alert_view in snapshot.health_alerts:
+            suggestion_row = box.row()
+            suggestion_row.alert = alert_view.alert
+            suggestion_row.label(text=alert_view.text, icon='INFO')
         
         # Clear suggestions button
-        if suggestions:
+        if snapshot.health_alerts:
             box.operator("blendpro.clear_suggestions", text="Clear", icon='X')
+        
+        # Expensive modifier stacks (measured by the modifier profiler)
+        if snapshot.modifier_stacks:
+            stacks_col = box.column(align=True)
+            stacks_col.label(text="Slowest Modifier Stacks:", icon='MODIFIER')
+            for stack_view in snapshot.modifier_stacks:
+                stack_row = stacks_col.row()
+                stack_row.alert = stack_view.alert
+                stack_row.label(text=stack_view.text)
+                if stack_view.suggestion:
+                    hint_row = stacks_col.row()
+                    hint_row.scale_y = 0.8
+                    hint_row.label(text=stack_view.suggestion, icon='BLANK1')
+        
+        box.operator("blendpro.profile_modifiers", text="Profile Modifiers", icon='TIME')
     
     def _draw_proactive_suggestions(self, layout, context):
         """Draw proactive suggestions"""
         box = layout.box()
         box.label(text="Suggestions", icon='OUTLINER_OB_LIGHT')
         
-        # Get active suggestions
-        proactive = get_proactive_suggestions()
-        active_suggestions = proactive.get_active_suggestions()
+        # Top suggestions, prebuilt by the suggestion system
+        suggestions = get_view_model().snapshot.suggestions
         
-        if active_suggestions:
-            # Show top 2 suggestions
-            for suggestion in active_suggestions[:2]:
+        if suggestions:
+            for suggestion in suggestions:
                 suggestion_box = box.box()
                 
                 # Title and priority
                 title_row = suggestion_box.row()
-                priority = suggestion.get("priority", 5)
-                
-                if priority >= 8:
-                    title_row.alert = True
-                    icon = 'ERROR'
-                elif priority >= 6:
-                    icon = 'INFO'
-                else:
-                    icon = 'QUESTION'
-                
-                title_row.label(text=suggestion.get("title", ""), icon=icon)
+                title_row.alert = suggestion.alert
+                title_row.label(text=suggestion.title, icon=suggestion.icon)
                 
                 # Description
                 desc_row = suggestion_box.row()
-                desc_row.label(text=suggestion.get("description", "")[:60] + "...")
+                desc_row.label(text=suggestion.description)
                 
                 # Action buttons
-                if suggestion.get("actionable", False):
+                if suggestion.actionable:
                     action_row = suggestion_box.row(align=True)
                     
                     # Execute action button
                     execute_op = action_row.operator("blendpro.execute_suggestion", text="Apply", icon='CHECKMARK')
-                    execute_op.suggestion_id = suggestion.get("id", "")
+                    execute_op.suggestion_id = suggestion.id
                     
                     # Dismiss button
                     dismiss_op = action_row.operator("blendpro.dismiss_suggestion", text="Dismiss", icon='X')
-                    dismiss_op.suggestion_id = suggestion.get("id", "")
+                    dismiss_op.suggestion_id = suggestion.id
         else:
             box.label(text="No active suggestions", icon='CHECKMARK')
     
@@ -268,18 +268,15 @@ class BLENDPRO_PT_MainPanel(bpy.types.Panel):
         box = layout.box()
         box.label(text="System Status", icon='SYSTEM')
         
-        # API Status
-        api_client = get_api_client()
-        cache_stats = api_client.get_cache_stats()
+        snapshot = get_view_model().snapshot
         
+        # API Status
         row = box.row()
-        row.label(text=f"Cached Requests: {cache_stats.get('cached_requests', 0)}")
+        row.label(text=f"Cached Requests: {snapshot.cached_requests}")
         
         # Interaction Engine Status
-        engine = get_interaction_engine()
-        
         row = box.row()
-        if hasattr(engine, '_processing') and engine._processing:
+        if snapshot.processing:
             row.label(text="Status: Processing", icon='TIME')
         else:
             row.label(text="Status: Ready", icon='CHECKMARK')
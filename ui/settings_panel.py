@@ -11,6 +11,13 @@ from ..config.settings import get_settings
 from ..config.models import get_model_choices, get_vision_model_choices
 from ..utils.api_client import get_api_client
 
+def _update_frame_monitor(self, context):
+    """Apply the frame monitor toggle immediately"""
+    from ..config.settings import get_settings
+    from ..workflow.frame_monitor import set_frame_monitoring
+    get_settings().update(enable_frame_monitor=self.enable_frame_monitor)
+    set_frame_monitoring(self.enable_frame_monitor)
+
 class BLENDPROAddonPreferences(AddonPreferences):
     """BlendPro addon preferences"""
     bl_idname = __package__.split('.')[0]  # Get main package name
@@ -86,6 +93,12 @@ class BLENDPROAddonPreferences(AddonPreferences):
         default=True
     )
     
+    enable_vision_routing: BoolProperty(
+        name="Route Vision Queries",
+        description="Answer from scene data first and capture the viewport only when a query needs it",
+        default=True
+    )
+    
     enable_multi_step_planning: BoolProperty(
         name="Enable Multi-Step Planning",
         description="Break complex tasks into multiple steps",
@@ -104,6 +117,13 @@ class BLENDPROAddonPreferences(AddonPreferences):
         default=True
     )
     
+    enable_frame_monitor: BoolProperty(
+        name="Enable Frame Time Monitor",
+        description="Time viewport draws and suggest a cause when they slow down",
+        default=True,
+        update=_update_frame_monitor
+    )
+    
     enable_auto_backup: BoolProperty(
         name="Enable Auto Backup",
         description="Automatically backup scene before code execution",
@@ -165,6 +185,83 @@ class BLENDPROAddonPreferences(AddonPreferences):
         max=10.0
     )
     
+    code_execution_timeout: FloatProperty(
+        name="Execution Timeout",
+        description="Seconds generated code may run before it is stopped and rolled back (0 disables)",
+        default=60.0,
+        min=0.0,
+        max=600.0
+    )
+    
+    code_execution_memory_limit: IntProperty(
+        name="Memory Limit (MB)",
+        description="Memory growth allowed while generated code runs before it is stopped (0 disables)",
+        default=0,
+        min=0,
+        max=65536
+    )
+    
+    screenshot_format: EnumProperty(
+        name="Screenshot Format",
+        description="Image format sent to the vision model",
+        items=[
+            ('JPEG', "JPEG", "Small lossy payloads (recommended)"),
+            ('WEBP', "WebP", "Smallest payloads, slower to encode"),
+            ('PNG', "PNG", "Lossless, largest payloads")
+        ],
+        default='JPEG'
+    )
+    
+    screenshot_max_dimension: IntProperty(
+        name="Max Dimension",
+        description="Longest side of screenshots sent to the vision model",
+        default=2048,
+        min=256,
+        max=4096
+    )
+    
+    screenshot_byte_budget_kb: IntProperty(
+        name="Size Budget (KB)",
+        description="Lower encoding quality until screenshots fit this size (0 disables)",
+        default=300,
+        min=0,
+        max=4096
+    )
+    
+    vision_dedup_threshold: IntProperty(
+        name="Frame Match Threshold",
+        description="Maximum perceptual hash distance (bits of 64) for reusing a previous vision analysis",
+        default=4,
+        min=0,
+        max=32
+    )
+    
+    vision_send_changed_tiles: BoolProperty(
+        name="Send Changed Regions Only",
+        description="When the viewport changed only partly, upload just the changed regions",
+        default=True
+    )
+    
+    image_cache_mb: IntProperty(
+        name="Image Cache (MB)",
+        description="Memory budget for cached encoded screenshots",
+        default=64,
+        min=8,
+        max=1024
+    )
+    
+    vision_roi_crops: BoolProperty(
+        name="Crop to Mentioned Objects",
+        description="For questions about specific objects, send a close-up of those objects instead of the whole viewport",
+        default=True
+    )
+    
+    vision_roi_overview: BoolProperty(
+        name="Include Overview",
+        description="Send a low-resolution full viewport alongside object close-ups",
+        default=True
+    )
+    
     def draw(self, context):
         """Draw preferences interface"""
         layout = self.layout
@@ -234,9 +331,11 @@ class BLENDPROAddonPreferences(AddonPreferences):
         # Core features
         col = box.column()
         col.prop(self, "enable_vision_context")
+        col.prop(self, "enable_vision_routing")
         col.prop(self, "enable_multi_step_planning")
         col.prop(self, "enable_proactive_suggestions")
         col.prop(self, "enable_scene_monitoring")
+        col.prop(self, "enable_frame_monitor")
         col.prop(self, "enable_auto_backup")
         col.prop(self, "enable_caching")
     
@@ -268,6 +367,30 @@ class BLENDPROAddonPreferences(AddonPreferences):
         row = backup_box.row()
         row.prop(self, "backup_interval")
         row.prop(self, "max_backups")
+        
+        # Code execution limits
+        execution_box = box.box()
+        execution_box.label(text="Code Execution", icon='SCRIPT')
+        
+        row = execution_box.row()
+        row.prop(self, "code_execution_timeout")
+        row.prop(self, "code_execution_memory_limit")
+        
+        # Screenshot encoding
+        screenshot_box = box.box()
+        screenshot_box.label(text="Screenshots", icon='IMAGE_DATA')
+        
+        screenshot_box.prop(self, "screenshot_format")
+        row = screenshot_box.row()
+        row.prop(self, "screenshot_max_dimension")
+        row.prop(self, "screenshot_byte_budget_kb")
+        row = screenshot_box.row()
+        row.prop(self, "vision_dedup_threshold")
+        row.prop(self, "vision_send_changed_tiles")
+        screenshot_box.prop(self, "image_cache_mb")
+        row = screenshot_box.row()
+        row.prop(self, "vision_roi_crops")
+        row.prop(self, "vision_roi_overview")
     
     def _draw_system_status(self, layout):
         """Draw system status information"""
@@ -288,6 +411,46 @@ class BLENDPROAddonPreferences(AddonPreferences):
         cache_row = box.row()
         cache_row.label(text=f"Cached Requests: {cache_stats.get('cached_requests', 0)}")
         
+        # Image cache memory
+        from ..vision.image_cache import get_image_cache
+        image_stats = get_image_cache().get_stats()
+        image_row = box.row()
+        image_row.label(
+            text=f"Image Cache: {image_stats['bytes_used'] / (1024 * 1024):.1f} / "
+                 f"{image_stats['max_bytes'] / (1024 * 1024):.0f} MB ({image_stats['cached_images']} images)"
+        )
+        
+        # Vision frame reuse
+        from ..vision.frame_dedup import get_frame_deduplicator
+        dedup_stats = get_frame_deduplicator().get_stats()
+        dedup_row = box.row()
+        dedup_row.label(
+            text=f"Vision Reuse: {dedup_stats['hit_rate']:.0%} hits, "
+                 f"{dedup_stats['bytes_saved'] / 1024:.0f} KB saved"
+        )
+        
+        # Text-first vision routing
+        from ..vision.vision_router import get_vision_router
+        routing_stats = get_vision_router().get_stats()
+        routing_row = box.row()
+        routing_row.label(
+            text=f"Vision Routing: {routing_stats['text_rate']:.0%} text-only, "
+                 f"~{routing_stats['image_tokens_saved']} image tokens, "
+                 f"{routing_stats['seconds_saved']:.1f}s saved"
+        )
+        
+        # Viewport frame time
+        from ..workflow.frame_monitor import get_frame_time_monitor
+        frame_stats = get_frame_time_monitor().get_stats()
+        frame_row = box.row()
+        if frame_stats["active"]:
+            frame_row.label(
+                text=f"Viewport Draw: {frame_stats['median_ms']:.1f} ms median, "
+                     f"{len(frame_stats['regressions'])} regressions"
+            )
+        else:
+            frame_row.label(text="Viewport Draw: Not Monitored")
+        
         # System actions
         actions_row = box.row(align=True)
         actions_row.operator("blendpro.clear_cache", text="Clear Cache", icon='TRASH')
@@ -329,6 +492,7 @@ class BLENDPRO_PT_SettingsPanel(bpy.types.Panel):
         col.prop(addon_prefs, "enable_multi_step_planning", text="Multi-Step Planning")
         col.prop(addon_prefs, "enable_proactive_suggestions", text="Suggestions")
         col.prop(addon_prefs, "enable_scene_monitoring", text="Scene Monitoring")
+        col.prop(addon_prefs, "enable_frame_monitor", text="Frame Time Monitor")
 
 # Settings-related operators
 class BLENDPRO_OT_InitializeAI(bpy.types.Operator):
@@ -426,6 +590,29 @@ class BLENDPRO_OT_ClearCache(bpy.types.Operator):
         
         get_scene_analyzer().clear_cache()
         
+        from ..vision.frame_dedup import get_frame_deduplicator
+        from ..vision.image_cache import get_image_cache
+        get_frame_deduplicator().clear()
+        get_image_cache().clear()
+        
+        from ..vision.vision_router import get_vision_router
+        get_vision_router().clear_answers()
+        
+        from ..workflow.render_cost import get_render_cost_estimator
+        get_render_cost_estimator().clear_cache()
+        
+        from ..workflow.geometry_dedup import get_geometry_deduplicator
+        get_geometry_deduplicator().clear_cache()
+        
+        from ..workflow.material_dedup import get_material_deduplicator
+        get_material_deduplicator().clear_cache()
+        
+        from ..workflow.texture_analyzer import get_texture_analyzer
+        get_texture_analyzer().clear_cache()
+        
+        from ..workflow.modifier_profiler import get_modifier_profiler
+        get_modifier_profiler().clear_cache()
+        
         self.report({'INFO'}, "All caches cleared")
         return {'FINISHED'}
 
@@ -451,12 +638,24 @@ class BLENDPRO_OT_ResetSettings(bpy.types.Operator):
         addon_prefs.backup_interval = 300
         addon_prefs.max_backups = 10
         addon_prefs.analysis_cooldown = 1.0
+        addon_prefs.code_execution_timeout = 60.0
+        addon_prefs.code_execution_memory_limit = 0
+        addon_prefs.screenshot_format = 'JPEG'
+        addon_prefs.screenshot_max_dimension = 2048
+        addon_prefs.screenshot_byte_budget_kb = 300
+        addon_prefs.vision_dedup_threshold = 4
+        addon_prefs.vision_send_changed_tiles = True
+        addon_prefs.image_cache_mb = 64
+        addon_prefs.vision_roi_crops = True
+        addon_prefs.vision_roi_overview = True
         
         # Reset feature toggles
         addon_prefs.enable_vision_context = True
+        addon_prefs.enable_vision_routing = True
         addon_prefs.enable_multi_step_planning = True
         addon_prefs.enable_proactive_suggestions = True
         addon_prefs.enable_scene_monitoring = True
+        addon_prefs.enable_frame_monitor = True
         addon_prefs.enable_auto_backup = True
         addon_prefs.enable_caching = True
         
@@ -5,7 +5,9 @@ Common utility functions and classes
 
 from .api_client import APIClient, APIError
 from .backup_manager import BackupManager, BackupError
-from .code_executor import CodeExecutor, CodeExecutionError
+from .code_executor import CodeExecutor, CodeExecutionError, BatchJob
+from .code_analyzer import CodeAnalyzer, CodeAnalysis, get_code_analyzer
+from .execution_watchdog import ExecutionWatchdog, ExecutionAborted
 from .file_manager import FileManager, init_props, clear_props
 from .dependency_loader import (
     DependencyLoader, DependencyError, get_dependency_loader,
@@ -19,6 +21,12 @@ __all__ = [
     'BackupError',
     'CodeExecutor',
     'CodeExecutionError',
+    'BatchJob',
+    'CodeAnalyzer',
+    'CodeAnalysis',
+    'get_code_analyzer',
+    'ExecutionWatchdog',
+    'ExecutionAborted',
     'FileManager',
     'init_props',
     'clear_props',
@@ -13,6 +13,7 @@ from ..config.settings import get_settings
 from ..config.models import get_model_config
 from .dependency_loader import require_package, DependencyError
 from .logger import get_logger, log_api_request, log_error_with_context
+from .view_model import get_view_model
 
 # Import OpenAI with dependency management
 try:
@@ -183,6 +184,7 @@ class APIClient:
                 # Cache successful response
                 if cache_key:
                     self._request_cache[cache_key] = api_response
+                    get_view_model().publish_system_status(cached_requests=len(self._request_cache))
 
                 return api_response
                 
@@ -249,6 +251,7 @@ class APIClient:
     def clear_cache(self) -> None:
         """Clear the request cache"""
         self._request_cache.clear()
+        get_view_model().publish_system_status(cached_requests=0)
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
@@ -0,0 +1,317 @@
+"""
+Code Analyzer for BlendPro: AI Co-Pilot
+Single-pass AST security analysis shared by all code validators
+"""
+
+import ast
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import CodeType
+from typing import Dict, List, Any, Optional, Tuple, FrozenSet
+
+# Built-in names that are flagged when referenced anywhere in the code
+DANGEROUS_BUILTINS = frozenset({
+    'exec', 'eval', 'compile', '__import__', 'open', 'file',
+    'input', 'raw_input', 'reload', 'vars', 'globals', 'locals',
+    'dir', 'hasattr', 'getattr', 'setattr', 'delattr'
+})
+
+# Built-ins that make code unsafe to execute
+BLOCKED_BUILTINS = frozenset({'exec', 'eval'})
+
+# Modules whose import is flagged
+DANGEROUS_MODULES = frozenset({
+    'os', 'sys', 'subprocess', 'shutil', 'pickle', 'marshal',
+    'imp', 'importlib', 'socket', 'urllib', 'http', 'ftplib',
+    'smtplib', 'telnetlib', 'webbrowser'
+})
+
+# Resolved call targets that spawn processes or kill Blender (blocked)
+BLOCKED_CALL_PREFIXES = (
+    'os.system', 'os.popen', 'os.exec', 'os.spawn', 'os.fork', 'os.kill',
+    'subprocess.', 'pty.', 'bpy.ops.wm.quit_blender'
+)
+
+# Call names reported as file operations
+FILE_OPERATIONS = ('open', 'file', 'read', 'write', 'remove', 'delete')
+
+# Substrings of imports/attribute chains reported as network access
+NETWORK_PATTERNS = ('urllib', 'requests', 'socket', 'http', 'ftp')
+
+# Categorised threat prefixes matched against resolved attribute chains and calls
+SECURITY_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    'code_injection': ('exec(', 'eval(', '__import__(', 'compile(', 'globals()', 'locals()'),
+    'file_access': ('open(', 'file(', '.read(', '.write(', 'os.system', 'subprocess.', 'shutil.'),
+    'network_access': ('urllib.', 'requests.', 'socket.', 'http.', 'ftplib.', 'smtplib.'),
+    'system_access': ('os.environ', 'sys.exit', 'sys.path', 'importlib.', '__builtins__', 'bpy.ops.wm.')
+}
+
+_CONTROL_NODES = (ast.If, ast.For, ast.While, ast.Try, ast.ExceptHandler, ast.With)
+_BRACKET_NODES = (ast.Call, ast.List, ast.Dict, ast.Subscript, ast.Tuple, ast.ListComp, ast.DictComp)
+_BASE64_LIKE = re.compile(r'[A-Za-z0-9+/]{20,}={0,2}')
+_HEX_ESCAPE = re.compile(r'\\x[0-9a-fA-F]{2}')
+
+@dataclass(frozen=True)
+class CodeAnalysis:
+    """Unified result of analysing a code string"""
+    code_hash: str
+    is_safe: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    syntax_error: Optional[str] = None
+    code_object: Optional[CodeType] = None
+    imports: FrozenSet[str] = frozenset()
+    names: FrozenSet[str] = frozenset()
+    calls: FrozenSet[str] = frozenset()
+    attribute_chains: FrozenSet[str] = frozenset()
+    string_literals: Tuple[str, ...] = ()
+    threats: Tuple[Tuple[str, str], ...] = ()
+    complexity: int = 0
+    obfuscated: bool = False
+
+class _SecurityVisitor(ast.NodeVisitor):
+    """Collects imports, names, calls, attribute chains and literals in one walk"""
+
+    def __init__(self):
+        self.aliases: Dict[str, str] = {}
+        self.imports: set = set()
+        self.names: set = set()
+        self.calls: set = set()
+        self.call_names: set = set()
+        self.chains: set = set()
+        self.literals: List[str] = []
+        self.complexity = 0
+
+    def resolve(self, node: ast.AST) -> Optional[str]:
+        """Resolve a Name/Attribute chain to a dotted path, following import aliases"""
+        if isinstance(node, ast.Name):
+            return self.aliases.get(node.id, node.id)
+        if isinstance(node, ast.Attribute):
+            base = self.resolve(node.value)
+            return f"{base}.{node.attr}" if base else None
+        return None
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if isinstance(node, _CONTROL_NODES):
+            self.complexity += 1
+        elif isinstance(node, _BRACKET_NODES):
+            self.complexity += 1
+        super().generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.complexity += 1
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.add(alias.name)
+            if alias.asname:
+                self.aliases[alias.asname] = alias.name
+            else:
+                root = alias.name.split('.')[0]
+                self.aliases[root] = root
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        self.imports.add(module)
+        for alias in node.names:
+            if alias.name != '*':
+                self.aliases[alias.asname or alias.name] = f"{module}.{alias.name}" if module else alias.name
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.names.add(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        chain = self.resolve(node)
+        if chain:
+            self.chains.add(chain)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        chain = self.resolve(node.func)
+        if chain:
+            self.calls.add(chain)
+        if isinstance(node.func, ast.Name):
+            self.call_names.add(node.func.id)
+        elif isinstance(node.func, ast.Attribute):
+            self.call_names.add(node.func.attr)
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            self.literals.append(node.value)
+
+class CodeAnalyzer:
+    """Parses code once, walks the AST once and caches verdicts by code hash"""
+
+    def __init__(self, max_cache_size: int = 256):
+        self._cache: "OrderedDict[str, CodeAnalysis]" = OrderedDict()
+        self._max_cache_size = max_cache_size
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def analyze(self, code: str) -> CodeAnalysis:
+        """Analyze code, returning a cached verdict when the code was seen before"""
+
+        code_hash = hashlib.sha256((code or "").encode('utf-8')).hexdigest()
+
+        with self._lock:
+            cached = self._cache.get(code_hash)
+            if cached is not None:
+                self._cache.move_to_end(code_hash)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        analysis = self._analyze_uncached(code, code_hash)
+
+        with self._lock:
+            self._cache[code_hash] = analysis
+            if len(self._cache) > self._max_cache_size:
+                self._cache.popitem(last=False)
+
+        return analysis
+
+    def _analyze_uncached(self, code: str, code_hash: str) -> CodeAnalysis:
+        """Run the single parse/walk/compile pass"""
+
+        if not code or not code.strip():
+            return CodeAnalysis(code_hash=code_hash, is_safe=False,
+                                errors=("Code cannot be empty",), warnings=())
+
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            return CodeAnalysis(code_hash=code_hash, is_safe=False,
+                                errors=(f"Syntax error: {e}",), warnings=(),
+                                syntax_error=str(e))
+
+        visitor = _SecurityVisitor()
+        visitor.visit(tree)
+
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        for name in sorted(visitor.names & DANGEROUS_BUILTINS):
+            message = f"Dangerous keyword detected: {name}"
+            (errors if name in BLOCKED_BUILTINS else warnings).append(message)
+
+        for module in sorted(visitor.imports):
+            if module.split('.')[0] in DANGEROUS_MODULES:
+                warnings.append(f"Dangerous module import: {module}")
+
+        for call in sorted(visitor.calls):
+            if call.startswith(BLOCKED_CALL_PREFIXES):
+                errors.append(f"Process or application control detected: {call}")
+
+        for op in FILE_OPERATIONS:
+            if op in visitor.call_names:
+                warnings.append(f"File operation detected: {op}")
+
+        lowered_refs = [ref.lower() for ref in visitor.imports | visitor.chains]
+        for pattern in NETWORK_PATTERNS:
+            if any(pattern in ref for ref in lowered_refs):
+                warnings.append(f"Network operation detected: {pattern}")
+
+        roots = {chain.split('.')[0] for chain in visitor.chains}
+        if 'bpy' in roots and 'bpy' not in visitor.imports:
+            warnings.append("Code uses bpy but doesn't import it")
+
+        threats = self._collect_threats(visitor)
+        complexity = visitor.complexity + code.count('\n') + 1
+        obfuscated = self._detect_obfuscation(code, visitor.literals)
+
+        # ast.parse accepts module-level return/break/await that only compile rejects
+        code_object = None
+        syntax_error = None
+        if not errors:
+            try:
+                code_object = compile(tree, '<string>', 'exec')
+            except SyntaxError as e:
+                syntax_error = str(e)
+                errors.append(f"Syntax error: {e}")
+
+        return CodeAnalysis(
+            code_hash=code_hash,
+            is_safe=not errors,
+            errors=tuple(errors),
+            warnings=tuple(warnings),
+            syntax_error=syntax_error,
+            code_object=code_object,
+            imports=frozenset(visitor.imports),
+            names=frozenset(visitor.names),
+            calls=frozenset(visitor.calls),
+            attribute_chains=frozenset(visitor.chains),
+            string_literals=tuple(visitor.literals),
+            threats=tuple(threats),
+            complexity=complexity,
+            obfuscated=obfuscated
+        )
+
+    def _collect_threats(self, visitor: _SecurityVisitor) -> List[Tuple[str, str]]:
+        """Categorise resolved references using SECURITY_PATTERNS"""
+
+        # Render references in the same shape as the patterns: calls end with "(",
+        # bare names and chains are left as-is
+        references = set(visitor.chains) | set(visitor.names)
+        references.update(f"{call}(" for call in visitor.calls)
+        references.update(f".{name}(" for name in visitor.call_names)
+        references.update(f"{name}()" for name in visitor.call_names)
+
+        threats = []
+        for category, patterns in SECURITY_PATTERNS.items():
+            for pattern in patterns:
+                if any(ref.startswith(pattern) or ref == pattern for ref in references):
+                    threats.append((category, pattern))
+        return threats
+
+    def _detect_obfuscation(self, code: str, literals: List[str]) -> bool:
+        """Detect potential obfuscation from literals and escape density"""
+
+        if len(literals) > 5 and code.count('+') > 20:
+            return True
+
+        if any(_BASE64_LIKE.search(literal) for literal in literals if len(literal) >= 20):
+            return True
+
+        if '\\x' in code and _HEX_ESCAPE.search(code):
+            return True
+
+        return code.count('\\') > len(code) * 0.1
+
+    def clear_cache(self) -> None:
+        """Clear cached verdicts"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self._hits + self._misses
+        return {
+            "cached_analyses": len(self._cache),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0
+        }
+
+# Global code analyzer instance
+_code_analyzer: Optional[CodeAnalyzer] = None
+
+def get_code_analyzer() -> CodeAnalyzer:
+    """Get global code analyzer instance"""
+    global _code_analyzer
+    if _code_analyzer is None:
+        _code_analyzer = CodeAnalyzer()
+    return _code_analyzer
+
+def analyze_code(code: str) -> CodeAnalysis:
+    """Convenience function to analyze code"""
+    return get_code_analyzer().analyze(code)
@@ -6,6 +6,9 @@ Safe execution of generated Python code in Blender
 import sys
 import traceback
 import time
+import fnmatch
+import functools
+from types import CodeType
 from typing import Dict, Any, Optional, List, Callable
 from contextlib import redirect_stdout, redirect_stderr
 from io import StringIO
@@ -14,7 +17,8 @@ import bpy
 from ..config.settings import get_settings
 from .backup_manager import get_backup_manager
 from .logger import get_logger, log_code_execution, log_error_with_context
-from .input_validator import get_input_validator, ValidationSeverity
+from .code_analyzer import get_code_analyzer
+from .execution_watchdog import ExecutionWatchdog, ExecutionAborted, format_hot_spots
 
 class CodeExecutionError(Exception):
     """Custom exception for code execution errors"""
@@ -33,6 +37,198 @@ class CodeExecutionError(Exception):
             return f"Code Execution Error [{self.error_type}]: {self.message}"
         return f"Code Execution Error: {self.message}"
 
+# Main-thread time spent per batch step (keeps the viewport interactive)
+BATCH_FRAME_BUDGET = 0.012  # seconds
+
+def resolve_batch_targets(context, mode: str = 'SELECTION', value: str = "") -> List[str]:
+    """Resolve a batch target set to object names (SELECTION, COLLECTION or PATTERN)"""
+    if mode == 'SELECTION':
+        return [obj.name for obj in context.selected_objects]
+    
+    if mode == 'COLLECTION':
+        collection = bpy.data.collections.get(value)
+        return [obj.name for obj in collection.all_objects] if collection else []
+    
+    if mode == 'PATTERN':
+        return [obj.name for obj in bpy.data.objects if fnmatch.fnmatchcase(obj.name, value or "*")]
+    
+    raise ValueError(f"Unknown batch target mode: {mode}")
+
+class BatchJob:
+    """Runs one compiled code object once per target, in time-budgeted chunks"""
+    
+    def __init__(
+        self,
+        executor: "CodeExecutor",
+        code_object: CodeType,
+        code: str,
+        targets: List[str],
+        variables_for: Optional[Callable[[str], Dict[str, Any]]] = None,
+        warnings: Optional[List[str]] = None,
+        stop_on_error: bool = False
+    ):
+        self.executor = executor
+        self.code_object = code_object
+        self.code = code
+        self.targets = list(targets)
+        self.variables_for = variables_for
+        self.warnings = list(warnings or [])
+        self.stop_on_error = stop_on_error
+        
+        self.results: List[Dict[str, Any]] = []
+        self.backup_path: Optional[str] = None
+        self.cancelled = False
+        self._index = 0
+        self._started = False
+        self._finished = False
+        self._start_time = 0.0
+        self._output = StringIO()
+        self._summary: Optional[Dict[str, Any]] = None
+        self._undo_checkpoint = False
+        self._abort: Optional[Dict[str, Any]] = None
+    
+    @property
+    def progress(self) -> float:
+        """Fraction of targets processed"""
+        return self._index / len(self.targets) if self.targets else 1.0
+    
+    @property
+    def processed(self) -> int:
+        """Number of targets processed so far"""
+        return self._index
+    
+    @property
+    def is_finished(self) -> bool:
+        """True once all targets ran, the job was cancelled or stopped on error"""
+        return self._finished
+    
+    def _begin(self) -> None:
+        """Create the single checkpoint for the whole batch"""
+        self._started = True
+        self._start_time = time.time()
+        
+        if self.executor.settings.enable_auto_backup:
+            try:
+                self.backup_path = self.executor.backup_manager.create_backup(force=True)
+            except Exception as e:
+                print(f"Warning: Failed to create backup before batch execution: {e}")
+        
+        if self.executor._create_watchdog().enabled:
+            self._undo_checkpoint = self.executor._push_undo_checkpoint()
+    
+    def _run_target(self, target_name: str) -> Dict[str, Any]:
+        """Execute the code object for a single target"""
+        obj = bpy.data.objects.get(target_name)
+        if obj is None:
+            return {"target": target_name, "success": False, "error": "Object no longer exists"}
+        
+        namespace = self.executor._create_safe_namespace()
+        namespace.update({"target": obj, "target_name": target_name})
+        if self.variables_for:
+            namespace.update(self.variables_for(target_name))
+        
+        try:
+            exec(self.code_object, namespace)
+            return {"target": target_name, "success": True}
+        except Exception as e:
+            return {
+                "target": target_name,
+                "success": False,
+                "error": str(e),
+                "traceback": traceback.format_exc()
+            }
+    
+    def step(self, time_budget: Optional[float] = BATCH_FRAME_BUDGET) -> bool:
+        """Process targets until the time budget is spent; returns True when finished"""
+        if self._finished:
+            return True
+        if not self._started:
+            self._begin()
+        
+        deadline = time.perf_counter() + time_budget if time_budget else None
+        watchdog = self.executor._create_watchdog()
+        index = self._index
+        
+        try:
+            with redirect_stdout(self._output), redirect_stderr(self._output), watchdog:
+                while self._index < len(self.targets):
+                    index = self._index
+                    # The timeout applies to each target, not to the whole batch
+                    watchdog.restart_clock()
+                    result = self._run_target(self.targets[index])
+                    self._index += 1
+                    self.results.append(result)
+                    
+                    if not result["success"] and self.stop_on_error:
+                        break
+                    
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+        except ExecutionAborted:
+            watchdog.disarm()
+            # The abort can land anywhere in the loop body; blame the target that was in flight
+            del self.results[index:]
+            self.results.append({"target": self.targets[index], "success": False, "error": watchdog.abort_reason})
+            self._index = index + 1
+            self._abort = self.executor._handle_abort(watchdog, self.code, self._undo_checkpoint, self.backup_path)
+        finally:
+            watchdog.disarm()
+        
+        stopped = self.stop_on_error and self.results and not self.results[-1]["success"]
+        if self._abort or stopped or self._index >= len(self.targets):
+            self._finish()
+        
+        return self._finished
+    
+    def cancel(self) -> Dict[str, Any]:
+        """Stop the batch, keeping results for targets already processed"""
+        self.cancelled = True
+        if not self._started:
+            self._start_time = time.time()
+        return self._finish()
+    
+    def run(self) -> Dict[str, Any]:
+        """Process every target without yielding"""
+        self.step(time_budget=None)
+        return self.get_summary()
+    
+    def _finish(self) -> Dict[str, Any]:
+        """Build the summary and record a single history entry"""
+        if self._finished:
+            return self._summary
+        self._finished = True
+        
+        failures = [result for result in self.results if not result["success"]]
+        execution_time = time.time() - self._start_time
+        
+        self._summary = {
+            "success": not failures and not self.cancelled,
+            "total": len(self.targets),
+            "processed": self._index,
+            "succeeded": len(self.results) - len(failures),
+            "failed": len(failures),
+            "failures": failures,
+            "results": self.results,
+            "cancelled": self.cancelled,
+            "output": self._output.getvalue(),
+            "error": f"{len(failures)} of {self._index} targets failed" if failures else "",
+            "warnings": self.warnings,
+            "execution_time": execution_time,
+            "backup_created": self.backup_path is not None,
+            "backup_path": self.backup_path
+        }
+        if self._abort:
+            self._summary.update(self._abort)
+        
+        log_code_execution(len(self.code), execution_time, self._summary["success"])
+        self.executor._add_to_history(self.code, self._summary)
+        
+        return self._summary
+    
+    def get_summary(self) -> Optional[Dict[str, Any]]:
+        """Get the batch summary once finished"""
+        return self._summary
+
 class CodeExecutor:
     """Handles safe execution of generated Python code"""
     
@@ -40,50 +236,29 @@ class CodeExecutor:
         self.settings = get_settings()
         self.logger = get_logger("BlendPro.CodeExec")
         self.backup_manager = get_backup_manager()
-        self.input_validator = get_input_validator()
+        self.code_analyzer = get_code_analyzer()
         self._execution_history: List[Dict[str, Any]] = []
         self._max_history = 50
+        self._base_namespace: Optional[Dict[str, Any]] = None
     
     def _validate_code(self, code: str) -> Dict[str, Any]:
         """Validate code for safety before execution"""
-        validation_result = {
-            "is_safe": True,
-            "warnings": [],
-            "errors": []
+        analysis = self.code_analyzer.analyze(code)
+        return {
+            "is_safe": analysis.is_safe,
+            "warnings": list(analysis.warnings),
+            "errors": list(analysis.errors),
+            "code_object": analysis.code_object
         }
-        
-        # Check for potentially dangerous operations
-        dangerous_patterns = [
-            ("import subprocess", "Subprocess operations not allowed"),
-            ("import os", "OS operations should be limited"),
-            ("exec(", "Dynamic code execution not recommended"),
-            ("eval(", "Dynamic evaluation not recommended"),
-            ("__import__", "Dynamic imports not allowed"),
-            ("open(", "File operations should be reviewed"),
-            ("file(", "File operations should be reviewed"),
-            ("input(", "User input operations not allowed"),
-            ("raw_input(", "User input operations not allowed"),
-        ]
-        
-        for pattern, warning in dangerous_patterns:
-            if pattern in code:
-                validation_result["warnings"].append(warning)
-        
-        # Check for syntax errors
-        try:
-            compile(code, '<string>', 'exec')
-        except SyntaxError as e:
-            validation_result["is_safe"] = False
-            validation_result["errors"].append(f"Syntax error: {e}")
-        
-        # Check for required Blender imports
-        if "bpy." in code and "import bpy" not in code:
-            validation_result["warnings"].append("Code uses bpy but doesn't import it")
-        
-        return validation_result
     
     def _create_safe_namespace(self) -> Dict[str, Any]:
         """Create a safe namespace for code execution"""
+        # Modules are resolved once; each execution gets fresh dict copies
+        if self._base_namespace is not None:
+            namespace = dict(self._base_namespace)
+            namespace['__builtins__'] = dict(self._base_namespace['__builtins__'])
+            return namespace
+        
         # Start with a minimal namespace
         safe_namespace = {
             '__builtins__': {
@@ -130,42 +305,65 @@ class CodeExecutor:
         except ImportError:
             pass
         
-        return safe_namespace
+        self._base_namespace = safe_namespace
+        return self._create_safe_namespace()
     
     def execute_code(self, code: str, show_preview: bool = True) -> Dict[str, Any]:
         """Execute Python code with safety checks and error handling"""
         execution_start = time.time()
         
-        # Validate code first with enhanced validation
+        # Validate code once; the verdict (and compiled code) is cached by code hash
         validation = self._validate_code(code)
-        enhanced_validation = self.input_validator.validate_code_safety(code)
 
-        if not validation["is_safe"] or not enhanced_validation.is_valid:
-            error_details = validation["errors"] + (enhanced_validation.issues or [])
+        if not validation["is_safe"]:
             self.logger.error("Code validation failed",
                             validation_errors=validation["errors"],
-                            enhanced_errors=enhanced_validation.issues,
                             code_length=len(code))
             return {
                 "success": False,
                 "error": "Code validation failed",
-                "details": error_details,
+                "details": validation["errors"],
                 "warnings": validation["warnings"]
             }
 
         # Log validation warnings
-        if validation["warnings"] or enhanced_validation.severity == ValidationSeverity.WARNING:
-            all_warnings = validation["warnings"] + (enhanced_validation.issues or [])
-            self.logger.warning("Code validation warnings", warnings=all_warnings)
+        if validation["warnings"]:
+            self.logger.warning("Code validation warnings", warnings=validation["warnings"])
+        
+        return self.execute_compiled(
+            validation["code_object"], code,
+            warnings=validation["warnings"],
+            execution_start=execution_start
+        )
+    
+    def execute_compiled(
+        self,
+        code_object: CodeType,
+        code: str,
+        variables: Optional[Dict[str, Any]] = None,
+        warnings: Optional[List[str]] = None,
+        create_backup: Optional[bool] = None,
+        execution_start: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Execute an already validated code object, injecting variables into its namespace"""
+        if execution_start is None:
+            execution_start = time.time()
+        if create_backup is None:
+            create_backup = self.settings.enable_auto_backup
+        
+        watchdog = self._create_watchdog()
         
         # Create backup before execution if enabled
         backup_path = None
-        if self.settings.enable_auto_backup:
+        if create_backup:
             try:
                 backup_path = self.backup_manager.create_backup(force=True)
             except Exception as e:
                 print(f"Warning: Failed to create backup before code execution: {e}")
         
+        # In-memory checkpoint that an abort can roll back to without reloading the file
+        undo_checkpoint = watchdog.enabled and self._push_undo_checkpoint()
+        
         # Capture output
         stdout_capture = StringIO()
         stderr_capture = StringIO()
@@ -174,7 +372,7 @@ class CodeExecutor:
             "success": False,
             "output": "",
             "error": "",
-            "warnings": validation["warnings"],
+            "warnings": list(warnings or []),
             "execution_time": 0,
             "backup_created": backup_path is not None,
             "backup_path": backup_path
@@ -183,10 +381,12 @@ class CodeExecutor:
         try:
             # Create safe execution namespace
             namespace = self._create_safe_namespace()
+            if variables:
+                namespace.update(variables)
             
-            # Execute code with output capture
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                exec(code, namespace)
+            # Execute code with output capture under the watchdog
+            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture), watchdog:
+                exec(code_object, namespace)
             
             # Capture results
             execution_result.update({
@@ -196,6 +396,14 @@ class CodeExecutor:
                 "execution_time": time.time() - execution_start
             })
             
+        except ExecutionAborted:
+            watchdog.disarm()
+            execution_result.update(self._handle_abort(watchdog, code, undo_checkpoint, backup_path))
+            execution_result.update({
+                "output": stdout_capture.getvalue(),
+                "execution_time": time.time() - execution_start
+            })
+            
         except Exception as e:
             # Capture execution error
             error_traceback = traceback.format_exc()
@@ -206,6 +414,9 @@ class CodeExecutor:
                 "execution_time": time.time() - execution_start
             })
         
+        finally:
+            watchdog.disarm()
+        
         # Log execution result
         execution_time = execution_result["execution_time"]
         success = execution_result["success"]
@@ -223,6 +434,109 @@ class CodeExecutor:
 
         return execution_result
     
+    def _create_watchdog(self, timeout: Optional[float] = None) -> ExecutionWatchdog:
+        """Create a watchdog enforcing the configured execution limits"""
+        return ExecutionWatchdog(
+            timeout=self.settings.code_execution_timeout if timeout is None else timeout,
+            memory_limit_mb=self.settings.code_execution_memory_limit
+        )
+    
+    def _push_undo_checkpoint(self) -> bool:
+        """Push an undo step marking the state before generated code runs"""
+        try:
+            return 'FINISHED' in bpy.ops.ed.undo_push(message="BlendPro: Before Execution")
+        except Exception as e:
+            print(f"Warning: Failed to push undo checkpoint: {e}")
+            return False
+    
+    def _handle_abort(
+        self,
+        watchdog: ExecutionWatchdog,
+        code: str,
+        undo_checkpoint: bool,
+        backup_path: Optional[str]
+    ) -> Dict[str, Any]:
+        """Roll back to the pre-execution checkpoint and describe where the time went"""
+        hot_spots = watchdog.get_hot_spots(code)
+        
+        rolled_back = False
+        if undo_checkpoint:
+            try:
+                # Step onto the aborted state so one undo lands on the checkpoint
+                bpy.ops.ed.undo_push(message="BlendPro: Aborted Execution")
+                rolled_back = 'FINISHED' in bpy.ops.ed.undo()
+            except Exception as e:
+                print(f"Failed to undo aborted execution: {e}")
+        
+        # Reloading the file unloads the caller's context, so it waits until the caller has returned
+        reload_scheduled = False
+        if not rolled_back and backup_path:
+            bpy.app.timers.register(
+                functools.partial(_reload_backup, backup_path, bpy.data.filepath),
+                first_interval=0.1
+            )
+            reload_scheduled = True
+        
+        self.logger.warning("Code execution aborted",
+                          reason=watchdog.abort_reason,
+                          elapsed=round(watchdog.elapsed, 2),
+                          hot_spots=hot_spots,
+                          rolled_back=rolled_back,
+                          reload_scheduled=reload_scheduled)
+        
+        return {
+            "success": False,
+            "error": watchdog.abort_reason,
+            "aborted": True,
+            "hot_spots": hot_spots,
+            "profile_summary": format_hot_spots(watchdog.abort_reason, hot_spots),
+            "rolled_back": rolled_back,
+            "reload_scheduled": reload_scheduled,
+            "backup_path": backup_path if reload_scheduled else None
+        }
+    
+    def create_batch_job(
+        self,
+        code: str,
+        targets: List[str],
+        variables_for: Optional[Callable[[str], Dict[str, Any]]] = None,
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """Validate code once and prepare a batch job over target object names"""
+        validation = self._validate_code(code)
+        
+        if not validation["is_safe"]:
+            self.logger.error("Batch code validation failed",
+                            validation_errors=validation["errors"],
+                            code_length=len(code))
+            return {
+                "success": False,
+                "error": "Code validation failed",
+                "details": validation["errors"],
+                "warnings": validation["warnings"]
+            }
+        
+        job = BatchJob(
+            self, validation["code_object"], code, targets,
+            variables_for=variables_for,
+            warnings=validation["warnings"],
+            stop_on_error=stop_on_error
+        )
+        return {"success": True, "job": job}
+    
+    def execute_batch(
+        self,
+        code: str,
+        targets: List[str],
+        variables_for: Optional[Callable[[str], Dict[str, Any]]] = None,
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """Execute code once per target object (available as `target`) in a single transaction"""
+        created = self.create_batch_job(code, targets, variables_for, stop_on_error)
+        if not created["success"]:
+            return created
+        return created["job"].run()
+    
     def _add_to_history(self, code: str, result: Dict[str, Any]) -> None:
         """Add execution to history"""
         history_entry = {
@@ -283,6 +597,20 @@ class CodeExecutor:
             "last_execution_time": self._execution_history[-1]["timestamp"] if self._execution_history else None
         }
 
+def _reload_backup(backup_path: str, original_filepath: str) -> None:
+    """Timer callback reopening the pre-execution backup after an abort that undo could not roll back"""
+    try:
+        get_backup_manager().restore_backup(backup_path)
+    except Exception as e:
+        print(f"Failed to roll back aborted execution: {e}")
+        return None
+
+    # The user's file on disk is left alone; saving over it is their decision
+    target = original_filepath or "your file"
+    print(f"BlendPro: Aborted execution could not be undone. Reopened the pre-execution backup "
+          f"{backup_path}; save it over {target} if you want to keep this state.")
+    return None
+
 # Global code executor instance
 _code_executor: Optional[CodeExecutor] = None
 
@@ -296,3 +624,7 @@ def get_code_executor() -> CodeExecutor:
 def execute_code(code: str, show_preview: bool = True) -> Dict[str, Any]:
     """Convenience function to execute code"""
     return get_code_executor().execute_code(code, show_preview=show_preview)
+
+def execute_batch(code: str, targets: List[str]) -> Dict[str, Any]:
+    """Convenience function to execute code per target object"""
+    return get_code_executor().execute_batch(code, targets)
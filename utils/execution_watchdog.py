@@ -0,0 +1,212 @@
+"""
+Execution Watchdog for BlendPro: AI Co-Pilot
+Wall-clock and memory supervision of generated code with hot-spot sampling
+"""
+
+import ctypes
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Any, Optional, Type
+
+from .dependency_loader import safe_import
+
+class ExecutionAborted(BaseException):
+    """Raised inside generated code when the watchdog stops it
+
+    Derives from BaseException so generated `except Exception:` blocks cannot swallow it.
+    """
+
+class ExecutionTimeout(ExecutionAborted):
+    """Generated code exceeded the wall-clock timeout"""
+
+class MemoryLimitExceeded(ExecutionAborted):
+    """Generated code grew process memory beyond the configured cap"""
+
+def _current_rss_mb() -> Optional[float]:
+    """Current resident set size in MB, or None when it cannot be measured"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    psutil = safe_import('psutil', 'psutil (Process Memory)')
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
+    return None
+
+class ExecutionWatchdog:
+    """Supervises the calling thread while generated code runs
+
+    A sampling thread checks elapsed time and memory growth and records which line of
+    the generated code is executing. No trace hook is installed, so the supervised code
+    runs at full speed; when a limit is exceeded the thread raises an asynchronous
+    exception in the supervised thread. Long-running C calls (e.g. a single bpy.ops
+    call) are interrupted as soon as they return to Python.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        memory_limit_mb: float = 0,
+        filename: str = '<string>',
+        sample_interval: float = 0.01
+    ):
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.filename = filename
+        self.sample_interval = sample_interval
+
+        self.abort_reason: Optional[str] = None
+        self.line_samples: Counter = Counter()
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._active = False
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._start_time = 0.0
+        self._end_time = 0.0
+        self._memory_baseline: Optional[float] = None
+        self._abort_exception: Optional[Type[ExecutionAborted]] = None
+        self._last_fired = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured"""
+        return self.timeout > 0 or self.memory_limit_mb > 0
+
+    @property
+    def aborted(self) -> bool:
+        """Whether the watchdog stopped the supervised code"""
+        return self.abort_reason is not None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent under supervision"""
+        end = self._end_time or time.perf_counter()
+        return end - self._start_time if self._start_time else 0.0
+
+    def __enter__(self) -> "ExecutionWatchdog":
+        self._start_time = time.perf_counter()
+
+        if not self.enabled:
+            return self
+
+        self._thread_id = threading.get_ident()
+        if self.memory_limit_mb > 0:
+            self._memory_baseline = _current_rss_mb()
+
+        self._active = True
+        self._thread = threading.Thread(target=self._watch, name="BlendPro.Watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.disarm()
+        return False
+
+    def restart_clock(self) -> None:
+        """Start the timeout over for the next unit of supervised work"""
+        with self._lock:
+            self._start_time = time.perf_counter()
+
+    def disarm(self) -> None:
+        """Stop supervising (idempotent; call again if an abort interrupted the first call)"""
+        with self._lock:
+            if not self._active and self._thread is None:
+                return
+            self._active = False
+        if not self._end_time:
+            self._end_time = time.perf_counter()
+        self._stop.set()
+
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+        # Drop an exception fired after the code finished but before it was raised
+        if self._abort_exception is not None and self._thread_id is not None:
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_id), None)
+
+    def _watch(self) -> None:
+        """Sampling loop running on the watchdog thread"""
+        while not self._stop.wait(self.sample_interval):
+            with self._lock:
+                if not self._active:
+                    return
+
+                self._sample_line()
+
+                if self._abort_exception is None:
+                    self._check_limits()
+
+                # Re-raise periodically in case a bare `except:` swallowed it
+                if self._abort_exception is not None and time.perf_counter() - self._last_fired >= 0.5:
+                    self._fire()
+
+    def _sample_line(self) -> None:
+        """Record the line of generated code currently executing"""
+        frame = sys._current_frames().get(self._thread_id)
+        while frame is not None:
+            if frame.f_code.co_filename == self.filename:
+                self.line_samples[frame.f_lineno] += 1
+                return
+            frame = frame.f_back
+
+    def _check_limits(self) -> None:
+        """Decide whether the supervised code has to be stopped"""
+        elapsed = time.perf_counter() - self._start_time
+        if self.timeout > 0 and elapsed > self.timeout:
+            self.abort_reason = f"Execution exceeded the {self.timeout:.1f}s timeout"
+            self._abort_exception = ExecutionTimeout
+            return
+
+        if self.memory_limit_mb > 0 and self._memory_baseline is not None:
+            current = _current_rss_mb()
+            if current is not None and current - self._memory_baseline > self.memory_limit_mb:
+                self.abort_reason = (
+                    f"Execution grew memory by {current - self._memory_baseline:.0f} MB "
+                    f"(limit {self.memory_limit_mb:.0f} MB)"
+                )
+                self._abort_exception = MemoryLimitExceeded
+
+    def _fire(self) -> None:
+        """Raise the abort exception in the supervised thread"""
+        self._last_fired = time.perf_counter()
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(
+            ctypes.c_ulong(self._thread_id), ctypes.py_object(self._abort_exception)
+        )
+
+    def get_hot_spots(self, code: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Most frequently sampled lines of the supervised code"""
+        total = sum(self.line_samples.values())
+        if not total:
+            return []
+
+        lines = code.splitlines()
+        hot_spots = []
+        for line_number, samples in self.line_samples.most_common(limit):
+            source = lines[line_number - 1].strip() if 0 < line_number <= len(lines) else ""
+            hot_spots.append({
+                "line": line_number,
+                "samples": samples,
+                "percent": round(samples / total * 100, 1),
+                "source": source
+            })
+        return hot_spots
+
+def format_hot_spots(reason: str, hot_spots: List[Dict[str, Any]]) -> str:
+    """Summarise an aborted run for the user or for re-prompting the model"""
+    if not hot_spots:
+        return reason
+
+    lines = [f"{reason}. Time was spent mostly in:"]
+    for spot in hot_spots:
+        lines.append(f"  line {spot['line']} ({spot['percent']}%): {spot['source']}")
+    return "\n".join(lines)
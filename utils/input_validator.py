@@ -4,13 +4,13 @@ Provides comprehensive input validation and sanitization
 """
 
 import re
-import ast
 import keyword
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from .logger import get_logger
+from .code_analyzer import get_code_analyzer, DANGEROUS_BUILTINS, DANGEROUS_MODULES
 
 class ValidationSeverity(Enum):
     """Severity levels for validation issues"""
@@ -39,18 +39,10 @@ class InputValidator:
         self.logger = get_logger("BlendPro.Validator")
         
         # Dangerous Python keywords and functions to block
-        self.dangerous_keywords = {
-            'exec', 'eval', 'compile', '__import__', 'open', 'file',
-            'input', 'raw_input', 'reload', 'vars', 'globals', 'locals',
-            'dir', 'hasattr', 'getattr', 'setattr', 'delattr'
-        }
+        self.dangerous_keywords = set(DANGEROUS_BUILTINS)
         
         # Dangerous modules to block in code
-        self.dangerous_modules = {
-            'os', 'sys', 'subprocess', 'shutil', 'pickle', 'marshal',
-            'imp', 'importlib', 'socket', 'urllib', 'http', 'ftplib',
-            'smtplib', 'telnetlib', 'webbrowser'
-        }
+        self.dangerous_modules = set(DANGEROUS_MODULES)
         
         # Safe Blender modules
         self.safe_blender_modules = {
@@ -129,63 +121,28 @@ class InputValidator:
                 message="Code cannot be empty"
             )
         
-        issues = []
+        # Single parse/walk shared with the executor and security manager
+        analysis = get_code_analyzer().analyze(code)
         
-        try:
-            # Parse the code to check syntax
-            tree = ast.parse(code)
-        except SyntaxError as e:
+        if analysis.syntax_error:
             return ValidationResult(
                 is_valid=False,
                 severity=ValidationSeverity.ERROR,
-                message=f"Syntax error in code: {str(e)}"
+                message=f"Syntax error in code: {analysis.syntax_error}"
             )
         
-        # Check for dangerous keywords
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and node.id in self.dangerous_keywords:
-                issues.append(f"Dangerous keyword detected: {node.id}")
-            
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name in self.dangerous_modules:
-                        issues.append(f"Dangerous module import: {alias.name}")
-            
-            elif isinstance(node, ast.ImportFrom):
-                if node.module in self.dangerous_modules:
-                    issues.append(f"Dangerous module import: {node.module}")
-        
-        # Check for file operations
-        file_operations = ['open', 'file', 'read', 'write', 'remove', 'delete']
-        for op in file_operations:
-            if re.search(rf'\b{op}\s*\(', code):
-                issues.append(f"File operation detected: {op}")
-        
-        # Check for network operations
-        network_patterns = [
-            r'urllib', r'requests', r'socket', r'http', r'ftp'
-        ]
-        for pattern in network_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                issues.append(f"Network operation detected: {pattern}")
+        issues = list(analysis.errors) + list(analysis.warnings)
         
         # Determine severity
-        critical_issues = [issue for issue in issues if any(
-            dangerous in issue.lower() for dangerous in ['exec', 'eval', 'import os', 'import sys']
-        )]
-        
-        if critical_issues:
+        if not analysis.is_safe:
             severity = ValidationSeverity.CRITICAL
-            is_valid = False
         elif issues:
             severity = ValidationSeverity.WARNING
-            is_valid = True
         else:
             severity = ValidationSeverity.INFO
-            is_valid = True
         
         return ValidationResult(
-            is_valid=is_valid,
+            is_valid=analysis.is_safe,
             severity=severity,
             message="Code safety validated" if not issues else f"Safety issues found: {', '.join(issues)}",
             issues=issues
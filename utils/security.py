@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from .logger import get_logger
+from .code_analyzer import get_code_analyzer
 
 class SecurityLevel(Enum):
     """Security threat levels"""
@@ -110,26 +111,30 @@ class SecurityManager:
                 recommendations=[]
             )
         
+        # Single parse/walk shared with the executor and input validator
+        analysis = get_code_analyzer().analyze(code)
+        
+        if analysis.syntax_error:
+            threats.append(f"Code could not be parsed: {analysis.syntax_error}")
+        
         # Check for dangerous patterns
-        for category, patterns in self.dangerous_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, code, re.IGNORECASE):
-                    threats.append(f"Dangerous {category} pattern detected: {pattern}")
+        for category, pattern in analysis.threats:
+            threats.append(f"Dangerous {category} pattern detected: {pattern}")
         
-        # Check for suspicious keywords
-        code_lower = code.lower()
+        # Check for suspicious keywords in identifiers and string literals
+        tokens = [token.lower() for token in analysis.attribute_chains | analysis.names]
+        tokens.extend(literal.lower() for literal in analysis.string_literals)
         for keyword in self.suspicious_keywords:
-            if keyword in code_lower:
+            if any(keyword in token for token in tokens):
                 threats.append(f"Suspicious keyword detected: {keyword}")
         
         # Check for obfuscation attempts
-        if self._detect_obfuscation(code):
+        if analysis.obfuscated:
             threats.append("Potential code obfuscation detected")
         
         # Check for excessive complexity
-        complexity_score = self._calculate_complexity(code)
-        if complexity_score > 100:
-            threats.append(f"High code complexity detected: {complexity_score}")
+        if analysis.complexity > 100:
+            threats.append(f"High code complexity detected: {analysis.complexity}")
             recommendations.append("Consider breaking down complex operations")
         
         # Determine security level
@@ -234,44 +239,6 @@ class SecurityManager:
         
         return sanitized
     
-    def _detect_obfuscation(self, code: str) -> bool:
-        """Detect potential code obfuscation"""
-        # Check for excessive string concatenation
-        if code.count('+') > 20 and code.count('"') > 10:
-            return True
-        
-        # Check for base64-like patterns
-        if re.search(r'[A-Za-z0-9+/]{20,}={0,2}', code):
-            return True
-        
-        # Check for hex encoding
-        if re.search(r'\\x[0-9a-fA-F]{2}', code):
-            return True
-        
-        # Check for excessive escape sequences
-        if code.count('\\') > len(code) * 0.1:
-            return True
-        
-        return False
-    
-    def _calculate_complexity(self, code: str) -> int:
-        """Calculate code complexity score"""
-        complexity = 0
-        
-        # Count control structures
-        complexity += len(re.findall(r'\b(if|for|while|try|except|with)\b', code))
-        
-        # Count function definitions
-        complexity += len(re.findall(r'\bdef\s+\w+', code))
-        
-        # Count nested structures
-        complexity += code.count('{') + code.count('[') + code.count('(')
-        
-        # Count lines
-        complexity += len(code.split('\n'))
-        
-        return complexity
-    
     def _determine_security_level(self, threats: List[str]) -> SecurityLevel:
         """Determine security level based on threats"""
         if not threats:
@@ -0,0 +1,185 @@
+"""
+View Model for BlendPro: AI Co-Pilot
+Immutable UI snapshots published by subsystems and read by panel draw callbacks
+"""
+
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, replace
+import bpy
+
+@dataclass(frozen=True)
+class HealthAlertView:
+    """Prebuilt row for a scene health alert"""
+    text: str
+    alert: bool
+
+@dataclass(frozen=True)
+class SuggestionView:
+    """Prebuilt box for a proactive suggestion"""
+    id: str
+    title: str
+    description: str
+    icon: str
+    alert: bool
+    actionable: bool
+
+@dataclass(frozen=True)
+class ModifierStackView:
+    """Prebuilt rows for an expensive modifier stack"""
+    object_name: str
+    text: str
+    suggestion: str
+    alert: bool
+
+@dataclass(frozen=True)
+class MainPanelSnapshot:
+    """Everything the main panel needs to draw, computed ahead of time"""
+    version: int = 0
+    monitoring_active: bool = False
+    health_alerts: Tuple[HealthAlertView, ...] = field(default_factory=tuple)
+    modifier_stacks: Tuple[ModifierStackView, ...] = field(default_factory=tuple)
+    suggestions: Tuple[SuggestionView, ...] = field(default_factory=tuple)
+    cached_requests: int = 0
+    processing: bool = False
+
+class ViewModel:
+    """Holds the latest UI snapshot and schedules redraws when it changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = MainPanelSnapshot()
+        self._redraw_pending = False
+
+    @property
+    def snapshot(self) -> MainPanelSnapshot:
+        """Current snapshot (safe to read from draw callbacks)"""
+        return self._snapshot
+
+    def publish(self, **changes) -> MainPanelSnapshot:
+        """Replace snapshot fields, bump the version and tag a redraw"""
+
+        with self._lock:
+            current = self._snapshot
+            if all(getattr(current, key) == value for key, value in changes.items()):
+                return current
+
+            self._snapshot = replace(current, version=current.version + 1, **changes)
+            self._redraw_pending = True
+            return self._snapshot
+
+    def publish_monitoring(self, active: bool, suggestions: List[Dict[str, Any]]) -> None:
+        """Publish scene monitor state"""
+
+        alerts = tuple(
+            HealthAlertView(
+                text=suggestion.get("message", "")[:40] + "...",
+                alert=suggestion.get("type") == "health_alert"
+            )
+            for suggestion in suggestions[-2:]
+        )
+        self.publish(monitoring_active=active, health_alerts=alerts)
+
+    def publish_modifier_stacks(self, profiles: List[Dict[str, Any]], slow_ms: float = 16.0) -> None:
+        """Publish the most expensive modifier stacks (already ranked)"""
+
+        views = []
+        for profile in profiles:
+            slowest = max(profile["modifiers"], key=lambda timing: timing["time_ms"], default=None)
+            if slowest is None:
+                continue
+            views.append(ModifierStackView(
+                object_name=profile["object"],
+                text=f"{profile['object']}: {profile['modifier_ms']:.1f} ms ({slowest['name']} {slowest['time_ms']:.1f} ms)",
+                suggestion=slowest["suggestion"],
+                alert=profile["modifier_ms"] > slow_ms
+            ))
+
+        self.publish(modifier_stacks=tuple(views))
+
+    def publish_suggestions(self, suggestions: List[Dict[str, Any]]) -> None:
+        """Publish active proactive suggestions (already ordered for display)"""
+
+        views = []
+        for suggestion in suggestions[:2]:
+            priority = suggestion.get("priority", 5)
+
+            if priority >= 8:
+                icon = 'ERROR'
+            elif priority >= 6:
+                icon = 'INFO'
+            else:
+                icon = 'QUESTION'
+
+            views.append(SuggestionView(
+                id=suggestion.get("id", ""),
+                title=suggestion.get("title", ""),
+                description=suggestion.get("description", "")[:60] + "...",
+                icon=icon,
+                alert=priority >= 8,
+                actionable=suggestion.get("actionable", False)
+            ))
+
+        self.publish(suggestions=tuple(views))
+
+    def publish_system_status(
+        self,
+        cached_requests: Optional[int] = None,
+        processing: Optional[bool] = None
+    ) -> None:
+        """Publish API cache and engine processing state"""
+
+        changes = {}
+        if cached_requests is not None:
+            changes["cached_requests"] = cached_requests
+        if processing is not None:
+            changes["processing"] = processing
+
+        if changes:
+            self.publish(**changes)
+
+    def consume_redraw(self) -> bool:
+        """Return True once per batch of published changes"""
+
+        with self._lock:
+            pending = self._redraw_pending
+            self._redraw_pending = False
+            return pending
+
+# Global view model instance
+_view_model: Optional[ViewModel] = None
+
+def get_view_model() -> ViewModel:
+    """Get global view model instance"""
+    global _view_model
+    if _view_model is None:
+        _view_model = ViewModel()
+    return _view_model
+
+_REDRAW_INTERVAL = 0.25  # seconds
+
+def _redraw_timer() -> float:
+    """Main-thread timer: tag sidebar regions for redraw when a new snapshot exists"""
+
+    if get_view_model().consume_redraw():
+        try:
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    if area.type == 'VIEW_3D':
+                        for region in area.regions:
+                            if region.type == 'UI':
+                                region.tag_redraw()
+        except (AttributeError, RuntimeError):
+            pass  # No window manager yet (e.g. background mode)
+
+    return _REDRAW_INTERVAL
+
+def register():
+    """Start the redraw timer"""
+    if not bpy.app.timers.is_registered(_redraw_timer):
+        bpy.app.timers.register(_redraw_timer, first_interval=_REDRAW_INTERVAL, persistent=True)
+
+def unregister():
+    """Stop the redraw timer"""
+    if bpy.app.timers.is_registered(_redraw_timer):
+        bpy.app.timers.unregister(_redraw_timer)
@@ -25,6 +25,54 @@ except ImportError as e:
     ScreenshotManager = None
     get_screenshot_manager = None
 
+try:
+    from .image_encoder import ImageEncoder, EncodedImage, EncodingOptions, get_image_encoder
+except ImportError as e:
+    print(f"BlendPro Vision: Failed to import image_encoder: {e}")
+    ImageEncoder = None
+    EncodedImage = None
+    EncodingOptions = None
+    get_image_encoder = None
+
+try:
+    from .image_cache import ImageCache, CachedImage, get_image_cache
+except ImportError as e:
+    print(f"BlendPro Vision: Failed to import image_cache: {e}")
+    ImageCache = None
+    CachedImage = None
+    get_image_cache = None
+
+try:
+    from .frame_dedup import FrameDeduplicator, FrameFingerprint, get_frame_deduplicator
+except ImportError as e:
+    print(f"BlendPro Vision: Failed to import frame_dedup: {e}")
+    FrameDeduplicator = None
+    FrameFingerprint = None
+    get_frame_deduplicator = None
+
+try:
+    from .spatial_index import SpatialIndex, get_spatial_index
+except ImportError as e:
+    print(f"BlendPro Vision: Failed to import spatial_index: {e}")
+    SpatialIndex = None
+    get_spatial_index = None
+
+try:
+    from .scene_snapshot import ObjectSnapshot, ObjectView, ObjectsView
+except ImportError as e:
+    print(f"BlendPro Vision: Failed to import scene_snapshot: {e}")
+    ObjectSnapshot = None
+    ObjectView = None
+    ObjectsView = None
+
+try:
+    from .vision_router import VisionRouter, RoutingDecision, get_vision_router
+except ImportError as e:
+    print(f"BlendPro Vision: Failed to import vision_router: {e}")
+    VisionRouter = None
+    RoutingDecision = None
+    get_vision_router = None
+
 try:
     from .multi_modal_vision import MultiModalVision, get_multi_modal_vision
 except ImportError as e:
@@ -39,6 +87,24 @@ __all__ = [
     'get_context_extractor',
     'ScreenshotManager',
     'get_screenshot_manager',
+    'ImageEncoder',
+    'EncodedImage',
+    'EncodingOptions',
+    'get_image_encoder',
+    'ImageCache',
+    'CachedImage',
+    'get_image_cache',
+    'FrameDeduplicator',
+    'FrameFingerprint',
+    'get_frame_deduplicator',
+    'SpatialIndex',
+    'get_spatial_index',
+    'ObjectSnapshot',
+    'ObjectView',
+    'ObjectsView',
+    'VisionRouter',
+    'RoutingDecision',
+    'get_vision_router',
     'MultiModalVision',
     'get_multi_modal_vision'
 ]
@@ -0,0 +1,207 @@
+"""
+Frame Deduplication for BlendPro: AI Co-Pilot
+Perceptual hashing of viewport frames to reuse vision analyses and send only changed tiles
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..utils.dependency_loader import safe_import
+
+PIL = safe_import('PIL', 'Pillow (Image Processing)', required=False, min_version='10.0.0')
+numpy = safe_import('numpy', 'NumPy (Numerical Computing)', required=False, min_version='1.24.0')
+
+PIL_AVAILABLE = PIL is not None
+NUMPY_AVAILABLE = numpy is not None
+
+if PIL_AVAILABLE:
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+        PIL_AVAILABLE = False
+else:
+    Image = None
+
+np = numpy if NUMPY_AVAILABLE else None
+
+# dHash compares HASH_SIZE + 1 columns per row, giving HASH_SIZE * HASH_SIZE bits
+HASH_SIZE = 8
+
+# Columns x rows of the tile grid used for change detection
+TILE_GRID = (4, 3)
+
+@dataclass(frozen=True)
+class FrameFingerprint:
+    """Perceptual hashes of a whole frame and of each grid tile"""
+    frame_hash: int
+    tile_hashes: Tuple[int, ...]
+    grid: Tuple[int, int]
+    size: Tuple[int, int]
+
+    def tile_box(self, index: int) -> Tuple[int, int, int, int]:
+        """Pixel box (left, top, right, bottom) of a tile in the source frame"""
+        cols, rows = self.grid
+        width, height = self.size
+        col, row = index % cols, index // cols
+        return (
+            col * width // cols,
+            row * height // rows,
+            (col + 1) * width // cols,
+            (row + 1) * height // rows
+        )
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count('1')
+
+def _dhash_blocks(pixels, rows: int, cols: int) -> List[int]:
+    """dHash of each (HASH_SIZE x HASH_SIZE + 1) block of a grayscale array"""
+
+    if NUMPY_AVAILABLE:
+        blocks = pixels.reshape(rows, HASH_SIZE, cols, HASH_SIZE + 1).transpose(0, 2, 1, 3)
+        bits = (blocks[..., 1:] > blocks[..., :-1]).reshape(rows * cols, HASH_SIZE * HASH_SIZE)
+        return [int.from_bytes(packed.tobytes(), 'big') for packed in np.packbits(bits, axis=1)]
+
+    # Pure Python on the downsampled pixels (at most a few hundred values)
+    width = cols * (HASH_SIZE + 1)
+    hashes = []
+    for row in range(rows):
+        for col in range(cols):
+            value = 0
+            for y in range(row * HASH_SIZE, (row + 1) * HASH_SIZE):
+                offset = y * width + col * (HASH_SIZE + 1)
+                for x in range(HASH_SIZE):
+                    value = (value << 1) | (pixels[offset + x + 1] > pixels[offset + x])
+            hashes.append(value)
+    return hashes
+
+def compute_fingerprint(image: "Image.Image", grid: Tuple[int, int] = TILE_GRID) -> FrameFingerprint:
+    """Compute frame and tile dHashes from area-averaged thumbnails"""
+
+    cols, rows = grid
+    gray = image.convert('L')  # Cheaper to average one channel than four
+
+    def thumbnail(size: Tuple[int, int]):
+        small = gray.resize(size, Image.BOX)
+        return np.asarray(small, dtype=np.int16) if NUMPY_AVAILABLE else list(small.getdata())
+
+    frame_hash = _dhash_blocks(thumbnail((HASH_SIZE + 1, HASH_SIZE)), 1, 1)[0]
+    tile_hashes = _dhash_blocks(thumbnail((cols * (HASH_SIZE + 1), rows * HASH_SIZE)), rows, cols)
+
+    return FrameFingerprint(
+        frame_hash=frame_hash,
+        tile_hashes=tuple(tile_hashes),
+        grid=grid,
+        size=image.size
+    )
+
+def changed_tiles(reference: FrameFingerprint, current: FrameFingerprint, threshold: int) -> List[int]:
+    """Indices of tiles whose hash moved more than threshold bits"""
+    if reference.grid != current.grid:
+        return list(range(len(current.tile_hashes)))
+    return [
+        index for index, (old, new) in enumerate(zip(reference.tile_hashes, current.tile_hashes))
+        if hamming_distance(old, new) > threshold
+    ]
+
+@dataclass
+class AnalyzedFrame:
+    """A frame that was sent to the vision model, with its analysis"""
+    fingerprint: FrameFingerprint
+    query_key: str
+    analysis: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+class FrameDeduplicator:
+    """Remembers recently analyzed frames and tracks what deduplication saved"""
+
+    def __init__(self, max_frames: int = 8, max_age: float = 600.0):
+        self._frames: deque = deque(maxlen=max_frames)
+        self._max_age = max_age
+        self._lock = threading.Lock()
+
+        self._lookups = 0
+        self._hits = 0
+        self._tile_requests = 0
+        self._bytes_saved = 0
+
+    @staticmethod
+    def _query_key(query: Optional[str]) -> str:
+        return " ".join((query or "").lower().split())
+
+    def _recent_frames(self) -> List[AnalyzedFrame]:
+        cutoff = time.time() - self._max_age
+        return [frame for frame in self._frames if frame.timestamp >= cutoff]
+
+    def lookup(self, fingerprint: FrameFingerprint, query: Optional[str], threshold: int) -> Optional[Dict[str, Any]]:
+        """Previous analysis of a near-identical frame for the same query
+
+        The whole-frame hash is only a prefilter; a local change must also leave
+        every tile hash within the threshold.
+        """
+
+        query_key = self._query_key(query)
+        with self._lock:
+            self._lookups += 1
+            for frame in reversed(self._recent_frames()):
+                if (frame.query_key == query_key and
+                        hamming_distance(frame.fingerprint.frame_hash, fingerprint.frame_hash) <= threshold and
+                        not changed_tiles(frame.fingerprint, fingerprint, threshold)):
+                    self._hits += 1
+                    return frame.analysis
+        return None
+
+    def find_reference(self, fingerprint: FrameFingerprint) -> Optional[AnalyzedFrame]:
+        """Most similar recently analyzed frame of the same size"""
+
+        with self._lock:
+            candidates = [
+                frame for frame in self._recent_frames()
+                if frame.fingerprint.size == fingerprint.size
+            ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda frame: hamming_distance(frame.fingerprint.frame_hash, fingerprint.frame_hash))
+
+    def record(self, fingerprint: FrameFingerprint, query: Optional[str], analysis: Dict[str, Any]) -> None:
+        """Remember an analysis made with this frame"""
+        with self._lock:
+            self._frames.append(AnalyzedFrame(fingerprint, self._query_key(query), analysis))
+
+    def add_bytes_saved(self, byte_count: int, tile_request: bool = False) -> None:
+        """Account for image bytes that did not have to be uploaded"""
+        with self._lock:
+            self._bytes_saved += max(0, byte_count)
+            if tile_request:
+                self._tile_requests += 1
+
+    def clear(self) -> None:
+        """Forget analyzed frames"""
+        with self._lock:
+            self._frames.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics"""
+        with self._lock:
+            return {
+                "analyzed_frames": len(self._frames),
+                "lookups": self._lookups,
+                "hits": self._hits,
+                "hit_rate": self._hits / self._lookups if self._lookups else 0.0,
+                "tile_requests": self._tile_requests,
+                "bytes_saved": self._bytes_saved
+            }
+
+# Global frame deduplicator instance
+_frame_deduplicator: Optional[FrameDeduplicator] = None
+
+def get_frame_deduplicator() -> FrameDeduplicator:
+    """Get global frame deduplicator instance"""
+    global _frame_deduplicator
+    if _frame_deduplicator is None:
+        _frame_deduplicator = FrameDeduplicator()
+    return _frame_deduplicator
@@ -0,0 +1,137 @@
+"""
+Image Cache for BlendPro: AI Co-Pilot
+Memory-bounded LRU cache of encoded images shared by screenshots and vision results
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+
+from ..config.settings import get_settings
+from .image_encoder import EncodedImage
+
+@dataclass
+class CachedImage:
+    """Cached image with result metadata and expiry time"""
+    image: EncodedImage
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    expires_at: Optional[float] = None
+
+class ImageCache:
+    """LRU cache of compressed image bytes evicted against a byte budget
+
+    Entries hold the encoded bytes only; base64 text is produced when a request
+    is built. Result dictionaries reference the same EncodedImage objects, so an
+    image is kept in memory once no matter how many results point at it.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._entries: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes_used = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return get_settings().image_cache_mb * 1024 * 1024
+
+    def get(self, key: str) -> Optional[CachedImage]:
+        """Cached image for key, or None when missing or expired"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires_at is not None and entry.expires_at < time.time():
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(
+        self,
+        key: str,
+        image: EncodedImage,
+        ttl: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> CachedImage:
+        """Store an image, evicting expired and least recently used entries to fit the budget"""
+
+        entry = CachedImage(image, metadata or {}, time.time() + ttl if ttl else None)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self._bytes_used += image.byte_size
+
+            self._evict_expired()
+            budget = self.max_bytes
+            while self._bytes_used > budget and len(self._entries) > 1:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+        return entry
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes_used -= entry.image.byte_size
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        expired = [
+            key for key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at < now
+        ]
+        for key in expired:
+            self._remove(key)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached images"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes_used = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "cached_images": len(self._entries),
+                "bytes_used": self._bytes_used,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "evictions": self._evictions
+            }
+
+def image_base64(image_data: Dict[str, Any]) -> str:
+    """Base64 payload of an image result, encoded on demand"""
+    return image_data["image"].to_base64()
+
+# Global image cache instance
+_image_cache: Optional[ImageCache] = None
+
+def get_image_cache() -> ImageCache:
+    """Get global image cache instance"""
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
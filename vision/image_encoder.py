@@ -0,0 +1,275 @@
+"""
+Image Encoder for BlendPro: AI Co-Pilot
+Size-budgeted encoding of viewport images for vision models
+"""
+
+import base64
+import io
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+from ..config.settings import get_settings
+from ..utils.dependency_loader import safe_import
+
+PIL = safe_import('PIL', 'Pillow (Image Processing)', required=False, min_version='10.0.0')
+numpy = safe_import('numpy', 'NumPy (Numerical Computing)', required=False, min_version='1.24.0')
+
+PIL_AVAILABLE = PIL is not None
+NUMPY_AVAILABLE = numpy is not None
+
+if PIL_AVAILABLE:
+    try:
+        from PIL import Image, features
+        WEBP_AVAILABLE = bool(features.check('webp'))
+    except ImportError:
+        Image = None
+        PIL_AVAILABLE = False
+        WEBP_AVAILABLE = False
+else:
+    Image = None
+    WEBP_AVAILABLE = False
+
+np = numpy if NUMPY_AVAILABLE else None
+
+# Vision models downscale to fit 2048x2048, then to a 768px short side, and bill per 512px tile
+VISION_TILE_SIZE = 512
+VISION_SHORT_SIDE = 768
+VISION_MAX_SIDE = 2048
+
+# Drop a partially filled tile row/column when it is less than this fraction full
+_TILE_SLACK = 0.15
+
+MIME_TYPES = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp"
+}
+
+@dataclass
+class EncodingOptions:
+    """Encoding parameters for one image"""
+    image_format: str = "JPEG"
+    max_dimension: int = VISION_MAX_SIDE
+    byte_budget: int = 0  # 0 disables the budget
+    quality: int = 85
+    min_quality: int = 40
+    tile_aware: bool = True
+
+    @classmethod
+    def from_settings(cls) -> "EncodingOptions":
+        """Build options from the current settings"""
+        settings = get_settings()
+        return cls(
+            image_format=settings.screenshot_format,
+            max_dimension=settings.screenshot_max_dimension,
+            byte_budget=settings.screenshot_byte_budget_kb * 1024
+        )
+
+@dataclass
+class EncodedImage:
+    """Encoded image payload ready for a vision request"""
+    data: bytes
+    image_format: str
+    width: int
+    height: int
+    source_width: int
+    source_height: int
+    quality: Optional[int]
+    encode_time: float
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES.get(self.image_format, "image/png")
+
+    @property
+    def byte_size(self) -> int:
+        return len(self.data)
+
+    def to_base64(self) -> str:
+        """Base64 text of the payload"""
+        return base64.b64encode(self.data).decode('ascii')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Screenshot result fields describing this payload (base64 is built on demand)"""
+        return {
+            "image": self,
+            "width": self.width,
+            "height": self.height,
+            "source_width": self.source_width,
+            "source_height": self.source_height,
+            "format": self.image_format,
+            "mime_type": self.mime_type,
+            "byte_size": self.byte_size,
+            "quality": self.quality,
+            "encode_time": self.encode_time
+        }
+
+def fit_to_vision_tiles(
+    width: int,
+    height: int,
+    max_dimension: int = VISION_MAX_SIDE,
+    tile_aware: bool = True
+) -> Tuple[int, int]:
+    """Target size that carries no pixels the vision model would discard or bill for"""
+
+    scale = min(1.0, max_dimension / max(width, height))
+    if tile_aware:
+        scale = min(scale, VISION_SHORT_SIDE / min(width, height))
+
+        # Snap down to a tile boundary when the last tile row/column would be nearly empty
+        base_scale = scale
+        for side in (width * base_scale, height * base_scale):
+            tiles = math.ceil(side / VISION_TILE_SIZE)
+            overflow = side - (tiles - 1) * VISION_TILE_SIZE
+            if tiles > 1 and overflow < VISION_TILE_SIZE * _TILE_SLACK:
+                scale = min(scale, base_scale * (tiles - 1) * VISION_TILE_SIZE / side)
+
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+def flatten_alpha(image: "Image.Image", background: Tuple[int, int, int] = (255, 255, 255)) -> "Image.Image":
+    """Composite an RGBA image onto a solid background and return RGB"""
+
+    if image.mode != 'RGBA':
+        return image if image.mode == 'RGB' else image.convert('RGB')
+
+    if NUMPY_AVAILABLE:
+        pixels = np.asarray(image)
+        alpha = pixels[..., 3:4]
+
+        # Fully opaque frames (the usual viewport case) need no blending at all
+        if alpha.min() == 255:
+            return Image.fromarray(np.ascontiguousarray(pixels[..., :3]), 'RGB')
+
+        alpha = alpha.astype(np.uint16)
+        rgb = pixels[..., :3].astype(np.uint16)
+        bg = np.array(background, dtype=np.uint16)
+        blended = (rgb * alpha + bg * (255 - alpha) + 127) // 255
+        return Image.fromarray(blended.astype(np.uint8), 'RGB')
+
+    flattened = Image.new('RGB', image.size, background)
+    flattened.paste(image, mask=image.getchannel('A'))
+    return flattened
+
+class ImageEncoder:
+    """Downscales and encodes images within a byte budget on a worker thread"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def encode(self, image: "Image.Image", options: Optional[EncodingOptions] = None) -> EncodedImage:
+        """Encode an image synchronously"""
+
+        if not PIL_AVAILABLE:
+            raise RuntimeError("PIL not available for image encoding")
+
+        options = options or EncodingOptions.from_settings()
+        start_time = time.perf_counter()
+        source_width, source_height = image.size
+
+        image_format = options.image_format.upper()
+        if image_format == "WEBP" and not WEBP_AVAILABLE:
+            image_format = "JPEG"
+
+        target = fit_to_vision_tiles(source_width, source_height, options.max_dimension, options.tile_aware)
+        if target != image.size:
+            image = image.resize(target, Image.BILINEAR, reducing_gap=2.0)
+
+        if image_format != "PNG" or image.mode == 'RGBA':
+            image = flatten_alpha(image)
+
+        data, quality = self._encode_within_budget(image, image_format, options)
+
+        # Still too large at minimum quality: shrink and try again
+        attempts = 0
+        while options.byte_budget and len(data) > options.byte_budget and attempts < 3:
+            image = image.resize(
+                (max(1, int(image.width * 0.75)), max(1, int(image.height * 0.75))),
+                Image.BILINEAR
+            )
+            data, quality = self._encode_within_budget(image, image_format, options)
+            attempts += 1
+
+        return EncodedImage(
+            data=data,
+            image_format=image_format,
+            width=image.width,
+            height=image.height,
+            source_width=source_width,
+            source_height=source_height,
+            quality=quality,
+            encode_time=time.perf_counter() - start_time
+        )
+
+    def encode_async(self, image: "Image.Image", options: Optional[EncodingOptions] = None) -> Future:
+        """Encode an image on the worker thread (Pillow releases the GIL while encoding)"""
+        return self._get_executor().submit(self.encode, image, options)
+
+    def _encode_within_budget(
+        self,
+        image: "Image.Image",
+        image_format: str,
+        options: EncodingOptions
+    ) -> Tuple[bytes, Optional[int]]:
+        """Encode at the highest quality that fits the byte budget"""
+
+        if image_format == "PNG":
+            return self._save(image, image_format, None), None
+
+        data = self._save(image, image_format, options.quality)
+        if not options.byte_budget or len(data) <= options.byte_budget:
+            return data, options.quality
+
+        # Binary search the quality; size is monotonic in quality for JPEG/WebP
+        best_data, best_quality = None, None
+        low, high = options.min_quality, options.quality - 1
+        while low <= high:
+            quality = (low + high) // 2
+            candidate = self._save(image, image_format, quality)
+            if len(candidate) <= options.byte_budget:
+                best_data, best_quality = candidate, quality
+                low = quality + 1
+            else:
+                high = quality - 1
+
+        if best_data is None:
+            return self._save(image, image_format, options.min_quality), options.min_quality
+        return best_data, best_quality
+
+    def _save(self, image: "Image.Image", image_format: str, quality: Optional[int]) -> bytes:
+        """Serialize an image to bytes"""
+        buffer = io.BytesIO()
+        if image_format == "JPEG":
+            image.save(buffer, format="JPEG", quality=quality, optimize=False, subsampling=2)
+        elif image_format == "WEBP":
+            image.save(buffer, format="WEBP", quality=quality, method=4)
+        else:
+            image.save(buffer, format="PNG", compress_level=6)
+        return buffer.getvalue()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BlendPro.Encoder")
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker thread"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+# Global image encoder instance
+_image_encoder: Optional[ImageEncoder] = None
+
+def get_image_encoder() -> ImageEncoder:
+    """Get global image encoder instance"""
+    global _image_encoder
+    if _image_encoder is None:
+        _image_encoder = ImageEncoder()
+    return _image_encoder
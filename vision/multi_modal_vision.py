@@ -4,7 +4,8 @@ Combines visual and textual analysis for comprehensive scene understanding
 """
 
 import json
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 import bpy
 
 from ..config.settings import get_settings
@@ -13,6 +14,11 @@ from ..utils.api_client import get_api_client, APIRequest
 from .scene_analyzer import get_scene_analyzer
 from .context_extractor import get_context_extractor
 from .screenshot_manager import get_screenshot_manager
+from .frame_dedup import get_frame_deduplicator, changed_tiles
+from .image_cache import image_base64
+from .spatial_index import get_spatial_index
+from .vision_router import get_vision_router, RoutingDecision
+from .scene_snapshot import snapshot_json_default
 
 class MultiModalVision:
     """Combines visual and textual scene analysis"""
@@ -23,6 +29,8 @@ class MultiModalVision:
         self.scene_analyzer = get_scene_analyzer()
         self.context_extractor = get_context_extractor()
         self.screenshot_manager = get_screenshot_manager()
+        self.frame_dedup = get_frame_deduplicator()
+        self.vision_router = get_vision_router()
     
     def analyze_scene_with_vision(
         self, 
@@ -33,6 +41,15 @@ class MultiModalVision:
         """Perform comprehensive scene analysis using both vision and data"""
         
         try:
+            start_time = time.perf_counter()
+            routing = self.settings.enable_vision_context and self.settings.enable_vision_routing
+            
+            # Start the capture first so encoding overlaps the scene analysis; when
+            # routing, only if the query words alone already call for the viewport
+            screenshot_future = None
+            if self.settings.enable_vision_context and (not routing or self.vision_router.decide(user_query).use_vision):
+                screenshot_future = self.screenshot_manager.capture_viewport_screenshot_async(context)
+            
             # Get scene data
             scene_data = self.scene_analyzer.analyze_scene(context)
             
@@ -43,28 +60,161 @@ class MultiModalVision:
                 scene_data
             )
             
-            # Capture screenshot if vision is enabled
+            # Answer from scene data alone when the query does not need pixels
+            decision = None
+            if routing:
+                decision = self.vision_router.decide(user_query, context_data.get("context_type", "full"))
+                self.vision_router.record_decision(decision, user_query)
+                
+                if not decision.use_vision:
+                    text_result = self._answer_text_first(context_data, user_query, decision)
+                    if text_result is not None:
+                        return text_result
+                    start_time = time.perf_counter()
+            
+            # Questions about specific objects get a close-up of those objects
             screenshot_data = None
-            if self.settings.enable_vision_context:
-                screenshot_data = self.screenshot_manager.capture_viewport_screenshot(context)
+            if (self.settings.enable_vision_context and self.settings.vision_roi_crops and
+                    context_data.get("context_type") == "mentioned" and context_data.get("objects")):
+                screenshot_data = self.screenshot_manager.capture_region_of_interest(
+                    context,
+                    context_data["objects"],
+                    include_overview=self.settings.vision_roi_overview
+                )
+                if screenshot_data.get("error"):
+                    screenshot_data = None
+            
+            # Collect screenshot if vision is enabled
+            if screenshot_data is None:
+                if self.settings.enable_vision_context and screenshot_future is None:
+                    screenshot_future = self.screenshot_manager.capture_viewport_screenshot_async(context)
+                screenshot_data = screenshot_future.result() if screenshot_future else None
+            
+            # Reuse the analysis of a visually identical frame for the same query
+            fingerprint = None
+            vision_analysis = None
+            if screenshot_data and not screenshot_data.get("error"):
+                fingerprint = screenshot_data.get("fingerprint")
+            
+            if fingerprint is not None:
+                reused = self.frame_dedup.lookup(fingerprint, user_query, self.settings.vision_dedup_threshold)
+                if reused is not None:
+                    self.frame_dedup.add_bytes_saved(screenshot_data.get("byte_size", 0))
+                    vision_analysis = {**reused, "reused": True}
             
             # Perform vision analysis
-            vision_analysis = self._perform_vision_analysis(
-                context_data, 
-                screenshot_data, 
-                user_query
-            )
+            if vision_analysis is None:
+                vision_analysis = self._perform_vision_analysis(
+                    context_data, 
+                    screenshot_data, 
+                    user_query
+                )
+                
+                if fingerprint is not None and vision_analysis.get("has_visual_input") and not vision_analysis.get("error"):
+                    self.frame_dedup.record(fingerprint, user_query, vision_analysis)
+                    self.vision_router.record_vision_cost(
+                        time.perf_counter() - start_time,
+                        screenshot_data.get("width", 0),
+                        screenshot_data.get("height", 0)
+                    )
             
             return {
                 "scene_data": context_data,
                 "screenshot": screenshot_data,
                 "vision_analysis": vision_analysis,
-                "analysis_type": "multi_modal"
+                "analysis_type": "multi_modal",
+                "routing": self._routing_info(decision)
             }
             
         except Exception as e:
             return {"error": f"Multi-modal analysis failed: {str(e)}"}
     
+    def _answer_text_first(
+        self,
+        context_data: Dict[str, Any],
+        user_query: Optional[str],
+        decision: RoutingDecision
+    ) -> Optional[Dict[str, Any]]:
+        """Text-only analysis result, or None when the query turns out to need the viewport"""
+        
+        answer_key = self.vision_router.answer_key(context_data, user_query)
+        text_analysis = self.vision_router.get_answer(answer_key)
+        
+        if text_analysis is not None:
+            text_analysis = {**text_analysis, "cached": True}
+        else:
+            start_time = time.perf_counter()
+            text_analysis = self._perform_text_analysis(context_data, user_query)
+            if text_analysis.get("error"):
+                return None
+            
+            # The text model asked to see the scene: escalate and learn from it
+            if self.vision_router.needs_escalation(text_analysis.get("analysis")):
+                self.vision_router.learn(user_query, decision.context_type, True)
+                return None
+            
+            self.vision_router.learn(user_query, decision.context_type, False)
+            self.vision_router.record_text_answer(time.perf_counter() - start_time)
+            self.vision_router.put_answer(answer_key, text_analysis)
+        
+        return {
+            "scene_data": context_data,
+            "screenshot": None,
+            "vision_analysis": text_analysis,
+            "analysis_type": "text_routed",
+            "routing": self._routing_info(decision)
+        }
+    
+    def _routing_info(self, decision: Optional[RoutingDecision]) -> Optional[Dict[str, Any]]:
+        """Summary of a routing decision for results"""
+        if decision is None:
+            return None
+        return {
+            "use_vision": decision.use_vision,
+            "probability": round(decision.probability, 3),
+            "reasons": decision.reasons,
+            "context_type": decision.context_type
+        }
+    
+    def analyze_multiple_views(
+        self,
+        context,
+        user_query: Optional[str] = None,
+        view_angles: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Analyze the scene from several angles with a single contact-sheet request"""
+        
+        try:
+            scene_data = self.scene_analyzer.analyze_scene(context)
+            context_data = self.context_extractor.extract_context(
+                user_query or "analyze scene from all sides",
+                "auto",
+                scene_data
+            )
+            
+            sheet = self.screenshot_manager.capture_contact_sheet(context, view_angles)
+            if sheet.get("error"):
+                return {"error": sheet["error"]}
+            
+            columns, rows = sheet["grid"]
+            layout_note = (
+                f"The image is a contact sheet of {len(sheet['views'])} viewport angles "
+                f"in a {columns}x{rows} grid, left to right and top to bottom: {', '.join(sheet['views'])}."
+            )
+            query = f"{user_query or 'Provide a comprehensive analysis of this Blender scene.'} {layout_note}"
+            
+            vision_analysis = self._perform_vision_analysis(context_data, sheet, query)
+            
+            return {
+                "scene_data": context_data,
+                "screenshot": sheet,
+                "vision_analysis": vision_analysis,
+                "analysis_type": "multi_view"
+            }
+            
+        except Exception as e:
+            return {"error": f"Multi-view analysis failed: {str(e)}"}
+    
     def _perform_vision_analysis(
         self, 
         scene_data: Dict[str, Any], 
@@ -77,7 +227,7 @@ class MultiModalVision:
             # Prepare the analysis prompt
             system_prompt = get_system_prompt(
                 PromptType.VISION_ANALYZER,
-                scene_data=json.dumps(scene_data, indent=2),
+                scene_data=json.dumps(scene_data, indent=2, default=snapshot_json_default),
                 visual_context="Screenshot provided" if screenshot_data else "No screenshot available",
                 analysis_focus=user_query or "General scene analysis"
             )
@@ -101,15 +251,22 @@ class MultiModalVision:
             if screenshot_data and not screenshot_data.get("error"):
                 # For vision-capable models, add the image
                 if self._is_vision_model_available():
-                    messages[-1]["content"] = [
-                        {"type": "text", "text": messages[-1]["content"]},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{screenshot_data['base64_image']}"
-                            }
-                        }
-                    ]
+                    text = messages[-1]["content"]
+                    image_parts = [self._image_part(screenshot_data)]
+                    
+                    # All supported vision models accept several images per message
+                    if self.settings.vision_send_changed_tiles:
+                        delta = self._changed_region_parts(screenshot_data)
+                        if delta is not None:
+                            note, image_parts = delta
+                            text += note
+                    
+                    if screenshot_data.get("roi_box"):
+                        text += self._roi_note(screenshot_data)
+                        if screenshot_data.get("overview"):
+                            image_parts.append(self._image_part(screenshot_data["overview"]))
+                    
+                    messages[-1]["content"] = [{"type": "text", "text": text}] + image_parts
             
             # Make API request
             request = APIRequest(
@@ -135,6 +292,62 @@ class MultiModalVision:
             # Fallback to text-only analysis
             return self._fallback_text_analysis(scene_data, user_query, str(e))
     
+    def _image_part(self, image_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Message content part for an encoded image"""
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:{image_data.get('mime_type', 'image/png')};base64,{image_base64(image_data)}"
+            }
+        }
+    
+    def _roi_note(self, screenshot_data: Dict[str, Any]) -> str:
+        """Prompt note describing a region-of-interest capture"""
+        
+        width, height = screenshot_data["frame_size"]
+        note = (
+            f"\n\nThe first image is a close-up crop {tuple(screenshot_data['roi_box'])} "
+            f"(left, top, right, bottom) of the {width}x{height} viewport around "
+            f"{', '.join(screenshot_data.get('roi_objects', []))}."
+        )
+        if screenshot_data.get("overview"):
+            note += " The last image is a low-resolution view of the whole viewport with the crop outlined."
+        return note
+    
+    def _changed_region_parts(self, screenshot_data: Dict[str, Any]) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """Prompt note and image parts covering only what changed since a previous analysis"""
+        
+        fingerprint = screenshot_data.get("fingerprint")
+        reference = self.frame_dedup.find_reference(fingerprint) if fingerprint else None
+        if reference is None:
+            return None
+        
+        changed = changed_tiles(reference.fingerprint, fingerprint, self.settings.vision_dedup_threshold)
+        
+        # Nothing changed but the query differs, or too much changed: send the full frame
+        if not changed or len(changed) > len(fingerprint.tile_hashes) // 2:
+            return None
+        
+        regions = self.screenshot_manager.encode_regions(screenshot_data, changed)
+        if not regions:
+            return None
+        
+        region_bytes = sum(region["byte_size"] for region in regions)
+        full_bytes = screenshot_data.get("byte_size", 0)
+        if region_bytes >= full_bytes:
+            return None
+        
+        self.frame_dedup.add_bytes_saved(full_bytes - region_bytes, tile_request=True)
+        
+        width, height = fingerprint.size
+        boxes = ", ".join(str(region["box"]) for region in regions)
+        note = (
+            f"\n\nPrevious analysis of this viewport:\n{reference.analysis.get('analysis', '')}\n\n"
+            f"Only the regions that changed since then are attached, as crops "
+            f"(left, top, right, bottom) of the {width}x{height} viewport: {boxes}."
+        )
+        return note, [self._image_part(region) for region in regions]
+    
     def _fallback_text_analysis(
         self, 
         scene_data: Dict[str, Any], 
@@ -143,6 +356,28 @@ class MultiModalVision:
     ) -> Dict[str, Any]:
         """Fallback to text-only analysis when vision fails"""
         
+        result = self._perform_text_analysis(scene_data, user_query)
+        if "model_used" not in result:
+            return {
+                "error": f"Both vision and fallback analysis failed: {result['error']}",
+                "fallback_used": True
+            }
+        
+        return {
+            "analysis": result.get("analysis", "Analysis failed"),
+            "model_used": result["model_used"],
+            "has_visual_input": False,
+            "fallback_used": True,
+            "fallback_reason": error_reason
+        }
+    
+    def _perform_text_analysis(
+        self,
+        scene_data: Dict[str, Any],
+        user_query: Optional[str]
+    ) -> Dict[str, Any]:
+        """Analyze the scene from its structured data with the text model"""
+        
         try:
             # Use text-only model for analysis
             system_prompt = get_system_prompt(PromptType.VISION_ANALYZER)
@@ -171,19 +406,18 @@ Please analyze this Blender scene based on the provided data.
             
             response = self.api_client.make_request(request)
             
+            if response.error:
+                return {"error": response.error, "model_used": request.model}
+            
             return {
-                "analysis": response.content if not response.error else "Analysis failed",
+                "analysis": response.content,
                 "model_used": request.model,
                 "has_visual_input": False,
-                "fallback_used": True,
-                "fallback_reason": error_reason
+                "fallback_used": False
             }
             
         except Exception as e:
-            return {
-                "error": f"Both vision and fallback analysis failed: {str(e)}",
-                "fallback_used": True
-            }
+            return {"error": str(e)}
     
     def _create_scene_description(self, scene_data: Dict[str, Any]) -> str:
         """Create detailed text description of scene data"""
@@ -259,36 +493,51 @@ Please analyze this Blender scene based on the provided data.
     def analyze_spatial_relationships(
         self, 
         context, 
-        objects: Optional[List[str]] = None
+        objects: Optional[List[str]] = None,
+        max_neighbors: int = 4
     ) -> Dict[str, Any]:
-        """Analyze spatial relationships between objects"""
+        """Analyze spatial relationships between neighbouring objects"""
         
         try:
             # Get scene data
             scene_data = self.scene_analyzer.analyze_scene(context)
+            all_objects = scene_data.get("objects", [])
             
             # Filter objects if specified
             if objects:
                 filtered_objects = [
-                    obj for obj in scene_data.get("objects", [])
+                    obj for obj in all_objects
                     if obj["name"] in objects
                 ]
             else:
-                filtered_objects = scene_data.get("objects", [])
+                filtered_objects = all_objects
             
             # Analyze relationships
             relationships = []
+            spatial_index = get_spatial_index()
             
-            for i, obj1 in enumerate(filtered_objects):
-                for obj2 in filtered_objects[i+1:]:
-                    relationship = self._calculate_spatial_relationship(obj1, obj2)
+            if spatial_index is not None:
+                spatial_index.sync_from_scene_data(all_objects)
+                by_name = {obj["name"]: obj for obj in filtered_objects}
+                
+                # Only neighbouring pairs carry meaningful relationships
+                for name1, name2, _ in spatial_index.neighbor_pairs(max_neighbors, names=set(by_name)):
+                    relationship = self._calculate_spatial_relationship(by_name[name1], by_name[name2])
                     if relationship:
+                        relationship["contact"] = spatial_index.contact(name1, name2)
                         relationships.append(relationship)
+            else:
+                for i, obj1 in enumerate(filtered_objects):
+                    for obj2 in filtered_objects[i+1:]:
+                        relationship = self._calculate_spatial_relationship(obj1, obj2)
+                        if relationship:
+                            relationships.append(relationship)
             
             return {
                 "relationships": relationships,
                 "analyzed_objects": len(filtered_objects),
-                "total_relationships": len(relationships)
+                "total_relationships": len(relationships),
+                "method": "spatial_index" if spatial_index is not None else "pairwise"
             }
             
         except Exception as e:
@@ -343,7 +592,9 @@ Please analyze this Blender scene based on the provided data.
             "spatial_analysis_available": True,
             "multi_view_available": True,
             "configured_vision_model": self._get_vision_model(),
-            "vision_context_enabled": self.settings.enable_vision_context
+            "vision_context_enabled": self.settings.enable_vision_context,
+            "frame_dedup": self.frame_dedup.get_stats(),
+            "vision_routing": self.vision_router.get_stats()
         }
 
 # Global multi-modal vision instance
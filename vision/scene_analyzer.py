@@ -6,10 +6,11 @@ Comprehensive Blender scene analysis and data extraction
 import bpy
 import bmesh
 import mathutils
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Sequence
 import time
 
 from ..config.settings import get_settings
+from .scene_snapshot import ObjectSnapshot, ObjectSnapshotBuilder, NUMPY_AVAILABLE, np
 
 class SceneAnalyzer:
     """Analyzes Blender scenes and extracts comprehensive data"""
@@ -71,8 +72,108 @@ class SceneAnalyzer:
             "gravity": list(scene.gravity) if hasattr(scene, 'gravity') else [0, 0, -9.81]
         }
     
-    def _extract_object_data(self, context) -> List[Dict[str, Any]]:
-        """Extract detailed object information"""
+    def _extract_object_data(self, context) -> Sequence[Dict[str, Any]]:
+        """Extract detailed object information (array-backed dict views when NumPy is available)"""
+        if NUMPY_AVAILABLE:
+            try:
+                return self.extract_object_snapshot(context).objects
+            except Exception as e:
+                print(f"Columnar object snapshot failed, using per-object dicts: {e}")
+        return self._extract_object_dicts(context)
+    
+    def extract_object_snapshot(self, context) -> ObjectSnapshot:
+        """Extract object information into a columnar snapshot"""
+        
+        scene_objects = context.scene.objects
+        objects = list(scene_objects)
+        active_object = getattr(context, 'active_object', None)
+        
+        # Transforms and bounds in bulk; fall back to reading them per object
+        transforms = self._read_transform_columns(scene_objects, len(objects))
+        
+        builder = ObjectSnapshotBuilder()
+        mesh_data_cache: Dict[Any, Dict[str, Any]] = {}  # Meshes shared by several objects are read once
+        source_rows = []
+        
+        for index, obj in enumerate(objects):
+            try:
+                obj_data = {
+                    "name": obj.name,
+                    "type": obj.type,
+                    "visible": obj.visible_get(),
+                    "selected": obj.select_get(),
+                    "active": obj == active_object if active_object else False,
+                    "parent": obj.parent.name if obj.parent else None,
+                    "material_slots": len(obj.material_slots),
+                    "modifiers": [mod.name for mod in obj.modifiers],
+                    "constraints": [con.name for con in obj.constraints]
+                }
+                
+                if transforms is None:
+                    obj_data.update({
+                        "location": list(obj.location),
+                        "rotation_euler": list(obj.rotation_euler),
+                        "scale": list(obj.scale),
+                        "dimensions": list(obj.dimensions),
+                        "world_bounds": self._world_bounds(obj)
+                    })
+                
+                # Add type-specific data
+                if obj.type == 'MESH':
+                    mesh_data = mesh_data_cache.get(obj.data) if obj.data else None
+                    if mesh_data is None:
+                        mesh_data = self._extract_mesh_data(obj)
+                        if obj.data:
+                            mesh_data_cache[obj.data] = mesh_data
+                    obj_data.update(mesh_data)
+                elif obj.type == 'LIGHT':
+                    obj_data.update(self._extract_light_specific_data(obj))
+                elif obj.type == 'CAMERA':
+                    obj_data.update(self._extract_camera_specific_data(obj))
+                
+                builder.add(obj_data)
+                source_rows.append(index)
+                
+            except Exception as e:
+                print(f"Error extracting data for object {obj.name}: {e}")
+                continue
+        
+        snapshot = builder.build()
+        if transforms is not None:
+            for key, column in transforms.items():
+                snapshot.records[key] = column[source_rows]
+        return snapshot
+    
+    def _read_transform_columns(self, scene_objects, count: int) -> Optional[Dict[str, Any]]:
+        """Transform and world bounds columns read with foreach_get, or None if unsupported"""
+        
+        try:
+            columns = {}
+            for key in ('location', 'rotation_euler', 'scale', 'dimensions'):
+                values = np.empty(count * 3, dtype=np.float32)
+                scene_objects.foreach_get(key, values)
+                columns[key] = values.reshape(count, 3).astype(np.float64)
+            
+            # matrix_world comes out column-major, so row vectors multiply from the left
+            matrices = np.empty(count * 16, dtype=np.float32)
+            scene_objects.foreach_get('matrix_world', matrices)
+            matrices = matrices.reshape(count, 4, 4).astype(np.float64)
+            
+            corners = np.empty(count * 24, dtype=np.float32)
+            scene_objects.foreach_get('bound_box', corners)
+            corners = np.concatenate(
+                [corners.reshape(count, 8, 3).astype(np.float64), np.ones((count, 8, 1))], axis=2
+            )
+            world_corners = (corners @ matrices)[..., :3]
+            columns['bounds_min'] = world_corners.min(axis=1)
+            columns['bounds_max'] = world_corners.max(axis=1)
+            return columns
+            
+        except Exception:
+            return None
+    
+    def _extract_object_dicts(self, context) -> List[Dict[str, Any]]:
+        """Extract detailed object information as one dict per object"""
         objects = []
         
         for obj in context.scene.objects:
@@ -87,6 +188,7 @@ class SceneAnalyzer:
                     "rotation_euler": list(obj.rotation_euler),
                     "scale": list(obj.scale),
                     "dimensions": list(obj.dimensions),
+                    "world_bounds": self._world_bounds(obj),
                     "visible": obj.visible_get(),
                     "selected": obj.select_get(),
                     "active": obj == active_object if active_object else False,
@@ -113,6 +215,15 @@ class SceneAnalyzer:
         
         return objects
     
+    def _world_bounds(self, obj) -> List[List[float]]:
+        """World-space axis-aligned bounding box as [min, max]"""
+        matrix = obj.matrix_world
+        corners = [matrix @ mathutils.Vector(corner) for corner in obj.bound_box]
+        return [
+            [min(corner[i] for corner in corners) for i in range(3)],
+            [max(corner[i] for corner in corners) for i in range(3)]
+        ]
+    
     def _extract_mesh_data(self, obj) -> Dict[str, Any]:
         """Extract mesh-specific data"""
         if not obj.data:
@@ -0,0 +1,455 @@
+"""
+Scene Snapshot for BlendPro: AI Co-Pilot
+Columnar, array-backed object data with vectorized filters and lazy dict views
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+
+from ..utils.dependency_loader import safe_import
+
+numpy = safe_import('numpy', 'NumPy (Numerical Computing)', required=False, min_version='1.24.0')
+
+NUMPY_AVAILABLE = numpy is not None
+np = numpy if NUMPY_AVAILABLE else None
+
+OBJECT_TYPES = (
+    'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'CURVES', 'POINTCLOUD', 'VOLUME',
+    'GPENCIL', 'GREASEPENCIL', 'ARMATURE', 'LATTICE', 'EMPTY', 'LIGHT', 'LIGHT_PROBE',
+    'CAMERA', 'SPEAKER'
+)
+_TYPE_CODES = {object_type: code for code, object_type in enumerate(OBJECT_TYPES)}
+
+# Bits of the "flags" column
+FLAG_VISIBLE = 1
+FLAG_SELECTED = 2
+FLAG_ACTIVE = 4
+FLAG_MESH_DATA = 8  # Mesh object with data: the mesh keys are present
+
+if NUMPY_AVAILABLE:
+    OBJECT_DTYPE = np.dtype([
+        ('name', 'i4'),
+        ('type', 'u1'),
+        ('flags', 'u1'),
+        ('parent', 'i4'),  # Row of the parent object, -1 for none
+        ('location', 'f8', 3),
+        ('rotation_euler', 'f8', 3),
+        ('scale', 'f8', 3),
+        ('dimensions', 'f8', 3),
+        ('bounds_min', 'f8', 3),
+        ('bounds_max', 'f8', 3),
+        ('material_slots', 'i4'),
+        ('vertices', 'i4'),
+        ('edges', 'i4'),
+        ('faces', 'i4'),
+        ('uv_layers', 'i2'),
+        ('vertex_colors', 'i2')
+    ])
+else:
+    OBJECT_DTYPE = None
+
+_BASE_KEYS = (
+    "name", "type", "location", "rotation_euler", "scale", "dimensions", "world_bounds",
+    "visible", "selected", "active", "parent", "children", "material_slots", "modifiers",
+    "constraints"
+)
+_MESH_KEYS = ("vertices", "edges", "faces", "materials", "uv_layers", "vertex_colors", "issues")
+
+class NameTable:
+    """Interned strings addressed by integer id"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def get_id(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def __getitem__(self, name_id: int) -> Optional[str]:
+        return self.names[name_id] if name_id >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+class RaggedColumn:
+    """Variable-length rows of name ids stored as offsets into one flat array"""
+
+    def __init__(self, offsets, values):
+        self.offsets = offsets
+        self.values = values
+
+    @classmethod
+    def from_rows(cls, rows: List[List[int]]) -> "RaggedColumn":
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.fromiter((value for row in rows for value in row), dtype=np.int32, count=int(offsets[-1]))
+        return cls(offsets, values)
+
+    def row(self, index: int):
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + self.values.nbytes
+
+class ObjectSnapshot:
+    """Object data of a scene as numpy columns
+
+    Numeric fields live in one structured array, strings are interned in a
+    shared name table and list fields (modifiers, constraints, materials, mesh
+    issues) are ragged id columns. Filters run as array operations; consumers
+    that expect SceneAnalyzer's per-object dicts read them through `objects`.
+    """
+
+    def __init__(
+        self,
+        records,
+        strings: NameTable,
+        modifiers: RaggedColumn,
+        constraints: RaggedColumn,
+        materials: RaggedColumn,
+        issues: RaggedColumn,
+        extras: Optional[Dict[int, Dict[str, Any]]] = None
+    ):
+        self.records = records
+        self.strings = strings
+        self.modifiers = modifiers
+        self.constraints = constraints
+        self.materials = materials
+        self.issues = issues
+        self.extras = extras or {}  # Type-specific keys of light and camera rows
+
+        self._rows_by_name: Optional[Dict[str, int]] = None
+        self._children: Optional[RaggedColumn] = None
+
+    @classmethod
+    def from_dicts(cls, objects: Iterable[Dict[str, Any]]) -> "ObjectSnapshot":
+        """Build a snapshot from SceneAnalyzer object dicts"""
+
+        builder = ObjectSnapshotBuilder()
+        for obj in objects:
+            builder.add(obj)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def objects(self) -> "ObjectsView":
+        """All rows as read-only dict views"""
+        return ObjectsView(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (excluding the interned strings)"""
+        return (
+            self.records.nbytes + self.modifiers.nbytes + self.constraints.nbytes +
+            self.materials.nbytes + self.issues.nbytes
+        )
+
+    def row_of(self, name: str) -> Optional[int]:
+        """Row of an object by name"""
+        if self._rows_by_name is None:
+            names = self.strings.names
+            self._rows_by_name = {names[name_id]: row for row, name_id in enumerate(self.records['name'].tolist())}
+        return self._rows_by_name.get(name)
+
+    def names(self, rows=None) -> List[str]:
+        """Object names of the given rows (all rows by default)"""
+        names = self.strings.names
+        ids = self.records['name'] if rows is None else self.records['name'][rows]
+        return [names[name_id] for name_id in ids.tolist()]
+
+    def children_rows(self, row: int):
+        """Rows of the direct children of a row"""
+        if self._children is None:
+            parents = self.records['parent']
+            order = np.argsort(parents, kind='stable')
+            order = order[parents[order] >= 0]
+            counts = np.bincount(parents[order], minlength=len(self))
+            offsets = np.zeros(len(self) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            self._children = RaggedColumn(offsets, order.astype(np.int32))
+        return self._children.row(row)
+
+    # Vectorized filters; each returns an array of rows
+
+    def type_mask(self, *object_types: str):
+        codes = [_TYPE_CODES[object_type] for object_type in object_types if object_type in _TYPE_CODES]
+        return np.isin(self.records['type'], codes)
+
+    def of_type(self, *object_types: str):
+        return np.flatnonzero(self.type_mask(*object_types))
+
+    def flagged(self, flag: int):
+        return np.flatnonzero(self.records['flags'] & flag)
+
+    def meshes_with_vertices_over(self, count: int):
+        return np.flatnonzero(self.type_mask('MESH') & (self.records['vertices'] > count))
+
+    def without_materials(self, object_types: Iterable[str] = ('MESH',)):
+        return np.flatnonzero(self.type_mask(*object_types) & (self.records['material_slots'] == 0))
+
+    def with_modifiers_over(self, count: int):
+        return np.flatnonzero(self.modifiers.lengths() > count)
+
+    def with_issues(self):
+        return np.flatnonzero(self.issues.lengths() > 0)
+
+    @staticmethod
+    def union(*row_arrays):
+        rows = np.empty(0, dtype=np.int64)
+        for row_array in row_arrays:
+            rows = np.union1d(rows, row_array)
+        return rows
+
+    def subset(self, rows) -> "ObjectsView":
+        """Dict views of the given rows"""
+        return ObjectsView(self, rows)
+
+    def view(self, row: int) -> "ObjectView":
+        return ObjectView(self, int(row))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a plain dict"""
+        return [self.view(row).to_dict() for row in range(len(self))]
+
+class ObjectSnapshotBuilder:
+    """Collects object dicts into column lists and packs them into arrays once"""
+
+    _VECTOR_KEYS = ('location', 'rotation_euler', 'scale', 'dimensions')
+    _MESH_COUNT_KEYS = ('vertices', 'edges', 'faces', 'uv_layers', 'vertex_colors')
+
+    def __init__(self):
+        self.strings = NameTable()
+        self.count = 0
+
+        self._columns: Dict[str, list] = {
+            key: [] for key in ('name', 'type', 'flags', 'material_slots') + self._VECTOR_KEYS + self._MESH_COUNT_KEYS
+        }
+        self._bounds_min: List[Any] = []
+        self._bounds_max: List[Any] = []
+        self._parents: List[Optional[str]] = []
+        self._modifiers: List[List[int]] = []
+        self._constraints: List[List[int]] = []
+        self._materials: List[List[int]] = []
+        self._issues: List[List[int]] = []
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+    def _ids(self, names: Iterable[Optional[str]]) -> List[int]:
+        return [self.strings.intern(name) if name is not None else -1 for name in names]
+
+    def add(self, obj: Dict[str, Any]) -> int:
+        """Append a SceneAnalyzer-style object dict and return its row"""
+
+        row = self.count
+        columns = self._columns
+        columns['name'].append(self.strings.intern(obj["name"]))
+        columns['type'].append(_TYPE_CODES.get(obj["type"], _TYPE_CODES['EMPTY']))
+
+        flags = 0
+        if obj.get("visible"):
+            flags |= FLAG_VISIBLE
+        if obj.get("selected"):
+            flags |= FLAG_SELECTED
+        if obj.get("active"):
+            flags |= FLAG_ACTIVE
+        if "vertices" in obj:
+            flags |= FLAG_MESH_DATA
+        columns['flags'].append(flags)
+
+        for key in self._VECTOR_KEYS:
+            columns[key].append(obj.get(key, (0.0, 0.0, 0.0)))
+        bounds = obj.get("world_bounds") or ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+        self._bounds_min.append(bounds[0])
+        self._bounds_max.append(bounds[1])
+
+        columns['material_slots'].append(obj.get("material_slots", 0))
+        for key in self._MESH_COUNT_KEYS:
+            columns[key].append(obj.get(key, 0))
+
+        self._parents.append(obj.get("parent"))
+        self._modifiers.append(self._ids(obj.get("modifiers", [])))
+        self._constraints.append(self._ids(obj.get("constraints", [])))
+        self._materials.append(self._ids(obj.get("materials", [])))
+        self._issues.append(self._ids(obj.get("issues", [])))
+
+        extras = {key: value for key, value in obj.items() if key not in _BASE_KEYS and key not in _MESH_KEYS}
+        if extras:
+            self._extras[row] = extras
+
+        self.count += 1
+        return row
+
+    def build(self) -> ObjectSnapshot:
+        records = np.zeros(self.count, dtype=OBJECT_DTYPE)
+        if self.count:
+            for key, values in self._columns.items():
+                records[key] = values
+            records['bounds_min'] = self._bounds_min
+            records['bounds_max'] = self._bounds_max
+
+        # Parents are resolved once every row has a name id
+        rows_by_name = {name_id: row for row, name_id in enumerate(self._columns['name'])}
+        records['parent'] = [
+            rows_by_name.get(self.strings.get_id(parent), -1) if parent is not None else -1
+            for parent in self._parents
+        ]
+
+        return ObjectSnapshot(
+            records,
+            self.strings,
+            RaggedColumn.from_rows(self._modifiers),
+            RaggedColumn.from_rows(self._constraints),
+            RaggedColumn.from_rows(self._materials),
+            RaggedColumn.from_rows(self._issues),
+            self._extras
+        )
+
+def _vector(key: str):
+    return lambda snapshot, row: snapshot.records[key][row].tolist()
+
+def _names(column: str):
+    return lambda snapshot, row: [snapshot.strings[name_id] for name_id in getattr(snapshot, column).row(row).tolist()]
+
+def _flag(flag: int):
+    return lambda snapshot, row: bool(snapshot.records['flags'][row] & flag)
+
+def _integer(key: str):
+    return lambda snapshot, row: int(snapshot.records[key][row])
+
+def _parent(snapshot: ObjectSnapshot, row: int) -> Optional[str]:
+    parent = int(snapshot.records['parent'][row])
+    return snapshot.strings[int(snapshot.records['name'][parent])] if parent >= 0 else None
+
+_GETTERS = {
+    "name": lambda snapshot, row: snapshot.strings[int(snapshot.records['name'][row])],
+    "type": lambda snapshot, row: OBJECT_TYPES[snapshot.records['type'][row]],
+    "location": _vector('location'),
+    "rotation_euler": _vector('rotation_euler'),
+    "scale": _vector('scale'),
+    "dimensions": _vector('dimensions'),
+    "world_bounds": lambda snapshot, row: [
+        snapshot.records['bounds_min'][row].tolist(), snapshot.records['bounds_max'][row].tolist()
+    ],
+    "visible": _flag(FLAG_VISIBLE),
+    "selected": _flag(FLAG_SELECTED),
+    "active": _flag(FLAG_ACTIVE),
+    "parent": _parent,
+    "children": lambda snapshot, row: snapshot.names(snapshot.children_rows(row)),
+    "material_slots": _integer('material_slots'),
+    "modifiers": _names('modifiers'),
+    "constraints": _names('constraints'),
+    "vertices": _integer('vertices'),
+    "edges": _integer('edges'),
+    "faces": _integer('faces'),
+    "materials": _names('materials'),
+    "uv_layers": _integer('uv_layers'),
+    "vertex_colors": _integer('vertex_colors'),
+    "issues": _names('issues')
+}
+
+class ObjectView(Mapping):
+    """Read-only dict view of one snapshot row; values are built on access"""
+
+    __slots__ = ('_snapshot', '_row')
+
+    def __init__(self, snapshot: ObjectSnapshot, row: int):
+        self._snapshot = snapshot
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def _keys(self) -> List[str]:
+        keys = list(_BASE_KEYS)
+        if self._snapshot.records['flags'][self._row] & FLAG_MESH_DATA:
+            keys.extend(_MESH_KEYS)
+        keys.extend(self._snapshot.extras.get(self._row, ()))
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        extras = self._snapshot.extras.get(self._row)
+        if extras and key in extras:
+            return extras[key]
+        getter = _GETTERS.get(key)
+        if getter is None or (key in _MESH_KEYS and not self._snapshot.records['flags'][self._row] & FLAG_MESH_DATA):
+            raise KeyError(key)
+        return getter(self._snapshot, self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize as a plain dict"""
+        return {key: self[key] for key in self._keys()}
+
+    def __repr__(self) -> str:
+        return f"ObjectView({self.to_dict()!r})"
+
+class ObjectsView(Sequence):
+    """Read-only list view of snapshot rows as ObjectView mappings"""
+
+    def __init__(self, snapshot: ObjectSnapshot, rows=None):
+        self.snapshot = snapshot
+        self.rows = rows  # None means every row
+
+    def __len__(self) -> int:
+        return len(self.snapshot) if self.rows is None else len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = np.arange(len(self.snapshot))[index] if self.rows is None else self.rows[index]
+            return ObjectsView(self.snapshot, rows)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("object index out of range")
+        row = index if self.rows is None else int(self.rows[index])
+        return ObjectView(self.snapshot, row)
+
+    def __iter__(self) -> Iterator[ObjectView]:
+        rows = range(len(self.snapshot)) if self.rows is None else self.rows.tolist()
+        for row in rows:
+            yield ObjectView(self.snapshot, row)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Materialize as a list of plain dicts"""
+        return [view.to_dict() for view in self]
+
+    def __repr__(self) -> str:
+        return f"ObjectsView({len(self)} objects)"
+
+def snapshot_of(objects: Any) -> Optional[ObjectSnapshot]:
+    """Snapshot behind a scene_data["objects"] value when it covers every row"""
+    if isinstance(objects, ObjectsView) and objects.rows is None:
+        return objects.snapshot
+    return None
+
+def snapshot_json_default(value: Any) -> Any:
+    """json.dumps default that serializes snapshot views and numpy values"""
+    if isinstance(value, ObjectView):
+        return value.to_dict()
+    if isinstance(value, ObjectsView):
+        return value.to_list()
+    if NUMPY_AVAILABLE and isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -5,45 +5,200 @@ Captures and manages viewport screenshots for vision analysis
 
 import bpy
 import gpu
-import base64
-import io
+import itertools
+import math
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, Tuple, List
-from mathutils import Vector
+from mathutils import Matrix, Quaternion, Vector
 
 from ..config.settings import get_settings
 from ..utils.dependency_loader import safe_import, is_available
+from .image_encoder import get_image_encoder, EncodingOptions
+from .frame_dedup import compute_fingerprint, FrameFingerprint
+from .image_cache import get_image_cache
+from .spatial_index import object_bounds
 
 # Import image processing dependencies with dependency loader
 PIL = safe_import('PIL', 'Pillow (Image Processing)', required=False, min_version='10.0.0')
-numpy = safe_import('numpy', 'NumPy (Numerical Computing)', required=False, min_version='1.24.0')
 
 # Feature flags for conditional functionality
 PIL_AVAILABLE = PIL is not None
-NUMPY_AVAILABLE = numpy is not None
 
 # Import specific classes if available
 if PIL_AVAILABLE:
     try:
-        from PIL import Image
+        from PIL import Image, ImageDraw
     except ImportError:
         Image = None
+        ImageDraw = None
         PIL_AVAILABLE = False
 else:
     Image = None
+    ImageDraw = None
 
-if NUMPY_AVAILABLE:
-    np = numpy
-else:
-    np = None
+# Blender's viewport lens maps to a 72 mm sensor (36 mm default sensor at 2x zoom)
+VIEWPORT_SENSOR_WIDTH = 72.0
+
+def view_matrix_from_angle(
+    view_angle: Dict[str, Any],
+    location: Vector,
+    rotation: Quaternion,
+    distance: float
+) -> Matrix:
+    """World-to-view matrix for an orbit view, like RegionView3D.view_matrix"""
+    
+    location = Vector(view_angle.get("location", location))
+    rotation = Quaternion(view_angle.get("rotation", rotation))
+    distance = view_angle.get("distance", distance)
+    
+    view_to_world = (
+        Matrix.Translation(location) @
+        rotation.to_matrix().to_4x4() @
+        Matrix.Translation((0.0, 0.0, distance))
+    )
+    return view_to_world.inverted()
+
+def perspective_matrix(lens: float, clip_start: float, clip_end: float, width: int, height: int) -> Matrix:
+    """Viewport projection for a lens and output size (sensor fitted to the longer side)"""
+    
+    half_extent = clip_start * (VIEWPORT_SENSOR_WIDTH / 2.0) / lens
+    if width >= height:
+        right, top = half_extent, half_extent * height / width
+    else:
+        right, top = half_extent * width / height, half_extent
+    
+    depth = clip_end - clip_start
+    return Matrix((
+        (clip_start / right, 0.0, 0.0, 0.0),
+        (0.0, clip_start / top, 0.0, 0.0),
+        (0.0, 0.0, -(clip_end + clip_start) / depth, -2.0 * clip_end * clip_start / depth),
+        (0.0, 0.0, -1.0, 0.0)
+    ))
+
+def project_bounds_to_screen(
+    bounds: Tuple[List[float], List[float]],
+    view_matrix: Matrix,
+    projection_matrix: Matrix,
+    width: int,
+    height: int
+) -> Optional[Tuple[int, int, int, int]]:
+    """Pixel box (left, top, right, bottom) covering a world-space AABB, or None when off-screen"""
+    
+    transform = projection_matrix @ view_matrix
+    xs, ys = [], []
+    behind = 0
+    for corner in itertools.product(*zip(*bounds)):
+        clip = transform @ Vector((*corner, 1.0))
+        if clip.w <= 1e-6:
+            behind += 1
+            continue
+        xs.append((clip.x / clip.w + 1.0) * 0.5 * width)
+        ys.append((1.0 - clip.y / clip.w) * 0.5 * height)
+    
+    if not xs:
+        return None
+    
+    # Box straddles the view plane: its projection can cover any part of the frame
+    if behind:
+        return 0, 0, width, height
+    
+    left, right = max(0.0, min(xs)), min(float(width), max(xs))
+    top, bottom = max(0.0, min(ys)), min(float(height), max(ys))
+    if left >= right or top >= bottom:
+        return None
+    return int(left), int(top), math.ceil(right), math.ceil(bottom)
+
+def expand_box(
+    box: Tuple[int, int, int, int],
+    padding: float,
+    min_size: int,
+    width: int,
+    height: int
+) -> Tuple[int, int, int, int]:
+    """Pad a pixel box, grow it to a minimum size and shift it inside the frame"""
+    
+    left, top, right, bottom = box
+    box_width = min(width, max((right - left) * (1.0 + 2.0 * padding), min_size))
+    box_height = min(height, max((bottom - top) * (1.0 + 2.0 * padding), min_size))
+    
+    center_x, center_y = (left + right) / 2.0, (top + bottom) / 2.0
+    left = min(max(0.0, center_x - box_width / 2.0), width - box_width)
+    top = min(max(0.0, center_y - box_height / 2.0), height - box_height)
+    return int(left), int(top), int(left + box_width), int(top + box_height)
+
+class OffscreenPool:
+    """Reuses GPU offscreen targets and read-back buffers per resolution"""
+    
+    def __init__(self, max_sizes: int = 4):
+        self._offscreens: "OrderedDict[Tuple[int, int], Any]" = OrderedDict()
+        self._buffers: Dict[Tuple[int, int], Any] = {}
+        self._max_sizes = max_sizes
+        self._allocations = 0
+        self._reuses = 0
+    
+    def acquire(self, width: int, height: int):
+        """Offscreen target of the given size, allocated on first use"""
+        
+        size = (width, height)
+        offscreen = self._offscreens.get(size)
+        if offscreen is not None:
+            self._offscreens.move_to_end(size)
+            self._reuses += 1
+            return offscreen
+        
+        offscreen = gpu.types.GPUOffScreen(width, height)
+        self._offscreens[size] = offscreen
+        self._allocations += 1
+        
+        while len(self._offscreens) > self._max_sizes:
+            evicted_size, evicted = self._offscreens.popitem(last=False)
+            evicted.free()
+            self._buffers.pop(evicted_size, None)
+        
+        return offscreen
+    
+    def scratch_buffer(self, width: int, height: int):
+        """Read-back buffer reused by callers that copy pixels out immediately"""
+        
+        size = (width, height)
+        buffer = self._buffers.get(size)
+        if buffer is None:
+            buffer = gpu.types.Buffer('UBYTE', width * height * 4)
+            self._buffers[size] = buffer
+        return buffer
+    
+    def free(self) -> None:
+        """Release all GPU targets"""
+        for offscreen in self._offscreens.values():
+            try:
+                offscreen.free()
+            except Exception as e:
+                print(f"Offscreen free failed: {e}")
+        self._offscreens.clear()
+        self._buffers.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        return {
+            "pooled_sizes": len(self._offscreens),
+            "allocations": self._allocations,
+            "reuses": self._reuses
+        }
 
 class ScreenshotManager:
     """Manages viewport screenshot capture and processing"""
     
     def __init__(self):
         self.settings = get_settings()
-        self._screenshot_cache: Dict[str, Tuple[str, float]] = {}
+        self._image_cache = get_image_cache()
+        self._source_frames: "OrderedDict[FrameFingerprint, Image.Image]" = OrderedDict()
+        self._max_source_frames = 2
+        self._source_lock = threading.Lock()
+        self._offscreen_pool = OffscreenPool()
         self._cache_timeout = 30.0  # seconds
     
     def capture_viewport_screenshot(
@@ -53,61 +208,95 @@ class ScreenshotManager:
         use_cache: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Capture screenshot of current viewport"""
+        return self.capture_viewport_screenshot_async(context, resolution, use_cache).result()
+    
+    def capture_viewport_screenshot_async(
+        self,
+        context,
+        resolution: Optional[Tuple[int, int]] = None,
+        use_cache: bool = True,
+        options: Optional[EncodingOptions] = None
+    ) -> Future:
+        """Read the viewport on the calling (main) thread and encode it on the worker thread"""
+        
+        result_future: Future = Future()
         
         if not PIL_AVAILABLE:
-            return {"error": "PIL not available for screenshot capture"}
+            result_future.set_result({"error": "PIL not available for screenshot capture"})
+            return result_future
         
         try:
             # Generate cache key
-            cache_key = self._generate_cache_key(context, resolution)
+            cache_key = f"screenshot:{self._generate_cache_key(context, resolution)}"
             
             # Check cache
-            if use_cache and cache_key in self._screenshot_cache:
-                cached_data, timestamp = self._screenshot_cache[cache_key]
-                if time.time() - timestamp < self._cache_timeout:
-                    return {"base64_image": cached_data, "cached": True}
+            if use_cache:
+                cached = self._image_cache.get(cache_key)
+                if cached is not None:
+                    result_future.set_result({
+                        **cached.image.to_dict(), **cached.metadata, "cache_key": cache_key, "cached": True
+                    })
+                    return result_future
             
-            # Capture screenshot
-            screenshot_data = self._capture_screenshot(context, resolution)
+            # Read pixels (GPU access must stay on the main thread)
+            image = self._capture_screenshot(context, resolution)
             
-            if screenshot_data:
-                # Cache the result
-                if use_cache:
-                    self._screenshot_cache[cache_key] = (screenshot_data["base64_image"], time.time())
+            if isinstance(image, dict):
+                result_future.set_result(image)
+                return result_future
+            
+            encode_future = get_image_encoder().encode_async(image, options)
+            
+            def on_encoded(future: Future) -> None:
+                try:
+                    screenshot_data = {**future.result().to_dict(), "cache_key": cache_key, "cached": False}
+                    fingerprint = compute_fingerprint(image)
+                    screenshot_data["fingerprint"] = fingerprint
+                    self._remember_source_frame(fingerprint, image)
+                except Exception as e:
+                    result_future.set_result({"error": f"Screenshot encoding failed: {str(e)}"})
+                    return
                 
-                return screenshot_data
+                # Cache the encoded bytes, shared with every result that references them
+                if use_cache:
+                    self._image_cache.put(
+                        cache_key,
+                        screenshot_data["image"],
+                        ttl=self._cache_timeout,
+                        metadata={"fingerprint": fingerprint}
+                    )
+                result_future.set_result(screenshot_data)
             
-            return {"error": "Failed to capture screenshot"}
+            encode_future.add_done_callback(on_encoded)
             
         except Exception as e:
-            return {"error": f"Screenshot capture failed: {str(e)}"}
+            result_future.set_result({"error": f"Screenshot capture failed: {str(e)}"})
+        
+        return result_future
+    
+    def _find_view3d(self, context) -> Optional[Tuple[Any, Any, Any]]:
+        """Locate the 3D viewport area, its window region and space"""
+        
+        for area in context.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for region in area.regions:
+                if region.type == 'WINDOW':
+                    return area, region, area.spaces.active
+        return None
     
     def _capture_screenshot(
         self, 
         context, 
         resolution: Optional[Tuple[int, int]] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Internal screenshot capture method"""
-        
-        # Get the 3D viewport area
-        area = None
-        for area_candidate in context.screen.areas:
-            if area_candidate.type == 'VIEW_3D':
-                area = area_candidate
-                break
+    ) -> Any:
+        """Read the viewport into an RGBA image (returns an error dict on failure)"""
         
-        if not area:
+        view3d = self._find_view3d(context)
+        if view3d is None:
             return {"error": "No 3D viewport found"}
         
-        # Get region
-        region = None
-        for region_candidate in area.regions:
-            if region_candidate.type == 'WINDOW':
-                region = region_candidate
-                break
-        
-        if not region:
-            return {"error": "No viewport region found"}
+        area, region, space = view3d
         
         # Determine resolution
         if resolution is None:
@@ -120,113 +309,70 @@ class ScreenshotManager:
         height = max(height, 64)
         
         try:
-            # Create offscreen buffer
-            offscreen = gpu.types.GPUOffScreen(width, height)
-            
-            with offscreen.bind():
-                # Clear the buffer
-                gpu.state.depth_test_set('LESS')
-                gpu.state.depth_mask_set(True)
-
-                # Set up viewport (handled by offscreen buffer)
-                
-                # Get view matrix from 3D viewport
-                space = area.spaces.active
-                if space.type == 'VIEW_3D':
-                    # Get view and projection matrices
-                    view_matrix = space.region_3d.view_matrix
-                    projection_matrix = space.region_3d.window_matrix
-                    
-                    # Render the scene
-                    self._render_scene_to_buffer(context, view_matrix, projection_matrix)
-                
-                # Read pixels using GPU module
-                buffer = gpu.types.Buffer('UBYTE', width * height * 4)
-                offscreen.read_color(0, 0, width, height, 4, 0, buffer)
+            buffer = self._render_view(
+                context, region, space,
+                space.region_3d.view_matrix,
+                space.region_3d.window_matrix,
+                width, height
+            )
             
             # Convert buffer to image
-            if NUMPY_AVAILABLE and np is not None:
-                try:
-                    # Use numpy for efficient conversion
-                    pixels = np.frombuffer(buffer, dtype=np.uint8)
-                    pixels = pixels.reshape((height, width, 4))
-                    pixels = np.flipud(pixels)  # Flip vertically
-
-                    # Convert to PIL Image
-                    image = Image.fromarray(pixels, 'RGBA')
-                except Exception as numpy_error:
-                    print(f"NumPy conversion failed: {numpy_error}")
-                    # Fallback to manual conversion
-                    image = self._create_fallback_image(width, height)
-            else:
-                try:
-                    # Fallback without numpy
-                    pixels = list(buffer)
-                    image = Image.new('RGBA', (width, height))
-
-                    # Convert buffer to pixel data
-                    pixel_data = []
-                    for i in range(0, len(pixels), 4):
-                        pixel_data.append((pixels[i], pixels[i+1], pixels[i+2], pixels[i+3]))
-
-                    image.putdata(pixel_data)
-                    image = image.transpose(Image.FLIP_TOP_BOTTOM)
-                except Exception as manual_error:
-                    print(f"Manual conversion failed: {manual_error}")
-                    # Create a simple fallback image
-                    image = self._create_fallback_image(width, height)
-
-            # Ensure we have a valid image
-            if image is None:
-                image = self._create_fallback_image(width, height)
-
-            # Convert to base64
             try:
-                base64_image = self._image_to_base64(image)
-            except Exception as base64_error:
-                print(f"Base64 conversion failed: {base64_error}")
-                # Create a minimal fallback
-                fallback_image = self._create_fallback_image(64, 64)
-                base64_image = self._image_to_base64(fallback_image)
-            
-            # Clean up
-            offscreen.free()
-            
-            return {
-                "base64_image": base64_image,
-                "width": width,
-                "height": height,
-                "format": "PNG",
-                "cached": False
-            }
+                return self._buffer_to_image(buffer, width, height)
+            except Exception as conversion_error:
+                print(f"Buffer conversion failed: {conversion_error}")
+                return self._create_fallback_image(width, height)
             
         except Exception as e:
             return {"error": f"Screenshot rendering failed: {str(e)}"}
     
-    def _render_scene_to_buffer(self, context, view_matrix, projection_matrix):
-        """Render scene to the current buffer - simplified approach"""
-
+    def _render_view(
+        self,
+        context,
+        region,
+        space,
+        view_matrix: Matrix,
+        projection_matrix: Matrix,
+        width: int,
+        height: int,
+        buffer=None
+    ):
+        """Draw the scene from the given matrices into a pooled offscreen and read it back"""
+        
+        offscreen = self._offscreen_pool.acquire(width, height)
+        
+        # Draws with explicit matrices; the user's region_3d is never touched
+        offscreen.draw_view3d(
+            context.scene,
+            context.view_layer,
+            space,
+            region,
+            view_matrix,
+            projection_matrix,
+            do_color_management=True
+        )
+        
+        if buffer is None:
+            buffer = gpu.types.Buffer('UBYTE', width * height * 4)
+        
+        with offscreen.bind():
+            framebuffer = gpu.state.active_framebuffer_get()
+            framebuffer.read_color(0, 0, width, height, 4, 0, 'UBYTE', data=buffer)
+        
+        return buffer
+    
+    def _buffer_to_image(self, buffer, width: int, height: int) -> Image.Image:
+        """Wrap a bottom-up RGBA pixel buffer as a top-down image without copying"""
+        
         try:
-            # For Blender 4.4+, we'll use a simpler approach
-            # Just clear the buffer with a background color
-
-            # Get background color from world or use default
-            world = context.scene.world
-            if world and hasattr(world, 'color'):
-                bg_color = world.color[:3]
-            else:
-                bg_color = (0.05, 0.05, 0.05)  # Default dark gray
-
-            # Clear the framebuffer
-            gpu.state.depth_test_set('LESS')
-            gpu.state.depth_mask_set(True)
-
-            # The offscreen buffer will automatically capture the viewport content
-            # when we read from it, so we don't need to manually render here
-
-        except Exception as e:
-            print(f"Scene rendering error: {e}")
-
+            data = memoryview(buffer)
+        except TypeError:
+            # Buffers without the buffer protocol: one bulk conversion, not per-pixel tuples
+            data = bytes(buffer.to_list())
+        
+        # Stride 0 = tightly packed rows; orientation -1 reads rows bottom-up (the GL origin)
+        return Image.frombuffer('RGBA', (width, height), data, 'raw', 'RGBA', 0, -1)
+    
     def _create_fallback_image(self, width: int, height: int) -> Image.Image:
         """Create a simple fallback image when screenshot fails"""
         if PIL_AVAILABLE and Image:
@@ -237,23 +383,135 @@ class ScreenshotManager:
             # This shouldn't happen if we got this far, but just in case
             raise Exception("PIL not available for fallback image")
 
-    def _image_to_base64(self, image: Image.Image) -> str:
-        """Convert PIL Image to base64 string"""
+    def _remember_source_frame(self, fingerprint: FrameFingerprint, image: Image.Image) -> None:
+        """Keep the last few unencoded frames for cropping changed regions"""
+        with self._source_lock:
+            self._source_frames[fingerprint] = image
+            self._source_frames.move_to_end(fingerprint)
+            while len(self._source_frames) > self._max_source_frames:
+                self._source_frames.popitem(last=False)
+    
+    def encode_regions(
+        self,
+        screenshot_data: Dict[str, Any],
+        tile_indices: List[int]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Encode the given grid tiles of a captured frame as separate images"""
+        
+        fingerprint = screenshot_data.get("fingerprint")
+        with self._source_lock:
+            image = self._source_frames.get(fingerprint) if fingerprint else None
+        
+        if image is None:
+            return None
+        
+        options = EncodingOptions.from_settings()
+        options.tile_aware = False
+        options.byte_budget //= max(1, len(tile_indices))
+        
+        regions = []
+        for index in tile_indices:
+            box = fingerprint.tile_box(index)
+            encoded = get_image_encoder().encode(image.crop(box), options)
+            regions.append({**encoded.to_dict(), "tile_index": index, "box": box})
+        
+        return regions
+    
+    def capture_region_of_interest(
+        self,
+        context,
+        objects: List[Dict[str, Any]],
+        include_overview: bool = True,
+        padding: float = 0.15,
+        min_size: int = 256,
+        overview_dimension: int = 512
+    ) -> Dict[str, Any]:
+        """Capture a padded crop around the given objects, optionally with a low-res full frame"""
+        
+        if not PIL_AVAILABLE:
+            return {"error": "PIL not available for screenshot capture"}
+        
+        start_time = time.perf_counter()
+        
+        view3d = self._find_view3d(context)
+        if view3d is None:
+            return {"error": "No 3D viewport found"}
+        
+        area, region, space = view3d
+        width, height = max(region.width, 64), max(region.height, 64)
+        region_3d = space.region_3d
+        
+        # Project each object's bounds with the viewport's own matrices
+        boxes, names = [], []
+        for obj in objects:
+            box = project_bounds_to_screen(
+                object_bounds(obj), region_3d.view_matrix, region_3d.window_matrix, width, height
+            )
+            if box is not None:
+                boxes.append(box)
+                names.append(obj["name"])
+        
+        if not boxes:
+            return {"error": "Objects are not in view"}
+        
+        union = (
+            min(box[0] for box in boxes), min(box[1] for box in boxes),
+            max(box[2] for box in boxes), max(box[3] for box in boxes)
+        )
+        roi = expand_box(union, padding, min_size, width, height)
+        
+        # A crop covering most of the frame already shows the surroundings
+        roi_area = (roi[2] - roi[0]) * (roi[3] - roi[1])
+        include_overview = include_overview and roi_area < 0.6 * width * height
+        
+        image = self._capture_screenshot(context)
+        if isinstance(image, dict):
+            return image
+        
+        encoder = get_image_encoder()
+        crop = image.crop(roi)
+        crop_future = encoder.encode_async(crop)
         
-        # Convert RGBA to RGB if needed
-        if image.mode == 'RGBA':
-            # Create white background
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
-            image = background
+        overview_future = None
+        if include_overview:
+            options = EncodingOptions.from_settings()
+            options.max_dimension = overview_dimension
+            options.tile_aware = False
+            options.byte_budget //= 4
+            overview_future = encoder.encode_async(self._overview_image(image, roi, overview_dimension), options)
         
-        # Save to bytes
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG', quality=95)
-        buffer.seek(0)
+        # Fingerprint the crop while the worker encodes it
+        fingerprint = compute_fingerprint(crop)
+        self._remember_source_frame(fingerprint, crop)
         
-        # Encode to base64
-        return base64.b64encode(buffer.getvalue()).decode('utf-8')
+        try:
+            encoded = crop_future.result()
+            overview = overview_future.result().to_dict() if overview_future else None
+        except Exception as e:
+            return {"error": f"Region of interest encoding failed: {str(e)}"}
+        
+        return {
+            **encoded.to_dict(),
+            "cached": False,
+            "fingerprint": fingerprint,
+            "roi_box": roi,
+            "roi_objects": names,
+            "frame_size": (width, height),
+            "overview": overview,
+            "capture_time": time.perf_counter() - start_time
+        }
+    
+    def _overview_image(self, image: Image.Image, roi: Tuple[int, int, int, int], max_dimension: int) -> Image.Image:
+        """Downscaled full frame with the region of interest outlined"""
+        
+        scale = min(1.0, max_dimension / max(image.size))
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        overview = image.resize(size, Image.BILINEAR, reducing_gap=2.0).convert('RGB')
+        
+        ImageDraw.Draw(overview).rectangle(
+            [coordinate * scale for coordinate in roi], outline=(255, 200, 0), width=2
+        )
+        return overview
     
     def _generate_cache_key(self, context, resolution: Optional[Tuple[int, int]]) -> str:
         """Generate cache key for screenshot"""
@@ -305,86 +563,130 @@ class ScreenshotManager:
     ) -> List[Dict[str, Any]]:
         """Capture screenshots from multiple view angles"""
         
-        screenshots = []
-        original_view_state = self._save_view_state(context)
+        rendered = self._render_views(context, view_angles, resolution)
+        if isinstance(rendered, dict):
+            return []
         
-        try:
-            for i, view_angle in enumerate(view_angles):
-                # Set view angle
-                self._set_view_angle(context, view_angle)
-                
-                # Capture screenshot
-                screenshot = self.capture_viewport_screenshot(
-                    context, 
-                    resolution=resolution,
-                    use_cache=False  # Don't cache multi-view screenshots
-                )
-                
-                if screenshot and not screenshot.get("error"):
-                    screenshot["view_angle"] = view_angle
-                    screenshot["view_index"] = i
-                    screenshots.append(screenshot)
-                
-        finally:
-            # Restore original view state
-            self._restore_view_state(context, original_view_state)
+        # All views are drawn first; encoding then runs on the worker thread
+        encoder = get_image_encoder()
+        futures = [encoder.encode_async(image) for _, image in rendered]
+        
+        screenshots = []
+        for i, ((view_angle, _), future) in enumerate(zip(rendered, futures)):
+            try:
+                screenshot = {**future.result().to_dict(), "cached": False}
+            except Exception as e:
+                print(f"Multi-view encoding failed: {e}")
+                continue
+            screenshot["view_angle"] = view_angle
+            screenshot["view_index"] = i
+            screenshots.append(screenshot)
         
         return screenshots
     
-    def _save_view_state(self, context) -> Dict[str, Any]:
-        """Save current viewport state"""
+    def capture_contact_sheet(
+        self,
+        context,
+        view_angles: Optional[List[Dict[str, Any]]] = None,
+        resolution: Tuple[int, int] = (512, 512),
+        columns: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Capture several view angles packed into one labelled image"""
         
-        area = context.area
-        space = context.space_data
+        if not PIL_AVAILABLE:
+            return {"error": "PIL not available for screenshot capture"}
         
-        if area and area.type == 'VIEW_3D' and space and hasattr(space, 'region_3d'):
-            region_3d = space.region_3d
-            return {
-                "view_location": region_3d.view_location.copy(),
-                "view_rotation": region_3d.view_rotation.copy(),
-                "view_distance": region_3d.view_distance
-            }
+        start_time = time.perf_counter()
+        view_angles = view_angles or self.get_standard_view_angles()
+        width, height = max(resolution[0], 64), max(resolution[1], 64)
         
-        return {}
-    
-    def _restore_view_state(self, context, view_state: Dict[str, Any]) -> None:
-        """Restore viewport state"""
+        columns = columns or math.ceil(math.sqrt(len(view_angles)))
+        rows = math.ceil(len(view_angles) / columns)
+        sheet = Image.new('RGB', (columns * width, rows * height), (32, 32, 32))
+        draw = ImageDraw.Draw(sheet)
         
-        if not view_state:
-            return
+        def paste_view(index: int, image: Image.Image) -> None:
+            sheet.paste(image.convert('RGB'), ((index % columns) * width, (index // columns) * height))
         
-        area = context.area
-        space = context.space_data
+        # Each view is copied into the sheet as soon as it is read, so one buffer serves all views
+        scratch = self._offscreen_pool.scratch_buffer(width, height)
+        rendered = self._render_views(context, view_angles, (width, height), buffer=scratch, on_view=paste_view)
+        if isinstance(rendered, dict):
+            return rendered
         
-        if area and area.type == 'VIEW_3D' and space and hasattr(space, 'region_3d'):
-            region_3d = space.region_3d
-            
-            if "view_location" in view_state:
-                region_3d.view_location = view_state["view_location"]
-            if "view_rotation" in view_state:
-                region_3d.view_rotation = view_state["view_rotation"]
-            if "view_distance" in view_state:
-                region_3d.view_distance = view_state["view_distance"]
-    
-    def _set_view_angle(self, context, view_angle: Dict[str, Any]) -> None:
-        """Set viewport to specific view angle"""
+        names = []
+        for i, (view_angle, _) in enumerate(rendered):
+            name = view_angle.get("name", f"view {i + 1}")
+            names.append(name)
+            draw.text(((i % columns) * width + 8, (i // columns) * height + 8), name, fill=(255, 255, 255))
         
-        area = context.area
-        space = context.space_data
+        render_time = time.perf_counter() - start_time
         
-        if not (area and area.type == 'VIEW_3D' and space and hasattr(space, 'region_3d')):
-            return
+        try:
+            encoded = get_image_encoder().encode(sheet)
+        except Exception as e:
+            return {"error": f"Contact sheet encoding failed: {str(e)}"}
         
-        region_3d = space.region_3d
+        return {
+            **encoded.to_dict(),
+            "cached": False,
+            "views": names,
+            "grid": (columns, rows),
+            "cell_size": (width, height),
+            "render_time": render_time,
+            "capture_time": time.perf_counter() - start_time
+        }
+    
+    def _render_views(
+        self,
+        context,
+        view_angles: List[Dict[str, Any]],
+        resolution: Optional[Tuple[int, int]] = None,
+        buffer=None,
+        on_view=None
+    ) -> Any:
+        """Render each view angle offscreen (returns [(view_angle, image)] or an error dict)
+
+        With a shared buffer, each image is only valid inside on_view.
+        """
+        
+        view3d = self._find_view3d(context)
+        if view3d is None:
+            return {"error": "No 3D viewport found"}
         
-        if "location" in view_angle:
-            region_3d.view_location = Vector(view_angle["location"])
+        area, region, space = view3d
+        region_3d = space.region_3d
         
-        if "rotation" in view_angle:
-            region_3d.view_rotation = view_angle["rotation"]
+        if resolution is None:
+            width, height = region.width, region.height
+        else:
+            width, height = resolution
+        width, height = max(width, 64), max(height, 64)
+        
+        projection_matrix = perspective_matrix(space.lens, space.clip_start, space.clip_end, width, height)
+        
+        rendered = []
+        for i, view_angle in enumerate(view_angles):
+            view_matrix = view_matrix_from_angle(
+                view_angle,
+                region_3d.view_location,
+                region_3d.view_rotation,
+                region_3d.view_distance
+            )
+            try:
+                view_buffer = self._render_view(
+                    context, region, space, view_matrix, projection_matrix, width, height, buffer
+                )
+                image = self._buffer_to_image(view_buffer, width, height)
+            except Exception as e:
+                print(f"Multi-view rendering failed: {e}")
+                continue
+            
+            if on_view is not None:
+                on_view(i, image)
+            rendered.append((view_angle, image))
         
-        if "distance" in view_angle:
-            region_3d.view_distance = view_angle["distance"]
+        return rendered
     
     def get_standard_view_angles(self) -> List[Dict[str, Any]]:
         """Get standard view angles for multi-view capture"""
@@ -400,13 +702,17 @@ class ScreenshotManager:
     
     def clear_cache(self) -> None:
         """Clear screenshot cache"""
-        self._screenshot_cache.clear()
+        self._image_cache.clear()
+        self._offscreen_pool.free()
+        with self._source_lock:
+            self._source_frames.clear()
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return {
-            "cached_screenshots": len(self._screenshot_cache),
-            "cache_timeout": self._cache_timeout
+            "cache_timeout": self._cache_timeout,
+            "image_cache": self._image_cache.get_stats(),
+            "offscreen_pool": self._offscreen_pool.get_stats()
         }
 
 # Blender operator for capturing screenshots
@@ -445,3 +751,5 @@ def register():
 def unregister():
     """Unregister Blender classes"""
     bpy.utils.unregister_class(BLENDPRO_OT_CaptureScreenshot)
+    get_screenshot_manager().clear_cache()
+    get_image_encoder().shutdown()
@@ -0,0 +1,473 @@
+"""
+Spatial Index for BlendPro: AI Co-Pilot
+Uniform-grid index over world-space bounding boxes for neighbour and containment queries
+"""
+
+import math
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Sequence, Set
+
+from ..utils.dependency_loader import safe_import
+
+numpy = safe_import('numpy', 'NumPy (Numerical Computing)', required=False, min_version='1.24.0')
+NUMPY_AVAILABLE = numpy is not None
+np = numpy if NUMPY_AVAILABLE else None
+
+Cell = Tuple[int, int, int]
+
+# Objects spanning more cells than this are kept in a side list checked by every query
+MAX_CELLS_PER_OBJECT = 64
+
+def object_bounds(obj_data: Dict[str, Any]) -> Tuple[List[float], List[float]]:
+    """World-space AABB of a SceneAnalyzer object entry"""
+    bounds = obj_data.get("world_bounds")
+    if bounds:
+        return list(bounds[0]), list(bounds[1])
+
+    # Older snapshots: box around the origin sized by the dimensions
+    location = obj_data.get("location", (0.0, 0.0, 0.0))
+    half = [d / 2.0 for d in obj_data.get("dimensions", (0.0, 0.0, 0.0))]
+    return [l - h for l, h in zip(location, half)], [l + h for l, h in zip(location, half)]
+
+class SpatialIndex:
+    """Hash grid of object bounding boxes with incremental updates
+
+    Each object is registered in every cell its box overlaps, and by its centre
+    in a second map used for neighbour search. Queries only look at the cells
+    around the query, so their cost depends on local density rather than on
+    the number of objects in the scene. Distances are measured between box
+    centres.
+    """
+
+    def __init__(self, cell_size: Optional[float] = None):
+        self._fixed_cell_size = cell_size
+        self.cell_size = cell_size or 1.0
+        self._reset(0)
+
+    def _reset(self, capacity: int) -> None:
+        capacity = max(capacity, 16)
+        self._mins = np.zeros((capacity, 3))
+        self._maxs = np.zeros((capacity, 3))
+        self._names: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._box_cells: Dict[Cell, Set[int]] = {}
+        self._center_cells: Dict[Cell, Set[int]] = {}
+        self._object_cells: Dict[int, Tuple[Cell, ...]] = {}
+        self._large: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._slots
+
+    # Building and updating
+
+    def build(self, boxes: Iterable[Tuple[str, Sequence[float], Sequence[float]]]) -> None:
+        """Rebuild the index from (name, min, max) boxes"""
+
+        boxes = list(boxes)
+        self._reset(len(boxes))
+
+        if not self._fixed_cell_size and boxes:
+            mins = np.array([box[1] for box in boxes], dtype=float)
+            maxs = np.array([box[2] for box in boxes], dtype=float)
+            self.cell_size = self._choose_cell_size(mins, maxs)
+
+        if not boxes:
+            return
+
+        # Cell coordinates for every box in one vectorised pass
+        count = len(boxes)
+        self._names = [box[0] for box in boxes]
+        self._slots = {name: slot for slot, name in enumerate(self._names)}
+        self._mins[:count] = [box[1] for box in boxes]
+        self._maxs[:count] = [box[2] for box in boxes]
+
+        lows = np.floor(self._mins[:count] / self.cell_size).astype(np.int64).tolist()
+        highs = np.floor(self._maxs[:count] / self.cell_size).astype(np.int64).tolist()
+        centers = np.floor(self._centers(slice(0, count)) / self.cell_size).astype(np.int64).tolist()
+
+        for slot in range(count):
+            self._register(slot, tuple(lows[slot]), tuple(highs[slot]), tuple(centers[slot]))
+
+    def build_from_scene_data(self, objects: List[Dict[str, Any]]) -> None:
+        """Rebuild the index from SceneAnalyzer object entries"""
+        self.build((obj["name"], *object_bounds(obj)) for obj in objects)
+
+    def sync_from_scene_data(self, objects: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Apply only the additions, moves and removals since the last sync"""
+
+        if not self._slots:
+            self.build_from_scene_data(objects)
+            return {"added": len(objects), "updated": 0, "removed": 0, "rebuilt": True}
+
+        seen = set()
+        added = updated = 0
+        for obj in objects:
+            name = obj["name"]
+            seen.add(name)
+            bmin, bmax = object_bounds(obj)
+            slot = self._slots.get(name)
+            if slot is None:
+                self.insert(name, bmin, bmax)
+                added += 1
+            elif not (np.allclose(self._mins[slot], bmin) and np.allclose(self._maxs[slot], bmax)):
+                self.update(name, bmin, bmax)
+                updated += 1
+
+        removed = [name for name in self._slots if name not in seen]
+        for name in removed:
+            self.remove(name)
+
+        # A mostly changed scene is better served by a fresh cell size
+        if added + updated > len(self._slots) // 2 and not self._fixed_cell_size:
+            self.build_from_scene_data(objects)
+            return {"added": added, "updated": updated, "removed": len(removed), "rebuilt": True}
+
+        return {"added": added, "updated": updated, "removed": len(removed), "rebuilt": False}
+
+    def insert(self, name: str, bmin: Sequence[float], bmax: Sequence[float]) -> None:
+        """Add an object's box"""
+
+        if name in self._slots:
+            self.update(name, bmin, bmax)
+            return
+
+        if self._free:
+            slot = self._free.pop()
+            self._names[slot] = name
+        else:
+            slot = len(self._names)
+            self._names.append(name)
+            if slot >= len(self._mins):
+                self._mins = np.resize(self._mins, (len(self._mins) * 2, 3))
+                self._maxs = np.resize(self._maxs, (len(self._maxs) * 2, 3))
+
+        self._slots[name] = slot
+        self._mins[slot] = bmin
+        self._maxs[slot] = bmax
+        self._register(slot)
+
+    def update(self, name: str, bmin: Sequence[float], bmax: Sequence[float]) -> None:
+        """Move an object's box"""
+        slot = self._slots[name]
+        self._unregister(slot)
+        self._mins[slot] = bmin
+        self._maxs[slot] = bmax
+        self._register(slot)
+
+    def remove(self, name: str) -> None:
+        """Remove an object"""
+        slot = self._slots.pop(name, None)
+        if slot is None:
+            return
+        self._unregister(slot)
+        self._names[slot] = None
+        self._free.append(slot)
+
+    def _choose_cell_size(self, mins, maxs) -> float:
+        """Cell edge: the typical object size, but coarse enough for a few objects per cell"""
+        extents = (maxs - mins).max(axis=1)
+        typical = float(np.median(extents)) * 2.0
+        scene_extent = float((maxs.max(axis=0) - mins.min(axis=0)).max())
+        spread = 2.0 * scene_extent / max(1.0, len(mins) ** (1.0 / 3.0))
+        return max(typical, spread, 1e-3)
+
+    def _cell_of(self, point) -> Cell:
+        return tuple(int(math.floor(c / self.cell_size)) for c in point)
+
+    def _cell_range(self, bmin, bmax) -> Tuple[Cell, Cell]:
+        return self._cell_of(bmin), self._cell_of(bmax)
+
+    def _register(
+        self,
+        slot: int,
+        low: Optional[Cell] = None,
+        high: Optional[Cell] = None,
+        center_cell: Optional[Cell] = None
+    ) -> None:
+        if low is None:
+            low, high = self._cell_range(self._mins[slot], self._maxs[slot])
+            center_cell = self._cell_of((self._mins[slot] + self._maxs[slot]) / 2.0)
+        self._center_cells.setdefault(center_cell, set()).add(slot)
+
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+        if span > MAX_CELLS_PER_OBJECT:
+            self._large.add(slot)
+            self._object_cells[slot] = (center_cell,)
+            return
+
+        cells = tuple(
+            (x, y, z)
+            for x in range(low[0], high[0] + 1)
+            for y in range(low[1], high[1] + 1)
+            for z in range(low[2], high[2] + 1)
+        )
+        for cell in cells:
+            self._box_cells.setdefault(cell, set()).add(slot)
+        self._object_cells[slot] = (center_cell,) + cells
+
+    def _unregister(self, slot: int) -> None:
+        cells = self._object_cells.pop(slot, ())
+        if not cells:
+            return
+
+        center_cell, box_cells = cells[0], cells[1:]
+        self._discard(self._center_cells, center_cell, slot)
+        for cell in box_cells:
+            self._discard(self._box_cells, cell, slot)
+        self._large.discard(slot)
+
+    @staticmethod
+    def _discard(cell_map: Dict[Cell, Set[int]], cell: Cell, slot: int) -> None:
+        members = cell_map.get(cell)
+        if members is not None:
+            members.discard(slot)
+            if not members:
+                del cell_map[cell]
+
+    # Queries
+
+    def _centers(self, slots) -> "np.ndarray":
+        return (self._mins[slots] + self._maxs[slots]) / 2.0
+
+    def _box_candidates(self, bmin, bmax) -> Set[int]:
+        """Slots whose boxes may intersect the given box"""
+        low, high = self._cell_range(bmin, bmax)
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+
+        candidates = set(self._large)
+        if span > len(self._box_cells):
+            # Query box larger than the occupied grid: walk occupied cells instead
+            for cell, members in self._box_cells.items():
+                if all(low[i] <= cell[i] <= high[i] for i in range(3)):
+                    candidates |= members
+            return candidates
+
+        for x in range(low[0], high[0] + 1):
+            for y in range(low[1], high[1] + 1):
+                for z in range(low[2], high[2] + 1):
+                    members = self._box_cells.get((x, y, z))
+                    if members:
+                        candidates |= members
+        return candidates
+
+    def _ranked(self, point, slots, exclude: Optional[str]) -> List[Tuple[str, float]]:
+        slots = [slot for slot in slots if self._names[slot] != exclude]
+        if not slots:
+            return []
+        distances = np.linalg.norm(self._centers(slots) - np.asarray(point, dtype=float), axis=1)
+        order = np.argsort(distances)
+        return [(self._names[slots[i]], float(distances[i])) for i in order]
+
+    def nearest(self, point: Sequence[float], k: int = 5, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """k nearest objects to a point by centre distance, searched in growing cell rings"""
+
+        if not self._slots:
+            return []
+
+        center = self._cell_of(point)
+        found: Set[int] = set(self._large)
+        wanted = k + (1 if exclude in self._slots else 0)
+        occupied = len(self._center_cells)
+
+        radius = 0
+        while True:
+            # The ring would visit more cells than are occupied: rank everything instead
+            if (2 * radius + 1) ** 3 > occupied * 8:
+                return self._ranked(point, list(self._slots.values()), exclude)[:k]
+
+            for cell in self._ring(center, radius):
+                members = self._center_cells.get(cell)
+                if members:
+                    found |= members
+
+            # Everything within radius * cell_size of the point has been seen
+            if len(found) >= wanted:
+                ranked = self._ranked(point, list(found), exclude)
+                if len(ranked) >= k and ranked[k - 1][1] <= radius * self.cell_size:
+                    return ranked[:k]
+            radius += 1
+
+    @staticmethod
+    def _ring(center: Cell, radius: int) -> Iterable[Cell]:
+        """Cells at Chebyshev distance exactly radius from center"""
+        cx, cy, cz = center
+        if radius == 0:
+            yield center
+            return
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                if abs(dx) == radius or abs(dy) == radius:
+                    for dz in range(-radius, radius + 1):
+                        yield (cx + dx, cy + dy, cz + dz)
+                else:
+                    yield (cx + dx, cy + dy, cz - radius)
+                    yield (cx + dx, cy + dy, cz + radius)
+
+    def within_radius(
+        self,
+        point: Sequence[float],
+        radius: float,
+        exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """Objects whose centres lie within radius of a point, nearest first"""
+
+        point = np.asarray(point, dtype=float)
+        low, high = self._cell_of(point - radius), self._cell_of(point + radius)
+
+        candidates: Set[int] = set(self._large)
+        for x in range(low[0], high[0] + 1):
+            for y in range(low[1], high[1] + 1):
+                for z in range(low[2], high[2] + 1):
+                    members = self._center_cells.get((x, y, z))
+                    if members:
+                        candidates |= members
+
+        return [item for item in self._ranked(point, list(candidates), exclude) if item[1] <= radius]
+
+    def _boxes_near(self, name: str, margin: float) -> Tuple[int, List[int]]:
+        slot = self._slots[name]
+        candidates = self._box_candidates(self._mins[slot] - margin, self._maxs[slot] + margin)
+        candidates.discard(slot)
+        return slot, list(candidates)
+
+    def overlapping(self, name: str, margin: float = 0.0) -> List[str]:
+        """Objects whose boxes intersect the named object's box (grown by margin)"""
+
+        slot, candidates = self._boxes_near(name, margin)
+        if not candidates:
+            return []
+        mins, maxs = self._mins[candidates], self._maxs[candidates]
+        hit = np.all(mins <= self._maxs[slot] + margin, axis=1) & np.all(maxs >= self._mins[slot] - margin, axis=1)
+        return [self._names[candidates[i]] for i in np.nonzero(hit)[0]]
+
+    def _footprints_overlap(self, slot: int, candidates: List[int]):
+        mins, maxs = self._mins[candidates], self._maxs[candidates]
+        return np.all(mins[:, :2] < self._maxs[slot, :2], axis=1) & np.all(maxs[:, :2] > self._mins[slot, :2], axis=1)
+
+    def on_top_of(self, name: str, tolerance: float = 0.01) -> List[str]:
+        """Objects resting on the named object (bottom at its top, footprints overlapping)"""
+
+        slot, candidates = self._boxes_near(name, tolerance)
+        if not candidates:
+            return []
+        resting = np.abs(self._mins[candidates, 2] - self._maxs[slot, 2]) <= tolerance
+        hit = resting & self._footprints_overlap(slot, candidates)
+        return [self._names[candidates[i]] for i in np.nonzero(hit)[0]]
+
+    def resting_on(self, name: str, tolerance: float = 0.01) -> List[str]:
+        """Objects the named object rests on"""
+
+        slot, candidates = self._boxes_near(name, tolerance)
+        if not candidates:
+            return []
+        supporting = np.abs(self._maxs[candidates, 2] - self._mins[slot, 2]) <= tolerance
+        hit = supporting & self._footprints_overlap(slot, candidates)
+        return [self._names[candidates[i]] for i in np.nonzero(hit)[0]]
+
+    def inside(self, name: str) -> List[str]:
+        """Objects whose boxes lie entirely inside the named object's box"""
+
+        slot, candidates = self._boxes_near(name, 0.0)
+        if not candidates:
+            return []
+        hit = (np.all(self._mins[candidates] >= self._mins[slot], axis=1) &
+               np.all(self._maxs[candidates] <= self._maxs[slot], axis=1))
+        return [self._names[candidates[i]] for i in np.nonzero(hit)[0]]
+
+    def contact(self, name_a: str, name_b: str, tolerance: float = 0.01) -> Optional[str]:
+        """Describe how two boxes touch: on_top_of, below, inside, contains, overlaps or None"""
+
+        a, b = self._slots[name_a], self._slots[name_b]
+        amin, amax, bmin, bmax = self._mins[a], self._maxs[a], self._mins[b], self._maxs[b]
+
+        footprint = bool(np.all(amin[:2] < bmax[:2]) and np.all(amax[:2] > bmin[:2]))
+        if footprint and abs(amin[2] - bmax[2]) <= tolerance:
+            return "on_top_of"
+        if footprint and abs(amax[2] - bmin[2]) <= tolerance:
+            return "below"
+        if np.all(amin >= bmin) and np.all(amax <= bmax):
+            return "inside"
+        if np.all(bmin >= amin) and np.all(bmax <= amax):
+            return "contains"
+        if np.all(amin <= bmax) and np.all(amax >= bmin):
+            return "overlaps"
+        return None
+
+    def neighbor_pairs(self, k: int = 4, names: Optional[Set[str]] = None) -> List[Tuple[str, str, float]]:
+        """Unique pairs linking each object to its k nearest neighbours in adjacent cells
+
+        Every occupied cell is processed as one block against its 27-cell neighbourhood,
+        so the work is vectorised per cell rather than per object.
+        """
+
+        allowed = {self._slots[name] for name in names if name in self._slots} if names is not None else None
+        firsts, seconds, lengths = [], [], []
+
+        for cell, members in self._center_cells.items():
+            block = [slot for slot in members if allowed is None or slot in allowed]
+            if not block:
+                continue
+
+            neighbours: Set[int] = set(self._large)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for dz in (-1, 0, 1):
+                        neighbours |= self._center_cells.get((cell[0] + dx, cell[1] + dy, cell[2] + dz), set())
+            if allowed is not None:
+                neighbours &= allowed
+            if len(neighbours) < 2:
+                continue
+
+            block = np.array(block)
+            neighbours = np.fromiter(neighbours, dtype=np.int64, count=len(neighbours))
+            distances = np.linalg.norm(
+                self._centers(block)[:, None, :] - self._centers(neighbours)[None, :, :], axis=2
+            )
+            distances[block[:, None] == neighbours[None, :]] = np.inf
+
+            count = min(k, len(neighbours) - 1)
+            columns = np.argpartition(distances, count - 1, axis=1)[:, :count]
+            firsts.append(np.repeat(block, count))
+            seconds.append(neighbours[columns].ravel())
+            lengths.append(np.take_along_axis(distances, columns, axis=1).ravel())
+
+        if not firsts:
+            return []
+
+        # Each pair is found from both ends; keep one copy
+        firsts, seconds, lengths = np.concatenate(firsts), np.concatenate(seconds), np.concatenate(lengths)
+        keys = np.stack([np.minimum(firsts, seconds), np.maximum(firsts, seconds)], axis=1)
+        keys, unique_rows = np.unique(keys, axis=0, return_index=True)
+
+        names = self._names
+        return [
+            (names[a], names[b], distance)
+            for (a, b), distance in zip(keys.tolist(), lengths[unique_rows].tolist())
+        ]
+
+    def get_bounds(self, name: str) -> Tuple[List[float], List[float]]:
+        """Indexed box of an object"""
+        slot = self._slots[name]
+        return self._mins[slot].tolist(), self._maxs[slot].tolist()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        return {
+            "objects": len(self._slots),
+            "cell_size": self.cell_size,
+            "occupied_cells": len(self._box_cells),
+            "large_objects": len(self._large)
+        }
+
+# Global spatial index instance
+_spatial_index: Optional[SpatialIndex] = None
+
+def get_spatial_index() -> Optional[SpatialIndex]:
+    """Get global spatial index instance (None without NumPy)"""
+    global _spatial_index
+    if _spatial_index is None and NUMPY_AVAILABLE:
+        _spatial_index = SpatialIndex()
+    return _spatial_index
@@ -0,0 +1,382 @@
+"""
+Vision Router for BlendPro: AI Co-Pilot
+Decides per query whether scene data is enough or a screenshot must be sent
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..config.settings import get_settings
+from ..utils.logger import get_logger
+from ..utils.file_manager import get_file_manager
+from .image_encoder import fit_to_vision_tiles, VISION_TILE_SIZE
+from .scene_snapshot import snapshot_json_default
+
+# Words that ask about appearance rather than data
+VISUAL_TERMS = {
+    "look", "looks", "looking", "appearance", "appear", "appears", "visible", "see", "seen",
+    "ugly", "pretty", "nice", "aesthetic", "style", "composition", "framing", "framed",
+    "overlap", "overlapping", "clipping", "intersect", "intersecting", "shading", "shadow",
+    "shadows", "reflection", "noise", "artifact", "artifacts", "screenshot", "image",
+    "picture", "viewport", "colour", "color", "colors", "colours", "bright", "dark", "glitch"
+}
+
+# Words that are answered from structured scene data
+STRUCTURAL_TERMS = {
+    "count", "many", "list", "name", "names", "rename", "vertices", "vertex", "faces",
+    "polygons", "polycount", "modifier", "modifiers", "location", "position", "coordinates",
+    "dimensions", "size", "scale", "rotation", "parent", "collection", "collections",
+    "delete", "create", "add", "remove", "script", "code", "keyframe", "keyframes", "frame",
+    "type", "types", "energy", "lens", "material", "materials"
+}
+
+# Prior log-odds in favour of vision for each ContextExtractor context type
+CONTEXT_PRIORS = {
+    "visible": 0.6,
+    "cameras": 0.6,
+    "lighting": 0.3,
+    "full": 0.0,
+    "materials": -0.2,
+    "active": -0.3,
+    "selected": -0.4,
+    "mentioned": -0.4
+}
+
+# Answers that show the text model could not respond without pixels
+ESCALATION_PHRASES = (
+    "cannot see", "can't see", "unable to see", "not able to see", "without seeing",
+    "without a screenshot", "without an image", "without visual", "need a screenshot",
+    "need to see", "would need to see", "cannot determine visually", "can't tell visually",
+    "visual inspection", "not possible to judge"
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+def _json_default(value: Any) -> Any:
+    try:
+        return snapshot_json_default(value)
+    except TypeError:
+        return str(value)
+
+@dataclass
+class RoutingDecision:
+    """Outcome of routing one query"""
+    use_vision: bool
+    probability: float
+    reasons: List[str] = field(default_factory=list)
+    context_type: str = "full"
+    learned_weight: float = 0.0
+    decision_time: float = 0.0
+
+class RouteClassifier:
+    """Online logistic regression over hashed query tokens and the context type"""
+
+    def __init__(self, dimensions: int = 1024, learning_rate: float = 0.3, l2: float = 1e-4):
+        self.dimensions = dimensions
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.weights = [0.0] * dimensions
+        self.bias = 0.0
+        self.samples = 0
+
+    def features(self, query: str, context_type: str) -> List[int]:
+        """Hashed indices of unigram, bigram and context-type features"""
+        tokens = _TOKEN_RE.findall(query.lower())
+        keys = [f"w:{token}" for token in tokens]
+        keys += [f"b:{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+        keys.append(f"c:{context_type}")
+        # crc32 is stable across sessions, unlike hash()
+        return sorted({zlib.crc32(key.encode('utf-8')) % self.dimensions for key in keys})
+
+    def logit(self, features: List[int]) -> float:
+        return self.bias + sum(self.weights[index] for index in features)
+
+    def update(self, features: List[int], label: bool) -> None:
+        """One SGD step on the log loss"""
+        probability = 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, self.logit(features)))))
+        gradient = (1.0 if label else 0.0) - probability
+        step = self.learning_rate / math.sqrt(1.0 + self.samples / 50.0)
+        for index in features:
+            self.weights[index] += step * (gradient - self.l2 * self.weights[index])
+        self.bias += step * gradient
+        self.samples += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dimensions": self.dimensions,
+            "bias": self.bias,
+            "samples": self.samples,
+            # Sparse storage; most buckets are never touched
+            "weights": {str(i): w for i, w in enumerate(self.weights) if w != 0.0}
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        if data.get("dimensions") != self.dimensions:
+            return
+        self.bias = float(data.get("bias", 0.0))
+        self.samples = int(data.get("samples", 0))
+        self.weights = [0.0] * self.dimensions
+        for index, weight in data.get("weights", {}).items():
+            self.weights[int(index)] = float(weight)
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """Input tokens a vision model bills for an image of this size (high detail)"""
+    width, height = fit_to_vision_tiles(width, height)
+    tiles = math.ceil(width / VISION_TILE_SIZE) * math.ceil(height / VISION_TILE_SIZE)
+    return 85 + 170 * tiles
+
+class VisionRouter:
+    """Routes scene questions to the text model unless they need pixels
+
+    The decision combines the configured vision keywords, visual/structural word
+    lists and the context type with a small classifier that learns from queries
+    whose text answer had to be escalated to the vision model.
+    """
+
+    def __init__(self, max_answers: int = 64, answer_ttl: float = 300.0):
+        self.settings = get_settings()
+        self.logger = get_logger("BlendPro.VisionRouter")
+        self.classifier = RouteClassifier()
+        self._lock = threading.Lock()
+
+        self._answers: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._max_answers = max_answers
+        self._answer_ttl = answer_ttl
+
+        # Running averages used to estimate what a text-only answer saved
+        self._vision_latency: Optional[float] = None
+        self._image_tokens = estimate_image_tokens(1920, 1080)
+
+        self._stats = {
+            "decisions": 0,
+            "vision_routed": 0,
+            "text_routed": 0,
+            "escalations": 0,
+            "answer_cache_hits": 0,
+            "image_tokens_saved": 0,
+            "seconds_saved": 0.0
+        }
+        self._dirty = False
+        self._load_model()
+
+    def _keyword_set(self) -> set:
+        return {
+            keyword.strip().lower()
+            for keyword in self.settings.auto_vision_keywords.split(",")
+            if keyword.strip()
+        }
+
+    def decide(self, query: Optional[str], context_type: Optional[str] = None) -> RoutingDecision:
+        """Decide whether a query needs a screenshot
+
+        Without a context type only the query words are used, which is enough to
+        start a capture early for queries that clearly ask about appearance.
+        """
+
+        start_time = time.perf_counter()
+        query = query or ""
+        tokens = set(_TOKEN_RE.findall(query.lower()))
+        reasons = []
+
+        # Text first: vision has to earn its cost
+        score = -0.5
+
+        visual = tokens & VISUAL_TERMS
+        if visual:
+            score += 1.5 * min(2, len(visual))
+            reasons.append(f"visual terms: {', '.join(sorted(visual))}")
+
+        configured = (tokens & self._keyword_set()) - visual
+        if configured:
+            score += 0.3 * min(2, len(configured))
+            reasons.append(f"vision keywords: {', '.join(sorted(configured))}")
+
+        structural = tokens & STRUCTURAL_TERMS
+        if structural:
+            score -= 1.0 * min(2, len(structural))
+            reasons.append(f"structural terms: {', '.join(sorted(structural))}")
+
+        if context_type:
+            prior = CONTEXT_PRIORS.get(context_type, 0.0)
+            score += prior
+            if prior:
+                reasons.append(f"context '{context_type}' ({prior:+.1f})")
+
+        # Trust the learned model as it sees more examples
+        learned_weight = 0.0
+        with self._lock:
+            if self.classifier.samples:
+                learned_weight = self.classifier.samples / (self.classifier.samples + 20.0)
+                learned = self.classifier.logit(self.classifier.features(query, context_type or "full"))
+                score += learned_weight * learned
+                reasons.append(f"learned {learned:+.2f} x {learned_weight:.2f}")
+
+        probability = 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, score))))
+        return RoutingDecision(
+            use_vision=probability >= 0.5,
+            probability=probability,
+            reasons=reasons,
+            context_type=context_type or "full",
+            learned_weight=learned_weight,
+            decision_time=time.perf_counter() - start_time
+        )
+
+    def record_decision(self, decision: RoutingDecision, query: Optional[str]) -> None:
+        """Count and log a final routing decision"""
+        with self._lock:
+            self._stats["decisions"] += 1
+            self._stats["vision_routed" if decision.use_vision else "text_routed"] += 1
+
+        self.logger.info(
+            f"Routed to {'vision' if decision.use_vision else 'text'} "
+            f"(p={decision.probability:.2f}, {decision.decision_time * 1000:.2f} ms): "
+            f"{'; '.join(decision.reasons) or 'no signals'} | query: {(query or '')[:60]!r}"
+        )
+
+    def record_vision_cost(self, latency: float, width: int = 0, height: int = 0) -> None:
+        """Measured capture plus vision request time, and the image size sent"""
+        with self._lock:
+            if self._vision_latency is None:
+                self._vision_latency = latency
+            else:
+                self._vision_latency = 0.8 * self._vision_latency + 0.2 * latency
+            if width and height:
+                self._image_tokens = estimate_image_tokens(width, height)
+
+    def record_text_answer(self, latency: float) -> None:
+        """Account for a text-only answer that avoided the vision path"""
+        with self._lock:
+            self._stats["image_tokens_saved"] += self._image_tokens
+            saved = (self._vision_latency - latency) if self._vision_latency is not None else 0.0
+            self._stats["seconds_saved"] += max(0.0, saved)
+
+        self.logger.info(
+            f"Text-only answer in {latency:.2f}s; saved ~{self._image_tokens} image tokens"
+            + (f", ~{saved:.2f}s" if saved > 0 else "")
+        )
+
+    def needs_escalation(self, answer: Optional[str]) -> bool:
+        """Whether a text-only answer says it needed to see the viewport"""
+        answer_lower = (answer or "").lower()
+        return any(phrase in answer_lower for phrase in ESCALATION_PHRASES)
+
+    def learn(self, query: Optional[str], context_type: Optional[str], needed_vision: bool) -> None:
+        """Train the classifier with the observed outcome of a query"""
+        with self._lock:
+            self.classifier.update(self.classifier.features(query or "", context_type or "full"), needed_vision)
+            if needed_vision:
+                self._stats["escalations"] += 1
+            self._dirty = True
+            samples = self.classifier.samples
+
+        if needed_vision:
+            self.logger.info(f"Escalated to vision; classifier trained on {samples} queries")
+
+        # Persist every few samples rather than after every query
+        if samples % 10 == 0:
+            self.save_model()
+
+    @staticmethod
+    def answer_key(context_data: Dict[str, Any], query: Optional[str]) -> str:
+        """Fingerprint of the scene data and normalised query an answer was given for"""
+        payload = json.dumps(context_data, sort_keys=True, default=_json_default)
+        normalized = " ".join((query or "").lower().split())
+        return hashlib.sha1(f"{normalized}\n{payload}".encode('utf-8')).hexdigest()
+
+    def get_answer(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached answer for an identical query on identical scene data"""
+        with self._lock:
+            entry = self._answers.get(key)
+            if entry is None:
+                return None
+            stored_at, answer = entry
+            if time.time() - stored_at > self._answer_ttl:
+                del self._answers[key]
+                return None
+            self._answers.move_to_end(key)
+            self._stats["answer_cache_hits"] += 1
+            return answer
+
+    def put_answer(self, key: str, answer: Dict[str, Any]) -> None:
+        """Remember an answer"""
+        with self._lock:
+            self._answers[key] = (time.time(), answer)
+            self._answers.move_to_end(key)
+            while len(self._answers) > self._max_answers:
+                self._answers.popitem(last=False)
+
+    def clear_answers(self) -> None:
+        """Forget cached answers"""
+        with self._lock:
+            self._answers.clear()
+
+    def _get_model_file_path(self) -> str:
+        """Get path for the classifier weights file"""
+        user_data_dir = get_file_manager().get_user_data_dir()
+        return f"{user_data_dir}/blendpro_vision_router.json"
+
+    def save_model(self) -> None:
+        """Save classifier weights to file"""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            model_data = {
+                "version": "1.0",
+                "last_updated": time.time(),
+                "classifier": self.classifier.to_dict()
+            }
+            self._dirty = False
+
+        try:
+            with open(self._get_model_file_path(), 'w', encoding='utf-8') as f:
+                json.dump(model_data, f, indent=2)
+        except Exception as e:
+            print(f"Failed to save vision router model: {e}")
+
+    def _load_model(self) -> None:
+        """Load classifier weights from file"""
+
+        try:
+            file_path = self._get_model_file_path()
+            if not os.path.exists(file_path):
+                return
+
+            with open(file_path, 'r', encoding='utf-8') as f:
+                model_data = json.load(f)
+
+            self.classifier.load_dict(model_data.get("classifier", {}))
+
+        except Exception as e:
+            print(f"Failed to load vision router model: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics"""
+        with self._lock:
+            decisions = self._stats["decisions"]
+            return {
+                **self._stats,
+                "text_rate": self._stats["text_routed"] / decisions if decisions else 0.0,
+                "cached_answers": len(self._answers),
+                "classifier_samples": self.classifier.samples,
+                "avg_vision_latency": self._vision_latency
+            }
+
+# Global vision router instance
+_vision_router: Optional[VisionRouter] = None
+
+def get_vision_router() -> VisionRouter:
+    """Get global vision router instance"""
+    global _vision_router
+    if _vision_router is None:
+        _vision_router = VisionRouter()
+    return _vision_router
@@ -5,14 +5,20 @@ Parametric code snippets and user-defined actions
 
 import json
 import re
+import bpy
 import time
+import hashlib
+import io
+import tokenize
+from types import CodeType
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from ..config.settings import get_settings
 from ..utils.file_manager import get_file_manager
-from ..utils.code_executor import get_code_executor
+from ..utils.code_executor import get_code_executor, resolve_batch_targets, BatchJob
+from ..utils.code_analyzer import get_code_analyzer
 
 class ParameterType(Enum):
     """Types of parameters in actions"""
@@ -52,6 +58,24 @@ class UserAction:
     last_used: float = 0.0
     author: str = "User"
 
+@dataclass
+class CompiledAction:
+    """Validated code object for one version of an action template"""
+    template_hash: str
+    source: str
+    code_object: Optional[CodeType]
+    variable_names: Dict[str, str]
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+# Minimum seconds between usage-statistics writes
+_USAGE_SAVE_INTERVAL = 5.0
+
+# f-string token types exist on Python 3.12+ only
+_FSTRING_START = getattr(tokenize, "FSTRING_START", None)
+_FSTRING_END = getattr(tokenize, "FSTRING_END", None)
+_FSTRING_PREFIX = re.compile(r'[rRbBuU]*[fF]')
+
 class ActionLibrary:
     """Manages user-defined parametric actions"""
     
@@ -61,6 +85,9 @@ class ActionLibrary:
         self.code_executor = get_code_executor()
         
         self._actions: Dict[str, UserAction] = {}
+        self._compiled_actions: Dict[str, CompiledAction] = {}
+        self._last_usage_save = 0.0
+        self._usage_pending = False
         self._load_actions()
     
     def create_action_from_code(
@@ -240,16 +267,26 @@ class ActionLibrary:
             if not validation_result["valid"]:
                 return {"error": f"Parameter validation failed: {validation_result['error']}"}
             
-            # Generate code from template
-            code = self._generate_code_from_template(action, parameters)
+            compiled = self.get_compiled_action(action)
             
-            # Execute code
-            execution_result = self.code_executor.execute_code(code)
+            if compiled is not None:
+                if compiled.code_object is None:
+                    return {"error": f"Action code validation failed: {', '.join(compiled.errors)}"}
+                
+                # Parameters travel as namespace variables; the template is never re-parsed
+                code = compiled.source
+                execution_result = self.code_executor.execute_compiled(
+                    compiled.code_object, code,
+                    variables=self._build_variables(compiled, parameters),
+                    warnings=compiled.warnings
+                )
+            else:
+                # Placeholders embedded inside larger literals need text substitution
+                code = self._generate_code_from_template(action, parameters)
+                execution_result = self.code_executor.execute_code(code)
             
             # Update usage statistics
-            action.usage_count += 1
-            action.last_used = time.time()
-            self._save_actions()
+            self._record_usage(action)
             
             return {
                 "success": execution_result["success"],
@@ -262,6 +299,187 @@ class ActionLibrary:
         except Exception as e:
             return {"error": f"Action execution failed: {str(e)}"}
     
+    def create_batch_job(
+        self,
+        action_id: str,
+        targets: List[str],
+        parameters: Optional[Dict[str, Any]] = None,
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """Prepare a batch job running an action once per target object"""
+        
+        if action_id not in self._actions:
+            return {"success": False, "error": f"Action '{action_id}' not found"}
+        
+        action = self._actions[action_id]
+        parameters = dict(parameters or {})
+        
+        validation_result = self._validate_parameters(action, parameters)
+        if not validation_result["valid"]:
+            return {"success": False, "error": f"Parameter validation failed: {validation_result['error']}"}
+        
+        compiled = self.get_compiled_action(action)
+        if compiled is None:
+            return {"success": False, "error": "Action template cannot be compiled for batch execution"}
+        if compiled.code_object is None:
+            return {"success": False, "error": f"Action code validation failed: {', '.join(compiled.errors)}"}
+        
+        # The first object-name parameter follows the current target
+        base_variables = self._build_variables(compiled, parameters)
+        target_variable = next(
+            (compiled.variable_names[param.name] for param in action.parameters
+             if param.param_type == ParameterType.OBJECT_NAME),
+            None
+        )
+        
+        def variables_for(target_name: str) -> Dict[str, Any]:
+            if target_variable is None:
+                return base_variables
+            return {**base_variables, target_variable: target_name}
+        
+        job = BatchJob(
+            self.code_executor, compiled.code_object, compiled.source, targets,
+            variables_for=variables_for,
+            warnings=compiled.warnings,
+            stop_on_error=stop_on_error
+        )
+        
+        self._record_usage(action)
+        return {"success": True, "job": job, "action_name": action.name}
+    
+    def execute_action_batch(
+        self,
+        action_id: str,
+        targets: List[str],
+        parameters: Optional[Dict[str, Any]] = None,
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """Execute an action once per target object in a single transaction"""
+        
+        created = self.create_batch_job(action_id, targets, parameters, stop_on_error)
+        if not created["success"]:
+            return created
+        
+        summary = created["job"].run()
+        summary["action_name"] = created["action_name"]
+        self.flush_usage()
+        return summary
+    
+    def get_compiled_action(self, action: UserAction) -> Optional[CompiledAction]:
+        """Get the compiled form of an action, compiling once per template version"""
+        
+        template_hash = hashlib.sha256(action.code_template.encode('utf-8')).hexdigest()
+        compiled = self._compiled_actions.get(action.id)
+        
+        if compiled is None or compiled.template_hash != template_hash:
+            compiled = self._compile_action(action, template_hash)
+            if compiled is None:
+                self._compiled_actions.pop(action.id, None)
+                return None
+            self._compiled_actions[action.id] = compiled
+        
+        return compiled
+    
+    def _compile_action(self, action: UserAction, template_hash: str) -> Optional[CompiledAction]:
+        """Rewrite placeholders as variable references, then validate and compile once"""
+        
+        param_names = {param.name for param in action.parameters}
+        variable_names = {name: f"_param_{name}" for name in param_names}
+        
+        source = self._replace_placeholders(action.code_template, variable_names)
+        if source is None:
+            return None
+        
+        analysis = get_code_analyzer().analyze(source)
+        
+        return CompiledAction(
+            template_hash=template_hash,
+            source=source,
+            code_object=analysis.code_object,
+            variable_names=variable_names,
+            errors=list(analysis.errors),
+            warnings=list(analysis.warnings)
+        )
+    
+    def _replace_placeholders(self, template: str, variable_names: Dict[str, str]) -> Optional[str]:
+        """Replace {name} and "{name}" placeholders with variable names using the tokenizer"""
+        
+        try:
+            tokens = list(tokenize.generate_tokens(io.StringIO(template).readline))
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            return None
+        
+        rewritten = []
+        fstring_depth = 0
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+
+            # Python 3.12+ tokenizes f-strings; their {name} fields are already expressions
+            if token.type == _FSTRING_START:
+                fstring_depth += 1
+            elif token.type == _FSTRING_END:
+                fstring_depth -= 1
+
+            # Bare placeholder: "{" NAME "}"
+            if (token.type == tokenize.OP and token.string == '{' and i + 2 < len(tokens)
+                    and tokens[i + 1].type == tokenize.NAME and tokens[i + 1].string in variable_names
+                    and tokens[i + 2].type == tokenize.OP and tokens[i + 2].string == '}'):
+                variable = variable_names[tokens[i + 1].string]
+                if fstring_depth:
+                    # Keep the replacement field: f"{name}" -> f"{_param_name}"
+                    rewritten.extend([token, tokens[i + 1]._replace(string=variable), tokens[i + 2]])
+                else:
+                    rewritten.append(token._replace(type=tokenize.NAME, string=variable, end=tokens[i + 2].end))
+                i += 3
+                continue
+
+            if token.type == tokenize.STRING and _FSTRING_PREFIX.match(token.string):
+                # Older tokenizers return f-strings as one literal
+                for name, variable in variable_names.items():
+                    token = token._replace(string=re.sub(
+                        r'(?<!\{)\{' + re.escape(name) + r'\}(?!\})', f"{{{variable}}}", token.string
+                    ))
+            elif token.type == tokenize.STRING:
+                for name, variable in variable_names.items():
+                    placeholder = f"{{{name}}}"
+                    if token.string in (f'"{placeholder}"', f"'{placeholder}'"):
+                        token = token._replace(type=tokenize.NAME, string=variable)
+                        break
+                    if placeholder in token.string:
+                        # Placeholder embedded in a larger literal
+                        return None
+            
+            rewritten.append(token)
+            i += 1
+        
+        return tokenize.untokenize(rewritten)
+    
+    def _build_variables(self, compiled: CompiledAction, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Map validated parameter values to the compiled action's variables"""
+        
+        variables = {}
+        for param_name, variable_name in compiled.variable_names.items():
+            value = parameters.get(param_name)
+            variables[variable_name] = tuple(value) if isinstance(value, list) else value
+        return variables
+    
+    def _record_usage(self, action: UserAction) -> None:
+        """Update usage statistics, throttling writes during repeated execution"""
+        
+        action.usage_count += 1
+        action.last_used = time.time()
+        
+        if action.last_used - self._last_usage_save >= _USAGE_SAVE_INTERVAL:
+            self._save_actions()
+        else:
+            self._usage_pending = True
+    
+    def flush_usage(self) -> None:
+        """Write usage statistics held back by the save throttle"""
+        if self._usage_pending:
+            self._save_actions()
+    
     def _validate_parameters(self, action: UserAction, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Validate parameters for an action"""
         
@@ -574,6 +792,9 @@ class ActionLibrary:
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(actions_data, f, indent=2, ensure_ascii=False)
 
+            self._last_usage_save = time.time()
+            self._usage_pending = False
+
         except Exception as e:
             print(f"Failed to save actions: {e}")
 
@@ -628,3 +849,130 @@ def get_action_library() -> ActionLibrary:
     if _action_library is None:
         _action_library = ActionLibrary()
     return _action_library
+
+class BLENDPRO_OT_BatchExecute(bpy.types.Operator):
+    """Run code or an action once per target object with progress reporting"""
+    bl_idname = "blendpro.batch_execute"
+    bl_label = "Batch Execute"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    code: bpy.props.StringProperty(
+        name="Code",
+        description="Python code run per target (the object is available as `target`)"
+    )
+    
+    action_id: bpy.props.StringProperty(
+        name="Action ID",
+        description="Library action run per target (used instead of code when set)"
+    )
+    
+    parameters_json: bpy.props.StringProperty(
+        name="Parameters",
+        description="Action parameters as JSON",
+        default="{}"
+    )
+    
+    target_mode: bpy.props.EnumProperty(
+        name="Targets",
+        items=[
+            ('SELECTION', "Selection", "Selected objects"),
+            ('COLLECTION', "Collection", "All objects in a collection"),
+            ('PATTERN', "Name Pattern", "Objects whose name matches a wildcard pattern")
+        ],
+        default='SELECTION'
+    )
+    
+    target_value: bpy.props.StringProperty(
+        name="Collection / Pattern",
+        description="Collection name or wildcard pattern, depending on the target mode"
+    )
+    
+    _timer = None
+    _job: Optional[BatchJob] = None
+    
+    def execute(self, context):
+        try:
+            targets = resolve_batch_targets(context, self.target_mode, self.target_value)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        if not targets:
+            self.report({'WARNING'}, "No target objects found")
+            return {'CANCELLED'}
+        
+        if self.action_id:
+            try:
+                parameters = json.loads(self.parameters_json or "{}")
+            except (json.JSONDecodeError, ValueError) as e:
+                self.report({'ERROR'}, f"Invalid parameters: {e}")
+                return {'CANCELLED'}
+            created = get_action_library().create_batch_job(self.action_id, targets, parameters)
+        else:
+            created = get_code_executor().create_batch_job(self.code, targets)
+        
+        if not created["success"]:
+            self.report({'ERROR'}, created.get("error", "Batch preparation failed"))
+            return {'CANCELLED'}
+        
+        self._job = created["job"]
+        
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._job.cancel()
+            return self._finish(context)
+        
+        if event.type == 'TIMER':
+            # Each tick runs one time-budgeted chunk so the UI keeps redrawing
+            finished = self._job.step()
+            context.window_manager.progress_update(int(self._job.progress * 100))
+            
+            if context.area:
+                context.area.header_text_set(
+                    f"BlendPro batch: {self._job.processed}/{len(self._job.targets)} (Esc to stop)"
+                )
+            
+            if finished:
+                return self._finish(context)
+        
+        return {'PASS_THROUGH'}
+    
+    def _finish(self, context):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.area:
+            context.area.header_text_set(None)
+        
+        get_action_library().flush_usage()
+        summary = self._job.get_summary()
+        message = f"Batch: {summary['succeeded']}/{summary['total']} succeeded"
+        
+        if summary["cancelled"]:
+            self.report({'WARNING'}, f"{message} (stopped)")
+        elif summary["failed"]:
+            first = summary["failures"][0]
+            self.report({'WARNING'}, f"{message}; first failure on {first['target']}: {first.get('error', '')}")
+        else:
+            self.report({'INFO'}, message)
+        
+        return {'FINISHED'}
+
+def register():
+    """Register Blender classes"""
+    bpy.utils.register_class(BLENDPRO_OT_BatchExecute)
+
+def unregister():
+    """Unregister Blender classes"""
+    bpy.utils.unregister_class(BLENDPRO_OT_BatchExecute)
+    if _action_library is not None:
+        _action_library.flush_usage()
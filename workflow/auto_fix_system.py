@@ -13,6 +13,15 @@ from ..config.settings import get_settings
 from ..utils.code_executor import get_code_executor
 from ..utils.backup_manager import get_backup_manager
 from .scene_monitor import get_scene_health_monitor, SceneIssue, IssueSeverity
+from .geometry_dedup import get_geometry_deduplicator
+from .material_dedup import get_material_deduplicator
+from .texture_analyzer import get_texture_analyzer
+from .orphan_data import get_orphan_data_analyzer
+from .lod_pipeline import get_lod_manager
+from .mesh_cleanup import (
+    unique_meshes, run_cleanup, remove_doubles, remove_loose, fill_small_holes,
+    has_loose_geometry, has_boundary_edges
+)
 
 class FixResult(Enum):
     """Results of auto-fix attempts"""
@@ -32,6 +41,7 @@ class AutoFix:
     fix_function: Callable
     requires_backup: bool = True
     batch_capable: bool = False
+    unattended_safe: bool = True  # False keeps it out of headless batch fixes
 
 class AutoFixSystem:
     """Manages automatic fixes for scene issues"""
@@ -100,6 +110,15 @@ class AutoFixSystem:
             requires_backup=False
         ))
         
+        self.register_fix(AutoFix(
+            fix_id="merge_duplicate_materials",
+            name="Merge Duplicate Materials",
+            description="Replace equivalent materials with one representative each",
+            applicable_categories=["materials"],
+            applicable_severities=[IssueSeverity.WARNING, IssueSeverity.INFO],
+            fix_function=self._fix_merge_duplicate_materials
+        ))
+        
         # Lighting fixes
         self.register_fix(AutoFix(
             fix_id="add_basic_lighting",
@@ -132,15 +151,37 @@ class AutoFixSystem:
         
         # Performance fixes
         self.register_fix(AutoFix(
-            fix_id="add_decimate_modifiers",
-            name="Add Decimate Modifiers",
-            description="Add decimate modifiers to high-polygon objects",
+            fix_id="generate_lods",
+            name="Generate Viewport LODs",
+            description="Show reduced meshes for heavy objects in the viewport; renders keep full resolution",
             applicable_categories=["performance"],
             applicable_severities=[IssueSeverity.WARNING],
-            fix_function=self._fix_add_decimate_modifiers,
+            fix_function=self._fix_generate_lods,
+            batch_capable=True
+        ))
+        
+        self.register_fix(AutoFix(
+            fix_id="share_duplicate_meshes",
+            name="Share Duplicate Meshes",
+            description="Relink objects with identical geometry to one shared mesh",
+            applicable_categories=["performance"],
+            applicable_severities=[IssueSeverity.WARNING, IssueSeverity.INFO],
+            fix_function=self._fix_share_duplicate_meshes,
             batch_capable=True
         ))
         
+        self.register_fix(AutoFix(
+            fix_id="downscale_textures",
+            name="Downscale Oversized Textures",
+            description="Relink textures to downscaled copies sized for their on-screen use",
+            applicable_categories=["textures"],
+            applicable_severities=[IssueSeverity.WARNING, IssueSeverity.INFO],
+            fix_function=self._fix_downscale_textures,
+            batch_capable=True,
+            # Relinks images to a per-user cache directory; needs a person to review it
+            unattended_safe=False
+        ))
+        
         # Organization fixes
         self.register_fix(AutoFix(
             fix_id="rename_default_objects",
@@ -152,6 +193,15 @@ class AutoFixSystem:
             batch_capable=True,
             requires_backup=False
         ))
+        
+        self.register_fix(AutoFix(
+            fix_id="purge_orphan_data",
+            name="Purge Orphan Data",
+            description="Remove all datablocks that no scene can reach",
+            applicable_categories=["organization"],
+            applicable_severities=[IssueSeverity.INFO, IssueSeverity.WARNING],
+            fix_function=self._fix_purge_orphan_data
+        ))
     
     def register_fix(self, fix: AutoFix) -> None:
         """Register a new auto-fix"""
@@ -250,11 +300,17 @@ class AutoFixSystem:
             "backup_path": backup_path
         }
     
-    def auto_fix_scene(self, context, severity_threshold: IssueSeverity = IssueSeverity.WARNING) -> Dict[str, Any]:
-        """Automatically fix all applicable issues in the scene"""
+    def auto_fix_scene(
+        self,
+        context,
+        severity_threshold: IssueSeverity = IssueSeverity.WARNING,
+        include_ai_insights: bool = True,
+        unattended: bool = False
+    ) -> Dict[str, Any]:
+        """Automatically fix all applicable issues in the scene (unattended skips fixes needing review)"""
         
         # Analyze scene health
-        health_report = self.scene_monitor.analyze_scene_health(context)
+        health_report = self.scene_monitor.analyze_scene_health(context, include_ai_insights)
         
         if health_report.get("error"):
             return {"error": health_report["error"]}
@@ -278,6 +334,8 @@ class AutoFixSystem:
         
         # Get applicable fixes
         applicable_fixes = self.get_applicable_fixes(filtered_issues)
+        if unattended:
+            applicable_fixes = [fix for fix in applicable_fixes if self._fixes[fix["fix_id"]].unattended_safe]
         
         if not applicable_fixes:
             return {
@@ -305,38 +363,21 @@ class AutoFixSystem:
     def _fix_remove_doubles(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
         """Remove duplicate vertices from mesh objects"""
 
-        objects_to_fix = self._get_target_mesh_objects(context, target_objects)
+        meshes = unique_meshes(self._get_target_mesh_objects(context, target_objects))
 
-        if not objects_to_fix:
+        if not meshes:
             return {"result": FixResult.NOT_APPLICABLE, "message": "No mesh objects to fix"}
 
-        fixed_count = 0
-
-        for obj in objects_to_fix:
-            try:
-                # Switch to edit mode
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-
-                # Select all and remove doubles
-                bpy.ops.mesh.select_all(action='SELECT')
-                result = bpy.ops.mesh.remove_doubles(threshold=0.0001)
-
-                # Switch back to object mode
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                if result == {'FINISHED'}:
-                    fixed_count += 1
-
-            except Exception as e:
-                print(f"Failed to remove doubles from {obj.name}: {e}")
-                continue
+        cleanup = run_cleanup(meshes, remove_doubles)
 
-        if fixed_count > 0:
+        if cleanup.meshes_processed > 0:
             return {
                 "result": FixResult.SUCCESS,
-                "message": f"Removed duplicate vertices from {fixed_count} object(s)",
-                "details": {"objects_fixed": fixed_count}
+                "message": (
+                    f"Removed {cleanup.elements_changed} duplicate vertices "
+                    f"from {cleanup.meshes_changed} mesh(es)"
+                ),
+                "details": {"objects_fixed": cleanup.meshes_changed, **cleanup.to_dict()}
             }
         else:
             return {"result": FixResult.FAILED, "message": "Failed to remove doubles from any objects"}
@@ -344,72 +385,43 @@ class AutoFixSystem:
     def _fix_non_manifold(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
         """Fix non-manifold geometry"""
 
-        objects_to_fix = self._get_target_mesh_objects(context, target_objects)
+        meshes = unique_meshes(self._get_target_mesh_objects(context, target_objects))
 
-        if not objects_to_fix:
+        if not meshes:
             return {"result": FixResult.NOT_APPLICABLE, "message": "No mesh objects to fix"}
 
-        fixed_count = 0
-
-        for obj in objects_to_fix:
-            try:
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-
-                # Select non-manifold geometry
-                bpy.ops.mesh.select_all(action='DESELECT')
-                bpy.ops.mesh.select_non_manifold()
+        # Merge split seams and fill small holes; closed meshes are skipped from array data
+        cleanup = run_cleanup(meshes, fill_small_holes, needs_fix=has_boundary_edges)
 
-                # Try to fix by filling holes and removing doubles
-                bpy.ops.mesh.fill_holes(sides=4)
-                bpy.ops.mesh.remove_doubles()
-
-                bpy.ops.object.mode_set(mode='OBJECT')
-                fixed_count += 1
-
-            except Exception as e:
-                print(f"Failed to fix non-manifold geometry in {obj.name}: {e}")
-                continue
+        if cleanup.meshes_processed == 0 and not cleanup.failed:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No open meshes found"}
 
         return {
-            "result": FixResult.SUCCESS if fixed_count > 0 else FixResult.FAILED,
-            "message": f"Attempted to fix non-manifold geometry in {fixed_count} object(s)",
-            "details": {"objects_processed": fixed_count}
+            "result": FixResult.SUCCESS if cleanup.meshes_processed > 0 else FixResult.FAILED,
+            "message": f"Attempted to fix non-manifold geometry in {cleanup.meshes_processed} mesh(es)",
+            "details": {"objects_processed": cleanup.meshes_processed, **cleanup.to_dict()}
         }
 
     def _fix_loose_vertices(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
         """Remove loose vertices"""
 
-        objects_to_fix = self._get_target_mesh_objects(context, target_objects)
+        meshes = unique_meshes(self._get_target_mesh_objects(context, target_objects))
 
-        if not objects_to_fix:
+        if not meshes:
             return {"result": FixResult.NOT_APPLICABLE, "message": "No mesh objects to fix"}
 
-        fixed_count = 0
+        cleanup = run_cleanup(meshes, remove_loose, needs_fix=has_loose_geometry)
 
-        for obj in objects_to_fix:
-            try:
-                bpy.context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
-
-                # Select loose vertices
-                bpy.ops.mesh.select_all(action='DESELECT')
-                bpy.ops.mesh.select_loose()
-
-                # Delete loose vertices
-                bpy.ops.mesh.delete(type='VERT')
-
-                bpy.ops.object.mode_set(mode='OBJECT')
-                fixed_count += 1
-
-            except Exception as e:
-                print(f"Failed to remove loose vertices from {obj.name}: {e}")
-                continue
+        if cleanup.meshes_changed == 0 and not cleanup.failed:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No loose vertices found"}
 
         return {
-            "result": FixResult.SUCCESS if fixed_count > 0 else FixResult.FAILED,
-            "message": f"Removed loose vertices from {fixed_count} object(s)",
-            "details": {"objects_fixed": fixed_count}
+            "result": FixResult.SUCCESS if cleanup.meshes_changed > 0 else FixResult.FAILED,
+            "message": (
+                f"Removed {cleanup.elements_changed} loose vertices "
+                f"from {cleanup.meshes_changed} mesh(es)"
+            ),
+            "details": {"objects_fixed": cleanup.meshes_changed, **cleanup.to_dict()}
         }
 
     def _fix_assign_basic_materials(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -452,22 +464,16 @@ class AutoFixSystem:
     def _fix_remove_unused_materials(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
         """Remove unused materials"""
 
-        removed_count = 0
-        materials_to_remove = []
-
         # Find unused materials
-        for material in bpy.data.materials:
-            if material.users == 0:
-                materials_to_remove.append(material)
+        materials_to_remove = [material for material in bpy.data.materials if material.users == 0]
 
-        # Remove unused materials
-        for material in materials_to_remove:
-            try:
-                bpy.data.materials.remove(material)
-                removed_count += 1
-            except Exception as e:
-                print(f"Failed to remove material {material.name}: {e}")
-                continue
+        # Remove them in one batch
+        removed_count = 0
+        try:
+            bpy.data.batch_remove(ids=materials_to_remove)
+            removed_count = len(materials_to_remove)
+        except Exception as e:
+            print(f"Failed to remove unused materials: {e}")
 
         return {
             "result": FixResult.SUCCESS if removed_count > 0 else FixResult.NOT_APPLICABLE,
@@ -475,6 +481,40 @@ class AutoFixSystem:
             "details": {"materials_removed": removed_count}
         }
 
+    def _fix_purge_orphan_data(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Remove every datablock unreachable from scenes in one batch"""
+
+        result = get_orphan_data_analyzer().purge()
+
+        if result["ids_removed"] == 0:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No orphan data found"}
+
+        return {
+            "result": FixResult.SUCCESS,
+            "message": (
+                f"Purged {result['ids_removed']} datablock(s), "
+                f"~{result['file_bytes'] / (1024 * 1024):.1f} MB file size reclaimed"
+            ),
+            "details": result
+        }
+
+    def _fix_merge_duplicate_materials(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Merge equivalent materials and remap their users"""
+
+        result = get_material_deduplicator().merge_duplicates()
+
+        if result["groups"] == 0:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No duplicate materials found"}
+
+        return {
+            "result": FixResult.SUCCESS if result["materials_removed"] > 0 else FixResult.FAILED,
+            "message": (
+                f"Merged {result['materials_removed']} duplicate material(s) into {result['groups']}, "
+                f"{result['nodes_removed']} nodes removed"
+            ),
+            "details": result
+        }
+
     def _fix_add_basic_lighting(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
         """Add basic three-point lighting setup"""
 
@@ -575,39 +615,54 @@ class AutoFixSystem:
             except Exception as e:
                 return {"result": FixResult.FAILED, "message": f"Failed to create camera: {str(e)}"}
 
-    def _fix_add_decimate_modifiers(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Add decimate modifiers to high-polygon objects"""
+    def _fix_generate_lods(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Add display-only viewport LODs to heavy objects"""
 
         objects_to_fix = self._get_target_mesh_objects(context, target_objects)
-        high_poly_threshold = 50000
+        result = get_lod_manager().generate_lods(context, objects_to_fix)
 
-        high_poly_objects = []
-        for obj in objects_to_fix:
-            if hasattr(obj.data, 'vertices') and len(obj.data.vertices) > high_poly_threshold:
-                high_poly_objects.append(obj)
+        if result["objects_managed"] == 0:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No heavy objects without LODs found"}
 
-        if not high_poly_objects:
-            return {"result": FixResult.NOT_APPLICABLE, "message": "No high-polygon objects found"}
+        return {
+            "result": FixResult.SUCCESS,
+            "message": f"Added {result['lod_levels']} LOD levels to {result['objects_managed']} object(s)",
+            "details": result
+        }
 
-        modified_count = 0
+    def _fix_share_duplicate_meshes(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Relink objects with identical meshes to one shared mesh datablock"""
 
-        for obj in high_poly_objects:
-            try:
-                # Check if decimate modifier already exists
-                if "BlendPro_Decimate" not in [mod.name for mod in obj.modifiers]:
-                    mod = obj.modifiers.new('BlendPro_Decimate', 'DECIMATE')
-                    mod.ratio = 0.5  # Reduce by 50%
-                    mod.use_collapse_triangulate = True
-                    modified_count += 1
+        result = get_geometry_deduplicator().relink_duplicates(context, target_objects)
 
-            except Exception as e:
-                print(f"Failed to add decimate modifier to {obj.name}: {e}")
-                continue
+        if result["groups"] == 0:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No duplicate meshes found"}
+
+        reclaimed_mb = result["bytes_reclaimed"] / (1024 * 1024)
+        return {
+            "result": FixResult.SUCCESS if result["objects_relinked"] > 0 else FixResult.FAILED,
+            "message": (
+                f"Relinked {result['objects_relinked']} object(s) to shared meshes, "
+                f"removed {result['meshes_removed']} copies (~{reclaimed_mb:.1f} MB)"
+            ),
+            "details": result
+        }
+
+    def _fix_downscale_textures(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Downscale textures larger than their on-screen use and relink them"""
+
+        result = get_texture_analyzer().downscale_textures(context)
+
+        if result.get("error"):
+            return {"result": FixResult.FAILED, "message": result["error"]}
+        if result["textures_downscaled"] == 0 and not result["failed"]:
+            return {"result": FixResult.NOT_APPLICABLE, "message": "No oversized textures to downscale"}
 
+        saved_mb = result["bytes_saved"] / (1024 * 1024)
         return {
-            "result": FixResult.SUCCESS if modified_count > 0 else FixResult.FAILED,
-            "message": f"Added decimate modifiers to {modified_count} object(s)",
-            "details": {"objects_modified": modified_count}
+            "result": FixResult.PARTIAL_SUCCESS if result["failed"] else FixResult.SUCCESS,
+            "message": f"Downscaled {result['textures_downscaled']} texture(s), ~{saved_mb:.0f} MB VRAM saved",
+            "details": result
         }
 
     def _fix_rename_default_objects(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -0,0 +1,358 @@
+"""
+Frame Time Monitor for BlendPro: AI Co-Pilot
+Viewport draw timing with regression alerts tied to recent scene changes
+"""
+
+import bpy
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from statistics import median
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from bpy.app.handlers import persistent
+
+from ..config.settings import get_settings
+from .proactive_suggestions import get_proactive_suggestions, ProactiveSuggestion, SuggestionType
+
+RING_SIZE = 512
+
+# Draws compared per regression check
+WINDOW = 30
+
+# A window this much slower than the baseline (and by at least MIN_REGRESSION_MS) is a regression
+REGRESSION_FACTOR = 1.5
+MIN_REGRESSION_MS = 2.0
+
+# Weight of each healthy window in the running baseline
+BASELINE_WEIGHT = 0.2
+
+_CHECK_INTERVAL = 1.0
+
+@dataclass
+class SceneChange:
+    """A depsgraph change that may explain a slowdown"""
+    timestamp: float
+    kind: str  # object_added, modifier_added, modifier_changed
+    object_name: str
+    detail: str = ""
+
+    def describe(self) -> str:
+        if self.kind == "object_added":
+            return f"adding '{self.object_name}'"
+        if self.kind == "modifier_added":
+            return f"adding {self.detail} to '{self.object_name}'"
+        return f"changing {self.detail} on '{self.object_name}'"
+
+@dataclass
+class FrameRegression:
+    """A jump in viewport draw time"""
+    timestamp: float
+    baseline_ms: float
+    current_ms: float
+    culprit: Optional[SceneChange] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "baseline_ms": self.baseline_ms,
+            "current_ms": self.current_ms,
+            "culprit": self.culprit.describe() if self.culprit else None
+        }
+
+def modifier_summary(obj) -> Tuple:
+    """Cheap modifier fingerprint: type, name, viewport visibility and levels"""
+    return tuple(
+        (mod.type, mod.name, mod.show_viewport, getattr(mod, "levels", None))
+        for mod in getattr(obj, "modifiers", ())
+    )
+
+class FrameTimeMonitor:
+    """Times 3D viewport draws through draw handlers into a ring buffer"""
+
+    def __init__(self):
+        self._durations = array('d', [0.0] * RING_SIZE)
+        self._stamps = array('d', [0.0] * RING_SIZE)
+        self._index = 0
+        self._count = 0
+        self._checked = 0
+        self._draw_start = 0.0
+        self._handles: Optional[Tuple[Any, Any]] = None
+
+        self._changes: deque = deque(maxlen=64)
+        self._modifiers: Dict[str, Tuple] = {}
+        self._known_objects: Optional[Set[str]] = None
+        self._regressions: deque = deque(maxlen=10)
+        self._baseline_ms: Optional[float] = None
+        self._last_good = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._handles is not None
+
+    def start(self) -> bool:
+        """Install the viewport draw handlers"""
+        if self._handles is not None:
+            return True
+        self._handles = (
+            bpy.types.SpaceView3D.draw_handler_add(self._begin_draw, (), 'WINDOW', 'PRE_VIEW'),
+            bpy.types.SpaceView3D.draw_handler_add(self._end_draw, (), 'WINDOW', 'POST_PIXEL')
+        )
+        self._last_good = time.perf_counter()
+        return True
+
+    def stop(self) -> bool:
+        """Remove the viewport draw handlers"""
+        if self._handles is None:
+            return True
+        for handle in self._handles:
+            bpy.types.SpaceView3D.draw_handler_remove(handle, 'WINDOW')
+        self._handles = None
+        self._draw_start = 0.0
+        return True
+
+    # Draw handlers: keep these to a timestamp and two array stores
+    def _begin_draw(self) -> None:
+        self._draw_start = time.perf_counter()
+
+    def _end_draw(self) -> None:
+        end = time.perf_counter()
+        start = self._draw_start
+        if not start:
+            return
+        index = self._index
+        self._durations[index] = (end - start) * 1000.0
+        self._stamps[index] = end
+        self._index = (index + 1) % RING_SIZE
+        self._count += 1
+        self._draw_start = 0.0
+
+    def recent_samples(self, count: int) -> List[Tuple[float, float]]:
+        """Newest (timestamp, ms) samples in draw order"""
+        count = min(count, self._count, RING_SIZE)
+        indices = [(self._index - count + offset) % RING_SIZE for offset in range(count)]
+        return [(self._stamps[i], self._durations[i]) for i in indices]
+
+    def on_depsgraph_update(self, scene, depsgraph) -> None:
+        """Record object and modifier changes that can slow drawing down"""
+
+        if self._known_objects is None:
+            # First update only learns the current state
+            self._known_objects = {obj.name for obj in scene.objects}
+            self._modifiers = {obj.name: modifier_summary(obj) for obj in scene.objects}
+            return
+
+        now = time.perf_counter()
+        for update in depsgraph.updates:
+            datablock = update.id
+            if not isinstance(datablock, bpy.types.Object):
+                continue
+            obj = datablock.original
+            name = obj.name
+
+            if name not in self._known_objects:
+                self._known_objects.add(name)
+                self._modifiers[name] = modifier_summary(obj)
+                self._changes.append(SceneChange(now, "object_added", name))
+                continue
+
+            if not update.is_updated_geometry:
+                continue
+            summary = modifier_summary(obj)
+            previous = self._modifiers.get(name, ())
+            if summary == previous:
+                continue
+            self._modifiers[name] = summary
+
+            previous_names = {entry[1] for entry in previous}
+            added = [entry for entry in summary if entry[1] not in previous_names]
+            if added:
+                self._changes.append(SceneChange(now, "modifier_added", name, f"modifier '{added[-1][1]}'"))
+            else:
+                changed = [entry for entry in summary if entry not in previous]
+                detail = f"modifier '{changed[-1][1]}'" if changed else "modifiers"
+                self._changes.append(SceneChange(now, "modifier_changed", name, detail))
+
+    def check_regression(self) -> Optional[FrameRegression]:
+        """Compare the newest window of draws with the running baseline"""
+
+        if self._count - self._checked < WINDOW:
+            return None
+        self._checked = self._count
+
+        samples = self.recent_samples(WINDOW)
+        current = median(duration for _, duration in samples)
+
+        if self._baseline_ms is None:
+            self._baseline_ms = current
+            self._last_good = samples[-1][0]
+            return None
+
+        baseline = self._baseline_ms
+        if current > baseline * REGRESSION_FACTOR and current - baseline > MIN_REGRESSION_MS:
+            regression = FrameRegression(
+                timestamp=time.time(),
+                baseline_ms=baseline,
+                current_ms=current,
+                culprit=self._probable_culprit(samples)
+            )
+            self._regressions.append(regression)
+            # Accept the new level so one change raises one alert
+            self._baseline_ms = current
+            self._last_good = samples[-1][0]
+            return regression
+
+        self._baseline_ms = (1.0 - BASELINE_WEIGHT) * baseline + BASELINE_WEIGHT * current
+        self._last_good = samples[-1][0]
+        return None
+
+    def _probable_culprit(self, samples: List[Tuple[float, float]]) -> Optional[SceneChange]:
+        """Latest change between the last healthy window and the first slow draw"""
+        threshold = (self._baseline_ms or 0.0) * REGRESSION_FACTOR
+        first_slow = next((stamp for stamp, duration in samples if duration > threshold), samples[-1][0])
+        candidates = [
+            change for change in self._changes
+            if self._last_good - _CHECK_INTERVAL <= change.timestamp <= first_slow
+        ]
+        return candidates[-1] if candidates else None
+
+    def report_regression(self, regression: FrameRegression) -> None:
+        """Raise a performance suggestion naming the probable culprit"""
+
+        culprit = regression.culprit
+        cause = f" after {culprit.describe()}" if culprit else ""
+        action_code = None
+        if culprit is not None and culprit.kind != "object_added" and culprit.detail.startswith("modifier '"):
+            modifier_name = culprit.detail[len("modifier '"):-1]
+            action_code = f"""
+import bpy
+obj = bpy.data.objects.get({culprit.object_name!r})
+if obj and {modifier_name!r} in obj.modifiers:
+    obj.modifiers[{modifier_name!r}].show_viewport = False
+"""
+
+        get_proactive_suggestions().add_suggestion(ProactiveSuggestion(
+            suggestion_type=SuggestionType.PERFORMANCE_TIP,
+            title="Viewport Slowed Down",
+            description=(
+                f"Viewport draws went from {regression.baseline_ms:.1f} ms to "
+                f"{regression.current_ms:.1f} ms{cause}."
+            ),
+            priority=7,
+            context=regression.to_dict(),
+            actionable=action_code is not None,
+            action_code=action_code
+        ))
+
+    def clear(self) -> None:
+        """Forget samples, baseline and recorded changes"""
+        self._index = 0
+        self._count = 0
+        self._checked = 0
+        self._baseline_ms = None
+        self._changes.clear()
+        self._modifiers.clear()
+        self._known_objects = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get frame time statistics"""
+        samples = self.recent_samples(WINDOW)
+        return {
+            "active": self.active,
+            "frames_sampled": self._count,
+            "median_ms": median(duration for _, duration in samples) if samples else 0.0,
+            "baseline_ms": self._baseline_ms or 0.0,
+            "regressions": [regression.to_dict() for regression in self._regressions]
+        }
+
+# Global frame time monitor instance
+_frame_time_monitor: Optional[FrameTimeMonitor] = None
+
+def get_frame_time_monitor() -> FrameTimeMonitor:
+    """Get global frame time monitor instance"""
+    global _frame_time_monitor
+    if _frame_time_monitor is None:
+        _frame_time_monitor = FrameTimeMonitor()
+    return _frame_time_monitor
+
+def set_frame_monitoring(enabled: bool) -> None:
+    """Start or stop frame time sampling"""
+    monitor = get_frame_time_monitor()
+    if enabled:
+        monitor.start()
+    else:
+        monitor.stop()
+
+def _check_timer():
+    """Look for regressions in the draws sampled since the last check"""
+    monitor = get_frame_time_monitor()
+    if monitor.active:
+        try:
+            regression = monitor.check_regression()
+            if regression is not None:
+                monitor.report_regression(regression)
+        except Exception as e:
+            print(f"Frame time check failed: {e}")
+    return _CHECK_INTERVAL
+
+def _start_from_preferences():
+    """Apply the saved frame monitor preference (one-shot timer)"""
+    addon_name = __package__.split('.')[0]
+    addon = bpy.context.preferences.addons.get(addon_name)
+    enabled = getattr(addon.preferences, "enable_frame_monitor", True) if addon else get_settings().enable_frame_monitor
+    if enabled and not bpy.app.background:
+        set_frame_monitoring(True)
+    return None
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Record changes for regression attribution"""
+    monitor = get_frame_time_monitor()
+    if depsgraph is None or not monitor.active:
+        return
+    try:
+        monitor.on_depsgraph_update(scene, depsgraph)
+    except Exception as e:
+        print(f"Frame monitor change tracking failed: {e}")
+
+@persistent
+def _on_load_post(*args):
+    """Timings from the previous file do not apply"""
+    get_frame_time_monitor().clear()
+
+class BLENDPRO_OT_ToggleFrameMonitor(bpy.types.Operator):
+    """Toggle viewport frame time monitoring"""
+    bl_idname = "blendpro.toggle_frame_monitor"
+    bl_label = "Toggle Frame Monitor"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        monitor = get_frame_time_monitor()
+        set_frame_monitoring(not monitor.active)
+        self.report({'INFO'}, "Frame monitoring started" if monitor.active else "Frame monitoring stopped")
+        return {'FINISHED'}
+
+def register():
+    """Register the toggle operator, handlers and check timer"""
+    bpy.utils.register_class(BLENDPRO_OT_ToggleFrameMonitor)
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    if not bpy.app.timers.is_registered(_check_timer):
+        bpy.app.timers.register(_check_timer, first_interval=_CHECK_INTERVAL, persistent=True)
+
+    # Preferences register after the workflow modules; read them once they exist
+    bpy.app.timers.register(_start_from_preferences, first_interval=0.1)
+
+def unregister():
+    """Stop sampling and remove handlers and timer"""
+    set_frame_monitoring(False)
+    if bpy.app.timers.is_registered(_check_timer):
+        bpy.app.timers.unregister(_check_timer)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    bpy.utils.unregister_class(BLENDPRO_OT_ToggleFrameMonitor)
@@ -0,0 +1,355 @@
+"""
+Geometry Deduplication for BlendPro: AI Co-Pilot
+Finds objects carrying identical mesh copies and relinks them to one shared mesh
+"""
+
+import bpy
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from bpy.app.handlers import persistent
+
+from ..utils.dependency_loader import safe_import
+from .render_cost import mesh_bytes
+
+numpy = safe_import('numpy', 'NumPy (Numerical Computing)', required=False, min_version='1.24.0')
+NUMPY_AVAILABLE = numpy is not None
+np = numpy if NUMPY_AVAILABLE else None
+
+# Local-space positions, UVs and other float attributes are compared on this grid
+POSITION_TOLERANCE = 1e-5
+UV_TOLERANCE = 1e-5
+ATTRIBUTE_TOLERANCE = 1e-5
+
+# foreach_get field, numpy dtype and width per attribute data type; other types are read one by one
+_ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", "float32", 1),
+    'INT': ("value", "int32", 1),
+    'INT8': ("value", "int32", 1),
+    'BOOLEAN': ("value", "bool", 1),
+    'FLOAT_VECTOR': ("vector", "float32", 3),
+    'FLOAT2': ("vector", "float32", 2),
+    'FLOAT_COLOR': ("color", "float32", 4),
+    'BYTE_COLOR': ("color", "float32", 4),
+    'INT32_2D': ("value", "int32", 2),
+    'QUATERNION': ("value", "float32", 4),
+    'FLOAT4X4': ("value", "float32", 16)
+}
+
+# Editor state stored as attributes; it does not change how a mesh looks
+_STATE_ATTRIBUTE_PREFIXES = (".select_", ".hide_")
+
+@dataclass
+class DuplicateGroup:
+    """Meshes with identical geometry that could share one datablock"""
+    digest: str
+    keep_mesh: str
+    duplicate_meshes: List[str]
+    objects: List[str]
+    wasted_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "digest": self.digest,
+            "keep_mesh": self.keep_mesh,
+            "duplicate_meshes": list(self.duplicate_meshes),
+            "objects": list(self.objects),
+            "wasted_bytes": self.wasted_bytes
+        }
+
+@dataclass
+class _MeshHash:
+    """Cached fingerprint of one mesh"""
+    signature: Tuple
+    digest: str
+    byte_size: int
+
+def _quantized(values, tolerance: float):
+    """Round float data onto a grid so float noise does not split groups"""
+    return np.round(values / tolerance).astype(np.int64)
+
+def _read(collection, attribute: str, dtype, width: int = 1):
+    """Read a bpy collection attribute into a flat numpy array"""
+    buffer = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attribute, buffer)
+    return buffer
+
+def hashed_attributes(mesh) -> List[Any]:
+    """Generic attributes covered by the hash beyond positions and UV maps"""
+    skipped = {"position"} | {uv_layer.name for uv_layer in mesh.uv_layers}
+    return sorted(
+        (attribute for attribute in mesh.attributes
+         if attribute.name not in skipped and not attribute.name.startswith(_STATE_ATTRIBUTE_PREFIXES)),
+        key=lambda attribute: attribute.name
+    )
+
+def mesh_signature(mesh) -> Tuple:
+    """Cheap size signature; meshes with different signatures cannot match"""
+    return (
+        len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons),
+        len(mesh.uv_layers), tuple(mat.name if mat else "" for mat in mesh.materials),
+        tuple((attribute.name, attribute.domain, attribute.data_type) for attribute in hashed_attributes(mesh)),
+        mesh.has_custom_normals
+    )
+
+def _attribute_array(attribute):
+    """Values of one generic attribute, float data quantized"""
+    layout = _ATTRIBUTE_LAYOUTS.get(attribute.data_type)
+    if layout is None:
+        # Strings cannot be read with foreach_get: compare their printed values
+        return np.frombuffer(repr([getattr(item, "value", None) for item in attribute.data]).encode(), dtype=np.uint8)
+    field_name, dtype, width = layout
+    values = _read(attribute.data, field_name, dtype, width)
+    if dtype == "float32":
+        return _quantized(values, ATTRIBUTE_TOLERANCE)
+    return values
+
+def hash_mesh(mesh) -> str:
+    """Digest of quantized local positions, topology, UVs, generic attributes and custom normals"""
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr(mesh_signature(mesh)).encode())
+
+    arrays = [
+        _quantized(_read(mesh.vertices, "co", np.float32, 3), POSITION_TOLERANCE),
+        _read(mesh.edges, "vertices", np.int32, 2),
+        _read(mesh.loops, "vertex_index", np.int32),
+        _read(mesh.polygons, "loop_start", np.int32),
+        _read(mesh.polygons, "loop_total", np.int32),
+        _read(mesh.polygons, "material_index", np.int32),
+        _read(mesh.polygons, "use_smooth", np.bool_)
+    ]
+    for uv_layer in mesh.uv_layers:
+        arrays.append(_quantized(_read(uv_layer.data, "uv", np.float32, 2), UV_TOLERANCE))
+
+    # Colors, creases, sharp edges, seams and any user attribute change the result too
+    for attribute in hashed_attributes(mesh):
+        arrays.append(_attribute_array(attribute))
+
+    if mesh.has_custom_normals and hasattr(mesh, "corner_normals"):
+        arrays.append(_quantized(_read(mesh.corner_normals, "vector", np.float32, 3), ATTRIBUTE_TOLERANCE))
+
+    for array in arrays:
+        digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+def is_shareable(obj) -> bool:
+    """Objects whose mesh can be swapped without changing their look"""
+    mesh = obj.data
+    # Vertex weights and shape keys live on the mesh and are not part of the hash; custom
+    # normals are only hashed where Blender exposes them without recomputing (4.1+)
+    return (
+        mesh is not None
+        and mesh.shape_keys is None
+        and len(obj.vertex_groups) == 0
+        and not getattr(mesh, "library", None)
+        and (not mesh.has_custom_normals or hasattr(mesh, "corner_normals"))
+    )
+
+class GeometryDeduplicator:
+    """Hashes meshes incrementally and groups identical ones"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._hashes: Dict[str, _MeshHash] = {}
+        self._dirty: Set[str] = set()
+        self._stats = {
+            "scans": 0,
+            "meshes_hashed": 0,
+            "hash_cache_hits": 0,
+            "meshes_relinked": 0,
+            "bytes_reclaimed": 0,
+            "last_scan_time": 0.0
+        }
+
+    def invalidate(self, mesh_names: Optional[List[str]] = None) -> None:
+        """Drop cached hashes for edited meshes (or all)"""
+        with self._lock:
+            if mesh_names is None:
+                self._hashes.clear()
+            else:
+                self._dirty.update(mesh_names)
+
+    def on_depsgraph_update(self, depsgraph) -> None:
+        """Invalidate hashes of meshes whose geometry changed"""
+        dirty = []
+        for update in depsgraph.updates:
+            if not update.is_updated_geometry:
+                continue
+            datablock = update.id
+            if isinstance(datablock, bpy.types.Mesh):
+                dirty.append(datablock.original.name)
+            elif isinstance(datablock, bpy.types.Object) and datablock.type == 'MESH':
+                dirty.append(datablock.original.data.name)
+        if dirty:
+            self.invalidate(dirty)
+
+    def find_duplicates(self, context) -> List[DuplicateGroup]:
+        """Groups of distinct meshes with identical geometry, largest waste first"""
+
+        if not NUMPY_AVAILABLE:
+            return []
+
+        with self._lock:
+            start_time = time.perf_counter()
+
+            users: Dict[str, List[str]] = defaultdict(list)
+            meshes = {}
+            for obj in context.scene.objects:
+                if obj.type != 'MESH' or not is_shareable(obj):
+                    continue
+                users[obj.data.name].append(obj.name)
+                meshes[obj.data.name] = obj.data
+
+            # Only meshes sharing a size signature with another mesh need a full hash
+            by_signature: Dict[Tuple, List[str]] = defaultdict(list)
+            for name, mesh in meshes.items():
+                by_signature[mesh_signature(mesh)].append(name)
+
+            by_digest: Dict[str, List[str]] = defaultdict(list)
+            for signature, names in by_signature.items():
+                if len(names) < 2:
+                    continue
+                for name in names:
+                    entry = self._hash_entry(meshes[name], signature)
+                    by_digest[entry.digest].append(name)
+
+            groups = []
+            for digest, names in by_digest.items():
+                if len(names) < 2:
+                    continue
+                names.sort(key=lambda name: (-len(users[name]), name))
+                keep, duplicates = names[0], names[1:]
+                groups.append(DuplicateGroup(
+                    digest=digest,
+                    keep_mesh=keep,
+                    duplicate_meshes=duplicates,
+                    objects=[obj_name for name in names for obj_name in users[name]],
+                    wasted_bytes=sum(self._hashes[name].byte_size for name in duplicates)
+                ))
+
+            # Forget meshes that no longer exist
+            for name in list(self._hashes):
+                if name not in meshes:
+                    del self._hashes[name]
+
+            groups.sort(key=lambda group: group.wasted_bytes, reverse=True)
+            self._stats["scans"] += 1
+            self._stats["last_scan_time"] = time.perf_counter() - start_time
+            return groups
+
+    def _hash_entry(self, mesh, signature: Tuple) -> _MeshHash:
+        """Cached hash of a mesh, recomputed when edited or resized"""
+        name = mesh.name
+        entry = self._hashes.get(name)
+        if entry is not None and name not in self._dirty and entry.signature == signature:
+            self._stats["hash_cache_hits"] += 1
+            return entry
+
+        entry = _MeshHash(signature=signature, digest=hash_mesh(mesh), byte_size=mesh_bytes(mesh))
+        self._hashes[name] = entry
+        self._dirty.discard(name)
+        self._stats["meshes_hashed"] += 1
+        return entry
+
+    def relink_duplicates(self, context, target_objects: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Point every duplicate's objects at the kept mesh and remove the copies"""
+
+        groups = self.find_duplicates(context)
+        targets = set(target_objects) if target_objects else None
+
+        relinked_objects = 0
+        removed_meshes = 0
+        reclaimed = 0
+
+        for group in groups:
+            keep = bpy.data.meshes.get(group.keep_mesh)
+            if keep is None:
+                continue
+
+            for mesh_name in group.duplicate_meshes:
+                duplicate = bpy.data.meshes.get(mesh_name)
+                if duplicate is None:
+                    continue
+
+                for obj_name in group.objects:
+                    obj = bpy.data.objects.get(obj_name)
+                    if obj is None or obj.data != duplicate:
+                        continue
+                    if targets is not None and obj_name not in targets:
+                        continue
+                    obj.data = keep
+                    relinked_objects += 1
+
+                if duplicate.users == 0:
+                    with self._lock:
+                        entry = self._hashes.pop(mesh_name, None)
+                    reclaimed += entry.byte_size if entry else 0
+                    bpy.data.meshes.remove(duplicate)
+                    removed_meshes += 1
+
+        with self._lock:
+            self._stats["meshes_relinked"] += removed_meshes
+            self._stats["bytes_reclaimed"] += reclaimed
+
+        return {
+            "groups": len(groups),
+            "objects_relinked": relinked_objects,
+            "meshes_removed": removed_meshes,
+            "bytes_reclaimed": reclaimed
+        }
+
+    def clear_cache(self) -> None:
+        """Forget all cached mesh hashes"""
+        with self._lock:
+            self._hashes.clear()
+            self._dirty.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics"""
+        with self._lock:
+            return {**self._stats, "cached_hashes": len(self._hashes)}
+
+# Global geometry deduplicator instance
+_geometry_deduplicator: Optional[GeometryDeduplicator] = None
+
+def get_geometry_deduplicator() -> GeometryDeduplicator:
+    """Get global geometry deduplicator instance"""
+    global _geometry_deduplicator
+    if _geometry_deduplicator is None:
+        _geometry_deduplicator = GeometryDeduplicator()
+    return _geometry_deduplicator
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Invalidate hashes of edited meshes"""
+    if depsgraph is None:
+        return
+    try:
+        get_geometry_deduplicator().on_depsgraph_update(depsgraph)
+    except Exception as e:
+        print(f"Geometry hash invalidation failed: {e}")
+
+@persistent
+def _on_load_post(*args):
+    """Mesh names mean nothing across files"""
+    get_geometry_deduplicator().clear_cache()
+
+def register():
+    """Install depsgraph handlers"""
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    """Remove depsgraph handlers"""
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
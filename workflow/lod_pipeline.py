@@ -0,0 +1,642 @@
+"""
+LOD Pipeline for BlendPro: AI Co-Pilot
+Display-only reduced meshes for heavy objects, switched by screen coverage
+"""
+
+import bpy
+import json
+import math
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+from bpy.app.handlers import persistent
+from mathutils import Vector
+
+from .render_cost import mesh_triangles
+
+# Object custom property holding {"ratios": [...], "meshes": [LOD holder objects], "base": [verts, faces]};
+# on the holder objects it names the object they belong to
+LOD_PROPERTY = "blendpro_lod"
+
+# Geometry Nodes modifier that displays the current LOD level in the viewport
+LOD_MODIFIER = "BlendPro_LOD"
+LOD_NODE_GROUP = "BlendPro LOD Switch"
+LOD_INPUT = "LOD Mesh"
+
+# Relative margin around coverage thresholds so LODs do not flicker
+HYSTERESIS = 0.15
+
+_UPDATE_INTERVAL = 0.5
+
+class BlendProLODSettings(bpy.types.PropertyGroup):
+    """Per-collection LOD configuration"""
+    enabled: bpy.props.BoolProperty(
+        name="Viewport LODs",
+        description="Show reduced geometry in the viewport for heavy objects in this collection",
+        default=True
+    )
+    level_count: bpy.props.IntProperty(
+        name="Levels",
+        description="Number of reduced levels per object",
+        default=3,
+        min=1,
+        max=3
+    )
+    reduction: bpy.props.FloatProperty(
+        name="Reduction",
+        description="Triangle ratio kept per level (level N keeps reduction^N)",
+        default=0.35,
+        min=0.05,
+        max=0.9
+    )
+    min_triangles: bpy.props.IntProperty(
+        name="Min Triangles",
+        description="Only objects above this triangle count get LODs",
+        default=50000,
+        min=1000
+    )
+    coverage_full: bpy.props.FloatProperty(
+        name="Full Detail Above",
+        description="Screen height fraction above which the full mesh is shown",
+        default=0.25,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    coverage_lowest: bpy.props.FloatProperty(
+        name="Lowest Detail Below",
+        description="Screen height fraction below which the lowest LOD is shown",
+        default=0.03,
+        min=0.001,
+        max=1.0,
+        subtype='FACTOR'
+    )
+
+_DEFAULT_SETTINGS = {
+    "enabled": True,
+    "level_count": 3,
+    "reduction": 0.35,
+    "min_triangles": 50000,
+    "coverage_full": 0.25,
+    "coverage_lowest": 0.03
+}
+
+def collection_lod_settings(obj) -> Dict[str, Any]:
+    """LOD settings of the first collection holding the object"""
+    for collection in obj.users_collection:
+        settings = getattr(collection, "blendpro_lod", None)
+        if settings is not None:
+            return {key: getattr(settings, key) for key in _DEFAULT_SETTINGS}
+    return dict(_DEFAULT_SETTINGS)
+
+def coverage_thresholds(settings: Dict[str, Any], levels: int) -> List[float]:
+    """Descending coverage below which each LOD level is used"""
+    high, low = settings["coverage_full"], min(settings["coverage_lowest"], settings["coverage_full"])
+    if levels == 1:
+        return [high]
+    return [high * (low / high) ** (k / (levels - 1)) for k in range(levels)]
+
+def choose_level(coverage: float, thresholds: List[float], current: int) -> int:
+    """LOD level for a screen coverage, with hysteresis around the current level"""
+    level = 0
+    for k, threshold in enumerate(thresholds, start=1):
+        margin = (1.0 + HYSTERESIS) if current >= k else (1.0 - HYSTERESIS)
+        if coverage < threshold * margin:
+            level = k
+    return level
+
+def world_sphere(obj) -> Tuple[Vector, float]:
+    """Bounding sphere of an object's world-space bounding box"""
+    matrix = obj.matrix_world
+    corners = [matrix @ Vector(corner) for corner in obj.bound_box]
+    center = sum(corners, Vector()) / 8.0
+    return center, max((corner - center).length for corner in corners)
+
+def lod_node_group():
+    """Shared Geometry Nodes group showing the LOD mesh in the viewport and the input in renders"""
+
+    group = bpy.data.node_groups.get(LOD_NODE_GROUP)
+    if group is not None and group.bl_idname == 'GeometryNodeTree':
+        return group
+
+    group = bpy.data.node_groups.new(LOD_NODE_GROUP, 'GeometryNodeTree')
+    group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    group.interface.new_socket(LOD_INPUT, in_out='INPUT', socket_type='NodeSocketObject')
+    group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes, links = group.nodes, group.links
+    group_input = nodes.new('NodeGroupInput')
+    group_output = nodes.new('NodeGroupOutput')
+    object_info = nodes.new('GeometryNodeObjectInfo')
+    object_info.transform_space = 'ORIGINAL'
+    is_viewport = nodes.new('GeometryNodeIsViewport')
+    switch = nodes.new('GeometryNodeSwitch')
+    switch.input_type = 'GEOMETRY'
+
+    # Blender 4.0 keeps one socket set per type on the Switch node; only the geometry set is enabled
+    condition, if_false, if_true = [socket for socket in switch.inputs if socket.enabled]
+    links.new(group_input.outputs[LOD_INPUT], object_info.inputs["Object"])
+    links.new(is_viewport.outputs[0], condition)
+    links.new(group_input.outputs["Geometry"], if_false)
+    links.new(object_info.outputs["Geometry"], if_true)
+    links.new(next(socket for socket in switch.outputs if socket.enabled), group_output.inputs["Geometry"])
+    return group
+
+def _lod_input_identifier(modifier) -> Optional[str]:
+    """Identifier of the LOD mesh input on a LOD modifier"""
+    group = modifier.node_group
+    if group is None:
+        return None
+    for item in group.interface.items_tree:
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == LOD_INPUT:
+            return item.identifier
+    return None
+
+def _build_lod_mesh(context, source_mesh, ratio: float, name: str):
+    """Object holding a decimated copy of a mesh; it is never linked to a scene"""
+
+    holder = bpy.data.objects.new(name, source_mesh.copy())
+    context.scene.collection.objects.link(holder)
+    try:
+        decimate = holder.modifiers.new("Decimate", 'DECIMATE')
+        decimate.ratio = ratio
+        decimate.use_collapse_triangulate = True
+        depsgraph = context.evaluated_depsgraph_get()
+        lod_mesh = bpy.data.meshes.new_from_object(
+            holder.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+    finally:
+        context.scene.collection.objects.unlink(holder)
+
+    copy = holder.data
+    holder.modifiers.clear()
+    holder.data = lod_mesh
+    lod_mesh.name = name
+    bpy.data.meshes.remove(copy)
+    return holder
+
+def lod_triangle_ratio(obj) -> float:
+    """Displayed LOD triangles over the full mesh (1.0 at full detail)"""
+    modifier = obj.modifiers.get(LOD_MODIFIER)
+    identifier = _lod_input_identifier(modifier) if modifier is not None else None
+    if identifier is None or not modifier.show_viewport:
+        return 1.0
+    holder = modifier.get(identifier)
+    full = mesh_triangles(obj.data)
+    if holder is None or holder.data is None or full <= 0:
+        return 1.0
+    return max(mesh_triangles(holder.data), 1) / full
+
+def _base_size(mesh) -> List[int]:
+    """Size of the full mesh the LODs were built from"""
+    return [len(mesh.vertices), len(mesh.polygons)]
+
+class LODManager:
+    """Switches precomputed LOD meshes on heavy objects by screen coverage
+
+    The reduced meshes are decimated once and shown through a Geometry Nodes modifier
+    that passes the full mesh through outside the viewport, so switching a level only
+    changes which mesh the modifier reads. The object's own mesh is never replaced;
+    edit mode, saved files and renders always see the full geometry.
+    """
+
+    def __init__(self):
+        self._managed: Dict[str, Dict[str, Any]] = {}
+        self._suspended: Optional[List[str]] = None
+        self._scanned = False
+        self._stats = {
+            "objects_managed": 0,
+            "switches": 0,
+            "last_update_time": 0.0,
+            "last_frame_ms_full": 0.0,
+            "last_frame_ms_lod": 0.0
+        }
+
+    def rescan(self) -> None:
+        """Rebuild the managed-object registry from custom properties"""
+        self._managed.clear()
+        for obj in bpy.data.objects:
+            if LOD_PROPERTY in obj and obj.modifiers.get(LOD_MODIFIER) is not None:
+                try:
+                    record = json.loads(obj[LOD_PROPERTY])
+                    if len(record["ratios"]) == len(record["meshes"]) and len(record["base"]) == 2:
+                        self._managed[obj.name] = record
+                except (TypeError, ValueError, KeyError):
+                    continue
+        self._scanned = True
+
+    def generate_lods(self, context, objects: List[Any]) -> Dict[str, Any]:
+        """Decimate heavy objects once per LOD level and add the display-only switch"""
+
+        start_time = time.perf_counter()
+        managed = 0
+        levels = 0
+        skipped = []
+
+        for obj in objects:
+            if obj.type != 'MESH' or obj.data is None:
+                continue
+            record = self._managed.get(obj.name)
+            if record is not None and record["base"] == _base_size(obj.data):
+                continue
+            if record is not None or LOD_PROPERTY in obj:
+                self.remove_lods([obj])  # The mesh was edited since its LODs were built
+
+            settings = collection_lod_settings(obj)
+            if not settings["enabled"] or mesh_triangles(obj.data) < settings["min_triangles"]:
+                skipped.append(obj.name)
+                continue
+
+            # Each level is decimated from the previous one, so every level costs less than the last
+            ratios = [settings["reduction"] ** level for level in range(1, settings["level_count"] + 1)]
+            holders = []
+            source_mesh = obj.data
+            for level in range(1, len(ratios) + 1):
+                holder = _build_lod_mesh(context, source_mesh, settings["reduction"], f"{LOD_MODIFIER}_{obj.name}_{level}")
+                holder[LOD_PROPERTY] = obj.name
+                holders.append(holder)
+                source_mesh = holder.data
+
+            modifier = obj.modifiers.new(LOD_MODIFIER, 'NODES')
+            modifier.node_group = lod_node_group()
+            # Full detail in edit mode; level 0 skips the modifier in the viewport as well
+            modifier.show_in_editmode = False
+            modifier.show_viewport = False
+            # First in the stack so deform and generate modifiers run on the displayed mesh
+            obj.modifiers.move(len(obj.modifiers) - 1, 0)
+
+            record = {"ratios": ratios, "meshes": [holder.name for holder in holders], "base": _base_size(obj.data)}
+            obj[LOD_PROPERTY] = json.dumps(record)
+            self._managed[obj.name] = record
+            managed += 1
+            levels += len(ratios)
+
+        self._stats["objects_managed"] = len(self._managed)
+
+        return {
+            "objects_managed": managed,
+            "lod_levels": levels,
+            "skipped": skipped,
+            "elapsed": time.perf_counter() - start_time
+        }
+
+    def remove_lods(self, objects: List[Any]) -> int:
+        """Remove the LOD modifier, the LOD meshes and the record from objects"""
+
+        removed = 0
+        for obj in objects:
+            if obj.name not in self._managed and LOD_PROPERTY not in obj:
+                continue
+            modifier = obj.modifiers.get(LOD_MODIFIER)
+            if modifier is not None:
+                obj.modifiers.remove(modifier)
+
+            try:
+                record = self._managed.get(obj.name) or json.loads(obj[LOD_PROPERTY])
+            except (TypeError, ValueError, KeyError):
+                record = {}
+            for name in record.get("meshes", []):
+                holder = bpy.data.objects.get(name)
+                if holder is None:
+                    continue
+                mesh = holder.data
+                bpy.data.objects.remove(holder)
+                if mesh is not None and mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
+
+            if LOD_PROPERTY in obj:
+                del obj[LOD_PROPERTY]
+            self._managed.pop(obj.name, None)
+            removed += 1
+
+        self._stats["objects_managed"] = len(self._managed)
+        return removed
+
+    def _current_level(self, modifier, record: Dict[str, Any]) -> int:
+        """LOD level the modifier displays (0 is the full mesh)"""
+        if not modifier.show_viewport:
+            return 0
+        identifier = _lod_input_identifier(modifier)
+        holder = modifier.get(identifier) if identifier else None
+        if holder is None or holder.name not in record["meshes"]:
+            return 0
+        return record["meshes"].index(holder.name) + 1
+
+    def _set_level(self, obj, modifier, record: Dict[str, Any], level: int) -> bool:
+        """Display one precomputed LOD level; no geometry is rebuilt"""
+        if level == 0:
+            modifier.show_viewport = False
+            return True
+
+        identifier = _lod_input_identifier(modifier)
+        holder = bpy.data.objects.get(record["meshes"][level - 1])
+        if identifier is None or holder is None:
+            return False
+        if modifier.get(identifier) != holder:
+            modifier[identifier] = holder
+            obj.update_tag()  # Modifier inputs set from Python do not tag the object themselves
+        if not modifier.show_viewport:
+            modifier.show_viewport = True
+        return True
+
+    def update_viewport(self, context) -> int:
+        """Switch every managed object to the LOD its screen coverage calls for"""
+
+        if not self._scanned:
+            self.rescan()
+        if not self._managed or self._suspended is not None:
+            return 0
+
+        view = self._viewpoint(context)
+        if view is None:
+            return 0
+        eye, tan_half_fov, ortho_height = view
+
+        view_layer = getattr(context, "view_layer", None)
+        active = view_layer.objects.active if view_layer else None
+
+        start_time = time.perf_counter()
+        switches = 0
+        for name, record in list(self._managed.items()):
+            obj = bpy.data.objects.get(name)
+            modifier = obj.modifiers.get(LOD_MODIFIER) if obj is not None else None
+            if modifier is None:
+                self._managed.pop(name, None)  # Object or modifier deleted by the user
+                continue
+            current = self._current_level(modifier, record)
+
+            settings = collection_lod_settings(obj)
+            # Objects the user is working on, or edited since their LODs were built, show the full mesh
+            if (not settings["enabled"] or obj.mode != 'OBJECT' or obj == active or obj.select_get()
+                    or record["base"] != _base_size(obj.data)):
+                target = 0
+            else:
+                center, radius = world_sphere(obj)
+                if ortho_height:
+                    coverage = 2.0 * radius / ortho_height
+                else:
+                    distance = max((center - eye).length - radius, 1e-6)
+                    coverage = radius / (distance * tan_half_fov)
+                target = choose_level(coverage, coverage_thresholds(settings, len(record["ratios"])), current)
+
+            if target != current and self._set_level(obj, modifier, record, target):
+                switches += 1
+
+        self._stats["switches"] += switches
+        self._stats["last_update_time"] = time.perf_counter() - start_time
+        return switches
+
+    def _viewpoint(self, context) -> Optional[Tuple[Vector, float, float]]:
+        """Eye position, tan(half vertical FOV) and ortho view height of the first 3D view"""
+
+        # Timers run without a screen in the context, so look through every window
+        window_manager = getattr(context, "window_manager", None)
+        for window in (window_manager.windows if window_manager else []):
+            for area in window.screen.areas:
+                if area.type != 'VIEW_3D':
+                    continue
+                region_3d = area.spaces.active.region_3d
+                if region_3d is None:
+                    continue
+                projection = region_3d.window_matrix
+                eye = region_3d.view_matrix.inverted().translation
+                if region_3d.is_perspective:
+                    return eye, 1.0 / projection[1][1], 0.0
+                return eye, 1.0, 2.0 / projection[1][1]
+
+        scene = getattr(context, "scene", None)
+        camera = scene.camera if scene else None
+        if camera is not None and camera.type == 'CAMERA':
+            return camera.matrix_world.translation, math.tan(camera.data.angle_y / 2.0), 0.0
+        return None
+
+    def suspend_lods(self) -> None:
+        """Show every managed object at full detail until resume_lods"""
+        if not self._scanned:
+            self.rescan()
+        suspended = []
+        for name in self._managed:
+            obj = bpy.data.objects.get(name)
+            modifier = obj.modifiers.get(LOD_MODIFIER) if obj is not None else None
+            if modifier is not None and modifier.show_viewport:
+                modifier.show_viewport = False
+                suspended.append(name)
+        self._suspended = suspended
+
+    def resume_lods(self) -> None:
+        """Undo suspend_lods"""
+        for name in self._suspended or []:
+            obj = bpy.data.objects.get(name)
+            modifier = obj.modifiers.get(LOD_MODIFIER) if obj is not None else None
+            if modifier is not None:
+                modifier.show_viewport = True
+        self._suspended = None
+
+    def triangle_savings(self) -> Dict[str, int]:
+        """Triangles drawn now against the full meshes (before later modifiers)"""
+        full_triangles = 0
+        shown_triangles = 0
+        for name in self._managed:
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.data is None or obj.modifiers.get(LOD_MODIFIER) is None:
+                continue
+            triangles = mesh_triangles(obj.data)
+            full_triangles += triangles
+            shown_triangles += min(triangles, int(triangles * lod_triangle_ratio(obj)))
+        return {
+            "full_triangles": full_triangles,
+            "shown_triangles": shown_triangles,
+            "triangles_saved": full_triangles - shown_triangles
+        }
+
+    def measure_frame_savings(self, context, iterations: int = 10) -> Dict[str, Any]:
+        """Viewport draw time with current LODs against full meshes"""
+
+        window, area, region = self._find_view3d(context)
+        if area is None:
+            return {"error": "No 3D viewport to measure"}
+
+        def draw_ms() -> float:
+            with context.temp_override(window=window, area=area, region=region):
+                start = time.perf_counter()
+                bpy.ops.wm.redraw_timer(type='DRAW', iterations=iterations)
+                return (time.perf_counter() - start) * 1000.0 / iterations
+
+        savings = self.triangle_savings()
+        lod_ms = draw_ms()
+        self.suspend_lods()
+        try:
+            full_ms = draw_ms()
+        finally:
+            self.resume_lods()
+
+        self._stats["last_frame_ms_full"] = full_ms
+        self._stats["last_frame_ms_lod"] = lod_ms
+        return {
+            "frame_ms_full": full_ms,
+            "frame_ms_lod": lod_ms,
+            "frame_ms_saved": full_ms - lod_ms,
+            **savings
+        }
+
+    def _find_view3d(self, context):
+        """First 3D viewport window, area and main region"""
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+                    return window, area, region
+        return None, None, None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get LOD statistics"""
+        return {**self._stats, "objects_managed": len(self._managed)}
+
+# Global LOD manager instance
+_lod_manager: Optional[LODManager] = None
+
+def get_lod_manager() -> LODManager:
+    """Get global LOD manager instance"""
+    global _lod_manager
+    if _lod_manager is None:
+        _lod_manager = LODManager()
+    return _lod_manager
+
+def _lod_timer():
+    """Periodic viewport LOD selection"""
+    try:
+        get_lod_manager().update_viewport(bpy.context)
+    except Exception as e:
+        print(f"LOD update failed: {e}")
+    return _UPDATE_INTERVAL
+
+@persistent
+def _on_load_post(*args):
+    """Pick up LOD objects stored in the loaded file"""
+    get_lod_manager().rescan()
+
+class BLENDPRO_OT_GenerateLODs(bpy.types.Operator):
+    """Add display-only viewport LODs to heavy objects"""
+    bl_idname = "blendpro.generate_lods"
+    bl_label = "Generate LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: bpy.props.EnumProperty(
+        items=[
+            ('SELECTED', "Selected", "Selected objects"),
+            ('COLLECTION', "Collection", "Objects in the active collection")
+        ],
+        default='SELECTED'
+    )
+    object_name: bpy.props.StringProperty(default="")
+
+    def execute(self, context):
+        if self.object_name:
+            objects = [obj for obj in [bpy.data.objects.get(self.object_name)] if obj]
+        elif self.scope == 'COLLECTION':
+            objects = list(context.collection.all_objects)
+        else:
+            objects = list(context.selected_objects)
+
+        result = get_lod_manager().generate_lods(context, objects)
+        self.report({'INFO'}, f"Added {result['lod_levels']} LOD levels to {result['objects_managed']} object(s)")
+        return {'FINISHED'}
+
+class BLENDPRO_OT_RemoveLODs(bpy.types.Operator):
+    """Remove viewport LODs from objects in the active collection"""
+    bl_idname = "blendpro.remove_lods"
+    bl_label = "Remove LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        removed = get_lod_manager().remove_lods(list(context.collection.all_objects))
+        self.report({'INFO'}, f"Removed LODs from {removed} object(s)")
+        return {'FINISHED'}
+
+class BLENDPRO_OT_MeasureLODSavings(bpy.types.Operator):
+    """Measure viewport frame time with and without LODs"""
+    bl_idname = "blendpro.measure_lod_savings"
+    bl_label = "Measure LOD Savings"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        result = get_lod_manager().measure_frame_savings(context)
+        if result.get("error"):
+            self.report({'ERROR'}, result["error"])
+            return {'CANCELLED'}
+
+        self.report(
+            {'INFO'},
+            f"Frame {result['frame_ms_full']:.1f} ms -> {result['frame_ms_lod']:.1f} ms, "
+            f"{result['triangles_saved']:,} triangles saved"
+        )
+        return {'FINISHED'}
+
+class BLENDPRO_PT_CollectionLOD(bpy.types.Panel):
+    """Per-collection LOD settings"""
+    bl_label = "BlendPro LODs"
+    bl_idname = "BLENDPRO_PT_collection_lod"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "collection"
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.collection.blendpro_lod
+
+        layout.prop(settings, "enabled")
+        col = layout.column()
+        col.active = settings.enabled
+        col.prop(settings, "level_count")
+        col.prop(settings, "reduction")
+        col.prop(settings, "min_triangles")
+        col.prop(settings, "coverage_full")
+        col.prop(settings, "coverage_lowest")
+
+        row = layout.row(align=True)
+        op = row.operator("blendpro.generate_lods", icon='MOD_DECIM')
+        op.scope = 'COLLECTION'
+        row.operator("blendpro.remove_lods", icon='X')
+        layout.operator("blendpro.measure_lod_savings", icon='TIME')
+
+        stats = get_lod_manager().get_stats()
+        if stats["last_frame_ms_full"]:
+            layout.label(
+                text=f"Last measure: {stats['last_frame_ms_full']:.1f} ms -> {stats['last_frame_ms_lod']:.1f} ms per frame"
+            )
+
+_classes = (
+    BlendProLODSettings,
+    BLENDPRO_OT_GenerateLODs,
+    BLENDPRO_OT_RemoveLODs,
+    BLENDPRO_OT_MeasureLODSavings,
+    BLENDPRO_PT_CollectionLOD,
+)
+
+def register():
+    """Register LOD classes, collection settings, the load handler and the update timer"""
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Collection.blendpro_lod = bpy.props.PointerProperty(type=BlendProLODSettings)
+
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+    if not bpy.app.timers.is_registered(_lod_timer):
+        bpy.app.timers.register(_lod_timer, first_interval=_UPDATE_INTERVAL, persistent=True)
+
+def unregister():
+    """Unregister LOD classes, the load handler and the update timer"""
+    if bpy.app.timers.is_registered(_lod_timer):
+        bpy.app.timers.unregister(_lod_timer)
+
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+
+    # Leave files showing full detail once nothing switches levels
+    global _lod_manager
+    get_lod_manager().suspend_lods()
+    _lod_manager = None
+
+    del bpy.types.Collection.blendpro_lod
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
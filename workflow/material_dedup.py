@@ -0,0 +1,408 @@
+"""
+Material Deduplication for BlendPro: AI Co-Pilot
+Canonical node-tree hashing to merge equivalent materials
+"""
+
+import bpy
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from bpy.app.handlers import persistent
+
+# Properties every node has that never change how it shades
+_IGNORED_NODE_PROPERTIES = {
+    "rna_type", "type", "location", "width", "width_hidden", "height", "dimensions",
+    "name", "label", "inputs", "outputs", "internal_links", "parent", "use_custom_color",
+    "color", "select", "show_options", "show_preview", "hide", "mute", "show_texture",
+    "bl_idname", "bl_label", "bl_description", "bl_icon", "bl_static_type",
+    "bl_width_default", "bl_width_min", "bl_width_max", "bl_height_default",
+    "bl_height_min", "bl_height_max", "is_active_output", "warning_propagation",
+    "location_absolute"
+}
+
+# Material settings outside the node tree that affect rendering
+_MATERIAL_PROPERTIES = (
+    "use_nodes", "blend_method", "surface_render_method", "shadow_method",
+    "use_backface_culling", "use_screen_refraction", "alpha_threshold",
+    "diffuse_color", "metallic", "roughness", "pass_index", "displacement_method"
+)
+
+# Rounding applied to float values before hashing
+_FLOAT_DIGITS = 6
+
+# Node-type property lists, discovered once per node class
+_node_property_cache: Dict[str, Tuple[str, ...]] = {}
+
+@dataclass
+class MaterialGroup:
+    """Equivalent materials and the representative they collapse to"""
+    digest: str
+    keep_material: str
+    duplicate_materials: List[str]
+    users: int
+    nodes_removed: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "digest": self.digest,
+            "keep_material": self.keep_material,
+            "duplicate_materials": list(self.duplicate_materials),
+            "users": self.users,
+            "nodes_removed": self.nodes_removed
+        }
+
+def _canonical(value) -> Any:
+    """Hashable, name-independent form of an RNA value"""
+
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return round(value, _FLOAT_DIGITS)
+
+    # Image references compare by source file so reloaded copies still match
+    if isinstance(value, bpy.types.Image):
+        source = value.filepath or value.name
+        return ("IMAGE", source, value.colorspace_settings.name, value.source)
+    if isinstance(value, bpy.types.ColorRamp):
+        return ("RAMP", value.interpolation, value.color_mode, tuple(
+            (round(element.position, _FLOAT_DIGITS), _canonical(element.color))
+            for element in value.elements
+        ))
+    if isinstance(value, bpy.types.CurveMapping):
+        return ("CURVES", tuple(
+            tuple((round(p.location[0], _FLOAT_DIGITS), round(p.location[1], _FLOAT_DIGITS), p.handle_type)
+                  for p in curve.points)
+            for curve in value.curves
+        ))
+    if isinstance(value, bpy.types.ShaderNodeTree):
+        return ("GROUP", node_tree_digest(value))
+    if isinstance(value, bpy.types.ID):
+        return ("ID", type(value).__name__, value.name)
+
+    try:
+        return tuple(_canonical(item) for item in value)
+    except TypeError:
+        return repr(value)
+
+def _node_properties(node) -> Tuple[str, ...]:
+    """Shading-relevant RNA properties of a node type"""
+    properties = _node_property_cache.get(node.bl_idname)
+    if properties is None:
+        properties = tuple(
+            prop.identifier for prop in node.bl_rna.properties
+            if prop.identifier not in _IGNORED_NODE_PROPERTIES
+            and prop.type != 'COLLECTION'
+        )
+        _node_property_cache[node.bl_idname] = properties
+    return properties
+
+def _node_signature(node) -> Tuple:
+    """Node type, mute state, settings and the values of its unlinked inputs"""
+
+    settings = []
+    for identifier in _node_properties(node):
+        try:
+            settings.append((identifier, _canonical(getattr(node, identifier))))
+        except (AttributeError, RuntimeError):
+            continue
+
+    # Every unlinked input value is compared, so defaults need no per-node table
+    inputs = []
+    for socket in node.inputs:
+        if socket.is_linked or not socket.enabled or not hasattr(socket, "default_value"):
+            continue
+        inputs.append((socket.identifier, _canonical(socket.default_value)))
+
+    # A muted node passes its inputs through, so it renders differently from an active one
+    return (node.bl_idname, node.mute, tuple(settings), tuple(inputs))
+
+def _incoming_links(node_tree) -> Dict[Tuple[str, str], List[Any]]:
+    """Active links keyed by (target node name, target socket identifier)"""
+    incoming: Dict[Tuple[str, str], List[Any]] = defaultdict(list)
+    for link in node_tree.links:
+        if link.is_valid and not link.is_muted:
+            incoming[(link.to_node.name, link.to_socket.identifier)].append(link)
+    return incoming
+
+def _upstream_sources(node, socket, incoming) -> List[Tuple[Any, str]]:
+    """(node, output socket identifier) pairs feeding an input, looking through reroutes"""
+    sources = []
+    for link in incoming.get((node.name, socket.identifier), []):
+        from_node, from_socket = link.from_node, link.from_socket
+        seen = set()
+        while from_node.type == 'REROUTE' and from_node.name not in seen:
+            seen.add(from_node.name)
+            feeding = incoming.get((from_node.name, from_node.inputs[0].identifier))
+            if not feeding:
+                break
+            from_node, from_socket = feeding[0].from_node, feeding[0].from_socket
+        if from_node.type != 'REROUTE':
+            sources.append((from_node, from_socket.identifier))
+    return sources
+
+def _node_hash(node, incoming, hashes: Dict[str, str]) -> str:
+    """Digest of a node's signature and, per input socket, the subtree wired into it"""
+
+    cached = hashes.get(node.name)
+    if cached is not None:
+        return cached
+    hashes[node.name] = ""  # In progress; a cycle through invalid links hashes as empty
+
+    wiring = []
+    for socket in node.inputs:
+        if not socket.enabled:
+            continue
+        sources = sorted(
+            (_node_hash(from_node, incoming, hashes), identifier)
+            for from_node, identifier in _upstream_sources(node, socket, incoming)
+        )
+        if sources:
+            wiring.append((socket.identifier, tuple(sources)))
+
+    digest = hashlib.blake2b(repr((_node_signature(node), tuple(wiring))).encode(), digest_size=20).hexdigest()
+    hashes[node.name] = digest
+    return digest
+
+def node_tree_digest(node_tree) -> str:
+    """Digest of a node tree that ignores node names, layout, order and unused nodes
+
+    Each output node is hashed together with everything wired into it, socket by
+    socket, so swapping two links between identical nodes changes the digest.
+    """
+
+    incoming = _incoming_links(node_tree)
+    hashes: Dict[str, str] = {}
+    outputs = []
+    for node in node_tree.nodes:
+        # Output nodes (material, world, AOV and group outputs) have no output sockets
+        if node.type in {'FRAME', 'REROUTE'} or len(node.outputs):
+            continue
+        outputs.append(repr((getattr(node, "is_active_output", True), _node_hash(node, incoming, hashes))))
+
+    digest = hashlib.blake2b(digest_size=20)
+    for output in sorted(outputs):
+        digest.update(output.encode())
+    return digest.hexdigest()
+
+def material_digest(material) -> str:
+    """Digest of a material's render-relevant settings and node tree"""
+
+    settings = []
+    for identifier in _MATERIAL_PROPERTIES:
+        if hasattr(material, identifier):
+            settings.append((identifier, _canonical(getattr(material, identifier))))
+
+    digest = hashlib.blake2b(repr(settings).encode(), digest_size=20)
+    if material.use_nodes and material.node_tree:
+        digest.update(node_tree_digest(material.node_tree).encode())
+    return digest.hexdigest()
+
+def _representative_rank(material) -> Tuple:
+    """Most used first, then the un-suffixed name ("Wood" before "Wood.001")"""
+    return (-material.users, material.name.count("."), len(material.name), material.name)
+
+class MaterialDeduplicator:
+    """Groups equivalent materials and remaps their users in one pass"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._digests: Dict[str, str] = {}
+        self._dirty: Set[str] = set()
+        self._stats = {
+            "scans": 0,
+            "materials_hashed": 0,
+            "hash_cache_hits": 0,
+            "materials_merged": 0,
+            "last_scan_time": 0.0
+        }
+
+    def invalidate(self, material_names: Optional[List[str]] = None) -> None:
+        """Drop cached digests for edited materials (or all)"""
+        with self._lock:
+            if material_names is None:
+                self._digests.clear()
+            else:
+                self._dirty.update(material_names)
+
+    def on_depsgraph_update(self, depsgraph) -> None:
+        """Invalidate digests of materials whose settings or nodes changed"""
+        dirty = []
+        everything = False
+        for update in depsgraph.updates:
+            datablock = update.id
+            if isinstance(datablock, bpy.types.Material):
+                dirty.append(datablock.original.name)
+            elif isinstance(datablock, (bpy.types.ShaderNodeTree, bpy.types.Image)):
+                # Group trees and images can be shared by any material
+                everything = True
+        if everything:
+            self.invalidate()
+        elif dirty:
+            self.invalidate(dirty)
+
+    def find_duplicates(self) -> List[MaterialGroup]:
+        """Groups of equivalent materials, largest groups first"""
+
+        with self._lock:
+            start_time = time.perf_counter()
+
+            by_digest: Dict[str, List[Any]] = defaultdict(list)
+            names = set()
+            for material in bpy.data.materials:
+                if material.library is not None or material.is_grease_pencil:
+                    continue
+                names.add(material.name)
+                by_digest[self._digest(material)].append(material)
+
+            for name in list(self._digests):
+                if name not in names:
+                    del self._digests[name]
+
+            groups = []
+            for digest, materials in by_digest.items():
+                if len(materials) < 2:
+                    continue
+                materials.sort(key=_representative_rank)
+                keep, duplicates = materials[0], materials[1:]
+                groups.append(MaterialGroup(
+                    digest=digest,
+                    keep_material=keep.name,
+                    duplicate_materials=[material.name for material in duplicates],
+                    users=sum(material.users for material in materials),
+                    nodes_removed=sum(
+                        len(material.node_tree.nodes) for material in duplicates
+                        if material.node_tree
+                    )
+                ))
+
+            groups.sort(key=lambda group: len(group.duplicate_materials), reverse=True)
+            self._stats["scans"] += 1
+            self._stats["last_scan_time"] = time.perf_counter() - start_time
+            return groups
+
+    def _digest(self, material) -> str:
+        """Cached material digest"""
+        name = material.name
+        digest = self._digests.get(name)
+        if digest is not None and name not in self._dirty:
+            self._stats["hash_cache_hits"] += 1
+            return digest
+
+        digest = material_digest(material)
+        self._digests[name] = digest
+        self._dirty.discard(name)
+        self._stats["materials_hashed"] += 1
+        return digest
+
+    def estimate_savings(self, groups: List[MaterialGroup]) -> Dict[str, Any]:
+        """What merging would save: shader compilations and node count"""
+        return {
+            "groups": len(groups),
+            "materials_removed": sum(len(group.duplicate_materials) for group in groups),
+            "shader_compiles_saved": sum(len(group.duplicate_materials) for group in groups),
+            "nodes_removed": sum(group.nodes_removed for group in groups)
+        }
+
+    def merge_duplicates(self, groups: Optional[List[MaterialGroup]] = None) -> Dict[str, Any]:
+        """Remap all users of duplicates to their representative and remove the duplicates"""
+
+        groups = self.find_duplicates() if groups is None else groups
+        savings = self.estimate_savings(groups)
+
+        remap = {}
+        for group in groups:
+            keep = bpy.data.materials.get(group.keep_material)
+            if keep is None:
+                continue
+            for name in group.duplicate_materials:
+                duplicate = bpy.data.materials.get(name)
+                if duplicate is not None and duplicate != keep:
+                    remap[duplicate] = keep
+
+        if not remap:
+            return {**savings, "materials_removed": 0, "slots_remapped": 0}
+
+        # One pass over every material slot in the file
+        slots_remapped = 0
+        for collection in (bpy.data.meshes, bpy.data.curves, bpy.data.metaballs, bpy.data.volumes):
+            for datablock in collection:
+                materials = datablock.materials
+                for index, material in enumerate(materials):
+                    if material in remap:
+                        materials[index] = remap[material]
+                        slots_remapped += 1
+        for obj in bpy.data.objects:
+            for slot in obj.material_slots:
+                if slot.link == 'OBJECT' and slot.material in remap:
+                    slot.material = remap[slot.material]
+                    slots_remapped += 1
+
+        # Anything else (node references, drivers) goes through Blender's generic remap
+        for duplicate, keep in remap.items():
+            if duplicate.users - int(duplicate.use_fake_user) > 0:
+                duplicate.user_remap(keep)
+
+        removable = [duplicate for duplicate in remap if duplicate.users - int(duplicate.use_fake_user) == 0]
+        removed_names = [duplicate.name for duplicate in removable]
+        bpy.data.batch_remove(ids=removable)
+
+        with self._lock:
+            for name in removed_names:
+                self._digests.pop(name, None)
+            self._stats["materials_merged"] += len(removed_names)
+
+        return {**savings, "materials_removed": len(removed_names), "slots_remapped": slots_remapped}
+
+    def clear_cache(self) -> None:
+        """Forget all cached digests"""
+        with self._lock:
+            self._digests.clear()
+            self._dirty.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics"""
+        with self._lock:
+            return {**self._stats, "cached_digests": len(self._digests)}
+
+# Global material deduplicator instance
+_material_deduplicator: Optional[MaterialDeduplicator] = None
+
+def get_material_deduplicator() -> MaterialDeduplicator:
+    """Get global material deduplicator instance"""
+    global _material_deduplicator
+    if _material_deduplicator is None:
+        _material_deduplicator = MaterialDeduplicator()
+    return _material_deduplicator
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Invalidate digests of edited materials"""
+    if depsgraph is None:
+        return
+    try:
+        get_material_deduplicator().on_depsgraph_update(depsgraph)
+    except Exception as e:
+        print(f"Material digest invalidation failed: {e}")
+
+@persistent
+def _on_load_post(*args):
+    """Material names mean nothing across files"""
+    get_material_deduplicator().clear_cache()
+
+def register():
+    """Install depsgraph handlers"""
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    """Remove depsgraph handlers"""
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
@@ -0,0 +1,339 @@
+"""
+Modifier Profiler for BlendPro: AI Co-Pilot
+Per-modifier evaluation timing, cached by modifier stack signature
+"""
+
+import bpy
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from .lod_pipeline import LOD_MODIFIER
+from .render_cost import mesh_triangles
+from ..utils.view_model import get_view_model
+
+# A stack slower than one 60 fps frame is worth a health issue
+SLOW_STACK_MS = 16.0
+
+# Combined subdivision cost at which Simplify is suggested
+SIMPLIFY_SUGGEST_MS = 50.0
+
+SUBDIVISION_TYPES = {'SUBSURF', 'MULTIRES'}
+GENERATOR_TYPES = {'ARRAY', 'NODES', 'PARTICLE_SYSTEM', 'SCREW', 'REMESH', 'SKIN', 'WIREFRAME'}
+
+_SIGNATURE_PROPERTY_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'ENUM', 'STRING'}
+_PROFILE_INTERVAL = 1.0
+
+@dataclass
+class ModifierTiming:
+    """Measured cost of one modifier in a stack"""
+    name: str
+    modifier_type: str
+    time_ms: float
+    triangles: int
+    suggestion: str
+
+@dataclass
+class StackProfile:
+    """Measured cost of an object's modifier stack"""
+    object_name: str
+    signature: Tuple
+    base_ms: float
+    total_ms: float
+    modifiers: List[ModifierTiming] = field(default_factory=list)
+    measured_at: float = 0.0
+
+    @property
+    def modifier_ms(self) -> float:
+        return sum(timing.time_ms for timing in self.modifiers)
+
+    def slowest(self) -> Optional[ModifierTiming]:
+        """Most expensive modifier in the stack"""
+        return max(self.modifiers, key=lambda timing: timing.time_ms, default=None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary"""
+        return {
+            "object": self.object_name,
+            "base_ms": self.base_ms,
+            "total_ms": self.total_ms,
+            "modifier_ms": self.modifier_ms,
+            "modifiers": [
+                {
+                    "name": timing.name,
+                    "type": timing.modifier_type,
+                    "time_ms": timing.time_ms,
+                    "triangles": timing.triangles,
+                    "suggestion": timing.suggestion
+                }
+                for timing in self.modifiers
+            ]
+        }
+
+def _signature_value(value) -> Any:
+    """Comparable form of an RNA property value (arrays and enum flags)"""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    try:
+        return tuple(value)
+    except TypeError:
+        return repr(value)
+
+def stack_signature(obj) -> Tuple:
+    """Modifier types, visibility and settings plus base mesh size"""
+    mesh = obj.data
+    parts = [len(mesh.vertices), len(mesh.polygons)]
+    for mod in obj.modifiers:
+        if mod.name == LOD_MODIFIER:
+            continue  # Viewport LOD switches must not invalidate the profile
+        settings = tuple(
+            _signature_value(getattr(mod, prop.identifier, None))
+            for prop in mod.bl_rna.properties
+            if prop.type in _SIGNATURE_PROPERTY_TYPES and not prop.is_readonly
+        )
+        parts.append((mod.type, settings))
+    return tuple(parts)
+
+def modifier_suggestion(mod, time_ms: float) -> str:
+    """Concrete way to make one modifier cheaper in the viewport"""
+    if mod.type in SUBDIVISION_TYPES and mod.levels > 0:
+        return f"Lower viewport levels from {mod.levels} to {mod.levels - 1}; render levels stay as set"
+    if mod.type == 'BOOLEAN' and getattr(mod, "solver", "") == 'EXACT':
+        return "Switch the boolean solver to Fast, or apply it once the cut is final"
+    if mod.type in GENERATOR_TYPES:
+        return "Apply it or replace repeated geometry with instances"
+    if time_ms > 1.0:
+        return "Apply it if the result is final, or disable it in the viewport while editing"
+    return ""
+
+def profiled_candidates(context) -> List[Any]:
+    """Visible mesh objects in object mode with at least one viewport modifier"""
+    return [
+        obj for obj in context.view_layer.objects
+        if obj.type == 'MESH' and obj.data is not None and obj.mode == 'OBJECT'
+        and obj.visible_get() and any(mod.show_viewport and mod.name != LOD_MODIFIER for mod in obj.modifiers)
+    ]
+
+class ModifierProfiler:
+    """Times depsgraph evaluation with modifiers enabled one at a time"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._profiles: Dict[str, StackProfile] = {}
+        self._pending: List[str] = []
+        self._stats = {
+            "stacks_measured": 0,
+            "stacks_reused": 0,
+            "evaluations": 0,
+            "last_profile_time": 0.0
+        }
+
+    def is_current(self, obj) -> bool:
+        """Whether the cached profile still matches the object's stack"""
+        with self._lock:
+            profile = self._profiles.get(obj.name)
+        return profile is not None and profile.signature == stack_signature(obj)
+
+    def cached_profiles(self) -> List[StackProfile]:
+        """Cached profiles, slowest first"""
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return sorted(profiles, key=lambda profile: profile.modifier_ms, reverse=True)
+
+    def stale_objects(self, context) -> List[Any]:
+        """Candidates without an up-to-date profile"""
+        return [obj for obj in profiled_candidates(context) if not self.is_current(obj)]
+
+    def queue(self, object_names: List[str]) -> None:
+        """Schedule objects for measurement on the main thread"""
+        with self._lock:
+            for name in object_names:
+                if name not in self._pending:
+                    self._pending.append(name)
+
+    def profile_object(self, context, obj, samples: int = 3) -> StackProfile:
+        """Measure each viewport modifier's share of the object's evaluation time"""
+
+        signature = stack_signature(obj)
+        with self._lock:
+            cached = self._profiles.get(obj.name)
+            if cached is not None and cached.signature == signature:
+                self._stats["stacks_reused"] += 1
+                return cached
+
+        modifiers = [mod for mod in obj.modifiers if mod.show_viewport and mod.name != LOD_MODIFIER]
+        lod = obj.modifiers.get(LOD_MODIFIER)
+        original = [mod.show_viewport for mod in obj.modifiers]
+        depsgraph = context.evaluated_depsgraph_get()
+
+        # Enable modifiers cumulatively; each step's increase is that modifier's cost
+        steps: List[Tuple[float, int]] = []
+        try:
+            for mod in modifiers:
+                mod.show_viewport = False
+            if lod is not None:
+                lod.show_viewport = False  # Measure the full stack, not the displayed LOD
+            steps.append(self._time_evaluation(obj, depsgraph, samples))
+            for mod in modifiers:
+                mod.show_viewport = True
+                steps.append(self._time_evaluation(obj, depsgraph, samples))
+        finally:
+            for mod, shown in zip(obj.modifiers, original):
+                if mod.show_viewport != shown:
+                    mod.show_viewport = shown
+            obj.update_tag()
+
+        timings = []
+        for index, mod in enumerate(modifiers):
+            time_ms = max(0.0, steps[index + 1][0] - steps[index][0])
+            timings.append(ModifierTiming(
+                name=mod.name,
+                modifier_type=mod.type,
+                time_ms=time_ms,
+                triangles=steps[index + 1][1],
+                suggestion=modifier_suggestion(mod, time_ms)
+            ))
+
+        profile = StackProfile(
+            object_name=obj.name,
+            signature=signature,
+            base_ms=steps[0][0],
+            total_ms=steps[-1][0],
+            modifiers=timings,
+            measured_at=time.time()
+        )
+
+        with self._lock:
+            self._profiles[obj.name] = profile
+            self._stats["stacks_measured"] += 1
+        return profile
+
+    def _time_evaluation(self, obj, depsgraph, samples: int) -> Tuple[float, int]:
+        """Fastest of several forced re-evaluations (ms) and the resulting triangle count"""
+        best = float("inf")
+        for _ in range(samples):
+            obj.update_tag(refresh={'DATA'})
+            start = time.perf_counter()
+            depsgraph.update()
+            best = min(best, (time.perf_counter() - start) * 1000.0)
+        self._stats["evaluations"] += samples
+        return best, mesh_triangles(obj.evaluated_get(depsgraph).data)
+
+    def profile_scene(self, context, samples: int = 3, budget: float = 2.0) -> List[StackProfile]:
+        """Profile every stale stack within a time budget (seconds), then publish"""
+
+        start_time = time.perf_counter()
+        names = {obj.name for obj in profiled_candidates(context)}
+        with self._lock:
+            for name in list(self._profiles):
+                if name not in names:
+                    del self._profiles[name]
+
+        for obj in self.stale_objects(context):
+            if time.perf_counter() - start_time > budget:
+                self.queue([obj.name])
+                continue
+            try:
+                self.profile_object(context, obj, samples)
+            except Exception as e:
+                print(f"Modifier profiling failed on {obj.name}: {e}")
+
+        self._stats["last_profile_time"] = time.perf_counter() - start_time
+        self.publish()
+        return self.cached_profiles()
+
+    def process_pending(self, context, samples: int = 1) -> int:
+        """Measure one queued object (called from the main-thread timer)"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            name = self._pending.pop(0)
+
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != 'MESH' or obj.mode != 'OBJECT' or self.is_current(obj):
+            return 0
+        try:
+            self.profile_object(context, obj, samples)
+        except Exception as e:
+            print(f"Modifier profiling failed on {name}: {e}")
+            return 0
+        self.publish()
+        return 1
+
+    def publish(self, count: int = 3) -> None:
+        """Publish the most expensive stacks to the Scene Health panel"""
+        get_view_model().publish_modifier_stacks([
+            profile.to_dict() for profile in self.cached_profiles()[:count]
+            if profile.modifier_ms > 1.0
+        ], SLOW_STACK_MS)
+
+    def clear_cache(self) -> None:
+        """Forget all profiles"""
+        with self._lock:
+            self._profiles.clear()
+            self._pending.clear()
+        get_view_model().publish_modifier_stacks([])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get profiler statistics"""
+        with self._lock:
+            return {
+                **self._stats,
+                "cached_profiles": len(self._profiles),
+                "pending": len(self._pending)
+            }
+
+# Global modifier profiler instance
+_modifier_profiler: Optional[ModifierProfiler] = None
+
+def get_modifier_profiler() -> ModifierProfiler:
+    """Get global modifier profiler instance"""
+    global _modifier_profiler
+    if _modifier_profiler is None:
+        _modifier_profiler = ModifierProfiler()
+    return _modifier_profiler
+
+def _profile_timer():
+    """Measure stacks queued by the background health checks"""
+    try:
+        get_modifier_profiler().process_pending(bpy.context)
+    except Exception as e:
+        print(f"Modifier profiling timer failed: {e}")
+    return _PROFILE_INTERVAL
+
+class BLENDPRO_OT_ProfileModifiers(bpy.types.Operator):
+    """Measure modifier stack evaluation time for visible objects"""
+    bl_idname = "blendpro.profile_modifiers"
+    bl_label = "Profile Modifiers"
+    bl_options = {'REGISTER'}
+
+    force: bpy.props.BoolProperty(default=False)
+
+    def execute(self, context):
+        profiler = get_modifier_profiler()
+        if self.force:
+            profiler.clear_cache()
+
+        profiles = profiler.profile_scene(context)
+        if not profiles:
+            self.report({'INFO'}, "No modifier stacks to profile")
+            return {'FINISHED'}
+
+        slowest = profiles[0]
+        self.report({'INFO'}, f"Slowest stack: {slowest.object_name} ({slowest.modifier_ms:.1f} ms)")
+        return {'FINISHED'}
+
+def register():
+    """Register the profiler operator and queue timer"""
+    bpy.utils.register_class(BLENDPRO_OT_ProfileModifiers)
+    if not bpy.app.timers.is_registered(_profile_timer):
+        bpy.app.timers.register(_profile_timer, first_interval=_PROFILE_INTERVAL, persistent=True)
+
+def unregister():
+    """Unregister the profiler operator and queue timer"""
+    if bpy.app.timers.is_registered(_profile_timer):
+        bpy.app.timers.unregister(_profile_timer)
+    bpy.utils.unregister_class(BLENDPRO_OT_ProfileModifiers)
@@ -0,0 +1,177 @@
+"""
+Orphan Data Analysis for BlendPro: AI Co-Pilot
+Finds datablocks unreachable from any scene and purges them in one batch
+"""
+
+import bpy
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set
+
+from .render_cost import mesh_bytes, texture_vram
+
+# ID types kept regardless of references (UI data, brushes, scripts)
+ROOT_TYPES = {
+    "Scene", "WindowManager", "WorkSpace", "Screen", "Brush", "Palette",
+    "Text", "Library", "PaintCurve"
+}
+
+# Rough per-item sizes used when a datablock has no better estimate
+_BASE_ID_BYTES = 1024
+_NODE_BYTES = 1024
+_KEYFRAME_BYTES = 40
+
+@dataclass
+class OrphanReport:
+    """Unreachable datablocks grouped by type"""
+    orphans: List[Any] = field(default_factory=list)
+    by_type: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    total_ids: int = 0
+    reachable_ids: int = 0
+    memory_bytes: int = 0
+    file_bytes: int = 0
+    analysis_time: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Serializable report without datablock references"""
+        return {
+            "orphan_count": len(self.orphans),
+            "by_type": {name: dict(values) for name, values in self.by_type.items()},
+            "total_ids": self.total_ids,
+            "reachable_ids": self.reachable_ids,
+            "memory_bytes": self.memory_bytes,
+            "file_bytes": self.file_bytes,
+            "analysis_time": self.analysis_time
+        }
+
+def id_type_name(datablock) -> str:
+    """RNA type name of an ID ("Mesh", "Material", ...)"""
+    return datablock.bl_rna.identifier
+
+def estimate_id_bytes(datablock) -> Dict[str, int]:
+    """Approximate memory and .blend bytes held by one datablock"""
+
+    type_name = id_type_name(datablock)
+    memory = _BASE_ID_BYTES
+    file_size = _BASE_ID_BYTES
+
+    try:
+        if type_name == "Mesh":
+            memory = file_size = mesh_bytes(datablock)
+        elif type_name == "Image":
+            packed = datablock.packed_file
+            file_size = packed.size if packed is not None else _BASE_ID_BYTES
+            if datablock.has_data:
+                width, height = datablock.size
+                memory = texture_vram(width, height, datablock.is_float)
+            else:
+                memory = file_size
+        elif type_name in {"Material", "World", "Light", "ShaderNodeTree", "GeometryNodeTree", "CompositorNodeTree"}:
+            node_tree = datablock if isinstance(datablock, bpy.types.NodeTree) else getattr(datablock, "node_tree", None)
+            nodes = len(node_tree.nodes) if node_tree is not None else 0
+            memory = file_size = _BASE_ID_BYTES + nodes * _NODE_BYTES
+        elif type_name == "Action":
+            keyframes = sum(len(fcurve.keyframe_points) for fcurve in getattr(datablock, "fcurves", []))
+            memory = file_size = _BASE_ID_BYTES + keyframes * _KEYFRAME_BYTES
+    except (AttributeError, ReferenceError, ValueError):
+        pass
+
+    return {"memory": memory, "file": file_size}
+
+class OrphanDataAnalyzer:
+    """Reachability analysis over the ID user map"""
+
+    def __init__(self):
+        self._stats = {
+            "analyses": 0,
+            "purges": 0,
+            "ids_purged": 0,
+            "bytes_reclaimed": 0
+        }
+
+    def analyze(self) -> OrphanReport:
+        """Everything not reachable from a scene, UI data or a fake user"""
+
+        start_time = time.perf_counter()
+
+        # user_map is target -> users; invert it to walk references forward
+        user_map = bpy.data.user_map()
+        references: Dict[Any, List[Any]] = defaultdict(list)
+        all_ids: Set[Any] = set(user_map)
+        for target, users in user_map.items():
+            for user in users:
+                references[user].append(target)
+                all_ids.add(user)
+
+        roots = [
+            datablock for datablock in all_ids
+            if id_type_name(datablock) in ROOT_TYPES
+            or datablock.use_fake_user
+            or datablock.library is not None
+        ]
+
+        reachable: Set[Any] = set(roots)
+        queue = deque(roots)
+        while queue:
+            for target in references.get(queue.popleft(), ()):
+                if target not in reachable:
+                    reachable.add(target)
+                    queue.append(target)
+
+        report = OrphanReport(total_ids=len(all_ids), reachable_ids=len(reachable))
+        by_type: Dict[str, Dict[str, int]] = defaultdict(lambda: {"count": 0, "memory_bytes": 0, "file_bytes": 0})
+        for datablock in all_ids:
+            if datablock in reachable:
+                continue
+            estimate = estimate_id_bytes(datablock)
+            entry = by_type[id_type_name(datablock)]
+            entry["count"] += 1
+            entry["memory_bytes"] += estimate["memory"]
+            entry["file_bytes"] += estimate["file"]
+            report.orphans.append(datablock)
+
+        report.by_type = dict(by_type)
+        report.memory_bytes = sum(entry["memory_bytes"] for entry in by_type.values())
+        report.file_bytes = sum(entry["file_bytes"] for entry in by_type.values())
+        report.analysis_time = time.perf_counter() - start_time
+
+        self._stats["analyses"] += 1
+        return report
+
+    def purge(self, report: Optional[OrphanReport] = None) -> Dict[str, Any]:
+        """Remove all orphans in a single batch"""
+
+        report = report or self.analyze()
+        if not report.orphans:
+            return {"ids_removed": 0, "memory_bytes": 0, "file_bytes": 0, "by_type": {}}
+
+        start_time = time.perf_counter()
+        bpy.data.batch_remove(ids=report.orphans)
+        purge_time = time.perf_counter() - start_time
+
+        self._stats["purges"] += 1
+        self._stats["ids_purged"] += len(report.orphans)
+        self._stats["bytes_reclaimed"] += report.memory_bytes
+
+        return {
+            "ids_removed": len(report.orphans),
+            "memory_bytes": report.memory_bytes,
+            "file_bytes": report.file_bytes,
+            "by_type": {name: values["count"] for name, values in report.by_type.items()},
+            "purge_time": purge_time
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get orphan analysis statistics"""
+        return dict(self._stats)
+
+# Global orphan data analyzer instance
+_orphan_data_analyzer: Optional[OrphanDataAnalyzer] = None
+
+def get_orphan_data_analyzer() -> OrphanDataAnalyzer:
+    """Get global orphan data analyzer instance"""
+    global _orphan_data_analyzer
+    if _orphan_data_analyzer is None:
+        _orphan_data_analyzer = OrphanDataAnalyzer()
+    return _orphan_data_analyzer
@@ -13,8 +13,11 @@ from enum import Enum
 from ..config.settings import get_settings
 from ..config.prompts import get_system_prompt, PromptType
 from ..utils.api_client import get_api_client, APIRequest
+from ..utils.view_model import get_view_model
 from ..vision.scene_analyzer import get_scene_analyzer
 from ..core.conversation_memory import get_conversation_memory
+from .render_cost import get_render_cost_estimator, OFFENDER_TRIANGLES
+from .texture_analyzer import get_texture_analyzer
 
 class SuggestionType(Enum):
     """Types of proactive suggestions"""
@@ -100,6 +103,7 @@ class ProactiveSuggestions:
                 self._active_suggestions.append(suggestion)
                 self._suggestion_history.append(suggestion)
             
+            self._publish_state()
             return filtered_suggestions
             
         except Exception as e:
@@ -381,28 +385,79 @@ else:
             suggestions.append(ProactiveSuggestion(
                 suggestion_type=SuggestionType.PERFORMANCE_TIP,
                 title="Optimize High-Poly Objects",
-                description=f"Found {len(high_poly_objects)} high-polygon objects that might slow down your workflow.",
+                description=f"Found {len(high_poly_objects)} high-polygon objects that might slow down your workflow. Viewport LODs speed up navigation without touching renders.",
                 priority=6,
                 context={"high_poly_objects": high_poly_objects},
                 actionable=True,
                 action_code=f"""
 import bpy
 
-# Add decimate modifiers to high-poly objects
-high_poly_objects = {high_poly_objects}
-
-for obj_name in high_poly_objects:
-    obj = bpy.data.objects.get(obj_name)
-    if obj and obj.type == 'MESH':
-        # Check if decimate modifier already exists
-        if "Decimate_Optimize" not in [mod.name for mod in obj.modifiers]:
-            mod = obj.modifiers.new('Decimate_Optimize', 'DECIMATE')
-            mod.ratio = 0.5  # Reduce by 50%
-            mod.use_collapse_triangulate = True
-            print(f"Added decimate modifier to {{obj_name}}")
+# Viewport LODs for high-poly objects; renders use the full meshes
+for obj_name in {high_poly_objects}:
+    bpy.ops.blendpro.generate_lods(object_name=obj_name)
 """
             ))
 
+        # Objects whose modifiers or instances make them expensive to render
+        try:
+            estimate = get_render_cost_estimator().estimate_scene(context)
+        except Exception as e:
+            print(f"Render cost estimate failed: {e}")
+            estimate = None
+
+        if estimate:
+            expensive = [
+                cost for cost in estimate["top_offenders"]
+                if cost["total_triangles"] > OFFENDER_TRIANGLES
+                and cost["name"] not in high_poly_objects
+            ]
+            if expensive:
+                summary = ", ".join(
+                    f"{cost['name']} ({cost['total_triangles']:,} tris)" for cost in expensive[:3]
+                )
+                suggestions.append(ProactiveSuggestion(
+                    suggestion_type=SuggestionType.PERFORMANCE_TIP,
+                    title="Reduce Render-Time Geometry",
+                    description=f"Modifiers and instances make these objects heavy at render time: {summary}.",
+                    priority=7,
+                    context={
+                        "expensive_objects": [cost["name"] for cost in expensive],
+                        "total_triangles": estimate["total_triangles"],
+                        "instancing_savings_bytes": estimate["instancing_savings_bytes"]
+                    },
+                    actionable=False
+                ))
+
+        # Textures far larger than they appear from the camera
+        try:
+            texture_analysis = get_texture_analyzer().analyze(context)
+        except Exception as e:
+            print(f"Texture analysis failed: {e}")
+            texture_analysis = None
+
+        if texture_analysis and texture_analysis["oversized"]:
+            savings_mb = texture_analysis["potential_savings_bytes"] / (1024 * 1024)
+            if savings_mb >= 64:
+                oversized = texture_analysis["oversized"]
+                suggestions.append(ProactiveSuggestion(
+                    suggestion_type=SuggestionType.PERFORMANCE_TIP,
+                    title="Downscale Oversized Textures",
+                    description=(
+                        f"{len(oversized)} textures are larger than the camera ever shows them. "
+                        f"Downscaled copies would save about {savings_mb:.0f} MB of VRAM."
+                    ),
+                    priority=6,
+                    context={
+                        "textures": [info.name for info in oversized],
+                        "savings_bytes": texture_analysis["potential_savings_bytes"]
+                    },
+                    actionable=True,
+                    action_code="""
+import bpy
+bpy.ops.blendpro.apply_specific_fix(fix_id="downscale_textures")
+"""
+                ))
+
         # Check viewport performance
         total_objects = len(scene_data.get("objects", []))
         if total_objects > 500:
@@ -535,9 +590,32 @@ if world:
         # Keep only recent activity (last 100 events)
         self._user_patterns["session_activity"] = self._user_patterns["session_activity"][-100:]
 
+    def add_suggestion(self, suggestion: ProactiveSuggestion) -> bool:
+        """Add a suggestion raised outside the generators (e.g. frame time alerts)"""
+
+        if not self.settings.enable_proactive_suggestions:
+            return False
+        if self._get_suggestion_id(suggestion) in self._dismissed_suggestions:
+            return False
+
+        self._active_suggestions.append(suggestion)
+        self._suggestion_history.append(suggestion)
+        self._publish_state()
+        return True
+
     def dismiss_suggestion(self, suggestion_id: str) -> None:
         """Dismiss a suggestion so it won't appear again"""
         self._dismissed_suggestions.add(suggestion_id)
+        self._publish_state()
+
+    def _publish_state(self) -> None:
+        """Publish visible suggestions to the UI view model"""
+
+        visible = [
+            self._suggestion_to_dict(s) for s in self._active_suggestions
+            if self._get_suggestion_id(s) not in self._dismissed_suggestions
+        ]
+        get_view_model().publish_suggestions(visible)
 
     def get_active_suggestions(self) -> List[Dict[str, Any]]:
         """Get currently active suggestions"""
@@ -569,6 +647,7 @@ if world:
     def clear_suggestions(self) -> None:
         """Clear all active suggestions"""
         self._active_suggestions.clear()
+        self._publish_state()
 
     def get_user_patterns(self) -> Dict[str, Any]:
         """Get user behavior patterns"""
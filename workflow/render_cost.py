@@ -0,0 +1,463 @@
+"""
+Render Cost Estimator for BlendPro: AI Co-Pilot
+Evaluated-geometry and texture cost estimates for scene health checks
+"""
+
+import bpy
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set
+
+from bpy.app.handlers import persistent
+
+from ..utils.logger import get_logger
+
+# Modifiers that multiply geometry between the base mesh and the render
+GROWTH_MODIFIERS = {
+    'SUBSURF', 'MULTIRES', 'ARRAY', 'NODES', 'PARTICLE_SYSTEM', 'SCREW',
+    'SOLIDIFY', 'MIRROR', 'REMESH', 'SKIN', 'BEVEL', 'WIREFRAME'
+}
+
+# Modifiers whose viewport and render subdivision levels can differ
+SUBDIVISION_MODIFIERS = {'SUBSURF', 'MULTIRES'}
+
+# Object types that evaluate to a mesh through to_mesh()
+CONVERTIBLE_TYPES = {'CURVE', 'SURFACE', 'FONT', 'META'}
+
+# Approximate GPU bytes per vertex (position + normal), loop (index + per-layer UV) and face
+_VERTEX_BYTES = 24
+_LOOP_BYTES = 4
+_UV_BYTES = 8
+_FACE_BYTES = 8
+
+# Health check thresholds
+OFFENDER_TRIANGLES = 1_000_000
+SCENE_TRIANGLES = 10_000_000
+TEXTURE_VRAM_BYTES = 2 * 1024 ** 3
+GROWTH_WARNING_FACTOR = 16.0
+
+# Full mip chain adds a third on top of the base level
+_MIPMAP_FACTOR = 4.0 / 3.0
+
+_REFRESH_INTERVAL = 1.0
+
+@dataclass
+class ObjectCost:
+    """Estimated render cost of one object"""
+    name: str
+    object_type: str
+    base_triangles: int = 0
+    evaluated_triangles: int = 0
+    instance_count: int = 0
+    instanced_triangles: int = 0
+    geometry_bytes: int = 0
+    texture_bytes: int = 0
+    instancing_savings_bytes: int = 0
+    images: List[str] = field(default_factory=list)
+    growth_modifiers: List[str] = field(default_factory=list)
+
+    @property
+    def total_triangles(self) -> int:
+        return self.evaluated_triangles + self.instanced_triangles
+
+    @property
+    def growth_factor(self) -> float:
+        if self.base_triangles <= 0:
+            return 0.0
+        return self.evaluated_triangles / self.base_triangles
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary"""
+        return {
+            "name": self.name,
+            "type": self.object_type,
+            "base_triangles": self.base_triangles,
+            "evaluated_triangles": self.evaluated_triangles,
+            "instance_count": self.instance_count,
+            "instanced_triangles": self.instanced_triangles,
+            "total_triangles": self.total_triangles,
+            "geometry_bytes": self.geometry_bytes,
+            "texture_bytes": self.texture_bytes,
+            "instancing_savings_bytes": self.instancing_savings_bytes,
+            "images": list(self.images),
+            "growth_modifiers": list(self.growth_modifiers)
+        }
+
+def mesh_triangles(mesh) -> int:
+    """Triangle count of a mesh after fan triangulation of every face"""
+    return max(0, len(mesh.loops) - 2 * len(mesh.polygons))
+
+def mesh_bytes(mesh) -> int:
+    """Approximate GPU memory held by a mesh"""
+    uv_layers = len(mesh.uv_layers) if hasattr(mesh, "uv_layers") else 0
+    return (
+        len(mesh.vertices) * _VERTEX_BYTES
+        + len(mesh.loops) * (_LOOP_BYTES + _UV_BYTES * uv_layers)
+        + len(mesh.polygons) * _FACE_BYTES
+    )
+
+def image_bytes(image) -> int:
+    """Approximate VRAM of an image texture including mipmaps"""
+    try:
+        width, height = image.size
+    except (AttributeError, ValueError):
+        return 0
+    if width <= 0 or height <= 0:
+        return 0
+
+    return texture_vram(width, height, getattr(image, "is_float", False))
+
+def texture_vram(width: int, height: int, is_float: bool) -> int:
+    """VRAM of a texture uploaded as RGBA8 or RGBA16F with mipmaps"""
+    bytes_per_pixel = 8 if is_float else 4
+    return int(width * height * bytes_per_pixel * _MIPMAP_FACTOR)
+
+def _modifier_growth(modifier, render: bool) -> float:
+    """Approximate triangle factor one modifier applies (1.0 when it cannot be estimated)"""
+    if modifier.type in SUBDIVISION_MODIFIERS:
+        return 4.0 ** (modifier.render_levels if render else modifier.levels)
+    if modifier.type == 'DECIMATE' and modifier.decimate_type == 'COLLAPSE':
+        return max(modifier.ratio, 1e-6)
+    if modifier.type == 'ARRAY' and modifier.fit_type == 'FIXED_COUNT':
+        return float(max(modifier.count, 1))
+    return 1.0
+
+def render_triangle_scale(obj) -> float:
+    """Factor from viewport-evaluated to render geometry
+
+    The context depsgraph is the viewport one: it subdivides at viewport levels and
+    applies modifiers by show_viewport, including the display-only BlendPro LOD.
+    """
+    from .lod_pipeline import LOD_MODIFIER, lod_triangle_ratio
+
+    scale = 1.0
+    for modifier in getattr(obj, "modifiers", []):
+        in_viewport = modifier.show_viewport
+        in_render = modifier.show_render
+        if modifier.name == LOD_MODIFIER:
+            # Renders pass the full mesh through; the viewport shows a precomputed reduction
+            if in_viewport:
+                scale /= lod_triangle_ratio(obj)
+        elif in_viewport and in_render:
+            if modifier.type in SUBDIVISION_MODIFIERS:
+                scale *= 4.0 ** (modifier.render_levels - modifier.levels)
+        elif in_viewport:
+            scale /= _modifier_growth(modifier, render=False)
+        elif in_render:
+            scale *= _modifier_growth(modifier, render=True)
+    return scale
+
+def material_images(material) -> List[Any]:
+    """Images referenced by image texture nodes of a material"""
+    if not material or not material.use_nodes or not material.node_tree:
+        return []
+    return [
+        node.image for node in material.node_tree.nodes
+        if node.type == 'TEX_IMAGE' and node.image is not None
+    ]
+
+class RenderCostEstimator:
+    """Estimates per-object render cost from the evaluated depsgraph, cached per object"""
+
+    def __init__(self):
+        self.logger = get_logger("BlendPro.RenderCost")
+        self._lock = threading.RLock()
+        self._costs: Dict[str, ObjectCost] = {}
+        self._dirty: Set[str] = set()
+        self._all_dirty = True
+        self._instances_dirty = True
+        self._last_estimate: Optional[Dict[str, Any]] = None
+        self._refresh_requested = False
+        self._stats = {
+            "estimates": 0,
+            "objects_evaluated": 0,
+            "objects_reused": 0,
+            "invalidations": 0,
+            "last_estimate_time": 0.0
+        }
+
+    def invalidate(self, object_names: Optional[List[str]] = None) -> None:
+        """Mark objects (or everything) for re-evaluation"""
+        with self._lock:
+            if object_names is None:
+                self._all_dirty = True
+            else:
+                self._dirty.update(object_names)
+            self._instances_dirty = True
+            self._stats["invalidations"] += 1
+
+    def on_depsgraph_update(self, depsgraph) -> None:
+        """Invalidate cached costs touched by a depsgraph update"""
+
+        dirty = []
+        everything = False
+        for update in depsgraph.updates:
+            datablock = update.id
+            if isinstance(datablock, bpy.types.Object):
+                if update.is_updated_geometry or update.is_updated_shading:
+                    dirty.append(datablock.original.name)
+            elif isinstance(datablock, (bpy.types.Material, bpy.types.Image, bpy.types.Collection)):
+                # Materials and images are shared; collections change instancing
+                everything = True
+
+        if everything:
+            self.invalidate()
+        elif dirty:
+            self.invalidate(dirty)
+
+    @property
+    def refresh_requested(self) -> bool:
+        """Whether a background thread asked for an estimate since the last refresh"""
+        return self._refresh_requested
+
+    def estimate_scene(self, context) -> Dict[str, Any]:
+        """Costs for all objects in the view layer, re-evaluating only invalidated ones"""
+
+        with self._lock:
+            if self._last_estimate is not None and not self._dirty and not self._all_dirty:
+                return self._last_estimate
+
+            if threading.current_thread() is not threading.main_thread():
+                # Evaluating the depsgraph off the main thread can crash Blender;
+                # serve the last estimate and leave the refresh to the main-thread timer
+                self._refresh_requested = True
+                return self._last_estimate if self._last_estimate is not None else self._summarize(0.0, 0)
+
+            self._refresh_requested = False
+
+            start_time = time.perf_counter()
+            depsgraph = context.evaluated_depsgraph_get()
+            objects = list(context.view_layer.objects)
+            names = {obj.name for obj in objects}
+
+            # Drop objects that were deleted or renamed
+            for name in list(self._costs):
+                if name not in names:
+                    del self._costs[name]
+
+            evaluated = 0
+            for obj in objects:
+                cached = self._costs.get(obj.name)
+                if cached is not None and not self._all_dirty and obj.name not in self._dirty:
+                    continue
+                cost = self._estimate_object(obj, depsgraph)
+                if cached is not None:
+                    cost.instance_count = cached.instance_count
+                    cost.instanced_triangles = cached.instanced_triangles
+                    cost.instancing_savings_bytes = cached.instancing_savings_bytes
+                self._costs[obj.name] = cost
+                evaluated += 1
+
+            if self._instances_dirty:
+                self._estimate_instances(depsgraph)
+
+            self._dirty.clear()
+            self._all_dirty = False
+            self._instances_dirty = False
+
+            estimate_time = time.perf_counter() - start_time
+            self._stats["estimates"] += 1
+            self._stats["objects_evaluated"] += evaluated
+            self._stats["objects_reused"] += len(objects) - evaluated
+            self._stats["last_estimate_time"] = estimate_time
+
+            self._last_estimate = self._summarize(estimate_time, evaluated)
+            return self._last_estimate
+
+    def top_offenders(self, context, count: int = 5, key: str = "triangles") -> List[ObjectCost]:
+        """Most expensive objects by triangles or texture memory"""
+        self.estimate_scene(context)
+        with self._lock:
+            costs = list(self._costs.values())
+        if key == "texture":
+            costs.sort(key=lambda cost: cost.texture_bytes, reverse=True)
+            return [cost for cost in costs[:count] if cost.texture_bytes > 0]
+        costs.sort(key=lambda cost: cost.total_triangles, reverse=True)
+        return [cost for cost in costs[:count] if cost.total_triangles > 0]
+
+    def _estimate_object(self, obj, depsgraph) -> ObjectCost:
+        """Evaluate one object's render geometry and texture cost"""
+
+        cost = ObjectCost(name=obj.name, object_type=obj.type)
+        cost.growth_modifiers = [
+            mod.type for mod in getattr(obj, "modifiers", [])
+            if mod.type in GROWTH_MODIFIERS and mod.show_render
+        ]
+
+        try:
+            if obj.type == 'MESH' and obj.data is not None:
+                cost.base_triangles = mesh_triangles(obj.data)
+                evaluated_mesh = obj.evaluated_get(depsgraph).data
+                cost.evaluated_triangles = mesh_triangles(evaluated_mesh)
+                cost.geometry_bytes = mesh_bytes(evaluated_mesh)
+            elif obj.type in CONVERTIBLE_TYPES:
+                obj_eval = obj.evaluated_get(depsgraph)
+                evaluated_mesh = obj_eval.to_mesh()
+                try:
+                    if evaluated_mesh is not None:
+                        cost.evaluated_triangles = mesh_triangles(evaluated_mesh)
+                        cost.geometry_bytes = mesh_bytes(evaluated_mesh)
+                finally:
+                    obj_eval.to_mesh_clear()
+        except (ReferenceError, RuntimeError) as e:
+            self.logger.debug(f"Could not evaluate {obj.name}: {e}")
+
+        # Turn viewport-evaluated figures into what a final render builds
+        scale = render_triangle_scale(obj)
+        if scale != 1.0:
+            cost.evaluated_triangles = int(cost.evaluated_triangles * scale)
+            cost.geometry_bytes = int(cost.geometry_bytes * scale)
+
+        images = {}
+        for slot in getattr(obj, "material_slots", []):
+            for image in material_images(slot.material):
+                images[image.name] = image
+        cost.images = sorted(images)
+        cost.texture_bytes = sum(image_bytes(image) for image in images.values())
+
+        return cost
+
+    def _estimate_instances(self, depsgraph) -> None:
+        """Attribute particle, collection and geometry-node instances to their instancer"""
+
+        counts: Dict[str, int] = defaultdict(int)
+        triangles: Dict[str, int] = defaultdict(int)
+        shared: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+        mesh_stats: Dict[int, tuple] = {}
+
+        for instance in depsgraph.object_instances:
+            if not instance.is_instance or instance.parent is None:
+                continue
+
+            instanced = instance.object
+            data = getattr(instanced, "data", None)
+            if instanced.type != 'MESH' or data is None:
+                continue
+
+            pointer = data.as_pointer()
+            stats = mesh_stats.get(pointer)
+            if stats is None:
+                stats = (mesh_triangles(data), mesh_bytes(data))
+                mesh_stats[pointer] = stats
+
+            parent = instance.parent.original.name
+            counts[parent] += 1
+            triangles[parent] += stats[0]
+            entry = shared[parent].setdefault(pointer, [0, stats[1]])
+            entry[0] += 1
+
+        for name, cost in self._costs.items():
+            cost.instance_count = counts.get(name, 0)
+            cost.instanced_triangles = triangles.get(name, 0)
+            # Every instance past the first reuses the same GPU geometry
+            cost.instancing_savings_bytes = sum(
+                (uses - 1) * size for uses, size in shared.get(name, {}).values()
+            )
+
+    def _summarize(self, estimate_time: float, evaluated: int) -> Dict[str, Any]:
+        """Scene totals from the cached per-object costs"""
+
+        costs = list(self._costs.values())
+        ranked = sorted(costs, key=lambda cost: cost.total_triangles, reverse=True)
+
+        return {
+            "object_count": len(costs),
+            "base_triangles": sum(cost.base_triangles for cost in costs),
+            "evaluated_triangles": sum(cost.evaluated_triangles for cost in costs),
+            "instanced_triangles": sum(cost.instanced_triangles for cost in costs),
+            "total_triangles": sum(cost.total_triangles for cost in costs),
+            "instance_count": sum(cost.instance_count for cost in costs),
+            "geometry_bytes": sum(cost.geometry_bytes for cost in costs),
+            "texture_bytes": self._unique_texture_bytes(costs),
+            "instancing_savings_bytes": sum(cost.instancing_savings_bytes for cost in costs),
+            "top_offenders": [cost.to_dict() for cost in ranked[:5] if cost.total_triangles > 0],
+            "objects_evaluated": evaluated,
+            "estimate_time": estimate_time
+        }
+
+    def _unique_texture_bytes(self, costs: List[ObjectCost]) -> int:
+        """Texture VRAM with each image counted once"""
+        seen = set()
+        total = 0
+        for cost in costs:
+            for name in cost.images:
+                if name in seen:
+                    continue
+                seen.add(name)
+                image = bpy.data.images.get(name)
+                if image is not None:
+                    total += image_bytes(image)
+        return total
+
+    def clear_cache(self) -> None:
+        """Forget all cached estimates"""
+        with self._lock:
+            self._costs.clear()
+            self._dirty.clear()
+            self._all_dirty = True
+            self._instances_dirty = True
+            self._last_estimate = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get estimator statistics"""
+        with self._lock:
+            return {
+                **self._stats,
+                "cached_objects": len(self._costs),
+                "pending_objects": len(self._dirty)
+            }
+
+# Global render cost estimator instance
+_render_cost_estimator: Optional[RenderCostEstimator] = None
+
+def get_render_cost_estimator() -> RenderCostEstimator:
+    """Get global render cost estimator instance"""
+    global _render_cost_estimator
+    if _render_cost_estimator is None:
+        _render_cost_estimator = RenderCostEstimator()
+    return _render_cost_estimator
+
+def _refresh_timer():
+    """Refresh estimates requested by the background health checks"""
+    estimator = get_render_cost_estimator()
+    if estimator.refresh_requested:
+        try:
+            estimator.estimate_scene(bpy.context)
+        except Exception as e:
+            print(f"Render cost refresh failed: {e}")
+    return _REFRESH_INTERVAL
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Invalidate estimates for objects the depsgraph re-evaluated"""
+    if depsgraph is None:
+        return
+    try:
+        get_render_cost_estimator().on_depsgraph_update(depsgraph)
+    except Exception as e:
+        print(f"Render cost invalidation failed: {e}")
+
+@persistent
+def _on_load_post(*args):
+    """A new file invalidates every estimate"""
+    get_render_cost_estimator().clear_cache()
+
+def register():
+    """Install depsgraph handlers and the refresh timer"""
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    if not bpy.app.timers.is_registered(_refresh_timer):
+        bpy.app.timers.register(_refresh_timer, first_interval=_REFRESH_INTERVAL, persistent=True)
+
+def unregister():
+    """Remove depsgraph handlers and the refresh timer"""
+    if bpy.app.timers.is_registered(_refresh_timer):
+        bpy.app.timers.unregister(_refresh_timer)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
@@ -0,0 +1,574 @@
+"""
+Render Optimizer for BlendPro: AI Co-Pilot
+Scene-aware render setting proposals with test renders, apply and revert
+"""
+
+import bpy
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+
+from bpy.app.handlers import persistent
+
+from .render_cost import get_render_cost_estimator
+
+# Scene custom property holding the values replaced by the last apply
+BACKUP_PROPERTY = "blendpro_render_backup"
+
+# Sample targets: with a denoiser, simple scenes converge much earlier
+DENOISED_SAMPLES = 256
+DENOISED_SAMPLES_SIMPLE = 128
+EEVEE_SAMPLES = 64
+
+# Below this estimated speedup the health report stays quiet
+MIN_REPORTED_SPEEDUP = 1.2
+
+MAX_BOUNCES = 8
+MANY_LIGHTS = 8
+
+# Test renders: small frame at two sample counts; the slope is the time per sample
+TEST_PERCENTAGE = 10
+TEST_MAX_SAMPLES = 16
+TEST_MIN_SAMPLES = 4
+
+# Rough render-time factors used for estimates (1.0 = no change)
+_ADAPTIVE_FACTOR = 0.75
+_BOUNCE_FACTOR = 0.9
+_TRANSMISSION_FACTOR = 0.95
+_VOLUME_STEP_FACTOR = 0.7
+_LIGHT_TREE_FACTOR = 0.8
+_PERSISTENT_DATA_FACTOR = 0.9
+
+EEVEE_ENGINES = {'BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'}
+
+# Datablock types whose changes can alter the proposals
+_ANALYSIS_ID_TYPES = ('SCENE', 'OBJECT', 'MATERIAL', 'WORLD', 'LIGHT', 'NODETREE')
+_ANALYSIS_INTERVAL = 1.0
+
+@dataclass
+class RenderProposal:
+    """One suggested render setting change"""
+    path: str  # Attribute path from the scene, e.g. "cycles.samples"
+    label: str
+    current: Any
+    proposed: Any
+    time_factor: float  # Estimated render time multiplier
+    reason: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "label": self.label,
+            "current": self.current,
+            "proposed": self.proposed,
+            "time_factor": self.time_factor,
+            "reason": self.reason
+        }
+
+def get_path(scene, path: str) -> Any:
+    """Read a dotted attribute path from the scene"""
+    value = scene
+    for part in path.split("."):
+        value = getattr(value, part)
+    return value
+
+def set_path(scene, path: str, value: Any) -> None:
+    """Write a dotted attribute path on the scene"""
+    owner_path, _, attribute = path.rpartition(".")
+    owner = get_path(scene, owner_path) if owner_path else scene
+    setattr(owner, attribute, value)
+
+def samples_path(scene) -> Optional[str]:
+    """Attribute path of the render sample count for the scene's engine"""
+    engine = scene.render.engine
+    if engine == 'CYCLES':
+        return "cycles.samples"
+    if engine in EEVEE_ENGINES:
+        return "eevee.taa_render_samples"
+    return None
+
+def _node_tree_has(node_tree, predicate) -> bool:
+    """Whether any node in a tree matches"""
+    return node_tree is not None and any(predicate(node) for node in node_tree.nodes)
+
+def _volume_linked(node) -> bool:
+    return node.type in {'OUTPUT_MATERIAL', 'OUTPUT_WORLD'} and "Volume" in node.inputs and node.inputs["Volume"].is_linked
+
+def _transparent(node) -> bool:
+    if node.type in {'BSDF_TRANSPARENT', 'BSDF_GLASS', 'BSDF_REFRACTION'}:
+        return True
+    if node.type == 'BSDF_PRINCIPLED':
+        for name in ("Alpha", "Transmission Weight", "Transmission"):
+            socket = node.inputs.get(name)
+            if socket is None:
+                continue
+            if socket.is_linked or (socket.default_value < 1.0 if name == "Alpha" else socket.default_value > 0.0):
+                return True
+    return False
+
+def scene_characteristics(context) -> Dict[str, Any]:
+    """Lights, geometry, volumes and transparency that drive render cost"""
+
+    scene = context.scene
+    objects = list(context.view_layer.objects)
+    materials = {
+        slot.material for obj in objects for slot in getattr(obj, "material_slots", [])
+        if slot.material is not None and slot.material.use_nodes
+    }
+    world_tree = scene.world.node_tree if scene.world is not None and scene.world.use_nodes else None
+
+    try:
+        triangles = get_render_cost_estimator().estimate_scene(context)["total_triangles"]
+    except Exception as e:
+        print(f"Render cost estimate failed: {e}")
+        triangles = 0
+
+    return {
+        "lights": sum(1 for obj in objects if obj.type == 'LIGHT' and not obj.hide_render),
+        "triangles": triangles,
+        "volumetrics": (
+            any(obj.type == 'VOLUME' for obj in objects)
+            or _node_tree_has(world_tree, _volume_linked)
+            or any(_node_tree_has(material.node_tree, _volume_linked) for material in materials)
+        ),
+        "transparency": any(_node_tree_has(material.node_tree, _transparent) for material in materials),
+        "animation": scene.frame_end > scene.frame_start
+    }
+
+class RenderOptimizer:
+    """Proposes faster render settings and measures them with test renders"""
+
+    def __init__(self):
+        self._last_measurement: Optional[Dict[str, Any]] = None
+        self._analysis: Optional[Dict[str, Any]] = None
+        self._analysis_stale = True
+        self._analysis_wanted = False
+        self._stats = {
+            "analyses": 0,
+            "applies": 0,
+            "reverts": 0,
+            "test_renders": 0
+        }
+
+    def analyze(self, context) -> Dict[str, Any]:
+        """Proposals for the scene's engine with a combined speedup estimate"""
+
+        scene = context.scene
+        traits = scene_characteristics(context)
+        engine = scene.render.engine
+
+        proposals: List[RenderProposal] = []
+        try:
+            if engine == 'CYCLES':
+                proposals = self._cycles_proposals(scene, traits)
+            elif engine in EEVEE_ENGINES:
+                proposals = self._eevee_proposals(scene)
+        except AttributeError as e:
+            print(f"Render settings not available for {engine}: {e}")
+
+        if traits["animation"] and not scene.render.use_persistent_data and engine == 'CYCLES':
+            proposals.append(RenderProposal(
+                "render.use_persistent_data", "Persistent Data", False, True, _PERSISTENT_DATA_FACTOR,
+                "Animation frames reuse BVH and textures instead of rebuilding them"
+            ))
+
+        time_factor = 1.0
+        for proposal in proposals:
+            time_factor *= proposal.time_factor
+
+        self._stats["analyses"] += 1
+        self._analysis = {
+            "engine": engine,
+            "characteristics": traits,
+            "proposals": proposals,
+            "time_factor": time_factor,
+            "estimated_speedup": 1.0 / time_factor if time_factor > 0 else 1.0
+        }
+        self._analysis_stale = False
+        self._analysis_wanted = False
+        return self._analysis
+
+    @property
+    def cached_analysis(self) -> Optional[Dict[str, Any]]:
+        """Last analysis, possibly stale; None before the first one"""
+        return self._analysis
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Whether a panel is waiting for a stale analysis to be redone"""
+        return self._analysis_stale and self._analysis_wanted
+
+    def current_analysis(self, context) -> Dict[str, Any]:
+        """Cached analysis, re-analyzing only after the scene changed"""
+        if self._analysis is None or self._analysis_stale:
+            return self.analyze(context)
+        return self._analysis
+
+    def request_analysis(self) -> None:
+        """Have the refresh timer redo a stale analysis (called from panel draw)"""
+        if self._analysis_stale:
+            self._analysis_wanted = True
+
+    def invalidate(self) -> None:
+        """Mark the cached analysis stale"""
+        self._analysis_stale = True
+
+    def clear_cache(self) -> None:
+        """Forget the cached analysis and measurement"""
+        self._analysis = None
+        self._analysis_stale = True
+        self._last_measurement = None
+
+    def _cycles_proposals(self, scene, traits: Dict[str, Any]) -> List[RenderProposal]:
+        """Sampling and light path proposals for Cycles"""
+
+        cycles = scene.cycles
+        proposals = []
+
+        if not cycles.use_denoising:
+            proposals.append(RenderProposal(
+                "cycles.use_denoising", "Denoise", False, True, 1.0,
+                "A denoised image needs far fewer samples"
+            ))
+
+        simple = not traits["volumetrics"] and not traits["transparency"]
+        target = DENOISED_SAMPLES_SIMPLE if simple else DENOISED_SAMPLES
+        if cycles.samples > target:
+            proposals.append(RenderProposal(
+                "cycles.samples", "Samples", cycles.samples, target, target / cycles.samples,
+                "Denoised scenes without volumes or glass converge early" if simple
+                else "Denoised scenes rarely improve past this count"
+            ))
+
+        if not cycles.use_adaptive_sampling:
+            proposals.append(RenderProposal(
+                "cycles.use_adaptive_sampling", "Adaptive Sampling", False, True, _ADAPTIVE_FACTOR,
+                "Stops sampling pixels that have already converged"
+            ))
+
+        if cycles.max_bounces > MAX_BOUNCES:
+            proposals.append(RenderProposal(
+                "cycles.max_bounces", "Max Bounces", cycles.max_bounces, MAX_BOUNCES, _BOUNCE_FACTOR,
+                "Paths past eight bounces rarely change the image"
+            ))
+
+        if not traits["transparency"] and cycles.transmission_bounces > 4:
+            proposals.append(RenderProposal(
+                "cycles.transmission_bounces", "Transmission Bounces", cycles.transmission_bounces, 4,
+                _TRANSMISSION_FACTOR, "No glass or transmissive materials in the scene"
+            ))
+
+        if not traits["volumetrics"] and cycles.volume_bounces > 0:
+            proposals.append(RenderProposal(
+                "cycles.volume_bounces", "Volume Bounces", cycles.volume_bounces, 0, 1.0,
+                "No volumes in the scene"
+            ))
+        elif traits["volumetrics"] and cycles.volume_step_rate < 2.0:
+            proposals.append(RenderProposal(
+                "cycles.volume_step_rate", "Volume Step Rate", cycles.volume_step_rate, 2.0,
+                _VOLUME_STEP_FACTOR, "Coarser volume steps are rarely visible after denoising"
+            ))
+
+        if traits["lights"] > MANY_LIGHTS and hasattr(cycles, "use_light_tree") and not cycles.use_light_tree:
+            proposals.append(RenderProposal(
+                "cycles.use_light_tree", "Light Tree", False, True, _LIGHT_TREE_FACTOR,
+                f"{traits['lights']} lights; the light tree samples the ones that matter"
+            ))
+
+        return proposals
+
+    def _eevee_proposals(self, scene) -> List[RenderProposal]:
+        """Sampling proposals for EEVEE"""
+
+        samples = scene.eevee.taa_render_samples
+        if samples <= EEVEE_SAMPLES:
+            return []
+        return [RenderProposal(
+            "eevee.taa_render_samples", "Render Samples", samples, EEVEE_SAMPLES, EEVEE_SAMPLES / samples,
+            "EEVEE anti-aliasing rarely improves past 64 samples"
+        )]
+
+    def apply(self, context, proposals: List[RenderProposal]) -> Dict[str, Any]:
+        """Apply proposals and remember the replaced values for revert"""
+
+        scene = context.scene
+        backup = self._backup(scene)
+        applied = []
+        for proposal in proposals:
+            try:
+                # Keep the oldest value so repeated applies still revert to the user's settings
+                backup.setdefault(proposal.path, get_path(scene, proposal.path))
+                set_path(scene, proposal.path, proposal.proposed)
+                applied.append(proposal.path)
+            except (AttributeError, TypeError, ValueError) as e:
+                print(f"Could not apply {proposal.path}: {e}")
+
+        scene[BACKUP_PROPERTY] = json.dumps(backup)
+        self._stats["applies"] += 1
+        return {"applied": applied, "revertable": len(backup)}
+
+    def revert(self, context) -> Dict[str, Any]:
+        """Restore the settings replaced by apply"""
+
+        scene = context.scene
+        backup = self._backup(scene)
+        restored = []
+        for path, value in backup.items():
+            try:
+                set_path(scene, path, value)
+                restored.append(path)
+            except (AttributeError, TypeError, ValueError) as e:
+                print(f"Could not restore {path}: {e}")
+
+        if BACKUP_PROPERTY in scene:
+            del scene[BACKUP_PROPERTY]
+        self._stats["reverts"] += 1
+        return {"restored": restored}
+
+    def has_backup(self, scene) -> bool:
+        """Whether there are applied changes to revert"""
+        return BACKUP_PROPERTY in scene
+
+    def _backup(self, scene) -> Dict[str, Any]:
+        """Stored pre-apply values"""
+        try:
+            return json.loads(scene.get(BACKUP_PROPERTY, "{}"))
+        except (TypeError, ValueError):
+            return {}
+
+    def measure(self, context, proposals: List[RenderProposal]) -> Dict[str, Any]:
+        """Time small test renders before and after the proposals and project full renders"""
+
+        scene = context.scene
+        path = samples_path(scene)
+        if path is None:
+            return {"error": f"Test renders are not supported for {scene.render.engine}"}
+
+        touched = {proposal.path for proposal in proposals} | {path, "render.resolution_percentage"}
+        original = {name: get_path(scene, name) for name in touched}
+
+        try:
+            scene.render.resolution_percentage = TEST_PERCENTAGE
+            before_ms, before_overhead = self._render_timing(scene, path)
+
+            for proposal in proposals:
+                set_path(scene, proposal.path, proposal.proposed)
+            target_samples = get_path(scene, path)
+            after_ms, after_overhead = self._render_timing(scene, path)
+        except RuntimeError as e:
+            return {"error": f"Test render failed: {e}"}
+        finally:
+            for name, value in original.items():
+                set_path(scene, name, value)
+
+        before_total = before_overhead + before_ms * original[path]
+        after_total = after_overhead + after_ms * target_samples
+        self._last_measurement = {
+            "ms_per_sample_before": before_ms,
+            "ms_per_sample_after": after_ms,
+            "overhead_ms_before": before_overhead,
+            "overhead_ms_after": after_overhead,
+            "projected_ms_before": before_total,
+            "projected_ms_after": after_total,
+            "measured_speedup": before_total / after_total if after_total > 0 else 1.0,
+            "test_percentage": TEST_PERCENTAGE
+        }
+        return self._last_measurement
+
+    def _render_timing(self, scene, path: str) -> Tuple[float, float]:
+        """Milliseconds per sample and fixed overhead from still renders at two sample counts"""
+        high = max(1, min(get_path(scene, path), TEST_MAX_SAMPLES))
+        low = min(TEST_MIN_SAMPLES, high)
+        if low == high:
+            # Too few samples for a second point; everything counts as per-sample time
+            return self._render_ms(scene, path, high) / high, 0.0
+
+        low_ms = self._render_ms(scene, path, low)
+        high_ms = self._render_ms(scene, path, high)
+
+        # Scene sync, BVH build and denoising cost the same at both counts and cancel out
+        per_sample = max(0.0, (high_ms - low_ms) / (high - low))
+        return per_sample, max(0.0, low_ms - per_sample * low)
+
+    def _render_ms(self, scene, path: str, samples: int) -> float:
+        """Wall time of one still render at a sample count"""
+        set_path(scene, path, samples)
+
+        start = time.perf_counter()
+        bpy.ops.render.render(write_still=False)
+        elapsed = (time.perf_counter() - start) * 1000.0
+
+        self._stats["test_renders"] += 1
+        return elapsed
+
+    @property
+    def last_measurement(self) -> Optional[Dict[str, Any]]:
+        return self._last_measurement
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get render optimizer statistics"""
+        return dict(self._stats)
+
+# Global render optimizer instance
+_render_optimizer: Optional[RenderOptimizer] = None
+
+def get_render_optimizer() -> RenderOptimizer:
+    """Get global render optimizer instance"""
+    global _render_optimizer
+    if _render_optimizer is None:
+        _render_optimizer = RenderOptimizer()
+    return _render_optimizer
+
+def _analysis_timer():
+    """Redo a stale analysis for an open panel, outside of draw"""
+    optimizer = get_render_optimizer()
+    if optimizer.needs_refresh:
+        try:
+            optimizer.analyze(bpy.context)
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    if area.type == 'PROPERTIES':
+                        area.tag_redraw()
+        except Exception as e:
+            print(f"Render settings analysis failed: {e}")
+    return _ANALYSIS_INTERVAL
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Mark the analysis stale when render settings, lights or materials change"""
+    if depsgraph is None:
+        return
+    if any(depsgraph.id_type_updated(id_type) for id_type in _ANALYSIS_ID_TYPES):
+        get_render_optimizer().invalidate()
+
+@persistent
+def _on_load_post(*args):
+    """A new file invalidates the analysis"""
+    get_render_optimizer().clear_cache()
+
+class BLENDPRO_OT_ApplyRenderOptimizations(bpy.types.Operator):
+    """Apply the proposed faster render settings"""
+    bl_idname = "blendpro.apply_render_optimizations"
+    bl_label = "Apply Render Optimizations"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        optimizer = get_render_optimizer()
+        analysis = optimizer.analyze(context)
+        if not analysis["proposals"]:
+            self.report({'INFO'}, "Render settings are already efficient")
+            return {'FINISHED'}
+
+        result = optimizer.apply(context, analysis["proposals"])
+        self.report(
+            {'INFO'},
+            f"Applied {len(result['applied'])} changes, est. {analysis['estimated_speedup']:.1f}x faster"
+        )
+        return {'FINISHED'}
+
+class BLENDPRO_OT_RevertRenderOptimizations(bpy.types.Operator):
+    """Restore render settings changed by BlendPro"""
+    bl_idname = "blendpro.revert_render_optimizations"
+    bl_label = "Revert Render Optimizations"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return get_render_optimizer().has_backup(context.scene)
+
+    def execute(self, context):
+        result = get_render_optimizer().revert(context)
+        self.report({'INFO'}, f"Restored {len(result['restored'])} render settings")
+        return {'FINISHED'}
+
+class BLENDPRO_OT_MeasureRenderOptimizations(bpy.types.Operator):
+    """Run small test renders with current and proposed settings"""
+    bl_idname = "blendpro.measure_render_optimizations"
+    bl_label = "Measure Render Speedup"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        optimizer = get_render_optimizer()
+        analysis = optimizer.analyze(context)
+        result = optimizer.measure(context, analysis["proposals"])
+        if result.get("error"):
+            self.report({'ERROR'}, result["error"])
+            return {'CANCELLED'}
+
+        self.report(
+            {'INFO'},
+            f"{result['ms_per_sample_before']:.1f} -> {result['ms_per_sample_after']:.1f} ms/sample, "
+            f"measured {result['measured_speedup']:.1f}x faster"
+        )
+        return {'FINISHED'}
+
+class BLENDPRO_PT_RenderOptimizer(bpy.types.Panel):
+    """Render setting proposals in the Render properties"""
+    bl_label = "BlendPro Render Optimizer"
+    bl_idname = "BLENDPRO_PT_render_optimizer"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "render"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        optimizer = get_render_optimizer()
+        # Analyzing walks node trees and evaluates geometry; draw only reads the cache
+        optimizer.request_analysis()
+        analysis = optimizer.cached_analysis
+
+        if analysis is None:
+            layout.label(text="Analyzing render settings...", icon='TIME')
+        elif analysis["proposals"]:
+            layout.label(text=f"Estimated {analysis['estimated_speedup']:.1f}x faster", icon='RENDER_STILL')
+            col = layout.column(align=True)
+            for proposal in analysis["proposals"]:
+                col.label(text=f"{proposal.label}: {proposal.current} -> {proposal.proposed}")
+        else:
+            layout.label(text="No faster settings found", icon='CHECKMARK')
+
+        measurement = optimizer.last_measurement
+        if measurement:
+            layout.label(
+                text=f"Measured: {measurement['ms_per_sample_before']:.1f} -> "
+                     f"{measurement['ms_per_sample_after']:.1f} ms/sample "
+                     f"({measurement['measured_speedup']:.1f}x)"
+            )
+
+        row = layout.row(align=True)
+        row.operator("blendpro.measure_render_optimizations", text="Measure", icon='TIME')
+        row.operator("blendpro.apply_render_optimizations", text="Apply", icon='CHECKMARK')
+        row.operator("blendpro.revert_render_optimizations", text="Revert", icon='LOOP_BACK')
+
+_classes = (
+    BLENDPRO_OT_ApplyRenderOptimizations,
+    BLENDPRO_OT_RevertRenderOptimizations,
+    BLENDPRO_OT_MeasureRenderOptimizations,
+    BLENDPRO_PT_RenderOptimizer,
+)
+
+def register():
+    """Register render optimizer classes, handlers and the analysis timer"""
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    if not bpy.app.timers.is_registered(_analysis_timer):
+        bpy.app.timers.register(_analysis_timer, first_interval=_ANALYSIS_INTERVAL, persistent=True)
+
+def unregister():
+    """Unregister render optimizer classes, handlers and the analysis timer"""
+    if bpy.app.timers.is_registered(_analysis_timer):
+        bpy.app.timers.unregister(_analysis_timer)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -16,7 +16,21 @@ from enum import Enum
 from ..config.settings import get_settings
 from ..config.prompts import get_system_prompt, PromptType
 from ..utils.api_client import get_api_client, APIRequest
+from ..utils.view_model import get_view_model
 from ..vision.scene_analyzer import get_scene_analyzer
+from ..vision.scene_snapshot import snapshot_of
+from .render_cost import (
+    get_render_cost_estimator, OFFENDER_TRIANGLES, SCENE_TRIANGLES,
+    TEXTURE_VRAM_BYTES, GROWTH_WARNING_FACTOR
+)
+from .geometry_dedup import get_geometry_deduplicator
+from .material_dedup import get_material_deduplicator
+from .texture_analyzer import get_texture_analyzer
+from .orphan_data import get_orphan_data_analyzer
+from .render_optimizer import get_render_optimizer, MIN_REPORTED_SPEEDUP
+from .modifier_profiler import (
+    get_modifier_profiler, SLOW_STACK_MS, SIMPLIFY_SUGGEST_MS, SUBDIVISION_TYPES
+)
 
 class IssueSeverity(Enum):
     """Severity levels for scene issues"""
@@ -78,6 +92,7 @@ class SceneHealthMonitor:
                 daemon=True
             )
             self._monitoring_thread.start()
+            self._publish_state()
             return True
             
         except Exception as e:
@@ -93,6 +108,7 @@ class SceneHealthMonitor:
         if self._monitoring_thread and self._monitoring_thread.is_alive():
             self._monitoring_thread.join(timeout=2.0)
         
+        self._publish_state()
         return True
     
     def _monitoring_loop(self, context):
@@ -122,7 +138,7 @@ class SceneHealthMonitor:
                 print(f"Scene monitoring error: {e}")
                 time.sleep(5.0)  # Longer sleep on error
     
-    def analyze_scene_health(self, context) -> Dict[str, Any]:
+    def analyze_scene_health(self, context, include_ai_insights: bool = True) -> Dict[str, Any]:
         """Perform comprehensive scene health analysis"""
         
         try:
@@ -155,7 +171,7 @@ class SceneHealthMonitor:
             
             # Generate AI-powered insights if enabled
             ai_insights = None
-            if len(all_issues) > 0:
+            if include_ai_insights and len(all_issues) > 0:
                 ai_insights = self._generate_ai_insights(scene_data, all_issues)
             
             health_report = {
@@ -178,8 +194,16 @@ class SceneHealthMonitor:
         """Check for geometry-related issues"""
         
         issues = []
+        objects = scene_data.get("objects", [])
+        
+        # Only dense meshes or meshes with issues can produce findings
+        snapshot = snapshot_of(objects)
+        if snapshot is not None:
+            objects = snapshot.subset(snapshot.union(
+                snapshot.meshes_with_vertices_over(100000), snapshot.with_issues()
+            ))
         
-        for obj_data in scene_data.get("objects", []):
+        for obj_data in objects:
             if obj_data["type"] != "MESH":
                 continue
             
@@ -193,13 +217,11 @@ class SceneHealthMonitor:
                     category="geometry",
                     description=f"High polygon count: {vertices:,} vertices",
                     affected_objects=[obj_name],
-                    fix_suggestion="Consider using a Decimate modifier to reduce polygon count",
+                    fix_suggestion="Generate viewport LODs; final renders keep the full mesh",
                     auto_fixable=True,
                     fix_code=f"""
 import bpy
-obj = bpy.data.objects['{obj_name}']
-mod = obj.modifiers.new('Decimate', 'DECIMATE')
-mod.ratio = 0.5
+bpy.ops.blendpro.generate_lods(object_name={obj_name!r})
 """
                 ))
             
@@ -255,10 +277,14 @@ bpy.ops.object.mode_set(mode='OBJECT')
         materials = scene_data.get("materials", [])
         
         # Check for objects without materials
-        objects_without_materials = []
-        for obj_data in scene_data.get("objects", []):
-            if obj_data["type"] == "MESH" and obj_data.get("material_slots", 0) == 0:
-                objects_without_materials.append(obj_data["name"])
+        snapshot = snapshot_of(scene_data.get("objects", []))
+        if snapshot is not None:
+            objects_without_materials = snapshot.names(snapshot.without_materials())
+        else:
+            objects_without_materials = []
+            for obj_data in scene_data.get("objects", []):
+                if obj_data["type"] == "MESH" and obj_data.get("material_slots", 0) == 0:
+                    objects_without_materials.append(obj_data["name"])
         
         if objects_without_materials:
             issues.append(SceneIssue(
@@ -303,8 +329,37 @@ for mat in bpy.data.materials:
 """
             ))
         
+        issues.extend(self._check_duplicate_materials())
+        
         return issues
     
+    def _check_duplicate_materials(self) -> List[SceneIssue]:
+        """Check for materials with equivalent settings and node trees"""
+        
+        deduplicator = get_material_deduplicator()
+        try:
+            groups = deduplicator.find_duplicates()
+        except Exception as e:
+            print(f"Duplicate material scan failed: {e}")
+            return []
+        
+        if not groups:
+            return []
+        
+        savings = deduplicator.estimate_savings(groups)
+        examples = ", ".join(group.keep_material for group in groups[:3])
+        return [SceneIssue(
+            severity=IssueSeverity.WARNING if savings["materials_removed"] > 50 else IssueSeverity.INFO,
+            category="materials",
+            description=(
+                f"{savings['materials_removed']} materials duplicate {len(groups)} others "
+                f"(e.g. {examples}); merging saves {savings['shader_compiles_saved']} shader compiles"
+            ),
+            affected_objects=[name for group in groups for name in group.duplicate_materials],
+            fix_suggestion="Merge equivalent materials into one representative each",
+            auto_fixable=True
+        )]
+    
     def _check_lighting_setup(self, scene_data: Dict[str, Any], context) -> List[SceneIssue]:
         """Check lighting setup"""
         
@@ -366,24 +421,225 @@ light.name = "Main_Sun"
             ))
         
         # Check for objects with many modifiers
-        heavy_modifier_objects = []
-        for obj_data in objects:
-            modifier_count = len(obj_data.get("modifiers", []))
-            if modifier_count > 5:
-                heavy_modifier_objects.append(obj_data["name"])
+        snapshot = snapshot_of(objects)
+        if snapshot is not None:
+            heavy_modifier_objects = snapshot.names(snapshot.with_modifiers_over(5))
+        else:
+            heavy_modifier_objects = []
+            for obj_data in objects:
+                modifier_count = len(obj_data.get("modifiers", []))
+                if modifier_count > 5:
+                    heavy_modifier_objects.append(obj_data["name"])
+        
+        issues.extend(self._check_modifier_costs(context, heavy_modifier_objects))
+        issues.extend(self._check_render_cost(context))
+        issues.extend(self._check_duplicate_geometry(context))
+        issues.extend(self._check_texture_sizes(context))
+        
+        return issues
+    
+    def _check_modifier_costs(self, context, heavy_modifier_objects: List[str]) -> List[SceneIssue]:
+        """Check measured modifier stack cost; unmeasured stacks fall back to modifier count"""
+        
+        issues = []
+        profiler = get_modifier_profiler()
+        try:
+            if threading.current_thread() is threading.main_thread():
+                profiles = profiler.profile_scene(context, samples=1)
+            else:
+                # Measuring toggles modifiers, so leave it to the main-thread timer
+                profiler.queue([obj.name for obj in profiler.stale_objects(context)])
+                profiles = profiler.cached_profiles()
+        except Exception as e:
+            print(f"Modifier profiling failed: {e}")
+            profiles = profiler.cached_profiles()
+        
+        for profile in profiles:
+            slowest = profile.slowest()
+            if profile.modifier_ms <= SLOW_STACK_MS or slowest is None:
+                continue
+            fix_code = None
+            if slowest.modifier_type in SUBDIVISION_TYPES:
+                fix_code = f"""
+import bpy
+mod = bpy.data.objects[{profile.object_name!r}].modifiers[{slowest.name!r}]
+mod.levels = max(0, mod.levels - 1)
+"""
+            issues.append(SceneIssue(
+                severity=IssueSeverity.WARNING,
+                category="performance",
+                description=(
+                    f"Modifiers on '{profile.object_name}' take {profile.modifier_ms:.1f} ms to evaluate "
+                    f"('{slowest.name}' {slowest.time_ms:.1f} ms)"
+                ),
+                affected_objects=[profile.object_name],
+                fix_suggestion=slowest.suggestion or "Apply or disable the slowest modifier in the viewport",
+                auto_fixable=fix_code is not None,
+                fix_code=fix_code
+            ))
+        
+        subdivision_ms = sum(
+            timing.time_ms for profile in profiles for timing in profile.modifiers
+            if timing.modifier_type in SUBDIVISION_TYPES
+        )
+        if subdivision_ms > SIMPLIFY_SUGGEST_MS and not context.scene.render.use_simplify:
+            issues.append(SceneIssue(
+                severity=IssueSeverity.INFO,
+                category="performance",
+                description=f"Subdivision modifiers take {subdivision_ms:.0f} ms per viewport update",
+                affected_objects=[
+                    profile.object_name for profile in profiles
+                    if any(timing.modifier_type in SUBDIVISION_TYPES for timing in profile.modifiers)
+                ],
+                fix_suggestion="Enable Simplify with Max Subdivision 1; final renders keep their own limit",
+                auto_fixable=True,
+                fix_code="""
+import bpy
+bpy.context.scene.render.use_simplify = True
+bpy.context.scene.render.simplify_subdivision = 1
+"""
+            ))
         
-        if heavy_modifier_objects:
+        measured = {profile.object_name for profile in profiles}
+        unmeasured = [name for name in heavy_modifier_objects if name not in measured]
+        if unmeasured:
             issues.append(SceneIssue(
                 severity=IssueSeverity.INFO,
                 category="performance",
-                description=f"Objects with many modifiers: {len(heavy_modifier_objects)}",
-                affected_objects=heavy_modifier_objects,
+                description=f"Objects with many modifiers: {len(unmeasured)}",
+                affected_objects=unmeasured,
                 fix_suggestion="Consider applying modifiers or optimizing modifier stack",
                 auto_fixable=False
             ))
         
         return issues
     
+    def _check_render_cost(self, context) -> List[SceneIssue]:
+        """Check evaluated geometry and texture cost (modifiers, instances, images)"""
+        
+        issues = []
+        try:
+            estimate = get_render_cost_estimator().estimate_scene(context)
+        except Exception as e:
+            print(f"Render cost estimate failed: {e}")
+            return issues
+        
+        offenders = [
+            cost for cost in estimate["top_offenders"]
+            if cost["total_triangles"] > OFFENDER_TRIANGLES
+        ]
+        for cost in offenders:
+            sources = ", ".join(sorted(set(cost["growth_modifiers"]))) or "base mesh"
+            if cost["instance_count"]:
+                sources += f", {cost['instance_count']} instances"
+            issues.append(SceneIssue(
+                severity=IssueSeverity.WARNING,
+                category="performance",
+                description=(
+                    f"'{cost['name']}' renders {cost['total_triangles']:,} triangles "
+                    f"(base mesh {cost['base_triangles']:,}; {sources})"
+                ),
+                affected_objects=[cost["name"]],
+                fix_suggestion="Lower subdivision render levels, array counts or instance density, or add a LOD",
+                auto_fixable=False
+            ))
+        
+        offender_names = {cost["name"] for cost in offenders}
+        growth_objects = [
+            cost["name"] for cost in estimate["top_offenders"]
+            if cost["base_triangles"] and cost["name"] not in offender_names
+            and cost["evaluated_triangles"] / cost["base_triangles"] > GROWTH_WARNING_FACTOR
+        ]
+        if growth_objects:
+            issues.append(SceneIssue(
+                severity=IssueSeverity.INFO,
+                category="performance",
+                description=f"Modifiers multiply geometry more than {GROWTH_WARNING_FACTOR:.0f}x on {len(growth_objects)} objects",
+                affected_objects=growth_objects,
+                fix_suggestion="Check subdivision levels and array counts on these objects",
+                auto_fixable=False
+            ))
+        
+        if estimate["total_triangles"] > SCENE_TRIANGLES:
+            issues.append(SceneIssue(
+                severity=IssueSeverity.WARNING,
+                category="performance",
+                description=(
+                    f"Scene renders {estimate['total_triangles']:,} triangles "
+                    f"({estimate['instanced_triangles']:,} from instances)"
+                ),
+                affected_objects=[cost["name"] for cost in estimate["top_offenders"]],
+                fix_suggestion="Reduce the heaviest objects first; instancing keeps memory low but not render time",
+                auto_fixable=False
+            ))
+        
+        if estimate["texture_bytes"] > TEXTURE_VRAM_BYTES:
+            heavy_textures = get_render_cost_estimator().top_offenders(context, key="texture")
+            issues.append(SceneIssue(
+                severity=IssueSeverity.WARNING,
+                category="performance",
+                description=f"Textures need about {estimate['texture_bytes'] / 1024 ** 3:.1f} GB of VRAM",
+                affected_objects=[cost.name for cost in heavy_textures],
+                fix_suggestion="Downscale large image textures or use lower resolution variants for distant objects",
+                auto_fixable=False
+            ))
+        
+        return issues
+    
+    def _check_duplicate_geometry(self, context) -> List[SceneIssue]:
+        """Check for identical meshes that are not shared between objects"""
+        
+        try:
+            groups = get_geometry_deduplicator().find_duplicates(context)
+        except Exception as e:
+            print(f"Duplicate geometry scan failed: {e}")
+            return []
+        
+        if not groups:
+            return []
+        
+        duplicate_meshes = sum(len(group.duplicate_meshes) for group in groups)
+        wasted_mb = sum(group.wasted_bytes for group in groups) / (1024 * 1024)
+        return [SceneIssue(
+            severity=IssueSeverity.WARNING if wasted_mb > 100 else IssueSeverity.INFO,
+            category="performance",
+            description=(
+                f"{duplicate_meshes} meshes duplicate geometry in {len(groups)} groups "
+                f"(~{wasted_mb:.1f} MB wasted)"
+            ),
+            affected_objects=[name for group in groups for name in group.objects],
+            fix_suggestion="Relink identical meshes to one shared mesh (linked duplicates)",
+            auto_fixable=True
+        )]
+    
+    def _check_texture_sizes(self, context) -> List[SceneIssue]:
+        """Check for textures larger than their on-screen size warrants"""
+        
+        try:
+            analysis = get_texture_analyzer().analyze(context)
+        except Exception as e:
+            print(f"Texture analysis failed: {e}")
+            return []
+        
+        oversized = analysis["oversized"]
+        if not oversized:
+            return []
+        
+        savings_mb = analysis["potential_savings_bytes"] / (1024 * 1024)
+        largest = oversized[0]
+        return [SceneIssue(
+            severity=IssueSeverity.WARNING if savings_mb > 512 else IssueSeverity.INFO,
+            category="textures",
+            description=(
+                f"{len(oversized)} textures exceed their on-screen size "
+                f"(e.g. {largest.name} {largest.width}x{largest.height} covers {largest.screen_pixels}px); "
+                f"downscaling saves ~{savings_mb:.0f} MB VRAM"
+            ),
+            affected_objects=sorted({name for info in oversized for name in info.objects}),
+            fix_suggestion="Use downscaled copies of textures seen only small or far from the camera",
+            auto_fixable=any(info.downscalable for info in oversized)
+        )]
+    
     def _check_organization_issues(self, scene_data: Dict[str, Any], context) -> List[SceneIssue]:
         """Check scene organization"""
         
@@ -408,8 +664,39 @@ light.name = "Main_Sun"
                 auto_fixable=False
             ))
         
+        issues.extend(self._check_orphan_data())
+        
         return issues
     
+    def _check_orphan_data(self) -> List[SceneIssue]:
+        """Check for datablocks no scene can reach"""
+        
+        try:
+            report = get_orphan_data_analyzer().analyze()
+        except Exception as e:
+            print(f"Orphan data analysis failed: {e}")
+            return []
+        
+        if not report.orphans:
+            return []
+        
+        breakdown = ", ".join(
+            f"{values['count']} {name}"
+            for name, values in sorted(report.by_type.items(), key=lambda item: -item[1]["count"])[:4]
+        )
+        return [SceneIssue(
+            severity=IssueSeverity.INFO,
+            category="organization",
+            description=(
+                f"{len(report.orphans)} unreachable datablocks ({breakdown}); "
+                f"~{report.memory_bytes / (1024 * 1024):.1f} MB memory, "
+                f"~{report.file_bytes / (1024 * 1024):.1f} MB file size"
+            ),
+            affected_objects=[],
+            fix_suggestion="Purge orphan data to shrink the file",
+            auto_fixable=True
+        )]
+    
     def _check_render_settings(self, scene_data: Dict[str, Any], context) -> List[SceneIssue]:
         """Check render settings"""
         
@@ -458,7 +745,38 @@ bpy.context.scene.camera = camera
                 auto_fixable=False
             ))
         
+        issues.extend(self._check_render_speed(context))
+        
         return issues
+    
+    def _check_render_speed(self, context) -> List[SceneIssue]:
+        """Check for render settings slower than the scene needs"""
+        
+        try:
+            analysis = get_render_optimizer().current_analysis(context)
+        except Exception as e:
+            print(f"Render settings analysis failed: {e}")
+            return []
+        
+        if analysis["estimated_speedup"] < MIN_REPORTED_SPEEDUP:
+            return []
+        
+        changes = ", ".join(
+            f"{proposal.label} {proposal.current} -> {proposal.proposed}"
+            for proposal in analysis["proposals"]
+        )
+        return [SceneIssue(
+            severity=IssueSeverity.SUGGESTION,
+            category="render",
+            description=f"Render settings could be about {analysis['estimated_speedup']:.1f}x faster",
+            affected_objects=[],
+            fix_suggestion=f"{changes} (revert with one click in Render Properties)",
+            auto_fixable=True,
+            fix_code="""
+import bpy
+bpy.ops.blendpro.apply_render_optimizations()
+"""
+        )]
 
     def _calculate_health_score(self, issues: List[SceneIssue]) -> float:
         """Calculate overall health score (0-100)"""
@@ -567,6 +885,15 @@ bpy.context.scene.camera = camera
             }
 
             self._suggestions_queue.append(suggestion)
+            self._publish_state()
+
+    def _publish_state(self) -> None:
+        """Publish monitoring state to the UI view model"""
+
+        get_view_model().publish_monitoring(
+            self._monitoring_active,
+            list(self._suggestions_queue)
+        )
 
     def _issue_to_dict(self, issue: SceneIssue) -> Dict[str, Any]:
         """Convert SceneIssue to dictionary"""
@@ -602,6 +929,7 @@ bpy.context.scene.camera = camera
         """Clear suggestions queue"""
 
         self._suggestions_queue.clear()
+        self._publish_state()
 
     def get_health_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent health analysis history"""
@@ -0,0 +1,437 @@
+"""
+Texture Analyzer for BlendPro: AI Co-Pilot
+Texture VRAM estimates, on-screen size checks and batch downscaling
+"""
+
+import bpy
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..utils.dependency_loader import safe_import
+from ..utils.file_manager import get_file_manager
+from .render_cost import material_images, texture_vram
+
+PIL = safe_import('PIL', 'Pillow (Image Processing)', required=False, min_version='10.0.0')
+PIL_AVAILABLE = PIL is not None
+
+if PIL_AVAILABLE:
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+        PIL_AVAILABLE = False
+else:
+    Image = None
+
+# Texels per screen pixel kept when downscaling (tiling and close-ups)
+TEXEL_MARGIN = 2.0
+
+# Never suggest textures smaller than this
+MIN_TEXTURE_SIZE = 256
+
+# Only flag textures that could shrink by at least this factor per side
+MIN_SHRINK_FACTOR = 2
+
+# Pillow modes the downscaler can round-trip
+_RESIZABLE_MODES = {"L", "LA", "RGB", "RGBA", "P"}
+
+# JPEG/WebP quality for downscaled copies (Pillow's default of 75 is visibly lossy)
+SAVE_QUALITY = 95
+
+# Custom property remembering the original file of a downscaled image
+ORIGINAL_PATH_PROPERTY = "blendpro_original_filepath"
+
+def bits_per_channel(path: str, source) -> int:
+    """Stored bit depth; Pillow opens 16-bit RGB(A) PNG and TIFF files as 8-bit modes"""
+    if source.mode in {"I;16", "I;16B", "I;16L"}:
+        return 16
+    if source.mode in {"F", "I"}:
+        return 32
+    if source.format == "PNG":
+        with open(path, "rb") as handle:
+            header = handle.read(25)
+        return header[24] if len(header) == 25 else 8  # IHDR bit depth
+    if source.format == "TIFF":
+        bits = source.tag_v2.get(258, 8)  # BitsPerSample
+        return max(bits) if isinstance(bits, tuple) else int(bits)
+    return 8
+
+def save_options(source, extension: str) -> Dict[str, Any]:
+    """Encoder options keeping the source's colour profile and quality"""
+    options: Dict[str, Any] = {}
+    icc_profile = source.info.get("icc_profile")
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    if extension in {".jpg", ".jpeg"}:
+        # Full-resolution chroma: 4:2:0 blurs colour edges in masks and albedo maps
+        options.update(quality=SAVE_QUALITY, subsampling=0)
+    elif extension == ".webp":
+        options["quality"] = SAVE_QUALITY
+    elif extension in {".tif", ".tiff"} and source.info.get("compression"):
+        options["compression"] = source.info["compression"]
+    return options
+
+@dataclass
+class TextureInfo:
+    """Memory and on-screen usage of one image texture"""
+    name: str
+    filepath: str
+    width: int
+    height: int
+    channels: int
+    is_float: bool
+    vram_bytes: int
+    objects: List[str] = field(default_factory=list)
+    screen_pixels: int = 0
+    recommended_size: Tuple[int, int] = (0, 0)
+    savings_bytes: int = 0
+    downscalable: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "filepath": self.filepath,
+            "size": [self.width, self.height],
+            "vram_bytes": self.vram_bytes,
+            "objects": list(self.objects),
+            "screen_pixels": self.screen_pixels,
+            "recommended_size": list(self.recommended_size),
+            "savings_bytes": self.savings_bytes,
+            "downscalable": self.downscalable
+        }
+
+def recommended_size(width: int, height: int, screen_pixels: int) -> Tuple[int, int]:
+    """Power-of-two size that covers the on-screen footprint with margin"""
+    needed = max(MIN_TEXTURE_SIZE, int(screen_pixels * TEXEL_MARGIN))
+    longest = max(width, height)
+    target = MIN_TEXTURE_SIZE
+    while target < needed and target < longest:
+        target *= 2
+    if target >= longest:
+        return width, height
+    scale = target / longest
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+def object_screen_pixels(scene, camera, obj) -> int:
+    """Longest side in render pixels of an object's bounding box from the camera"""
+
+    from bpy_extras.object_utils import world_to_camera_view
+    from mathutils import Vector
+
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    res_x, res_y = render.resolution_x * scale, render.resolution_y * scale
+
+    xs, ys = [], []
+    for corner in obj.bound_box:
+        projected = world_to_camera_view(scene, camera, obj.matrix_world @ Vector(corner))
+        if projected.z <= 0.0:
+            # Straddles the camera: could fill the frame
+            return int(max(res_x, res_y))
+        xs.append(projected.x)
+        ys.append(projected.y)
+
+    if max(xs) < 0.0 or min(xs) > 1.0 or max(ys) < 0.0 or min(ys) > 1.0:
+        return 0
+
+    width = (min(max(xs), 1.0) - max(min(xs), 0.0)) * res_x
+    height = (min(max(ys), 1.0) - max(min(ys), 0.0)) * res_y
+    return int(max(width, height))
+
+class TextureAnalyzer:
+    """Analyzes image textures and produces downscaled copies"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._headers: Dict[Tuple[str, float], Tuple[int, int, int, bool]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {
+            "analyses": 0,
+            "header_cache_hits": 0,
+            "headers_read": 0,
+            "textures_downscaled": 0,
+            "bytes_saved": 0,
+            "last_analysis_time": 0.0
+        }
+
+    def analyze(self, context) -> Dict[str, Any]:
+        """VRAM per image and textures larger than their on-screen use needs"""
+
+        start_time = time.perf_counter()
+        scene = context.scene
+        camera = scene.camera
+
+        users: Dict[str, List[Any]] = {}
+        images = {}
+        for obj in scene.objects:
+            if not hasattr(obj, "material_slots"):
+                continue
+            for slot in obj.material_slots:
+                for image in material_images(slot.material):
+                    images[image.name] = image
+                    object_list = users.setdefault(image.name, [])
+                    if obj not in object_list:
+                        object_list.append(obj)
+
+        screen_cache: Dict[str, int] = {}
+        textures = []
+        for name, image in images.items():
+            header = self._image_header(image)
+            if header is None:
+                continue
+            width, height, channels, is_float = header
+
+            info = TextureInfo(
+                name=name,
+                filepath=self._absolute_path(image) or "",
+                width=width,
+                height=height,
+                channels=channels,
+                is_float=is_float,
+                vram_bytes=texture_vram(width, height, is_float),
+                objects=[obj.name for obj in users[name]]
+            )
+
+            if camera is not None:
+                for obj in users[name]:
+                    if obj.name not in screen_cache:
+                        try:
+                            screen_cache[obj.name] = object_screen_pixels(scene, camera, obj)
+                        except Exception as e:
+                            print(f"Screen size of {obj.name} failed: {e}")
+                            screen_cache[obj.name] = max(width, height)
+                    info.screen_pixels = max(info.screen_pixels, screen_cache[obj.name])
+
+                target = recommended_size(width, height, info.screen_pixels)
+                if max(width, height) >= max(target) * MIN_SHRINK_FACTOR:
+                    info.recommended_size = target
+                    info.savings_bytes = info.vram_bytes - texture_vram(target[0], target[1], is_float)
+                    info.downscalable = self._can_downscale(image, info)
+
+            textures.append(info)
+
+        textures.sort(key=lambda info: info.vram_bytes, reverse=True)
+        oversized = sorted(
+            (info for info in textures if info.savings_bytes > 0),
+            key=lambda info: info.savings_bytes, reverse=True
+        )
+
+        analysis_time = time.perf_counter() - start_time
+        with self._lock:
+            self._stats["analyses"] += 1
+            self._stats["last_analysis_time"] = analysis_time
+
+        return {
+            "textures": textures,
+            "oversized": oversized,
+            "total_vram_bytes": sum(info.vram_bytes for info in textures),
+            "potential_savings_bytes": sum(info.savings_bytes for info in oversized),
+            "has_camera": camera is not None,
+            "analysis_time": analysis_time
+        }
+
+    def _absolute_path(self, image) -> Optional[str]:
+        """On-disk file of an image, if it has one"""
+        if image.source not in {'FILE', 'SEQUENCE', 'TILED'} or image.packed_file is not None:
+            return None
+        path = bpy.path.abspath(image.filepath, library=image.library)
+        return path if path and os.path.isfile(path) else None
+
+    def _image_header(self, image) -> Optional[Tuple[int, int, int, bool]]:
+        """Size, channels and float flag, read from the file header when possible"""
+
+        path = self._absolute_path(image)
+        if path is None or not PIL_AVAILABLE:
+            # Packed or generated: Blender already has the pixels
+            width, height = image.size
+            if width <= 0 or height <= 0:
+                return None
+            return width, height, image.channels, bool(image.is_float)
+
+        key = (path, os.path.getmtime(path))
+        with self._lock:
+            header = self._headers.get(key)
+            if header is not None:
+                self._stats["header_cache_hits"] += 1
+                return header
+
+        try:
+            # Opening is lazy: only the header is parsed, Blender never loads the pixels
+            with Image.open(path) as source:
+                width, height = source.size
+                channels = len(source.getbands())
+                # Blender loads anything deeper than 8 bits into a float buffer
+                is_float = bits_per_channel(path, source) > 8
+        except Exception:
+            width, height = image.size
+            if width <= 0 or height <= 0:
+                return None
+            channels, is_float = image.channels, bool(image.is_float)
+
+        header = (width, height, channels, is_float)
+        with self._lock:
+            self._headers[key] = header
+            self._stats["headers_read"] += 1
+        return header
+
+    def _can_downscale(self, image, info: TextureInfo) -> bool:
+        """Files Pillow can read and write back without losing precision"""
+        if not PIL_AVAILABLE or not info.filepath or info.is_float or image.source != 'FILE':
+            return False
+        extension = os.path.splitext(info.filepath)[1].lower()
+        return extension in {".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tif", ".tiff", ".webp"}
+
+    def get_cache_dir(self) -> str:
+        """Directory holding downscaled copies"""
+        cache_dir = os.path.join(get_file_manager().get_user_data_dir(), "texture_cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
+    def downscale_textures(self, context, image_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Write downscaled copies in parallel and relink the images to them"""
+
+        if not PIL_AVAILABLE:
+            return {"error": "Pillow is required for texture downscaling"}
+
+        analysis = self.analyze(context)
+        candidates = [
+            info for info in analysis["oversized"]
+            if info.downscalable and (image_names is None or info.name in image_names)
+        ]
+        if not candidates:
+            return {"textures_downscaled": 0, "bytes_saved": 0, "failed": []}
+
+        cache_dir = self.get_cache_dir()
+        jobs = {
+            info.name: self._get_executor().submit(self._write_downscaled, info, cache_dir)
+            for info in candidates
+        }
+
+        # Relinking touches bpy data, so it stays on the calling (main) thread
+        downscaled = 0
+        saved = 0
+        failed = []
+        for info in candidates:
+            try:
+                output_path = jobs[info.name].result()
+            except Exception as e:
+                print(f"Failed to downscale {info.name}: {e}")
+                failed.append(info.name)
+                continue
+
+            image = bpy.data.images.get(info.name)
+            if image is None:
+                continue
+            if ORIGINAL_PATH_PROPERTY not in image:
+                image[ORIGINAL_PATH_PROPERTY] = image.filepath
+            image.filepath = output_path
+            image.reload()
+            downscaled += 1
+            saved += info.savings_bytes
+
+        with self._lock:
+            self._stats["textures_downscaled"] += downscaled
+            self._stats["bytes_saved"] += saved
+
+        return {"textures_downscaled": downscaled, "bytes_saved": saved, "failed": failed}
+
+    def _write_downscaled(self, info: TextureInfo, cache_dir: str) -> str:
+        """Resize one file into the cache directory (runs on a worker thread)"""
+
+        width, height = info.recommended_size
+        source_key = f"{info.filepath}:{os.path.getmtime(info.filepath)}:{width}x{height}"
+        digest = hashlib.sha1(source_key.encode()).hexdigest()[:12]
+        stem, extension = os.path.splitext(os.path.basename(info.filepath))
+        output_path = os.path.join(cache_dir, f"{stem}_{width}x{height}_{digest}{extension}")
+
+        # Same source, same size: reuse the earlier copy
+        if os.path.isfile(output_path):
+            return output_path
+
+        with Image.open(info.filepath) as source:
+            if source.mode not in _RESIZABLE_MODES:
+                raise ValueError(f"unsupported image mode {source.mode}")
+            if bits_per_channel(info.filepath, source) > 8:
+                raise ValueError("more than 8 bits per channel would be truncated")
+            options = save_options(source, extension.lower())
+            if source.mode == "P":
+                source = source.convert("RGBA")
+            resized = source.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+
+        temp_path = output_path + ".tmp" + extension
+        resized.save(temp_path, **options)
+        os.replace(temp_path, output_path)
+        return output_path
+
+    def restore_originals(self, image_names: Optional[List[str]] = None) -> int:
+        """Point downscaled images back at their original files"""
+        restored = 0
+        for image in bpy.data.images:
+            if ORIGINAL_PATH_PROPERTY not in image:
+                continue
+            if image_names is not None and image.name not in image_names:
+                continue
+            image.filepath = image[ORIGINAL_PATH_PROPERTY]
+            del image[ORIGINAL_PATH_PROPERTY]
+            image.reload()
+            restored += 1
+        return restored
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                workers = max(2, min(8, (os.cpu_count() or 2) - 1))
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="BlendPro.Texture")
+            return self._executor
+
+    def clear_cache(self) -> None:
+        """Forget cached image headers"""
+        with self._lock:
+            self._headers.clear()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get texture analyzer statistics"""
+        with self._lock:
+            return {**self._stats, "cached_headers": len(self._headers)}
+
+class BLENDPRO_OT_RestoreOriginalTextures(bpy.types.Operator):
+    """Relink downscaled textures to their original files"""
+    bl_idname = "blendpro.restore_original_textures"
+    bl_label = "Restore Original Textures"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        restored = get_texture_analyzer().restore_originals()
+        self.report({'INFO'}, f"Restored {restored} texture(s)")
+        return {'FINISHED'}
+
+# Global texture analyzer instance
+_texture_analyzer: Optional[TextureAnalyzer] = None
+
+def get_texture_analyzer() -> TextureAnalyzer:
+    """Get global texture analyzer instance"""
+    global _texture_analyzer
+    if _texture_analyzer is None:
+        _texture_analyzer = TextureAnalyzer()
+    return _texture_analyzer
+
+def register():
+    """Register Blender classes"""
+    bpy.utils.register_class(BLENDPRO_OT_RestoreOriginalTextures)
+
+def unregister():
+    """Unregister Blender classes"""
+    bpy.utils.unregister_class(BLENDPRO_OT_RestoreOriginalTextures)
+    get_texture_analyzer().shutdown()